@@ -338,7 +338,7 @@ from .examplefield import example_field, example_fields, example_domain
 
 from .cfimplementation import CFImplementation, implementation
 
-from .read_write import read, write
+from .read_write import catalogue, iread, read, write
 
 from .regrid import RegridOperator
 
@@ -1,8 +1,14 @@
 import logging
+import weakref
+from bisect import bisect_left, bisect_right, insort
 from collections import namedtuple
+from contextlib import contextmanager
 from dataclasses import dataclass
 from dataclasses import field as dataclasses_field
+from itertools import chain
+from math import inf, isfinite
 from operator import itemgetter
+from time import perf_counter
 
 import numpy as np
 from cfdm import is_log_level_debug, is_log_level_detail, is_log_level_info
@@ -23,6 +29,7 @@ from .functions import _DEPRECATION_ERROR_FUNCTION_KWARGS
 from .functions import atol as cf_atol
 from .functions import flat
 from .functions import rtol as cf_rtol
+from .hashcache import HashCacheFile, hash_cache, hash_cache_key
 from .query import Query, gt, isclose, wi
 from .timeduration import M, Y
 from .units import Units
@@ -94,15 +101,15 @@ class _HFLCache:
             'c957a7929dd40d008078a3aa': 'c957a7929dd40d008078a3aa'
         },
         hash_to_data={
-            ((2, 2), <Units: degrees_north>): {'c0736bd479cc6889865c11c0': <CF Data(2, 2): [[-90.0, ..., -30.0]] degrees_north>},
-            ((8, 2), <Units: degrees_east>): {'bfa820175fabd4972b03ac2f: <CF Data(8, 2): [[0.0, ..., 360.0]] degrees_east>},
-            ((3, 2), <Units: degrees_north>): {'c957a7929dd40d008078a3aa': <CF Data(3, 2): [[-30.0, ..., 90.0]] degrees_north>}
+            ((2, 2), <Units: degrees_north>): _HashGroup(arrays={'c0736bd479cc6889865c11c0': array([[-90., -60.], [-60., -30.]])}, ...),
+            ((8, 2), <Units: degrees_east>): _HashGroup(arrays={'bfa820175fabd4972b03ac2f': array([[0., 45.], ..., [315., 360.]])}, ...),
+            ((3, 2), <Units: degrees_north>): _HashGroup(arrays={'c957a7929dd40d008078a3aa': array([[-30., 30.], [30., 60.], [60., 90.]])}, ...)
         },
         hash_to_data_bounds={
-            ((2,), <Units: degrees_north>): {'d5888e04e7409f4770cbdee3': <CF Data(2): [-75.0, -45.0] degrees_north>},
-            ((8,), <Units: degrees_east>): {'bb4458b7bf091fe2a90b9bbe': <CF Data(8): [22.5, ..., 337.5] degrees_east>},
-            ((1,), <Units: days since 2018-12-01>): {'a28d8e98a795155f74703fb1': <CF Data(1): [2019-01-01 00:00:00]>},
-            ((3,), <Units: degrees_north>): {'c740442fa201fcebe826995e': <CF Data(3): [0.0, 45.0, 75.0] degrees_north>}
+            ((2,), <Units: degrees_north>): _HashGroup(arrays={'d5888e04e7409f4770cbdee3': array([-75., -45.])}, ...),
+            ((8,), <Units: degrees_east>): _HashGroup(arrays={'bb4458b7bf091fe2a90b9bbe': array([22.5, ..., 337.5])}, ...),
+            ((1,), <Units: days since 2018-12-01>): _HashGroup(arrays={'a28d8e98a795155f74703fb1': array([31.])}, ...),
+            ((3,), <Units: degrees_north>): _HashGroup(arrays={'c740442fa201fcebe826995e': array([ 0., 45., 75.])}, ...)
         },
         fl={
             'd5888e04e7409f4770cbdee3': (-75.0, -45.0),
@@ -124,12 +131,14 @@ class _HFLCache:
     # 2001-01-01').
     hash_map: dict = dataclasses_field(default_factory=dict)
 
-    # Store non-coordinate-bounds Data objects, separated into groups
-    # of (shape, canonical units) and then keyed by unique hashes.
+    # Store the values of non-coordinate-bounds Data objects,
+    # separated into groups of (shape, canonical units), each of
+    # which keys its arrays by unique hashes.
     hash_to_data: dict = dataclasses_field(default_factory=dict)
 
-    # Store coordinate bounds Data objects, separated into groups of
-    # (shape, canonical units) and then keyed by unique hashes.
+    # Store the values of coordinate bounds Data objects, separated
+    # into groups of (shape, canonical units), each of which keys its
+    # arrays by unique hashes.
     hash_to_data_bounds: dict = dataclasses_field(default_factory=dict)
 
     # The first and last values of non-coordinate-bounds Data objects.
@@ -139,6 +148,145 @@ class _HFLCache:
     # objects.
     flb: dict = dataclasses_field(default_factory=dict)
 
+    # The on-disk cache of the values of file-backed Data objects.
+    # Only set during a call to `aggregate`.
+    hash_cache_file: HashCacheFile = None
+
+    # The profiling statistics of the aggregation. Only set during a
+    # call to `aggregate` with profiling enabled.
+    profile: dict = None
+
+
+@dataclass()
+class _HashGroup:
+    """The unique arrays of a given shape and canonical units.
+
+    Equal arrays are found without comparing a new array with every
+    unique array: arrays with identical values are found from the
+    tokens of their values; and numeric arrays that are equal within
+    a tolerance are only compared with the unique arrays that have a
+    sufficiently close first element.
+
+    Arrays of non-numeric data types are only equal if their values
+    are identical.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+
+    # The unique arrays, keyed by their hashes, in the order in which
+    # they were added.
+    arrays: dict = dataclasses_field(default_factory=dict)
+
+    # The hash of the unique array that is equal to each array that
+    # has been found, keyed by the token of the array values.
+    tokens: dict = dataclasses_field(default_factory=dict)
+
+    # For the unique numeric arrays whose first element is finite and
+    # not masked, the sorted (first element, position, hash) tuples.
+    first_elements: list = dataclasses_field(default_factory=list)
+
+    # The hashes of the other unique numeric arrays, in the order in
+    # which they were added.
+    others: list = dataclasses_field(default_factory=list)
+
+    def find(self, array, token, rtol, atol):
+        """Return the hash of a unique array that equals an array.
+
+        If more than one unique array is equal to the array then the
+        one that was added first is returned.
+
+        :Parameters:
+
+            array: `numpy.ndarray`
+                The array to find.
+
+            token: `str`
+                The token of the array values, as returned by
+                `_array_token`.
+
+            rtol: `float`
+                The relative tolerance for numerical comparisons.
+
+            atol: `float`
+                The absolute tolerance for numerical comparisons.
+
+        :Returns:
+
+            `str` or `None`
+                The hash of the equal unique array, or `None` if there
+                isn't one.
+
+        """
+        hash_value = self.tokens.get(token)
+        if hash_value is not None or array.dtype.kind not in "ifuc":
+            return hash_value
+
+        first = _first_element(array)
+        if first is None:
+            candidates = self.others
+        else:
+            # A unique array can only equal the array if its first
+            # element y satisfies |first - y| <= atol + rtol*|y|,
+            # which implies that |first - y| <= width.
+            if rtol < 1:
+                width = (atol + rtol * abs(first)) / (1 - rtol)
+                width += 4 * np.finfo(float).eps * (abs(first) + width)
+            else:
+                width = inf
+
+            first_elements = self.first_elements
+            candidates = [
+                x[2]
+                for x in sorted(
+                    first_elements[
+                        bisect_left(first_elements, (first - width,)) : (
+                            bisect_right(first_elements, (first + width, inf))
+                        )
+                    ],
+                    key=itemgetter(1),
+                )
+            ]
+
+        arrays = self.arrays
+        for hash_value in candidates:
+            if _arrays_equal(array, arrays[hash_value], rtol, atol):
+                self.tokens[token] = hash_value
+                return hash_value
+
+    def add(self, hash_value, array, token):
+        """Add a unique array.
+
+        :Parameters:
+
+            hash_value: `str`
+                The unique hash of the array.
+
+            array: `numpy.ndarray`
+                The array to add.
+
+            token: `str`
+                The token of the array values, as returned by
+                `_array_token`.
+
+        :Returns:
+
+            `None`
+
+        """
+        self.tokens[token] = hash_value
+        if array.dtype.kind in "ifuc":
+            first = _first_element(array)
+            if first is None:
+                self.others.append(hash_value)
+            else:
+                insort(
+                    self.first_elements,
+                    (first, len(self.arrays), hash_value),
+                )
+
+        self.arrays[hash_value] = array
+
 
 @dataclass()
 class _Canonical:
@@ -197,6 +345,42 @@ class _Canonical:
     cell_methods: list = dataclasses_field(default_factory=list)
 
 
+@dataclass()
+class _AggregationState:
+    """The state of an aggregation, for continuing it incrementally.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `aggregate`
+
+    """
+
+    # The representation of the keyword parameters to `aggregate` that
+    # affect the aggregation.
+    options: str
+
+    # The cache of coordinate and cell measure hashes, first and last
+    # values and first and last cell bounds.
+    hfl_cache: _HFLCache
+
+    # The cache of canonical metadata attributes.
+    canonical: _Canonical
+
+    # The canonical direction of each axis, keyed by structural
+    # signature and then by axis identity.
+    canonical_directions: dict
+
+    # The metadata summary of each output construct, keyed by the
+    # identifier of the construct.
+    meta: dict
+
+
+# The aggregation state of each field list returned by `aggregate`,
+# keyed by the identifier of the field list. An entry is removed when
+# its field list is garbage collected.
+_aggregation_states = {}
+
+
 class _Meta:
     """A summary of a field.
 
@@ -1274,6 +1458,50 @@ class _Meta:
         new.field = new.field.copy()
         return new
 
+    def copy_summary(self):
+        """Return a copy whose summary may be aggregated independently.
+
+        The field is not copied, but the hash values and first and
+        last values that are updated in-place during aggregation are
+        copied, so that aggregating the copy does not change this
+        summary.
+
+        .. versionadded:: NEXTVERSION
+
+        :Returns:
+
+            `_Meta`
+                The copy.
+
+        """
+        new = _Meta.__new__(_Meta)
+        new.__dict__ = self.__dict__.copy()
+        if not hasattr(self, "hash_values"):
+            # There is no summary, e.g. because the structural
+            # signature was set by the field's 'aggregate' attribute
+            return new
+
+        for attr in ("hash_values", "first_values", "last_values"):
+            setattr(
+                new, attr, {k: list(v) for k, v in getattr(self, attr).items()}
+            )
+
+        new.first_bounds = self.first_bounds.copy()
+        new.last_bounds = self.last_bounds.copy()
+        for attr in ("nd_aux", "field_anc", "domain_anc"):
+            setattr(
+                new,
+                attr,
+                {k: v.copy() for k, v in getattr(self, attr).items()},
+            )
+
+        new.msr = {
+            k: {**v, "hash_values": list(v["hash_values"])}
+            for k, v in self.msr.items()
+        }
+        new.promoted_field_ancillaries = self.promoted_field_ancillaries[:]
+        return new
+
     def canonical_axes(self, variable, identity, axes):
         """Return a construct's canonical axes.
 
@@ -2171,6 +2399,10 @@ def aggregate(
     field_identity=None,
     field_ancillaries=None,
     cells=None,
+    into=None,
+    incremental=False,
+    hash_cache=None,
+    profile=False,
     info=False,
 ):
     """Aggregate field constructs into as few field constructs as
@@ -2635,6 +2867,136 @@ def aggregate(
 
             .. versionadded:: 3.15.2
 
+        into: `FieldList` or `None`, optional
+            A field list returned by a previous call to
+            `cf.aggregate` with *incremental* set to True, into which
+            to aggregate the input field constructs, as if they had
+            all been aggregated together. This allows a growing
+            collection of field constructs to be aggregated
+            incrementally: the structural signatures, coordinate
+            hashes and first and last coordinate values that were
+            found for *into* are reused, so that only the input field
+            constructs need to be inspected. The returned field list
+            may itself be used with *into* in a subsequent call.
+
+            *into* is not changed, unless *copy* is False, and its
+            field constructs must not have been changed since they
+            were returned by `cf.aggregate`. The same keyword
+            parameters must be given as when *into* was created,
+            otherwise the field constructs of *into* are inspected
+            again and aggregated along with the input field
+            constructs, without any of the savings. This is also the
+            case if *into* was not returned by `cf.aggregate` with
+            *incremental* set to True, or if *field_ancillaries* is
+            set.
+
+            *Parameter example:*
+              ``g = cf.aggregate(fields, incremental=True)`` followed
+              by ``g = cf.aggregate(new_fields, into=g)`` gives the
+              same result as ``g = cf.aggregate(fields +
+              new_fields)``.
+
+            .. versionadded:: NEXTVERSION
+
+        incremental: `bool`, optional
+            If True then keep the state of the aggregation, including
+            the arrays of the coordinate and cell measure constructs
+            that were inspected, for as long as the returned field
+            list exists, so that it may be used with *into*. By
+            default the state is only kept when the aggregation
+            continued the state of *into*, and otherwise the
+            returned field list may not be used with *into* without
+            inspecting its field constructs again.
+
+            .. versionadded:: NEXTVERSION
+
+        hash_cache: `str` or `None`, optional
+            The name of an on-disk cache of the values of the
+            metadata construct arrays that are needed to find the
+            hash values and first and last coordinate values of the
+            input field constructs. The file is created if it does
+            not already exist. The cache persists between sessions,
+            so that aggregating field constructs whose coordinates
+            are stored in files does not require those arrays to be
+            read from the files again.
+
+            An entry is only used if the files that store its array
+            have the same paths, sizes and modification times as
+            when the entry was created. Arrays that are stored in
+            memory, or in non-local files, are never cached.
+
+            The arrays are also kept, whether or not *hash_cache* is
+            set, in an in-memory cache whose maximum size is given by
+            `cf.hash_cache_size`.
+
+            *Parameter example:*
+              ``hash_cache='hashes.db'``
+
+            .. versionadded:: NEXTVERSION
+
+        profile: `bool`, optional
+            If True then also return statistics on the aggregation,
+            for finding out where its time is spent. The statistics
+            are returned in a dictionary with keys:
+
+            ==================  ======================================
+            Key                 Value
+            ==================  ======================================
+            ``'fields'``        The number of input field or domain
+                                constructs.
+
+            ``'signatures'``    The number of distinct structural
+                                signatures of the input constructs.
+
+            ``'passes'``        The number of passes, one for each
+                                axis of each group of constructs with
+                                the same structural signature, in
+                                which constructs were grouped for
+                                aggregation along the axis.
+
+            ``'aggregations'``  The number of times that constructs
+                                were aggregated along an axis.
+
+            ``'output'``        The number of output constructs.
+
+            ``'arrays'``        The number of metadata construct
+                                arrays that were computed to find
+                                hash values and first and last
+                                coordinate values.
+
+            ``'bytes'``         The total size in bytes of the
+                                computed arrays, which includes any
+                                coordinate data read from files.
+
+            ``'cached_arrays'`` The number of arrays that were found
+                                in the hash caches instead of being
+                                computed (see *hash_cache*).
+
+            ``'graph_size'``    The total number of tasks in the Dask
+                                graphs of the data of the output
+                                constructs.
+
+            ``'time'``          A dictionary of the wall-clock times,
+                                in seconds, of the phases of the
+                                aggregation: ``'signatures'``
+                                (creating the structural signatures),
+                                ``'hashing'`` (finding the hash
+                                values and first and last coordinate
+                                values, including the canonical
+                                element orders of the coordinates),
+                                ``'grouping'`` (grouping constructs
+                                for aggregation along an axis),
+                                ``'sorting'`` (sorting each group by
+                                its first coordinate values),
+                                ``'checking'`` (checking for
+                                overlapping coordinates),
+                                ``'concatenation'`` (creating the
+                                aggregated constructs), and
+                                ``'total'`` (the whole aggregation).
+            ==================  ======================================
+
+            .. versionadded:: NEXTVERSION
+
         no_overlap: deprecated at version 3.0.0
             Use the *overlap* parameter instead.
 
@@ -2643,8 +3005,10 @@ def aggregate(
 
     :Returns:
 
-        `FieldList`
-            The aggregated field constructs.
+        `FieldList` or `tuple`
+            The aggregated field constructs. If *profile* is True
+            then a 2-tuple of the aggregated field constructs and the
+            profiling statistics is returned.
 
     **Examples**
 
@@ -2668,7 +3032,56 @@ def aggregate(
     >>> g[0].source
     AttributeError: 'Field' object has no attribute 'source'
 
+    Find out where the time is spent:
+
+    >>> g, stats = cf.aggregate(f, profile=True)
+    >>> stats
+    {'fields': 6,
+     'signatures': 1,
+     'passes': 3,
+     'aggregations': 4,
+     'output': 1,
+     'arrays': 9,
+     'bytes': 336,
+     'cached_arrays': 0,
+     'graph_size': 13,
+     'time': {'signatures': 0.0039,
+              'hashing': 0.0364,
+              'grouping': 0.0001,
+              'sorting': 0.0000,
+              'checking': 0.0002,
+              'concatenation': 0.0504,
+              'total': 0.0921}}
+
     """
+    if profile:
+        start = perf_counter()
+        profile = {
+            "fields": 0,
+            "signatures": 0,
+            "passes": 0,
+            "aggregations": 0,
+            "output": 0,
+            "arrays": 0,
+            "bytes": 0,
+            "cached_arrays": 0,
+            "graph_size": 0,
+            "time": dict.fromkeys(
+                (
+                    "signatures",
+                    "hashing",
+                    "grouping",
+                    "sorting",
+                    "checking",
+                    "concatenation",
+                    "total",
+                ),
+                0.0,
+            ),
+        }
+    else:
+        profile = None
+
     if no_overlap is not False:
         _DEPRECATION_ERROR_FUNCTION_KWARGS(
             "cf.aggregate",
@@ -2697,12 +3110,71 @@ def aggregate(
     detail = is_log_level_detail(logger)
     debug = is_log_level_debug(logger)
 
-    # Initialise the cache of coordinate and cell measure hashes,
-    # first and last values and first and last cell bounds
-    hfl_cache = _HFLCache()
+    # The keyword parameters that affect the aggregation, which must
+    # be the same for an incremental aggregation
+    options = repr(
+        (
+            relaxed_units,
+            overlap,
+            contiguous,
+            relaxed_identities,
+            ncvar_identities,
+            respect_valid,
+            equal_all,
+            exist_all,
+            equal,
+            exist,
+            ignore,
+            exclude,
+            dimension,
+            concatenate,
+            axes,
+            donotchecknonaggregatingaxes,
+            allow_no_identity,
+            atol if atol is not None else cf_atol(),
+            rtol if rtol is not None else cf_rtol(),
+            field_identity,
+            cells,
+        )
+    )
+
+    # Find the state of the aggregation that created 'into'
+    state = None
+    if into is not None:
+        state = _aggregation_state(into, options)
+        if state is None:
+            if info:
+                logger.info(
+                    "Can't aggregate incrementally into the given field "
+                    "list: Aggregating all field constructs"
+                )
+
+            fields = [into, fields]
+
+    if state is not None:
+        # Continue the aggregation that created 'into'
+        hfl_cache = state.hfl_cache
+        canonical = state.canonical
+        canonical_directions = state.canonical_directions
+        existing_meta = [state.meta[id(f)].copy_summary() for f in into]
+    else:
+        # Initialise the cache of coordinate and cell measure hashes,
+        # first and last values and first and last cell bounds
+        hfl_cache = _HFLCache()
+
+        # Initialise the cache of canonical metadata attributes
+        canonical = _Canonical()
 
-    # Initialise the cache of canonical metadata attributes
-    canonical = _Canonical()
+        # Initialise the canonical axis directions
+        canonical_directions = {}
+
+        existing_meta = []
+
+    # The ids of the summaries that already have hashes and first and
+    # last values
+    hashed = set(
+        id(m) for m in existing_meta if hasattr(m, "aggregating_axes")
+    )
 
     output_meta = []
     output_meta_append = output_meta.append
@@ -2826,34 +3298,48 @@ def aggregate(
     # 1. Group together fields with the same structural signature
     # ================================================================
     signatures = {}
+    for meta in existing_meta:
+        if not meta:
+            if copy:
+                meta = meta.copy()
+
+            output_meta_append(meta)
+            continue
+
+        signatures.setdefault(meta.signature, []).append(meta)
+
     for f in flat(fields):
         # ------------------------------------------------------------
         # Create the metadata summary, including the structural
         # signature
         # ------------------------------------------------------------
-        meta = _Meta(
-            f,
-            verbose=verbose,
-            rtol=rtol,
-            atol=atol,
-            relaxed_units=relaxed_units,
-            allow_no_identity=allow_no_identity,
-            equal_all=equal_all,
-            exist_all=exist_all,
-            equal=equal,
-            exist=exist,
-            ignore=ignore,
-            dimension=dimension,
-            relaxed_identities=relaxed_identities,
-            ncvar_identities=ncvar_identities,
-            field_identity=field_identity,
-            respect_valid=respect_valid,
-            canonical=canonical,
-            info=info,
-            field_ancillaries=field_ancillaries,
-            cells=cells,
-            copy=copy,
-        )
+        if profile is not None:
+            profile["fields"] += 1
+
+        with _timed(profile, "signatures"):
+            meta = _Meta(
+                f,
+                verbose=verbose,
+                rtol=rtol,
+                atol=atol,
+                relaxed_units=relaxed_units,
+                allow_no_identity=allow_no_identity,
+                equal_all=equal_all,
+                exist_all=exist_all,
+                equal=equal,
+                exist=exist,
+                ignore=ignore,
+                dimension=dimension,
+                relaxed_identities=relaxed_identities,
+                ncvar_identities=ncvar_identities,
+                field_identity=field_identity,
+                respect_valid=respect_valid,
+                canonical=canonical,
+                info=info,
+                field_ancillaries=field_ancillaries,
+                cells=cells,
+                copy=copy,
+            )
 
         if not meta:
             unaggregatable = True
@@ -2908,364 +3394,291 @@ def aggregate(
     #                        logger.info(hash(w1))
     #                        logger.info(hash(w2))
 
-    for signature in signatures:  # sorted(signatures):
-        meta = signatures[signature]
-
-        # Print useful information
-        meta[0].print_info()
-
-        # Note (verbosity): the interface between cf.aggregate's use of:
-        #    _manage_log_level_via_verbosity
-        # and some (only print_info ATM) of _Meta's methods' use of:
-        #    _manage_log_level_via_verbose_attr
-        # breaks the verbosity management here. This is currently the
-        # only case in the code bases cfdm and cf where both decorators are at
-        # play. Logic to handle the interface between the two has not
-        # yet been added, so the latter called with print_info resets the
-        # log level prematurely w.r.t the intentions of the former. For now,
-        # we can work around this by resetting the verbosity manually after
-        # the small number of print_info calls in this function, like so:
-        if verbose is not None:
-            # We already know _is_valid_log_level_int(verbose) is True since
-            # if not, decorator would have errored before cf.aggregate ran.
-            _reset_log_emergence_level(verbose)
-
-        if detail:
-            logger.detail("")
-
-        if len(meta) == 1:
-            # --------------------------------------------------------
-            # There's only one field with this signature, so we can
-            # add it straight to the output list and move on to the
-            # next signature.
-            # --------------------------------------------------------
-            if copy:
-                meta[0] = meta[0].copy()
-
-            output_meta_append(meta[0])
-            continue
-
-        if not relaxed_units and not meta[0].units.isvalid:
-            if info:
-                x = ", ".join(set(repr(m.units) for m in meta))
-                logger.info(
-                    f"Unaggregatable {f_identity(meta[0])} fields "
-                    f"have{exclude} been output: Non-valid units {x}"
-                )
-
-            if not exclude:
+    try:
+        if hash_cache is not None:
+            hfl_cache.hash_cache_file = HashCacheFile(hash_cache)
+
+        hfl_cache.profile = profile
+        if profile is not None:
+            profile["signatures"] = len(signatures)
+
+        for signature in signatures:  # sorted(signatures):
+            meta = signatures[signature]
+
+            # Print useful information
+            meta[0].print_info()
+
+            # Note (verbosity): the interface between cf.aggregate's use of:
+            #    _manage_log_level_via_verbosity
+            # and some (only print_info ATM) of _Meta's methods' use of:
+            #    _manage_log_level_via_verbose_attr
+            # breaks the verbosity management here. This is currently the
+            # only case in the code bases cfdm and cf where both decorators are at
+            # play. Logic to handle the interface between the two has not
+            # yet been added, so the latter called with print_info resets the
+            # log level prematurely w.r.t the intentions of the former. For now,
+            # we can work around this by resetting the verbosity manually after
+            # the small number of print_info calls in this function, like so:
+            if verbose is not None:
+                # We already know _is_valid_log_level_int(verbose) is True since
+                # if not, decorator would have errored before cf.aggregate ran.
+                _reset_log_emergence_level(verbose)
+
+            if detail:
+                logger.detail("")
+
+            if len(meta) == 1:
+                # --------------------------------------------------------
+                # There's only one field with this signature, so we can
+                # add it straight to the output list and move on to the
+                # next signature.
+                # --------------------------------------------------------
                 if copy:
-                    output_meta_extend(m.copy() for m in meta)
-                else:
-                    output_meta_extend(meta)
-
-            continue
-
-        # ------------------------------------------------------------
-        # Still here? Then there are 2 or more fields with this
-        # signature which may be aggregatable. These fields need to be
-        # passed through until no more aggregations are possible. With
-        # each pass, the number of fields in the group will reduce by
-        # one for each aggregation that occurs. Each pass represents
-        # an aggregation in another axis.
-        # ------------------------------------------------------------
-
-        # ------------------------------------------------------------
-        # For each axis's 1-d coordinates, create the canonical hash
-        # value and the first and last cell values.
-        # ------------------------------------------------------------
-        if axes is None:
-            # Aggregation will be over as many axes as possible
-            m0 = meta[0]
-            aggregating_axes = m0.axis_ids[:]
-
-            # For DSG feature types, only consider aggregating the
-            # feature dimension(s).
-            if m0.featureType:
-                for axis in aggregating_axes[:]:
-                    if not dsg_feature_type_axis(m0, axis):
-                        aggregating_axes.remove(axis)
-
-            _create_hash_and_first_values(
-                meta, aggregating_axes, False, hfl_cache, rtol, atol
-            )
-        else:
-            # Specific aggregation axes have been selected
-            aggregating_axes = []
-            axis_items = meta[0].axis.items()
-            for axis in axes:
-                coord = meta[0].field.coordinate(axis, default=None)
-                if coord is None:
-                    continue
-
-                coord_identity = coord.identity(
-                    strict=strict_identities,
-                    relaxed=relaxed_identities and not ncvar_identities,
-                    nc_only=ncvar_identities,
-                    default=None,
-                )
-                for identity, value in axis_items:
-                    if (
-                        identity not in aggregating_axes
-                        and coord_identity in value["ids"]
-                    ):
-                        aggregating_axes.append(identity)
-                        break
+                    meta[0] = meta[0].copy()
 
-            _create_hash_and_first_values(
-                meta,
-                aggregating_axes,
-                donotchecknonaggregatingaxes,
-                hfl_cache,
-                rtol,
-                atol,
-            )
+                output_meta_append(meta[0])
+                continue
 
-        # Print useful information
-        for m in meta:
-            m.print_info(signature=False)
+            if not relaxed_units and not meta[0].units.isvalid:
+                if info:
+                    x = ", ".join(set(repr(m.units) for m in meta))
+                    logger.info(
+                        f"Unaggregatable {f_identity(meta[0])} fields "
+                        f"have{exclude} been output: Non-valid units {x}"
+                    )
 
-        # See 'Note (verbosity)' above
-        if verbose is not None:
-            _reset_log_emergence_level(verbose)
+                if not exclude:
+                    if copy:
+                        output_meta_extend(m.copy() for m in meta)
+                    else:
+                        output_meta_extend(meta)
 
-        if detail:
-            logger.detail("")
+                continue
 
-        # Take a shallow copy in case we abandon and want to output
-        # the original, unaggregated fields.
-        meta0 = meta[:]
+            # ------------------------------------------------------------
+            # Still here? Then there are 2 or more fields with this
+            # signature which may be aggregatable. These fields need to be
+            # passed through until no more aggregations are possible. With
+            # each pass, the number of fields in the group will reduce by
+            # one for each aggregation that occurs. Each pass represents
+            # an aggregation in another axis.
+            # ------------------------------------------------------------
+
+            # ------------------------------------------------------------
+            # For each axis's 1-d coordinates, create the canonical hash
+            # value and the first and last cell values.
+            # ------------------------------------------------------------
+            if axes is None:
+                # Aggregation will be over as many axes as possible
+                m0 = meta[0]
+                aggregating_axes = m0.axis_ids[:]
+
+                # For DSG feature types, only consider aggregating the
+                # feature dimension(s).
+                if m0.featureType:
+                    for axis in aggregating_axes[:]:
+                        if not dsg_feature_type_axis(m0, axis):
+                            aggregating_axes.remove(axis)
+
+                with _timed(profile, "hashing"):
+                    _create_hash_and_first_values(
+                        [m for m in meta if id(m) not in hashed],
+                        aggregating_axes,
+                        False,
+                        hfl_cache,
+                        rtol,
+                        atol,
+                        canonical_directions.setdefault(signature, {}),
+                    )
+            else:
+                # Specific aggregation axes have been selected
+                aggregating_axes = []
+                axis_items = meta[0].axis.items()
+                for axis in axes:
+                    coord = meta[0].field.coordinate(axis, default=None)
+                    if coord is None:
+                        continue
 
-        unaggregatable = False
+                    coord_identity = coord.identity(
+                        strict=strict_identities,
+                        relaxed=relaxed_identities and not ncvar_identities,
+                        nc_only=ncvar_identities,
+                        default=None,
+                    )
+                    for identity, value in axis_items:
+                        if (
+                            identity not in aggregating_axes
+                            and coord_identity in value["ids"]
+                        ):
+                            aggregating_axes.append(identity)
+                            break
+
+                with _timed(profile, "hashing"):
+                    _create_hash_and_first_values(
+                        [m for m in meta if id(m) not in hashed],
+                        aggregating_axes,
+                        donotchecknonaggregatingaxes,
+                        hfl_cache,
+                        rtol,
+                        atol,
+                        canonical_directions.setdefault(signature, {}),
+                    )
 
-        # Record the names of the axes that are actually aggregated
-        axes_aggregated = []
+            # Print useful information
+            for m in meta:
+                m.print_info(signature=False)
 
-        for axis in aggregating_axes:
-            number_of_fields = len(meta)
-            if number_of_fields == 1:
-                break
+            # See 'Note (verbosity)' above
+            if verbose is not None:
+                _reset_log_emergence_level(verbose)
 
-            # --------------------------------------------------------
-            # Separate the fields with the same structural signature
-            # into groups such that either within each group the
-            # fields' domains differ only long the axis or each group
-            # contains only one field.
-            #
-            # Note that the 'a_identity' attribute, that gives the
-            # identity of the aggregating axis, is set in
-            # _group_fields().
-            # --------------------------------------------------------
-            grouped_meta = _group_fields(meta, axis, info=info)
+            if detail:
+                logger.detail("")
 
-            if not grouped_meta:
-                if info:
-                    logger.info(
-                        f"Unaggregatable {f_identity(meta[0])} fields "
-                        f"have{exclude} been output: {meta[0].message}"
-                    )
+            # Take a shallow copy in case we abandon and want to output
+            # the original, unaggregated fields.
+            meta0 = meta[:]
 
-                unaggregatable = True
-                break
+            unaggregatable = False
 
-            if len(grouped_meta) == number_of_fields:
-                if debug:
-                    logger.debug(
-                        f"{meta[0].identity!r} fields can't be "
-                        f"aggregated along their {axis!r} axis"
-                    )
+            # Record the names of the axes that are actually aggregated
+            axes_aggregated = []
 
-                continue
+            for axis in aggregating_axes:
+                number_of_fields = len(meta)
+                if number_of_fields == 1:
+                    break
 
-            # --------------------------------------------------------
-            # Within each group, aggregate as many fields as possible.
-            # --------------------------------------------------------
-            for m in grouped_meta:
-                if len(m) == 1:
-                    continue
+                # --------------------------------------------------------
+                # Separate the fields with the same structural signature
+                # into groups such that either within each group the
+                # fields' domains differ only long the axis or each group
+                # contains only one field.
+                #
+                # Note that the 'a_identity' attribute, that gives the
+                # identity of the aggregating axis, is set in
+                # _group_fields().
+                # --------------------------------------------------------
+                if profile is not None:
+                    profile["passes"] += 1
 
-                # ----------------------------------------------------
-                # Still here? The sort the fields in place by the
-                # canonical first values of their 1-d coordinates for
-                # the aggregating axis.
-                # ----------------------------------------------------
-                _sorted_by_first_values(m, axis)
+                with _timed(profile, "grouping"):
+                    grouped_meta = _group_fields(meta, axis, info=info)
 
-                # ----------------------------------------------------
-                # Check that the aggregating axis's 1-d coordinates
-                # don't overlap, and don't aggregate anything in this
-                # group if any do.
-                # ----------------------------------------------------
-                if not _ok_coordinate_arrays(
-                    m, axis, overlap, contiguous, info, verbose
-                ):
+                if not grouped_meta:
                     if info:
                         logger.info(
-                            f"Unaggregatable {f_identity(m[0])} fields "
-                            f"have{exclude} been output: {m[0].message}"
+                            f"Unaggregatable {f_identity(meta[0])} fields "
+                            f"have{exclude} been output: {meta[0].message}"
                         )
 
                     unaggregatable = True
                     break
 
-                # ----------------------------------------------------
-                # Still here? Then pass through the fields
-                # ----------------------------------------------------
+                if len(grouped_meta) == number_of_fields:
+                    if debug:
+                        logger.debug(
+                            f"{meta[0].identity!r} fields can't be "
+                            f"aggregated along their {axis!r} axis"
+                        )
 
-                # ----------------------------------------------------
-                # Initialise the dictionary that will contain the data
-                # arrays that will need concatenating.
-                #
-                # This dictionary will contain, e.g.
-                #
-                # {'field': {
-                #    1: [
-                #      <CF Data(5, 2): [[0.007, ..., 0.029]] 1>,
-                #      <CF Data(5, 6): [[0.023, ..., 0.066]] 1>
-                #    ]
-                #  },
-                #  'dimension_coordinate': {
-                #    ('dimensioncoordinate0', 0): [
-                #      <CF DimensionCoordinate: longitude(2) degreesE>,
-                #      <CF DimensionCoordinate: longitude(6) degreesE>
-                #    ]
-                #  },
-                #  'auxiliary_coordinate': {},
-                #  'cell_connectivity': {},
-                #  'cell_measure': {},
-                #  'domain_ancillary': {},
-                #  'domain_topology': {},
-                #  'field_ancillary': {},
-                # }
-                #
-                # In general, the keys of the nested dictionaries are
-                # `(key, iaxis)`, where `key` is the construct
-                # identifier in the aggregated field and `iaxis` is
-                # the position of the aggregation axis in the
-                # constructs being aggregated. The values of the
-                # nested dictionaries are the ordered lists of
-                # constructs to be concatenated.
-                #
-                # The exception to this is the 'field' nested
-                # dictionary, whose key is is the position of the
-                # aggregation axis in the field's data, and whose
-                # values are the Data objects to be concatenated.
-                # ----------------------------------------------------
-                data_concatenation = {
-                    "field": {},
-                    "auxiliary_coordinate": {},
-                    "dimension_coordinate": {},
-                    "cell_measure": {},
-                    "domain_ancillary": {},
-                    "field_ancillary": {},
-                    "domain_topology": {},
-                    "cell_connectivity": {},
-                }
+                    continue
 
-                m0 = m[0].copy()
-                for m1 in m[1:]:
-                    m0 = _aggregate_2_fields(
-                        m0,
-                        m1,
-                        rtol=rtol,
-                        atol=atol,
-                        verbose=verbose,
-                        concatenate=concatenate,
-                        data_concatenation=data_concatenation,
-                        relaxed_units=relaxed_units,
-                        copy=copy,
-                    )
+                # --------------------------------------------------------
+                # Within each group, aggregate as many fields as possible.
+                # --------------------------------------------------------
+                for m in grouped_meta:
+                    if len(m) == 1:
+                        continue
+
+                    # ----------------------------------------------------
+                    # Still here? The sort the fields in place by the
+                    # canonical first values of their 1-d coordinates for
+                    # the aggregating axis.
+                    # ----------------------------------------------------
+                    with _timed(profile, "sorting"):
+                        _sorted_by_first_values(m, axis)
+
+                    # ----------------------------------------------------
+                    # Check that the aggregating axis's 1-d coordinates
+                    # don't overlap, and don't aggregate anything in this
+                    # group if any do.
+                    # ----------------------------------------------------
+                    with _timed(profile, "checking"):
+                        ok = _ok_coordinate_arrays(
+                            m, axis, overlap, contiguous, info, verbose
+                        )
 
-                    if not m0:
-                        # Couldn't aggregate these two fields, so
-                        # abandon all aggregations on the fields with
-                        # this structural signature, including those
-                        # already done.
+                    if not ok:
                         if info:
                             logger.info(
-                                f"Unaggregatable {f_identity(m1)} fields "
-                                f"fields have{exclude} been output: "
-                                f"{m1.message}"
+                                f"Unaggregatable {f_identity(m[0])} fields "
+                                f"have{exclude} been output: {m[0].message}"
                             )
 
                         unaggregatable = True
                         break
 
-                if not unaggregatable:
-                    # -------------------------------------------------
-                    # The aggregation along this axis was successful
-                    # for this sub-group, so concatenate all of the
-                    # data arrays.
+                    # ----------------------------------------------------
+                    # Still here? Then aggregate the fields, concatenating
+                    # all of their data arrays at once.
                     #
-                    # The concatenation is done here so that all
-                    # arrays can be concatenated at once. With Dask, this
-                    # is faster than the old code (pre-3.15.1) which
-                    # effectively did N-1 partial concatenations
-                    # inside the `_aggregate_2_fields` function when
-                    # aggregating N arrays. The old method scaled
-                    # poorly with N. Old-method concatenation timings
-                    # *for a single aggregated array* for N = 10, 100,
-                    # 100, 2000 were (in seconds)
+                    # With Dask, this is faster than the old code
+                    # (pre-3.15.1) which effectively did N-1 partial
+                    # concatenations when aggregating N arrays. The old
+                    # method scaled poorly with N. Old-method
+                    # concatenation timings *for a single aggregated
+                    # array* for N = 10, 100, 100, 2000 were (in seconds)
                     #
                     #   0.0012 , 0.019 , 0.55 , 2.1
                     #
                     # compared with current method timings of
                     #
                     #   0.00035, 0.0012, 0.013, 0.064
-                    # ------------------------------------------------
-                    field = m0.field
-                    field_arrays = data_concatenation.pop("field")
-                    if field_arrays:
-                        # Concatenate the field data
-                        iaxis, arrays = field_arrays.popitem()
-                        data = Data.concatenate(
-                            arrays,
-                            iaxis,
-                            relaxed_units=relaxed_units,
-                            copy=copy,
-                        )
-                        field.set_data(data, set_axes=False, copy=False)
-
-                    # Concatenate the metadata construct data
-                    for construct_type, value in data_concatenation.items():
-                        for (key, iaxis), constructs in value.items():
-                            c = constructs[0].concatenate(
-                                constructs,
-                                iaxis,
+                    # ----------------------------------------------------
+                    if profile is not None:
+                        profile["aggregations"] += 1
+
+                    with _timed(profile, "concatenation"):
+                        m[:] = [
+                            _aggregate_fields(
+                                m,
+                                concatenate=concatenate,
                                 relaxed_units=relaxed_units,
                                 copy=copy,
                             )
-                            field.set_construct(
-                                c,
-                                axes=field.get_data_axes(key),
-                                key=key,
-                                copy=False,
-                            )
+                        ]
+
+                if unaggregatable:
+                    break
 
-                m[:] = [m0]
+                # --------------------------------------------------------
+                # Still here? Then the aggregation along this axis was
+                # completely successful for each sub-group, so reassemble
+                # the aggregated fields as a single list ready for
+                # aggregation along the next axis.
+                # --------------------------------------------------------
+                axes_aggregated.append(axis)
+                meta = [m for gm in grouped_meta for m in gm]
 
+            # Add fields to the output list
             if unaggregatable:
-                break
-
-            # --------------------------------------------------------
-            # Still here? Then the aggregation along this axis was
-            # completely successful for each sub-group, so reassemble
-            # the aggregated fields as a single list ready for
-            # aggregation along the next axis.
-            # --------------------------------------------------------
-            axes_aggregated.append(axis)
-            meta = [m for gm in grouped_meta for m in gm]
+                status = 1
+                if not exclude:
+                    if copy:
+                        output_meta_extend(m.copy() for m in meta0)
+                    else:
+                        output_meta_extend(meta0)
+            else:
+                output_meta_extend(meta)
+    finally:
+        # Commit and close the hash cache file, even if the
+        # aggregation failed
+        if hfl_cache.hash_cache_file is not None:
+            hfl_cache.hash_cache_file.close()
+            hfl_cache.hash_cache_file = None
 
-        # Add fields to the output list
-        if unaggregatable:
-            status = 1
-            if not exclude:
-                if copy:
-                    output_meta_extend(m.copy() for m in meta0)
-                else:
-                    output_meta_extend(meta0)
-        else:
-            output_meta_extend(meta)
+        hfl_cache.profile = None
 
     if cells:
         _set_cell_conditions(output_meta)
@@ -3290,9 +3703,79 @@ def aggregate(
     if Type == "field":
         output_constructs = FieldList(output_constructs)
 
+        if (incremental or state is not None) and not field_ancillaries:
+            # Store the state of the aggregation, so that it may be
+            # continued with the 'into' parameter. This keeps the
+            # arrays of the hash cache in memory, so is only done on
+            # request.
+            key = id(output_constructs)
+            _aggregation_states[key] = _AggregationState(
+                options=options,
+                hfl_cache=hfl_cache,
+                canonical=canonical,
+                canonical_directions=canonical_directions,
+                meta={id(m.field): m for m in output_meta},
+            )
+            weakref.finalize(
+                output_constructs, _aggregation_states.pop, key, None
+            )
+
+    if profile is not None:
+        profile["output"] = len(output_constructs)
+        for x in output_constructs:
+            d = x.get_data(None, _fill_value=False)
+            if d is not None:
+                dx = d.to_dask_array(
+                    _force_mask_hardness=False, _force_to_memory=False
+                )
+                profile["graph_size"] += len(dx.dask)
+
+        profile["time"]["total"] = perf_counter() - start
+        return output_constructs, profile
+
     return output_constructs
 
 
+def _aggregation_state(fields, options):
+    """Return the state of the aggregation that created a field list.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `aggregate`
+
+    :Parameters:
+
+        fields: `FieldList`
+            The field list.
+
+        options: `str`
+            The representation of the keyword parameters to
+            `aggregate` that affect the aggregation.
+
+    :Returns:
+
+        `_AggregationState` or `None`
+            The state, or `None` if *fields* was not created by
+            `aggregate` with the same *options*, or if it has been
+            changed since.
+
+    """
+    state = _aggregation_states.get(id(fields))
+    if state is None or state.options != options:
+        return
+
+    meta = state.meta
+    if len(meta) != len(fields):
+        return
+
+    for f in fields:
+        m = meta.get(id(f))
+        if m is None or m.field is not f:
+            return
+
+    return state
+
+
 def _set_cell_conditions(output_meta):
     """Store the cell characteristics from any cell conditions.
 
@@ -3499,7 +3982,13 @@ def climatology_cells(
 
 
 def _create_hash_and_first_values(
-    meta, aggregating_axes, donotchecknonaggregatingaxes, hfl_cache, rtol, atol
+    meta,
+    aggregating_axes,
+    donotchecknonaggregatingaxes,
+    hfl_cache,
+    rtol,
+    atol,
+    canonical_direction=None,
 ):
     """Updates each field's _Meta object.
 
@@ -3512,14 +4001,21 @@ def _create_hash_and_first_values(
 
         donotchecknonaggregatingaxes: `bool`
 
+        canonical_direction: `dict`, optional
+            The canonical direction for each axis, keyed by the axis
+            identity, which is updated in-place with the directions
+            of any new axes. By default the canonical directions are
+            those of the first field with each axis.
+
+            .. versionadded:: NEXTVERSION
+
     :Returns:
 
         `None`
 
     """
-    # The canonical direction for each axis, keyed by the axis
-    # identity.
-    canonical_direction = {}
+    if canonical_direction is None:
+        canonical_direction = {}
 
     for m in meta:
         field = m.field
@@ -3993,8 +4489,10 @@ def _get_hfl(
     """Return the hash value, and optionally first and last values or
     bounds.
 
-    The performance of this function depends on minimising number of
-    calls to `Data.compute` and `Data.equals`.
+    The performance of this function depends on minimising the
+    number of times that the values of Data objects are computed.
+    Each unique Data object is computed at most once, and its values
+    are then compared with those of other arrays with `numpy`.
 
     :Parameters:
 
@@ -4051,51 +4549,57 @@ def _get_hfl(
     hash_map = hfl_cache.hash_map
 
     # Get a hash value for the data
+    array = None
     try:
         # Fast
         hash_value = d.get_deterministic_name()
     except ValueError:
         # Slow
-        hash_value = tokenize(d.compute())
+        array = d.array
+        hash_value = tokenize(array)
+        _profile_array(array, hfl_cache)
 
     if hash_value in hash_map:
         hash_value = hash_map[hash_value]
     else:
+        token = None
+        if array is None:
+            key, token, array = _cached_values(d, hfl_cache)
+            if array is None:
+                array = d.array
+                _profile_array(array, hfl_cache)
+                if key is not None:
+                    token = _array_token(array)
+                    _cache_values(key, token, array, hfl_cache)
+
+        if token is None:
+            token = _array_token(array)
+
+        # Set the cached elements from the computed values, so that
+        # the first and last values don't need computing again
+        _set_cached_elements(d, array)
+
         if first_and_last_values:
             hash_to_data = hfl_cache.hash_to_data_bounds
         else:
             hash_to_data = hfl_cache.hash_to_data
 
         key = (d.shape, canonical_units)
-        hash_to_data.setdefault(key, {})
-        hash_to_data = hash_to_data[key]
-        if hash_value not in hash_to_data:
-            # We've not seen this hash value before ...
-            found_equal = False
-            kind = d.dtype.kind
-            for hash_value0, d0 in hash_to_data.items():
-                kind0 = d0.dtype.kind
-                if kind != kind0 and (kind not in "ifu" or kind0 not in "ifu"):
-                    # Data types are incompatible, so 'd' can't equal 'd0'
-                    continue
-
-                if d.equals(
-                    d0,
-                    rtol=rtol,
-                    atol=atol,
-                    ignore_data_type=True,
-                    ignore_fill_value=True,
-                    verbose=1,
-                ):
-                    # ... but the data that it represents has been seen.
-                    hash_map[hash_value] = hash_value0
-                    hash_value = hash_value0
-                    found_equal = True
-                    break
-
-            if not found_equal:
-                hash_map[hash_value] = hash_value
-                hash_to_data[hash_value] = d
+        group = hash_to_data.get(key)
+        if group is None:
+            group = _HashGroup()
+            hash_to_data[key] = group
+
+        hash_value0 = group.find(array, token, rtol, atol)
+        if hash_value0 is None:
+            # We've not seen this data before
+            hash_map[hash_value] = hash_value
+            group.add(hash_value, array, token)
+        else:
+            # We've not seen this hash value before, but the data
+            # that it represents has been seen.
+            hash_map[hash_value] = hash_value0
+            hash_value = hash_value0
 
     if first_and_last_values:
         # Record the first and last cells
@@ -4128,6 +4632,277 @@ def _get_hfl(
         return hash_value
 
 
+def _cached_values(d, hfl_cache):
+    """Return the values of file-backed data from the hash caches.
+
+    The in-memory hash cache is searched first, followed by the
+    on-disk hash cache, if there is one.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_cache_values`, `cf.hash_cache_size`
+
+    :Parameters:
+
+        d: `Data`
+            The data.
+
+        hfl_cache: `_HFLCache`
+            The cache of coordinate and cell measure hashes, first and
+            last values and first and last cell bounds.
+
+    :Returns:
+
+        3-`tuple`
+            The hash cache key of the data, and the token and values
+            of the data. The token and values are `None` if they are
+            not cached, and the key is also `None` if the data can't
+            be cached.
+
+    """
+    hash_cache_file = hfl_cache.hash_cache_file
+    if hash_cache.max_size <= 0 and hash_cache_file is None:
+        return None, None, None
+
+    key = hash_cache_key(d)
+    if key is None:
+        return None, None, None
+
+    x = hash_cache.get(key)
+    if x is None and hash_cache_file is not None:
+        x = hash_cache_file.get(key)
+        if x is not None:
+            hash_cache.put(key, *x)
+
+    if x is None:
+        return key, None, None
+
+    if hfl_cache.profile is not None:
+        hfl_cache.profile["cached_arrays"] += 1
+
+    return (key,) + x
+
+
+def _cache_values(key, token, array, hfl_cache):
+    """Store the values of file-backed data in the hash caches.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_cached_values`
+
+    :Parameters:
+
+        key: `tuple`
+            The hash cache key of the data.
+
+        token: `str`
+            The token of the values, as returned by `_array_token`.
+
+        array: `numpy.ndarray`
+            The values of the data.
+
+        hfl_cache: `_HFLCache`
+            The cache of coordinate and cell measure hashes, first and
+            last values and first and last cell bounds.
+
+    :Returns:
+
+        `None`
+
+    """
+    hash_cache.put(key, token, array)
+    if hfl_cache.hash_cache_file is not None:
+        hfl_cache.hash_cache_file.put(key, token, array)
+
+
+def _profile_array(array, hfl_cache):
+    """Record a computed array in the profiling statistics.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The computed array.
+
+        hfl_cache: `_HFLCache`
+            The cache of coordinate and cell measure hashes, first and
+            last values and first and last cell bounds.
+
+    :Returns:
+
+        `None`
+
+    """
+    profile = hfl_cache.profile
+    if profile is not None:
+        profile["arrays"] += 1
+        profile["bytes"] += array.nbytes
+
+
+@contextmanager
+def _timed(profile, phase):
+    """A context manager that times a phase of an aggregation.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        profile: `dict` or `None`
+            The profiling statistics, whose time for the phase is
+            incremented by the wall-clock time spent in the context.
+            If `None` then nothing is timed.
+
+        phase: `str`
+            The name of the phase.
+
+    """
+    if profile is None:
+        yield
+        return
+
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        profile["time"][phase] += perf_counter() - start
+
+
+def _set_cached_elements(d, array):
+    """Cache the elements of data used for first and last values.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `Data`
+            The data, which is updated in-place.
+
+        array: `numpy.ndarray`
+            The computed values of *d*.
+
+    :Returns:
+
+        `None`
+
+    """
+    array = np.ma.ravel(array)
+    elements = {0: array[0], -1: array[-1]}
+    if array.size > 1:
+        elements[1] = array[1]
+        elements[-2] = array[-2]
+
+    d._set_cached_elements(elements)
+
+
+def _first_element(array):
+    """Return the first element of a real array, if it is finite.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+
+    :Returns:
+
+        `float` or `None`
+            The first element, or `None` if it is masked or not
+            finite, or if the array is not real.
+
+    """
+    if array.dtype.kind not in "ifu":
+        return
+
+    first = np.ma.ravel(array)[0]
+    if first is np.ma.masked:
+        return
+
+    first = float(first)
+    if not isfinite(first):
+        return
+
+    return first
+
+
+def _array_token(array):
+    """Return a token of the values of an array.
+
+    Arrays that differ only in their values at masked elements have
+    the same token.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+
+    :Returns:
+
+        `str`
+            The token.
+
+    """
+    data = np.ma.getdata(array)
+    mask = np.ma.getmaskarray(array)
+    if mask.any():
+        data = data.copy()
+        data[mask] = np.zeros((), dtype=data.dtype)
+        return tokenize(data, mask)
+
+    return tokenize(data)
+
+
+def _arrays_equal(array0, array1, rtol, atol):
+    """Whether or not two arrays of the same shape are equal.
+
+    Equivalent to `Data.equals` with *ignore_data_type* and
+    *ignore_fill_value* set to True.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array0, array1: `numpy.ndarray`
+            The arrays to compare.
+
+        rtol: `float`
+            The relative tolerance for numerical comparisons.
+
+        atol: `float`
+            The absolute tolerance for numerical comparisons.
+
+    :Returns:
+
+        `bool`
+            Whether or not the arrays are equal.
+
+    """
+    kind0 = array0.dtype.kind
+    kind1 = array1.dtype.kind
+    if kind0 != kind1 and (kind0 not in "ifu" or kind1 not in "ifu"):
+        # Data types are incompatible
+        return False
+
+    if not np.array_equal(
+        np.ma.getmaskarray(array0), np.ma.getmaskarray(array1)
+    ):
+        return False
+
+    if kind0 in "ifuc":
+        return bool(
+            np.ma.allclose(
+                array0, array1, masked_equal=True, rtol=rtol, atol=atol
+            )
+        )
+
+    equal = np.all(array0 == array1)
+    if equal is np.ma.masked:
+        return True
+
+    return bool(equal)
+
+
 def _group_fields(meta, axis, info=False):
     """Return groups of potentially aggregatable fields.
 
@@ -4577,279 +5352,340 @@ def _difference_units(units):
 
 
 @_manage_log_level_via_verbosity
-def _aggregate_2_fields(
-    m0,
-    m1,
-    rtol=None,
-    atol=None,
-    verbose=None,
+def _aggregate_fields(
+    meta,
     concatenate=True,
-    data_concatenation=None,
-    cell_conditions=None,
     relaxed_units=False,
     copy=True,
 ):
-    """Aggregate two fields, returning the _Meta object of the
-    aggregated field.
+    """Aggregate fields along their aggregating axis in a single sweep.
 
-    :Parameters:
+    The fields are assumed to have already been sorted by the
+    canonical first values of their 1-d coordinates for the
+    aggregating axis, and checked for overlaps.
 
-        m0: `_Meta`
+    The data arrays of the fields, and of their metadata constructs
+    that span the aggregating axis, are collected in one pass over
+    the fields and then concatenated with one N-way concatenation for
+    each array, rather than by merging neighbouring fields two at a
+    time. Likewise, the hash values of the aggregated arrays are
+    joined once, so the cost of aggregating N fields is linear in N.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
 
-        m1: `_Meta`
+        meta: `list` of `_Meta`
+            The sorted summaries of the fields to aggregate, which
+            are not changed.
 
-        rtol: `float`, optional
+        concatenate: `bool`, optional
             See the `cf.aggregate` function for details.
 
-        atol: `float`, optional
+        relaxed_units: `bool`, optional
             See the `cf.aggregate` function for details.
 
-        verbose: `int` or `str` or `None`, optional
+        copy: `bool`, optional
             See the `cf.aggregate` function for details.
 
-        data_concatenation: `dict`
-            The dictionary that contains the data arrays for each
-            construct type that will need concatenating. Will be
-            updated in-place.
+    :Returns:
 
-            .. versionadded:: 3.15.1
+        `_Meta`
+            The summary of the aggregated field.
 
     """
+    m0 = meta[0].copy()
     a_identity = m0.a_identity
 
     parent0 = m0.field
-    parent1 = m1.field
-
-    if copy:
-        parent1 = parent1.copy()
-
-    # ----------------------------------------------------------------
-    # Map the axes of parent1 to those of parent0
-    # ----------------------------------------------------------------
-    dim1_name_map = {
-        m1.id_to_axis[identity]: m0.id_to_axis[identity]
-        for identity in m0.axis_ids
-    }
-
-    dim0_name_map = {axis0: axis1 for axis1, axis0 in dim1_name_map.items()}
+    constructs0 = parent0.constructs.todict()
 
     # ----------------------------------------------------------------
-    # In each field, find the identifier of the aggregating axis.
+    # In the first field, find the identifier and direction of the
+    # aggregating axis
     # ----------------------------------------------------------------
     adim0 = m0.id_to_axis[a_identity]
-    adim1 = m1.id_to_axis[a_identity]
-
-    # ----------------------------------------------------------------
-    # Make sure that, along the aggregating axis, parent1 runs in the
-    # same direction as parent0
-    # ----------------------------------------------------------------
     direction0 = parent0.direction(adim0)
-    if parent1.direction(adim1) != direction0:
-        parent1.flip(adim1, inplace=True)
-
-    constructs0 = parent0.constructs.todict()
-    constructs1 = parent1.constructs.todict()
 
     # ----------------------------------------------------------------
-    # Find matching pairs of coordinates and cell measures which span
-    # the aggregating axis
+    # Find the coordinates, cell measures, and field and domain
+    # ancillaries which span the aggregating axis. For each one,
+    # 'spanning' contains the identifier of the construct in the first
+    # field and a function that returns the identifier of the
+    # matching construct in any field.
     # ----------------------------------------------------------------
-    # 1-d coordinates
-    spanning_variables = [
-        (key0, key1, constructs0[key0], constructs1[key1])
-        for key0, key1 in zip(
-            m0.axis[a_identity]["keys"], m1.axis[a_identity]["keys"]
-        )
+    spanning = [
+        (key0, lambda m, i=i: m.axis[a_identity]["keys"][i])
+        for i, key0 in enumerate(m0.axis[a_identity]["keys"])
     ]
 
-    hash_values0 = m0.hash_values[a_identity]
-    hash_values1 = m1.hash_values[a_identity]
-
-    for i, (hash0, hash1) in enumerate(zip(hash_values0, hash_values1)):
-        hash_values0[i] = hash_values0[i] + hash_values1[i]
-
     # N-d auxiliary coordinates
-    for identity in m0.nd_aux:
-        aux0 = m0.nd_aux[identity]
-        aux1 = m1.nd_aux[identity]
+    for identity, aux0 in m0.nd_aux.items():
         if a_identity in aux0["axes"]:
-            key0 = aux0["key"]
-            key1 = aux1["key"]
-            spanning_variables.append(
-                (
-                    key0,
-                    key1,
-                    constructs0[key0],
-                    constructs1[key1],
-                )
+            spanning.append(
+                (aux0["key"], lambda m, i=identity: m.nd_aux[i]["key"])
             )
 
-            hash_value0 = aux0["hash_value"]
-            hash_value1 = aux1["hash_value"]
-            aux0["hash_value"] = hash_value0 + hash_value1
-
     # Cell measures
-    for units in m0.msr:
-        hash_values0 = m0.msr[units]["hash_values"]
-        hash_values1 = m1.msr[units]["hash_values"]
-        for i, (axes, key0, key1) in enumerate(
-            zip(
-                m0.msr[units]["axes"],
-                m0.msr[units]["keys"],
-                m1.msr[units]["keys"],
-            )
-        ):
+    for units, msr0 in m0.msr.items():
+        for i, (axes, key0) in enumerate(zip(msr0["axes"], msr0["keys"])):
             if a_identity in axes:
-                spanning_variables.append(
-                    (
-                        key0,
-                        key1,
-                        constructs0[key0],
-                        constructs1[key1],
-                    )
+                spanning.append(
+                    (key0, lambda m, u=units, i=i: m.msr[u]["keys"][i])
                 )
 
-                hash_values0[i] = hash_values0[i] + hash_values1[i]
-
     # Field ancillaries
-    for identity in m0.field_anc:
-        anc0 = m0.field_anc[identity]
-        anc1 = m1.field_anc[identity]
+    for identity, anc0 in m0.field_anc.items():
         if a_identity in anc0["axes"]:
             key0 = anc0["key"]
-            key1 = anc1["key"]
-            spanning_variables.append(
-                (
-                    key0,
-                    key1,
-                    constructs0[key0],
-                    constructs1[key1],
-                )
+            spanning.append(
+                (key0, lambda m, i=identity: m.field_anc[i]["key"])
             )
 
-            hash_value0 = anc0["hash_value"]
-            hash_value1 = anc1["hash_value"]
-            anc0["hash_value"] = hash_value0 + hash_value1
-
-            # The result of aggregating a promoted amd non-promoted
+            # The result of aggregating a promoted and non-promoted
             # field ancillary is a non-promoted field ancillary
-            if (
-                key0 in m0.promoted_field_ancillaries
-                and key1 not in m1.promoted_field_ancillaries
+            if key0 in m0.promoted_field_ancillaries and any(
+                m1.field_anc[identity]["key"]
+                not in m1.promoted_field_ancillaries
+                for m1 in meta[1:]
             ):
-                m0.promoted_field_ancillaries.remove(key0)
+                m0.promoted_field_ancillaries = [
+                    key for key in m0.promoted_field_ancillaries if key != key0
+                ]
 
     # Domain ancillaries
-    for identity in m0.domain_anc:
-        anc0 = m0.domain_anc[identity]
-        anc1 = m1.domain_anc[identity]
+    for identity, anc0 in m0.domain_anc.items():
         if a_identity in anc0["axes"]:
-            key0 = anc0["key"]
-            key1 = anc1["key"]
-            spanning_variables.append(
-                (
-                    key0,
-                    key1,
-                    constructs0[key0],
-                    constructs1[key1],
-                )
+            spanning.append(
+                (anc0["key"], lambda m, i=identity: m.domain_anc[i]["key"])
             )
 
-            hash_value0 = anc0["hash_value"]
-            hash_value1 = anc1["hash_value"]
-            anc0["hash_value"] = hash_value0 + hash_value1
+    # ----------------------------------------------------------------
+    # Map the axes of each other field to those of the first field,
+    # and make sure that each other field runs in the same direction
+    # as the first field along the aggregating axis.
+    # ----------------------------------------------------------------
+    parents = []
+    for m1 in meta[1:]:
+        parent1 = m1.field
+        adim1 = m1.id_to_axis[a_identity]
+        if parent1.direction(adim1) != direction0:
+            parent1 = parent1.flip(adim1)
+
+        dim0_name_map = {
+            m0.id_to_axis[identity]: m1.id_to_axis[identity]
+            for identity in m0.axis_ids
+        }
+        parents.append((m1, parent1, dim0_name_map))
 
     # ----------------------------------------------------------------
-    # For each matching pair of coordinates, cell measures, and field
-    # and domain ancillaries which span the aggregating axis, insert
-    # the one from parent1 into the one from parent0
+    # Collect the constructs to be concatenated, in the order of the
+    # sorted fields. Each construct is transposed to have the same
+    # axis order as the construct in the first field.
     # ----------------------------------------------------------------
-    for key0, key1, construct0, construct1 in spanning_variables:
+    construct_concatenation = {}
+    for key0, get_key in spanning:
+        construct0 = constructs0[key0]
         construct_axes0 = parent0.get_data_axes(key0)
-        construct_axes1 = parent1.get_data_axes(key1)
-
-        # Ensure that the axis orders are the same in both constructs
-        iaxes = [
-            construct_axes1.index(dim0_name_map[axis0])
-            for axis0 in construct_axes0
-        ]
-        construct1.transpose(iaxes, inplace=True)
-
-        # Find the position of the concatenating axis
-        axis = construct_axes0.index(adim0)
-
-        construct_type = construct0.construct_type
-        key = (key0, axis)
-        if direction0:
-            # The fields are increasing along the aggregating axis
-            data_concatenation[construct_type].setdefault(
-                key, [construct0]
-            ).append(construct1)
-        else:
-            # The fields are decreasing along the aggregating axis
-            data_concatenation[construct_type].setdefault(
-                key, [construct1]
-            ).append(construct0)
+        constructs = [construct0]
+        for m1, parent1, dim0_name_map in parents:
+            key1 = get_key(m1)
+            construct1 = parent1.constructs[key1]
+            construct_axes1 = parent1.get_data_axes(key1)
+            iaxes = [
+                construct_axes1.index(dim0_name_map[axis0])
+                for axis0 in construct_axes0
+            ]
+            if iaxes != sorted(iaxes):
+                construct1 = construct1.transpose(iaxes)
+
+            constructs.append(construct1)
+
+        construct_concatenation[key0] = (
+            construct_axes0.index(adim0),
+            constructs,
+        )
 
     # ----------------------------------------------------------------
-    # Update the size of the aggregating axis in the output parent
-    # construct
+    # Collect the data arrays to be concatenated
     # ----------------------------------------------------------------
     if m0.has_field_data:
-        # ----------------------------------------------------------------
-        # Insert the data array from parent1 into the data array of
-        # parent0
-        # ----------------------------------------------------------------
+        # Ensure that the data of the first field spans every axis
+        # that is spanned by the data of any field, including the
+        # aggregating axis.
         data_axes0 = list(parent0.get_data_axes())
-        data_axes1 = list(parent1.get_data_axes())
-
-        # Ensure that both data arrays span the same axes, including
-        # the aggregating axis.
-        for axis1 in data_axes1:
-            axis0 = dim1_name_map[axis1]
-            if axis0 not in data_axes0:
-                parent0.insert_dimension(axis0, position=0, inplace=True)
-                data_axes0.insert(0, axis0)
-
-        for axis0 in data_axes0:
-            axis1 = dim0_name_map[axis0]
-            if axis1 not in data_axes1:
-                parent1.insert_dimension(axis1, position=0, inplace=True)
-
-        # Find the position of the concatenating axis
+        for m1, parent1, dim0_name_map in parents:
+            dim1_name_map = {
+                axis1: axis0 for axis0, axis1 in dim0_name_map.items()
+            }
+            for axis1 in parent1.get_data_axes():
+                axis0 = dim1_name_map[axis1]
+                if axis0 not in data_axes0:
+                    parent0.insert_dimension(axis0, position=0, inplace=True)
+                    data_axes0.insert(0, axis0)
+
         if adim0 not in data_axes0:
-            # Insert the aggregating axis at position 0 because is not
-            # already spanned by either data arrays
             parent0.insert_dimension(adim0, position=0, inplace=True)
-            parent1.insert_dimension(adim1, position=0, inplace=True)
-            axis = 0
-        else:
-            axis = data_axes0.index(adim0)
-
-        # Get the data axes again, in case we've inserted new dimensions
-        data_axes0 = parent0.get_data_axes()
-        data_axes1 = parent1.get_data_axes()
-
-        # Ensure that the axis orders are the same in both fields
-        transpose_axes1 = [dim0_name_map[axis0] for axis0 in data_axes0]
-        if transpose_axes1 != list(data_axes1):
-            parent1.transpose(transpose_axes1, inplace=True)
-
-        construct_type = parent0.construct_type
-        if direction0:
-            # The fields are increasing along the aggregating axis
-            data_concatenation[construct_type].setdefault(
-                axis, [parent0.get_data()]
-            ).append(parent1.get_data())
-        else:
-            # The fields are decreasing along the aggregating axis
-            data_concatenation[construct_type].setdefault(
-                axis, [parent1.get_data()]
-            ).append(parent0.get_data())
+            data_axes0.insert(0, adim0)
+
+        # Ensure that the data of each other field spans the same
+        # axes, in the same order, as the data of the first field
+        arrays = [parent0.get_data()]
+        for m1, parent1, dim0_name_map in parents:
+            data1 = parent1.get_data()
+            data_axes1 = list(parent1.get_data_axes())
+            for axis0 in data_axes0:
+                axis1 = dim0_name_map[axis0]
+                if axis1 not in data_axes1:
+                    data1 = data1.insert_dimension(0)
+                    data_axes1.insert(0, axis1)
+
+            iaxes = [
+                data_axes1.index(dim0_name_map[axis0]) for axis0 in data_axes0
+            ]
+            if iaxes != sorted(iaxes):
+                data1 = data1.transpose(iaxes)
+
+            arrays.append(data1)
 
-    # Update the size of the aggregating axis in parent0
+    # ----------------------------------------------------------------
+    # Update the size of the aggregating axis
+    # ----------------------------------------------------------------
     domain_axis = constructs0[adim0]
-    domain_axis += constructs1[adim1].get_size()
+    domain_axis.set_size(
+        domain_axis.get_size()
+        + sum(
+            parent1.domain_axis(m1.id_to_axis[a_identity]).get_size()
+            for m1, parent1, _ in parents
+        )
+    )
+
+    # ----------------------------------------------------------------
+    # Update the properties of the aggregated field with those of
+    # each other field, in order.
+    # ----------------------------------------------------------------
+    for m1, parent1, _ in parents:
+        _aggregate_properties(m0, parent1, concatenate)
+
+    # ----------------------------------------------------------------
+    # Concatenate the data arrays. If the fields are decreasing along
+    # the aggregating axis then their arrays are concatenated in
+    # reverse order.
+    # ----------------------------------------------------------------
+    if m0.has_field_data:
+        if not direction0:
+            arrays = arrays[::-1]
+
+        data = Data.concatenate(
+            arrays,
+            data_axes0.index(adim0),
+            relaxed_units=relaxed_units,
+            copy=copy,
+        )
+        parent0.set_data(data, set_axes=False, copy=False)
+
+    for key0, (iaxis, constructs) in construct_concatenation.items():
+        if not direction0:
+            constructs = constructs[::-1]
+
+        c = constructs[0].concatenate(
+            constructs,
+            iaxis,
+            relaxed_units=relaxed_units,
+            copy=copy,
+        )
+        parent0.set_construct(
+            c,
+            axes=parent0.get_data_axes(key0),
+            key=key0,
+            copy=False,
+        )
+
+    # ----------------------------------------------------------------
+    # Join the hash values of the aggregated arrays. New containers
+    # are created so that the summary of the first field is not
+    # changed.
+    # ----------------------------------------------------------------
+    def join(hash_values):
+        return tuple(chain.from_iterable(hash_values))
+
+    m0.hash_values = m0.hash_values.copy()
+    m0.hash_values[a_identity] = [
+        join(m.hash_values[a_identity][i] for m in meta)
+        for i in range(len(m0.hash_values[a_identity]))
+    ]
+
+    for attr in ("nd_aux", "field_anc", "domain_anc"):
+        values = getattr(m0, attr).copy()
+        for identity, value in values.items():
+            if a_identity in value["axes"]:
+                values[identity] = {
+                    **value,
+                    "hash_value": join(
+                        getattr(m, attr)[identity]["hash_value"] for m in meta
+                    ),
+                }
+
+        setattr(m0, attr, values)
+
+    msr = m0.msr.copy()
+    for units, value in msr.items():
+        msr[units] = {
+            **value,
+            "hash_values": [
+                (
+                    join(m.msr[units]["hash_values"][i] for m in meta)
+                    if a_identity in axes
+                    else hash_value
+                )
+                for i, (axes, hash_value) in enumerate(
+                    zip(value["axes"], value["hash_values"])
+                )
+            ],
+        }
+
+    m0.msr = msr
+
+    # Record the last cell of the aggregated field along the
+    # aggregating axis, so that it may be aggregated again (see the
+    # 'into' parameter of `cf.aggregate`)
+    m0.last_values = m0.last_values.copy()
+    m0.last_values[a_identity] = meta[-1].last_values[a_identity]
+    if a_identity in m0.last_bounds:
+        m0.last_bounds = m0.last_bounds.copy()
+        m0.last_bounds[a_identity] = meta[-1].last_bounds[a_identity]
+
+    # Make a note that the parent construct in this _Meta object has
+    # already been aggregated
+    m0.aggregated_field = True
+
+    return m0
+
+
+def _aggregate_properties(m0, parent1, concatenate=True):
+    """Update the properties of an aggregated field with another's.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        m0: `_Meta`
+            The summary of the aggregated field, whose properties
+            are updated in-place.
+
+        parent1: `Field` or `Domain`
+            The field or domain construct being aggregated into the
+            aggregated field.
+
+        concatenate: `bool`, optional
+            See the `cf.aggregate` function for details.
+
+    :Returns:
+
+        `None`
+
+    """
+    parent0 = m0.field
 
     # Make sure that parent0 has a standard_name, if possible.
     if getattr(parent0, "id", None) is not None:
@@ -4932,16 +5768,6 @@ def _aggregate_2_fields(
                 # valid_range is non-CF-compliant
                 pass
 
-    # Make a note that the parent construct in this _Meta object has
-    # already been aggregated
-    m0.aggregated_field = True
-
-    # ----------------------------------------------------------------
-    # Return the _Meta object containing the aggregated parent
-    # construct
-    # ----------------------------------------------------------------
-    return m0
-
 
 def f_identity(meta):
     """Return the field identity for logging strings.
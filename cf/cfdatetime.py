@@ -1,5 +1,6 @@
 import datetime
-from functools import partial
+from functools import lru_cache, partial
+from operator import attrgetter
 
 import cftime
 import numpy as np
@@ -453,6 +454,11 @@ def rt2dt(array, units_in, units_out=None, dummy1=None):
     units = units_in.units
     calendar = getattr(units_in, "calendar", "standard")
 
+    if ndim:
+        elements = rt2elements(np.asanyarray(array), units_in)
+        if elements is not None:
+            return elements2dt(elements, calendar)
+
     array = cftime.num2date(
         array, units, calendar, only_use_cftime_datetimes=True
     )
@@ -512,6 +518,11 @@ def dt2rt(array, units_in, units_out, dummy1=None):
     """
     isscalar = not np.ndim(array)
 
+    if not isscalar and np.size(array):
+        rt = _dt2rt(array, units_out)
+        if rt is not None:
+            return rt
+
     array = cftime.date2num(
         array, units=units_out.units, calendar=units_out._utime.calendar
     )
@@ -525,6 +536,53 @@ def dt2rt(array, units_in, units_out, dummy1=None):
     return array
 
 
+def _dt2rt(array, units):
+    """Return numeric time values from datetime objects.
+
+    The values are calculated with integer calendar arithmetic from
+    the elements of the date-time objects.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `dt2rt`, `elements2rt`
+
+    :Parameters:
+
+        array: numpy array-like of date-time objects
+            The date-time objects.
+
+        units: `Units`
+            The units of the numeric time values.
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The numeric time values, or `None` if they can't be
+            calculated with integer calendar arithmetic, in which case
+            `cftime.date2num` should be used instead.
+
+    """
+    array = np.asanyarray(array)
+    if np.ma.is_masked(array):
+        mask = np.ma.getmaskarray(array)
+        x = np.ma.getdata(array)[~mask]
+    else:
+        mask = None
+        x = np.ma.getdata(array)
+
+    elements = dt2elements(x)
+    if elements is None:
+        return
+
+    rt = elements2rt(elements, units)
+    if rt is None or mask is None:
+        return rt
+
+    out = np.ma.masked_all(array.shape, dtype=float)
+    out[~mask] = rt
+    return out
+
+
 def st2rt(array, units_in, units_out, dummy1=None):
     """The returned array is always independent.
 
@@ -555,3 +613,611 @@ def st2rt(array, units_in, units_out, dummy1=None):
         array = np.asanyarray(array)
 
     return array
+
+
+# --------------------------------------------------------------------
+# Integer calendar arithmetic
+# --------------------------------------------------------------------
+# The number of microseconds in each time unit that `cftime` allows
+# for reference time units in any calendar
+_microseconds = {
+    "microseconds": 1,
+    "microsecond": 1,
+    "microsec": 1,
+    "microsecs": 1,
+    "milliseconds": 1000,
+    "millisecond": 1000,
+    "millisec": 1000,
+    "millisecs": 1000,
+    "msec": 1000,
+    "msecs": 1000,
+    "ms": 1000,
+    "seconds": 1000000,
+    "second": 1000000,
+    "sec": 1000000,
+    "secs": 1000000,
+    "s": 1000000,
+    "minutes": 60000000,
+    "minute": 60000000,
+    "min": 60000000,
+    "mins": 60000000,
+    "hours": 3600000000,
+    "hour": 3600000000,
+    "hr": 3600000000,
+    "hrs": 3600000000,
+    "h": 3600000000,
+    "days": 86400000000,
+    "day": 86400000000,
+    "d": 86400000000,
+}
+
+_microseconds_per_day = 86400000000
+
+# The calendars supported by integer calendar arithmetic
+_integer_calendar = {
+    "standard": "standard",
+    "gregorian": "standard",
+    "proleptic_gregorian": "proleptic_gregorian",
+    "julian": "julian",
+    "noleap": "noleap",
+    "365_day": "noleap",
+    "all_leap": "all_leap",
+    "366_day": "all_leap",
+    "360_day": "360_day",
+}
+
+# The number of days before the start of each month, and in the
+# year, for calendars with fixed year lengths
+_cumulative_days = {
+    "noleap": np.cumsum([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]),
+    "all_leap": np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]),
+}
+
+# The Julian day number of the first day of the Gregorian calendar
+# in the standard calendar, i.e. 1582-10-15
+_gregorian_start = 2299161
+
+# The elements of a date-time object
+_elements = attrgetter(
+    "year", "month", "day", "hour", "minute", "second", "microsecond"
+)
+
+# The positions of date-time components in date-time elements
+element_index = {
+    "year": 0,
+    "month": 1,
+    "day": 2,
+    "hour": 3,
+    "minute": 4,
+    "second": 5,
+    "microsecond": 6,
+}
+
+
+@lru_cache(maxsize=256)
+def _reference_time(units, calendar):
+    """Parse reference time units for integer calendar arithmetic.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        units: `str`
+            The reference time units, e.g. ``'days since
+            2000-01-01'``.
+
+        calendar: `str`
+            The calendar of the reference time units.
+
+    :Returns:
+
+        `tuple` or `None`
+            The canonical calendar name, the number of microseconds
+            in a time unit, the day number of the reference date-time
+            and the microsecond of that day. `None` is returned if
+            the units or calendar are not supported, in which case
+            `cftime` should be used instead.
+
+    """
+    calendar = calendar.lower()
+    integer_calendar = _integer_calendar.get(calendar)
+    if integer_calendar is None:
+        return
+
+    try:
+        unit = units.split(None, 1)[0].lower()
+    except IndexError:
+        return
+
+    factor = _microseconds.get(unit)
+    if factor is None:
+        return
+
+    try:
+        # Let cftime parse the reference date-time, so that any time
+        # zone offset is applied in the same way
+        reftime = cftime.num2date(
+            0, units, calendar, only_use_cftime_datetimes=True
+        )
+    except Exception:
+        return
+
+    year, month, day, hour, minute, second, microsecond = _elements(reftime)
+    day0 = _day_number(
+        _astronomical_year(np.array(year), integer_calendar),
+        np.array(month),
+        np.array(day),
+        integer_calendar,
+    )
+    time0 = ((hour * 60 + minute) * 60 + second) * 1000000 + microsecond
+
+    return integer_calendar, factor, int(day0), time0
+
+
+def _astronomical_year(year, calendar):
+    """Return astronomical year numbers.
+
+    Calendars without a year zero (``'standard'`` and ``'julian'``)
+    number the year before year 1 as -1, rather than 0.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+    if calendar in ("standard", "julian"):
+        return year + (year < 0)
+
+    return year
+
+
+def _historical_year(year, calendar):
+    """Return year numbers from astronomical year numbers.
+
+    The inverse of `_astronomical_year`.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+    if calendar in ("standard", "julian"):
+        return year - (year <= 0)
+
+    return year
+
+
+def _day_number(year, month, day, calendar):
+    """Return the day numbers of dates.
+
+    For the ``'standard'``, ``'proleptic_gregorian'`` and
+    ``'julian'`` calendars the day number is the Julian day number,
+    and for other calendars it is the number of days since 0000-01-01.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        year, month, day: `numpy.ndarray`
+            The integer dates, with astronomical year numbers.
+
+        calendar: `str`
+            The canonical calendar name.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The integer day numbers.
+
+    """
+    if calendar == "360_day":
+        return year * 360 + (month - 1) * 30 + day - 1
+
+    cumulative_days = _cumulative_days.get(calendar)
+    if cumulative_days is not None:
+        return (
+            year * cumulative_days[-1] + cumulative_days[month - 1] + day - 1
+        )
+
+    # Count years from March, so that any leap day is the last day of
+    # the year
+    year = year - (month <= 2)
+    day_of_year = (153 * ((month + 9) % 12) + 2) // 5 + day - 1
+
+    if calendar != "julian":
+        era = year // 400
+        year_of_era = year - era * 400
+        gregorian = (
+            era * 146097
+            + year_of_era * 365
+            + year_of_era // 4
+            - year_of_era // 100
+            + day_of_year
+            + 1721120
+        )
+        if calendar == "proleptic_gregorian":
+            return gregorian
+
+    era = year // 4
+    julian = era * 1461 + (year - era * 4) * 365 + day_of_year + 1721118
+    if calendar == "julian":
+        return julian
+
+    return np.where(gregorian >= _gregorian_start, gregorian, julian)
+
+
+def _date(day_number, calendar):
+    """Return the dates of day numbers.
+
+    The inverse of `_day_number`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        day_number: `numpy.ndarray`
+            The integer day numbers.
+
+        calendar: `str`
+            The canonical calendar name.
+
+    :Returns:
+
+        3-`tuple` of `numpy.ndarray`
+            The year, month and day of each day number, with
+            astronomical year numbers.
+
+    """
+    if calendar == "360_day":
+        year, day = np.divmod(day_number, 360)
+        month, day = np.divmod(day, 30)
+        return year, month + 1, day + 1
+
+    cumulative_days = _cumulative_days.get(calendar)
+    if cumulative_days is not None:
+        year, day = np.divmod(day_number, cumulative_days[-1])
+        month = np.searchsorted(cumulative_days, day, side="right")
+        return year, month, day - cumulative_days[month - 1] + 1
+
+    if calendar == "julian":
+        year, day_of_year = _julian_year(day_number)
+    elif calendar == "proleptic_gregorian":
+        year, day_of_year = _gregorian_year(day_number)
+    else:
+        gregorian = day_number >= _gregorian_start
+        year, day_of_year = _gregorian_year(day_number)
+        if not gregorian.all():
+            j_year, j_day_of_year = _julian_year(day_number)
+            year = np.where(gregorian, year, j_year)
+            day_of_year = np.where(gregorian, day_of_year, j_day_of_year)
+
+    month = (5 * day_of_year + 2) // 153
+    day = day_of_year - (153 * month + 2) // 5 + 1
+    month = np.where(month < 10, month + 3, month - 9)
+    return year + (month <= 2), month, day
+
+
+def _gregorian_year(day_number):
+    """Return the March-based Gregorian years of Julian day numbers.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        day_number: `numpy.ndarray`
+            The integer Julian day numbers.
+
+    :Returns:
+
+        2-`tuple` of `numpy.ndarray`
+            The astronomical year that starts on the 1st of March,
+            and the day of that year, starting at zero.
+
+    """
+    era, day_of_era = np.divmod(day_number - 1721120, 146097)
+    year = (
+        day_of_era
+        - day_of_era // 1460
+        + day_of_era // 36524
+        - day_of_era // 146096
+    ) // 365
+    day_of_year = day_of_era - (year * 365 + year // 4 - year // 100)
+    return year + era * 400, day_of_year
+
+
+def _julian_year(day_number):
+    """Return the March-based Julian years of Julian day numbers.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        day_number: `numpy.ndarray`
+            The integer Julian day numbers.
+
+    :Returns:
+
+        2-`tuple` of `numpy.ndarray`
+            The astronomical year that starts on the 1st of March,
+            and the day of that year, starting at zero.
+
+    """
+    era, day_of_era = np.divmod(day_number - 1721118, 1461)
+    year = np.minimum(day_of_era // 365, 3)
+    day_of_year = day_of_era - year * 365
+    return year + era * 4, day_of_year
+
+
+def rt2elements(array, units):
+    """Convert reference times to date-time elements.
+
+    The year, month, day, hour, minute, second and microsecond of
+    each reference time are calculated with vectorised integer
+    arithmetic, rather than by creating date-time objects. The results
+    are identical to those of `cftime.num2date`.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `elements2rt`, `rt2dt`
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The numeric reference times.
+
+        units: `Units`
+            The reference time units.
+
+    :Returns:
+
+        7-`tuple` of `numpy.ndarray` or `None`
+            The integer year, month, day, hour, minute, second and
+            microsecond of each reference time, or `None` if the
+            calendar or units are not supported, or the values are out
+            of range, in which case `cftime` should be used instead.
+            Each array is masked where *array* is masked or not
+            finite.
+
+    **Examples**
+
+    >>> y, m, d, H, M, S, u = cf.cfdatetime.rt2elements(
+    ...     np.array([0, 685.5]), cf.Units('days since 2000-01-01')
+    ... )
+    >>> print(y, m, d, H)
+    [2000 2001] [ 1 11] [ 1 16] [ 0 12]
+
+    """
+    reftime = _reference_time(
+        units.units, getattr(units, "calendar", "standard")
+    )
+    if reftime is None:
+        return
+
+    calendar, factor, day0, time0 = reftime
+
+    shape = np.shape(array)
+    x = np.ma.getdata(array).reshape(-1)
+    kind = x.dtype.kind
+    if kind not in "fiu":
+        return
+
+    if np.ma.isMA(array):
+        mask = np.ma.getmaskarray(array).reshape(-1)
+    else:
+        mask = None
+
+    # Convert to integer microseconds since the reference date-time,
+    # rounding as is done by `cftime.num2date`
+    if kind == "f":
+        finite = np.isfinite(x)
+        if not finite.all():
+            if mask is None:
+                mask = ~finite
+            else:
+                mask = mask | ~finite
+
+        if mask is not None:
+            x = np.where(mask, 0, x)
+
+        x = x.astype(np.longdouble) * factor
+        if x.size and (x.min() < -(2**62) or x.max() > 2**62):
+            return
+
+        us = np.rint(x).astype(np.int64)
+        if factor >= 1000000:
+            # Round down values that are 1 microsecond more than a
+            # whole second, and up values that are 1 microsecond less
+            remainder = us % 1000000
+            for r, func in ((1, np.floor), (999999, np.ceil)):
+                index = np.nonzero(remainder == r)
+                if index[0].size:
+                    us[index] = func(x[index])
+    else:
+        if mask is not None:
+            x = np.where(mask, 0, x)
+
+        if x.size and (
+            max(abs(int(x.min())), abs(int(x.max()))) * factor > 2**62
+        ):
+            return
+
+        us = x.astype(np.int64) * factor
+
+    day_number, us = np.divmod(us + time0, _microseconds_per_day)
+    day_number += day0
+
+    year, month, day = _date(day_number, calendar)
+    year = _historical_year(year, calendar)
+    hour, us = np.divmod(us, 3600000000)
+    minute, us = np.divmod(us, 60000000)
+    second, microsecond = np.divmod(us, 1000000)
+
+    elements = (year, month, day, hour, minute, second, microsecond)
+    elements = tuple(e.reshape(shape) for e in elements)
+    if mask is not None:
+        mask = mask.reshape(shape)
+        elements = tuple(np.ma.array(e, mask=mask) for e in elements)
+
+    return elements
+
+
+def elements2rt(elements, units):
+    """Convert date-time elements to reference times.
+
+    The reference times are calculated with vectorised integer
+    arithmetic, rather than from date-time objects. The results are
+    identical to those of `cftime.date2num`: integers if every
+    reference time is a whole number of units, and floats otherwise.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `dt2elements`, `rt2elements`
+
+    :Parameters:
+
+        elements: sequence of `numpy.ndarray`
+            The integer year, month, day, hour, minute, second and
+            microsecond of each date-time.
+
+        units: `Units`
+            The reference time units.
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            The reference times, or `None` if the calendar or units
+            are not supported, any date is not valid in the calendar,
+            or the values are out of range, in which case `cftime`
+            should be used instead.
+
+    **Examples**
+
+    >>> cf.cfdatetime.elements2rt(
+    ...     ([2000, 2001], [1, 11], [1, 16], [0, 12], [0, 0], [0, 0], [0, 0]),
+    ...     cf.Units('days since 2000-01-01')
+    ... )
+    array([  0. , 685.5])
+
+    """
+    reftime = _reference_time(
+        units.units, getattr(units, "calendar", "standard")
+    )
+    if reftime is None:
+        return
+
+    calendar, factor, day0, time0 = reftime
+
+    year, month, day, hour, minute, second, microsecond = (
+        np.asanyarray(e, dtype=np.int64) for e in elements
+    )
+    if not year.size or np.abs(year).max() > 10**6:
+        return
+
+    if calendar in ("standard", "julian") and (year == 0).any():
+        # No year zero
+        return
+
+    year = _astronomical_year(year, calendar)
+    if (
+        (month < 1).any()
+        or (month > 12).any()
+        or (day < 1).any()
+        or (day > 31).any()
+    ):
+        return
+
+    day_number = _day_number(year, month, day, calendar)
+
+    # Dates that are not valid in the calendar (which `cftime` would
+    # reject) don't survive the round trip
+    for x, y in zip(_date(day_number, calendar), (year, month, day)):
+        if not np.array_equal(x, y):
+            return
+
+    us = (day_number - day0) * _microseconds_per_day + (
+        ((hour * 60 + minute) * 60 + second) * 1000000 + microsecond - time0
+    )
+
+    rt, remainder = np.divmod(us, factor)
+    if not remainder.any():
+        return rt
+
+    rt = us / factor
+
+    # Microseconds that can't be converted exactly to double
+    # precision are divided as Python integers, as is done by
+    # `cftime.date2num`
+    large = np.abs(us) > 2**53
+    if large.any():
+        rt[large] = [x / factor for x in us[large].tolist()]
+
+    return rt
+
+
+def dt2elements(array):
+    """Return the elements of date-time objects.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `elements2rt`
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            An array of `cftime.datetime` objects.
+
+    :Returns:
+
+        7-`tuple` of `numpy.ndarray` or `None`
+            The integer year, month, day, hour, minute, second and
+            microsecond of each date-time object, or `None` if any
+            element is not a `cftime.datetime` object.
+
+    """
+    array = np.asanyarray(array)
+    if not all(
+        issubclass(t, cftime.datetime) for t in set(map(type, array.flat))
+    ):
+        return
+
+    shape = array.shape
+    elements = np.array(list(map(_elements, array.flat)), dtype=np.int64)
+    return tuple(e.reshape(shape) for e in elements.T)
+
+
+def elements2dt(elements, calendar):
+    """Create date-time objects from date-time elements.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `rt2elements`
+
+    :Parameters:
+
+        elements: sequence of `numpy.ndarray`
+            The integer year, month, day, hour, minute, second and
+            microsecond of each date-time.
+
+        calendar: `str`
+            The calendar of the date-time objects.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The date-time objects, masked where the elements are
+            masked.
+
+    """
+    calendar = calendar.lower()
+    for calendars, datetime_object in _datetime_object.items():
+        if calendar in calendars:
+            break
+
+    mask = np.ma.getmask(elements[0])
+    elements = [np.ma.getdata(e) for e in elements]
+    array = np.frompyfunc(partial(datetime_object, calendar=calendar), 7, 1)(
+        *elements
+    )
+    if not isinstance(array, np.ndarray):
+        array = np.array(array, dtype=object)
+
+    if mask is not np.ma.nomask:
+        array = np.ma.array(array, mask=mask)
+
+    return array
@@ -52,6 +52,18 @@ in cf.
       The minimal level of seriousness for which log messages are
       shown. See `cf.log_level`.
 
+    MAX_OPEN_FILES: `int`
+      The maximum number of idle PP and UM files kept open. See
+      `cf.max_open_files`.
+
+    READ_CACHE_SIZE: `int`
+      The maximum size in bytes of the in-memory cache of the
+      constructs read from files. See `cf.read_cache_size`.
+
+    HASH_CACHE_SIZE: `int`
+      The maximum size in bytes of the in-memory cache of the metadata
+      arrays used for aggregation. See `cf.hash_cache_size`.
+
 """
 CONSTANTS = {
     "ATOL": sys.float_info.epsilon,
@@ -66,6 +78,9 @@ CONSTANTS = {
     "active_storage": False,
     "active_storage_url": None,
     "active_storage_max_requests": 100,
+    "MAX_OPEN_FILES": 64,
+    "READ_CACHE_SIZE": 0,
+    "HASH_CACHE_SIZE": 0,
 }
 
 masked = np.ma.masked
@@ -75,6 +90,11 @@ repr_suffix = ""
 
 _stash2standard_name = {}
 
+# The STASH to standard name conversion table entries that are valid
+# for each UM version, keyed by (submodel, STASH code, UM version)
+# tuples. See `cf.functions._stash2standard_name_records`.
+_stash2standard_name_versions = {}
+
 # ---------------------------------------------------------------------
 # Coordinate reference constants TODO: turn these into functions
 # ---------------------------------------------------------------------
@@ -1,8 +1,16 @@
+from numbers import Integral
+
 import cfdm
+import numpy as np
 
 from ...constants import _stash2standard_name
-from ...functions import _DEPRECATION_ERROR_ATTRIBUTE, load_stash2standard_name
-from ...umread_lib.umfile import File, Rec
+from ...functions import (
+    _DEPRECATION_ERROR_ATTRIBUTE,
+    _stash2standard_name_records,
+    load_stash2standard_name,
+)
+from ...umread_lib.filepool import file_pool
+from ...umread_lib.umfile import LBPACK, Rec
 from .abstract import Array
 
 
@@ -26,6 +34,7 @@ class UMArray(
         unpack=True,
         attributes=None,
         storage_options=None,
+        mmap=False,
         source=None,
         copy=True,
     ):
@@ -37,7 +46,15 @@ class UMArray(
                 The file name(s).
 
             address: (sequence of) `int`, optional
-                The start position in the file(s) of the header(s).
+                The start position in the file of the lookup header
+                of the record containing the data.
+
+                If a sequence of positions is given then the data
+                comprise the records at each of those positions, read
+                with a single opening of the file, and arranged in
+                row-major order along the leading dimensions of
+                *shape*. In this case the last two dimensions of
+                *shape* are the shape of each record.
 
                 .. versionadded:: 3.15.0
 
@@ -70,6 +87,23 @@ class UMArray(
 
                 .. versionadded:: 3.16.3
 
+            mmap: `bool`, optional
+                If True then the data of records that are not packed
+                are accessed via a memory map of the file, so that the
+                index is applied before any data are copied into
+                memory and only the parts of the file that are needed
+                are read from disk. If False, the default, then every
+                selected record is read into memory in its entirety
+                before the index is applied. Packed records are always
+                read into memory in their entirety.
+
+                .. warning:: If the file is truncated whilst it is
+                             memory mapped then accessing the data
+                             may terminate the Python process, rather
+                             than raise an exception.
+
+                .. versionadded:: NEXTVERSION
+
             {{init source: optional}}
 
             {{init copy: `bool`, optional}}
@@ -128,6 +162,11 @@ class UMArray(
             except AttributeError:
                 byte_ordering = None
 
+            try:
+                mmap = source._get_component("mmap", False)
+            except AttributeError:
+                mmap = False
+
         if fmt is not None:
             self._set_component("fmt", fmt, copy=False)
 
@@ -137,7 +176,10 @@ class UMArray(
         if word_size is not None:
             self._set_component("word_size", word_size, copy=False)
 
-        # By default, close the UM file after data array access
+        self._set_component("mmap", bool(mmap), copy=False)
+
+        # By default, return the UM file to the pool of open files
+        # after data array access
         self._set_component("close", True, copy=False)
 
     def _get_array(self, index=None):
@@ -162,22 +204,78 @@ class UMArray(
         if index is None:
             index = self.index()
 
-        f, header_offset = self.open()
-        rec = self._get_rec(f, header_offset)
+        f, address = self.open()
+        try:
+            if isinstance(address, Integral):
+                # Read a single record
+                attributes = self.get_attributes({})
+                array = self._get_record_array(
+                    self._get_rec(f, address),
+                    self.original_shape,
+                    index,
+                    attributes,
+                )
+            else:
+                # Read multiple records from the same open file
+                array, attributes = self._get_records_array(f, address, index)
+        finally:
+            self.close(f)
+
+        # Set the netCDF attributes for the data
+        self._set_component("attributes", attributes, copy=False)
+
+        # Set the data type
+        self._set_component("dtype", array.dtype, copy=False)
+
+        # Return the numpy array
+        return array
+
+    def _get_record_array(self, rec, shape, index, attributes, data=None):
+        """Returns a subspace of one record.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_get_array`, `_get_records_array`
+
+        :Parameters:
+
+            rec: `umread_lib.umfile.Rec`
+                The record.
+
+            shape: `tuple`
+                The shape to which the record's data is reshaped
+                before *index* is applied.
+
+            {{index: `tuple` or `None`, optional}}
+
+            attributes: `dict`
+                The netCDF attributes of the data. Any attributes
+                which haven't already been set will be inferred from
+                the record's lookup header, in which case
+                *attributes* is updated in-place.
+
+            data: `numpy.ndarray`, optional
+                The record's data, if they have already been read
+                from the file. By default they are read from the file.
 
+        :Returns:
+
+            `numpy.ndarray`
+                The subspace of the record.
+
+        """
         int_hdr = rec.int_hdr
         real_hdr = rec.real_hdr
-        array = rec.get_data().reshape(self.original_shape)
+        if data is None:
+            data = rec.get_data(mmap=self._get_component("mmap", False))
 
-        self.close(f)
-        del f, rec
+        array = data.reshape(shape)
+        del rec, data
 
         # Set the netCDF attributes for the data
-        attributes = self.get_attributes({})
         self._set_units(int_hdr, attributes)
         self._set_FillValue(int_hdr, real_hdr, attributes)
         self._set_unpack(int_hdr, real_hdr, attributes)
-        self._set_component("attributes", attributes, copy=False)
 
         # Get the data subspace, applying any masking and unpacking
         array = cfdm.netcdf_indexer(
@@ -191,16 +289,169 @@ class UMArray(
         )
         array = array[index]
 
+        if not (array.flags.writeable and array.dtype.isnative):
+            # The subspace is a view of a memory map of the file, so
+            # copy it into memory with native byte order
+            array = array.astype(array.dtype.newbyteorder("="))
+
         if int_hdr.item(38) == 3:
             # Convert the data to a boolean array
             array = array.astype(bool)
 
-        # Set the data type
-        self._set_component("dtype", array.dtype, copy=False)
-
-        # Return the numpy array
         return array
 
+    def _get_records_array(self, f, addresses, index):
+        """Returns a subspace of data spanning multiple records.
+
+        Only the records which are selected by *index* are read from
+        the file, and all of them are read from the same open file.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_get_array`, `_get_record_array`
+
+        :Parameters:
+
+            f: `umread_lib.umfile.File`
+                The open PP or FF file.
+
+            addresses: sequence of `int`
+                The start positions in the file of the lookup headers
+                of the records, in the row-major order of the leading
+                dimensions of `original_shape`.
+
+            {{index: `tuple` or `None`, optional}}
+
+        :Returns:
+
+            2-`tuple`
+                The subspace of the data, and the netCDF attributes
+                that are common to all of the records.
+
+        """
+        shape = self.original_shape
+        leading_shape = shape[:-2]
+        record_shape = shape[-2:]
+        n_leading = len(leading_shape)
+
+        recnos = np.arange(len(addresses)).reshape(leading_shape)
+
+        if len(index) == len(shape) and not any(i is None for i in index):
+            # Find the records selected by the leading indices, and
+            # apply the trailing indices to each record as it is read
+            positions = [
+                np.arange(size)[i]
+                for size, i in zip(leading_shape, index[:n_leading])
+            ]
+            recnos = recnos[np.ix_(*[np.atleast_1d(p) for p in positions])]
+            record_index = index[n_leading:]
+            index = tuple(
+                0 if not np.ndim(p) else slice(None) for p in positions
+            )
+        else:
+            # The index contains new axes, so read every record and
+            # apply the whole index afterwards
+            record_index = Ellipsis
+
+        recs = [self._get_rec(f, addresses[recno]) for recno in recnos.flat]
+        data = self._get_records_data(f, recs)
+
+        # Each record's unpacking and missing data attributes (from
+        # its BMKS, BDATUM and BMDI) are inferred from its own lookup
+        # header, starting from the attributes that were set for the
+        # whole array.
+        attributes0 = self.get_attributes({})
+        attributes = None
+        arrays = []
+        for rec, d in zip(recs, data):
+            a = attributes0.copy()
+            arrays.append(
+                self._get_record_array(
+                    rec, record_shape, record_index, a, data=d
+                )
+            )
+            if attributes is None:
+                # Only the units and calendar, which are the same for
+                # every record, are stored on the array. Storing the
+                # other attributes of one record would stop them from
+                # being inferred for the other records on the next
+                # read.
+                attributes = attributes0.copy()
+                for attr in ("units", "calendar"):
+                    if attr in a:
+                        attributes.setdefault(attr, a[attr])
+
+        if any(np.ma.isMA(a) for a in arrays):
+            array = np.ma.stack(arrays)
+        else:
+            array = np.stack(arrays)
+
+        array = array.reshape(recnos.shape + array.shape[1:])
+
+        if record_index is Ellipsis:
+            array = cfdm.netcdf_indexer(
+                array,
+                mask=False,
+                unpack=False,
+                always_masked_array=False,
+                orthogonal_indexing=True,
+                copy=False,
+            )
+
+        array = array[index]
+
+        return array, attributes
+
+    def _get_records_data(self, f, recs):
+        """Read the data of packed records in a single batch.
+
+        The data of all of the records that are packed (or that are
+        not packed, when memory mapping is disabled) are read from
+        disk in one go, and then unpacked with a single call to the
+        UM C library which releases the GIL for its duration.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_get_records_array`
+
+        :Parameters:
+
+            f: `umread_lib.umfile.File`
+                The open PP or FF file.
+
+            recs: sequence of `umread_lib.umfile.Rec`
+                The records.
+
+        :Returns:
+
+            `list`
+                For each record, its data if they have been read, or
+                `None` if they are to be read separately.
+
+        """
+        data = [None] * len(recs)
+
+        if self._get_component("mmap", False):
+            # Unpacked records are accessed via a memory map
+            batch = [
+                i for i, rec in enumerate(recs) if rec.int_hdr[LBPACK] % 10
+            ]
+        else:
+            batch = list(range(len(recs)))
+
+        if len(batch) > 1:
+            try:
+                batch_data = f.read_records_data([recs[i] for i in batch])
+            except ValueError:
+                # The records have different data types or sizes, so
+                # read them separately
+                pass
+            else:
+                for i, d in zip(batch, batch_data):
+                    data[i] = d
+
+        return data
+
     def _get_rec(self, f, header_offset):
         """Get a container for a record.
 
@@ -308,29 +559,25 @@ class UMArray(
 
         submodel = int_hdr.item(44)
         stash = int_hdr.item(41)
-        records = _stash2standard_name.get((submodel, stash))
-        if records:
-            LBSRCE = int_hdr.item(37)
-            version, source = divmod(LBSRCE, 10000)
-            if version <= 0:
-                version = 405.0
-
-            for (
-                long_name,
-                units0,
-                valid_from,
-                valid_to,
-                standard_name,
-                cf_info,
-                condition,
-            ) in records:
-                if not self._test_version(
-                    valid_from, valid_to, version
-                ) or not self._test_condition(condition, int_hdr):
-                    continue
-
-                units = units0
-                break
+        LBSRCE = int_hdr.item(37)
+        version, source = divmod(LBSRCE, 10000)
+        if version <= 0:
+            version = 405.0
+
+        for (
+            long_name,
+            units0,
+            valid_from,
+            valid_to,
+            standard_name,
+            cf_info,
+            condition,
+        ) in _stash2standard_name_records(submodel, stash, version):
+            if not self._test_condition(condition, int_hdr):
+                continue
+
+            units = units0
+            break
 
         attributes["units"] = units
 
@@ -609,6 +856,14 @@ class UMArray(
     def close(self, f):
         """Close the dataset containing the data.
 
+        The dataset is returned to the process-wide pool of open UM
+        and PP files, from which it may be reused by a subsequent
+        `open`. It is only actually closed if the pool is full. The
+        maximum number of files kept open by the pool is set with
+        `cf.max_open_files`.
+
+        .. seealso:: `open`, `cf.close_files`
+
         :Parameters:
 
             f: `umfile_lib.File`
@@ -622,7 +877,7 @@ class UMArray(
 
         """
         if self._get_component("close"):
-            f.close_fd()
+            file_pool.release(f)
 
     def get_byte_ordering(self):
         """The endianness of the data.
@@ -702,6 +957,11 @@ class UMArray(
     def open(self):
         """Returns an open dataset and the address of the data.
 
+        The dataset is taken from the process-wide pool of open UM
+        and PP files, if possible, rather than being opened anew.
+
+        .. seealso:: `close`
+
         :Returns:
 
             `umfile_lib.umfile.File`, `int`
@@ -715,9 +975,8 @@ class UMArray(
 
         """
         return super().open(
-            File,
+            file_pool.open,
             byte_ordering=self.get_byte_ordering(),
             word_size=self.get_word_size(),
             fmt=self.get_fmt(),
-            parse=False,
         )
@@ -1,5 +1,6 @@
 from functools import partial
 
+import dask.array as da
 import numpy as np
 from cfdm.core import DocstringRewriteMeta
 from dask.array.reductions import reduction
@@ -56,6 +57,18 @@ class Collapse(metaclass=DocstringRewriteMeta):
 
     """
 
+    # The methods that may be calculated together by `multi`
+    _multi_methods = (
+        "max",
+        "mean",
+        "mid_range",
+        "min",
+        "range",
+        "sample_size",
+        "sum",
+        "var",
+    )
+
     def __docstring_substitutions__(self):
         """Define docstring substitutions that apply to this class and
         all of its subclasses.
@@ -88,6 +101,191 @@ class Collapse(metaclass=DocstringRewriteMeta):
         """
         return 0
 
+    def grouped(
+        self,
+        a,
+        method,
+        groups,
+        axis=0,
+        weights=None,
+        mtol=1,
+        ddof=None,
+        split_every=None,
+    ):
+        """Return the values of a statistic for groups along an axis.
+
+        Each group comprises any elements along the collapse axis, not
+        necessarily contiguous, and the axis is collapsed to one
+        element per group.
+
+        Every chunk is collapsed for all groups at once with segment
+        reductions, and the partial results for each group from all
+        chunks are then combined by one tree reduction, rather than
+        creating separate collapses for each group.
+
+        The results are the same as those of the corresponding
+        collapse methods applied to each group in turn.
+
+        See
+        https://ncas-cms.github.io/cf-python/analysis.html#collapse-methods
+        for mathematical definitions.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            a: `dask.array.Array`
+                The array to be collapsed.
+
+            method: `str`
+                The collapse method, one of ``'max'``,
+                ``'max_abs'``, ``'mean'``, ``'mean_abs'``,
+                ``'mid_range'``, ``'min'``, ``'min_abs'``,
+                ``'range'``, ``'rms'``, ``'sample_size'``,
+                ``'sum'``, ``'sum_of_weights'``,
+                ``'sum_of_weights2'``, and ``'var'``.
+
+            groups: 1-d array_like of `int`
+                The group of each element along the collapse axis,
+                numbered from 0. Elements in negative groups are
+                ignored. The size of the collapsed axis is one more
+                than the largest group number.
+
+            axis: `int`, optional
+                The collapse axis. By default the first axis is
+                collapsed.
+
+            {{Collapse weights: data_like or `None`, optional}}
+
+            {{mtol: number, optional}}
+
+                The threshold applies to the number of elements in
+                each group.
+
+            {{ddof: number}}
+
+                Only required for the ``'var'`` method.
+
+            {{split_every: `int` or `dict`, optional}}
+
+        :Returns:
+
+            `dask.array.Array`
+                The collapsed array.
+
+        **Examples**
+
+        >>> a = da.arange(12).reshape(6, 2)
+        >>> Collapse().grouped(a, "sum", [0, 0, 1, 1, 1, -1]).compute()
+        masked_array(
+          data=[[ 2,  4],
+                [18, 21]],
+          mask=False,
+          fill_value=999999)
+
+        """
+        from .dask_collapse import (
+            cf_grouped_chunk,
+            cf_grouped_combine,
+            cf_grouped_statistic,
+        )
+
+        if method in ("mid_range", "range"):
+            check_input_dtype(a, allowed="fi")
+        else:
+            check_input_dtype(a)
+
+        if method in ("max_abs", "min_abs", "mean_abs"):
+            a = abs(a)
+            method = method[:-4]
+        elif method == "rms":
+            a = da.multiply(a, a, dtype="f8")
+
+        groups = np.asanyarray(groups, dtype="i8")
+        if groups.shape != (a.shape[axis],):
+            raise ValueError(
+                f"Can't collapse: Groups with shape {groups.shape} are "
+                f"not compatible with collapse axis of size {a.shape[axis]}"
+            )
+
+        sizes = np.bincount(groups[groups >= 0])
+        ngroups = sizes.size
+        if not ngroups:
+            raise ValueError("Can't collapse: There are no groups")
+
+        if method in ("max", "mid_range", "min", "range", "sample_size"):
+            # These methods are unweighted
+            weights = None
+
+        sum_dtype = double_precision_dtype(a)
+        inds = tuple(range(a.ndim))
+        args = [
+            a,
+            inds,
+            da.from_array(groups, chunks=(a.chunks[axis],)),
+            (axis,),
+        ]
+        if weights is not None:
+            weights = da.broadcast_to(da.asanyarray(weights), a.shape)
+            args.extend((weights.rechunk(a.chunks), inds))
+            sum_dtype = np.result_type(
+                double_precision_dtype(weights), sum_dtype
+            )
+
+        x = da.blockwise(
+            partial(
+                cf_grouped_chunk,
+                axis=axis,
+                ngroups=ngroups,
+                method="mean" if method == "rms" else method,
+                ddof=ddof,
+                sum_dtype=sum_dtype,
+            ),
+            inds,
+            *args,
+            meta=np.array((), dtype="f8"),
+        )
+
+        # Combine the partial results from all chunks
+        x = reduction(
+            x,
+            cf_grouped_combine,
+            cf_grouped_combine,
+            axis=axis,
+            keepdims=True,
+            dtype="f8",
+            split_every=split_every,
+            combine=cf_grouped_combine,
+            concatenate=False,
+            output_size=ngroups,
+            meta=np.array((), dtype="f8"),
+        )
+
+        if method in ("max", "min", "range"):
+            dtype = a.dtype
+        elif method == "sum":
+            dtype = sum_dtype
+        elif method == "sample_size":
+            dtype = "i8"
+        elif method in ("sum_of_weights", "sum_of_weights2"):
+            dtype = double_precision_dtype(weights, default="i8")
+        else:
+            dtype = "f8"
+
+        x = x.map_blocks(
+            cf_grouped_statistic,
+            method="mean" if method == "rms" else method,
+            axis=axis,
+            mtol=mtol,
+            sizes=sizes,
+            dtype=dtype,
+            meta=np.array((), dtype=dtype),
+        )
+        if method == "rms":
+            x = da.sqrt(x)
+
+        return x
+
     def max(
         self,
         a,
@@ -497,6 +695,153 @@ class Collapse(metaclass=DocstringRewriteMeta):
             split_every=split_every,
         )
 
+    def multi(
+        self,
+        a,
+        methods,
+        axis=None,
+        weights=None,
+        keepdims=False,
+        mtol=1,
+        ddof=None,
+        split_every=None,
+    ):
+        """Return several statistics of an array from a single pass.
+
+        The partial sums, extrema and sample sizes needed by all of
+        the methods are calculated together by one chunk function, and
+        combined by one tree reduction. The collapsed array for each
+        method is then derived from the result of that reduction, so
+        the arrays share the reading of the data when they are
+        computed together (e.g. with `dask.compute`).
+
+        The results are the same as those of the corresponding
+        individual collapse methods.
+
+        See
+        https://ncas-cms.github.io/cf-python/analysis.html#collapse-methods
+        for mathematical definitions.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            a: `dask.array.Array`
+                The array to be collapsed.
+
+            methods: sequence of `str`
+                The collapse methods, any of ``'max'``, ``'mean'``,
+                ``'mid_range'``, ``'min'``, ``'range'``,
+                ``'sample_size'``, ``'sum'``, and ``'var'``.
+
+            {{Collapse weights: data_like or `None`, optional}}
+
+                The weights are ignored by the ``'max'``,
+                ``'mid_range'``, ``'min'``, ``'range'``, and
+                ``'sample_size'`` methods.
+
+            {{collapse axes: (sequence of) `int`, optional}}
+
+            {{collapse keepdims: `bool`, optional}}
+
+            {{mtol: number, optional}}
+
+            {{ddof: number}}
+
+                Only required for the ``'var'`` method.
+
+            {{split_every: `int` or `dict`, optional}}
+
+        :Returns:
+
+            `dict`
+                The collapsed array for each method, keyed by method
+                name.
+
+        **Examples**
+
+        >>> a = da.arange(12).reshape(4, 3)
+        >>> out = Collapse().multi(a, ("max", "mean"), axis=0)
+        >>> dask.compute(out)
+        ({'max': array([ 9, 10, 11]), 'mean': array([4.5, 5.5, 6.5])},)
+
+        """
+        from .dask_collapse import (
+            cf_multi_chunk,
+            cf_multi_combine,
+            cf_multi_statistic,
+        )
+
+        methods = tuple(dict.fromkeys(methods))
+        unknown = set(methods).difference(self._multi_methods)
+        if unknown:
+            raise ValueError(
+                "Can't collapse with multiple methods: Unsupported "
+                f"method(s): {', '.join(map(repr, sorted(unknown)))}"
+            )
+
+        if not set(methods).isdisjoint(("mid_range", "range")):
+            check_input_dtype(a, allowed="fi")
+        else:
+            check_input_dtype(a)
+
+        if axis is None:
+            axis = tuple(range(a.ndim))
+        elif isinstance(axis, int):
+            axis = (axis,)
+        else:
+            axis = tuple(axis)
+
+        sum_dtype = double_precision_dtype(a)
+        if weights is not None:
+            sum_dtype = np.result_type(
+                double_precision_dtype(weights), sum_dtype
+            )
+
+        dtype = "f8"
+        x = reduction(
+            a,
+            partial(
+                cf_multi_chunk, methods=methods, ddof=ddof, sum_dtype=sum_dtype
+            ),
+            cf_multi_combine,
+            axis=axis,
+            keepdims=True,
+            dtype=dtype,
+            split_every=split_every,
+            combine=cf_multi_combine,
+            concatenate=False,
+            meta=np.array((), dtype=dtype),
+            weights=weights,
+        )
+
+        out = {}
+        for method in methods:
+            if method in ("max", "min", "range"):
+                dtype = a.dtype
+            elif method == "sum":
+                dtype = sum_dtype
+            elif method == "sample_size":
+                dtype = "i8"
+            else:
+                dtype = "f8"
+
+            y = x.map_blocks(
+                cf_multi_statistic,
+                method=method,
+                axis=axis,
+                mtol=mtol,
+                original_shape=a.shape,
+                dtype=dtype,
+                meta=np.array((), dtype=dtype),
+            )
+            if not keepdims:
+                y = y.squeeze(axis=axis)
+
+            out[method] = y
+
+        return out
+
     def range(
         self,
         a,
@@ -905,6 +1250,78 @@ class Collapse(metaclass=DocstringRewriteMeta):
             weights=weights,
         )
 
+    def tdigest(
+        self,
+        a,
+        axis=None,
+        compression=100,
+        split_every=None,
+        chunk_function=None,
+    ):
+        """Return t-digests of an array.
+
+        A t-digest is a mergeable summary of the distribution of
+        values, from which approximate percentiles may be found (see
+        `cf.data.collapse.dask_collapse.cf_tdigest_percentile`). A
+        t-digest is created for each element of the collapsed
+        array. The t-digests of the chunks of the array are merged
+        with a tree reduction, so the array does not need to be
+        rechunked.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            a: `dask.array.Array`
+                The array to be collapsed.
+
+            {{collapse axes: (sequence of) `int`, optional}}
+
+            compression: `int`, optional
+                The maximum number of centroids in each t-digest.
+
+            {{split_every: `int` or `dict`, optional}}
+
+            {{chunk_function: callable or `None`, optional}}
+
+                A callable function must accept a *compression*
+                keyword parameter. See
+                `cf.data.collapse.dask_collapse.cf_tdigest_chunk` for
+                details.
+
+        :Returns:
+
+            `dask.array.Array`
+                The collapsed array, with the collapsed axes retained
+                with size one. Each chunk is a dictionary that defines
+                the t-digests of the elements of the chunk, as
+                returned by
+                `cf.data.collapse.dask_collapse.cf_tdigest_combine`,
+                rather than a `numpy` array.
+
+        """
+        from .dask_collapse import cf_tdigest_chunk, cf_tdigest_combine
+
+        if chunk_function is None:
+            # Default function for chunk calculations
+            chunk_function = cf_tdigest_chunk
+
+        check_input_dtype(a)
+        dtype = "f8"
+        combine = partial(cf_tdigest_combine, compression=compression)
+        return reduction(
+            a,
+            partial(chunk_function, compression=compression),
+            combine,
+            axis=axis,
+            keepdims=True,
+            dtype=dtype,
+            split_every=split_every,
+            combine=combine,
+            concatenate=False,
+            meta=np.array((), dtype=dtype),
+        )
+
     def unique(self, a, split_every=None, chunk_function=None):
         """Return unique elements of the data.
 
@@ -227,6 +227,396 @@ def sum_sample_sizes(pairs, axis, computing_meta=False, **kwargs):
     )
 
 
+def segment_reduce(ufunc, x, starts, groups, axis, ngroups, fill_value=0):
+    """Reduce contiguous segments of an array along an axis.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        ufunc: `numpy.ufunc`
+            The reducing function, such as `numpy.add` or
+            `numpy.maximum`.
+
+        x: `numpy.ndarray`
+            The array to be reduced, whose elements are sorted by
+            group along the reduction axis.
+
+        starts: `numpy.ndarray`
+            The index of the first element of each segment along the
+            reduction axis.
+
+        groups: `numpy.ndarray`
+            The group of each segment.
+
+        axis: `int`
+            The reduction axis.
+
+        ngroups: `int`
+            The number of groups.
+
+        fill_value: scalar, optional
+            The value for groups that have no segment.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The reduced array, with the same shape as *x* except that
+            the reduction axis has size *ngroups*.
+
+    **Examples**
+
+    >>> x = np.array([[1, 2, 3, 4, 5]])
+    >>> segment_reduce(
+    ...     np.add, x, np.array([0, 3]), np.array([0, 2]), 1, 3
+    ... )
+    array([[6, 0, 9]])
+
+    """
+    shape = list(x.shape)
+    shape[axis] = ngroups
+    out = np.full(shape, fill_value, dtype=x.dtype)
+    if starts.size:
+        index = [slice(None)] * x.ndim
+        index[axis] = groups
+        out[tuple(index)] = ufunc.reduceat(x, starts, axis=axis)
+
+    return out
+
+
+def extreme_value(dtype, maximum=True):
+    """Return the largest or smallest value of a data type.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        dtype: data-type
+            The data type.
+
+        maximum: `bool`, optional
+            If True, the default, return the largest value, otherwise
+            return the smallest value.
+
+    :Returns:
+
+        The largest or smallest value.
+
+    **Examples**
+
+    >>> extreme_value('int8')
+    127
+    >>> extreme_value('f8', maximum=False)
+    -inf
+
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == "f":
+        return np.inf if maximum else -np.inf
+
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        return info.max if maximum else info.min
+
+    return maximum
+
+
+# --------------------------------------------------------------------
+# grouped statistics
+# --------------------------------------------------------------------
+def cf_grouped_chunk(
+    x,
+    groups,
+    weights=None,
+    axis=0,
+    ngroups=1,
+    method=None,
+    ddof=None,
+    sum_dtype="f8",
+    dtype="f8",
+    computing_meta=False,
+):
+    """Chunk calculations for grouped statistics.
+
+    The elements of the chunk are sorted by group along the collapse
+    axis, and then the partial sums, extrema and sample sizes of all
+    groups are calculated together with segment reductions (see
+    `segment_reduce`).
+
+    This function is passed to `dask.array.blockwise`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        x: `numpy.ndarray`
+            The chunk.
+
+        groups: `numpy.ndarray`
+            The group of each element of the chunk along the collapse
+            axis, between 0 and ``ngroups - 1``. Elements in negative
+            groups are ignored.
+
+        weights: `numpy.ndarray`, optional
+            The weights, with the same shape as *x*.
+
+        axis: `int`
+            The collapse axis.
+
+        ngroups: `int`
+            The number of groups.
+
+        method: `str`
+            The collapse method, one of ``'max'``, ``'mean'``,
+            ``'mid_range'``, ``'min'``, ``'range'``,
+            ``'sample_size'``, ``'sum'``, ``'sum_of_weights'``,
+            ``'sum_of_weights2'``, and ``'var'``.
+
+        ddof: number
+            The delta degrees of freedom for the variance. See
+            `cf_var_chunk` for details.
+
+        sum_dtype: `str`
+            The data type of the sum.
+
+        dtype: `str`
+            The data type of the partial sums of the mean and
+            variance.
+
+    :Returns:
+
+        `dict`
+            Dictionary with the keys below, each of whose arrays has
+            the shape of the chunk except that the collapse axis has
+            size *ngroups*:
+
+            * N: The sample size.
+            * weighted: True if weights have been set.
+            * ddof: The delta degrees of freedom.
+            * max: The maximum of ``x``, if required.
+            * min: The minimum of ``x``, if required.
+            * total: The weighted sum of ``x``, with data type
+                     *sum_dtype*, if required.
+            * V1, sum: As returned by `cf_mean_chunk`, if required.
+            * V2, part: As returned by `cf_var_chunk`, if required.
+
+    """
+    if computing_meta:
+        return x
+
+    x = cfdm_to_memory(x)
+    weighted = weights is not None
+    if weighted:
+        weights = cfdm_to_memory(weights)
+
+    # Sort the elements by group along the collapse axis, ignoring
+    # those which are not in a group
+    order = np.argsort(groups, kind="stable")
+    order = order[groups[order] >= 0]
+    groups = groups[order]
+    labels, starts = np.unique(groups, return_index=True)
+
+    x = x.take(order, axis=axis)
+    mask = None
+    if np.ma.is_masked(x):
+        mask = np.ma.getmaskarray(x)
+
+    if weighted:
+        weights = weights.take(order, axis=axis)
+        if weights.size:
+            w_min = weights.min()
+            if w_min <= 0:
+                raise ValueError(
+                    "All collapse weights must be positive. "
+                    f"Got a weight of {w_min!r}. Consider replacing "
+                    "non-positive values with missing data."
+                )
+
+        weights = weights.astype(double_precision_dtype(weights))
+        if mask is not None:
+            weights = np.where(mask, 0, weights)
+
+    def segments(y, ufunc=np.add, fill_value=0):
+        return segment_reduce(
+            ufunc, y, starts, labels, axis, ngroups, fill_value
+        )
+
+    if mask is None:
+        # The sample size of each group is its number of elements
+        n = np.zeros((ngroups,), dtype="i8")
+        n[labels] = np.diff(starts, append=x.shape[axis])
+        shape = [1] * x.ndim
+        shape[axis] = ngroups
+        N = np.empty(x.shape[:axis] + (ngroups,) + x.shape[axis + 1 :], "i8")
+        N[...] = n.reshape(shape)
+    else:
+        N = segments((~mask).astype("i8"))
+
+    d = {"N": N, "weighted": weighted, "ddof": ddof}
+
+    if method in ("max", "mid_range", "range"):
+        fill_value = extreme_value(x.dtype, maximum=False)
+        d["max"] = segments(
+            np.ma.filled(x, fill_value), np.maximum, fill_value
+        )
+
+    if method in ("min", "mid_range", "range"):
+        fill_value = extreme_value(x.dtype, maximum=True)
+        d["min"] = segments(
+            np.ma.filled(x, fill_value), np.minimum, fill_value
+        )
+
+    if method in ("sum", "mean", "var"):
+        x = np.ma.filled(x, 0)
+
+    if method == "sum":
+        y = x.astype(sum_dtype)
+        if weighted:
+            y *= weights
+
+        d["total"] = segments(y)
+
+    if method in ("mean", "var"):
+        y = x.astype(dtype)
+        if weighted:
+            y *= weights
+
+        d["sum"] = segments(y)
+
+    if method in ("mean", "var", "sum_of_weights"):
+        d["V1"] = segments(weights) if weighted else N
+
+    if method == "sum_of_weights2" or (
+        method == "var" and weighted and ddof == 1
+    ):
+        d["V2"] = segments(weights * weights) if weighted else N
+    elif method == "var":
+        d["V2"] = None
+
+    if method == "var":
+        # Find the deviations from each group's mean
+        wsum = d["sum"]
+        V1 = d["V1"]
+        avg = np.divide(wsum, V1, out=np.zeros_like(wsum), where=V1 > 0)
+        index = [slice(None)] * x.ndim
+        index[axis] = groups
+        part = x - avg[tuple(index)]
+        part *= part
+        if weighted:
+            part *= weights
+        elif mask is not None:
+            part[mask] = 0
+
+        d["part"] = segments(part) + avg * wsum
+
+    if mask is not None:
+        # Use masked arrays, as would be the case for non-grouped
+        # collapses of masked data, so that invalid statistics (such
+        # as the variance of one value with ddof=1) are masked
+        for key, value in d.items():
+            if isinstance(value, np.ndarray):
+                d[key] = np.ma.array(value)
+
+    return d
+
+
+def cf_grouped_combine(pairs, axis=None, computing_meta=False, **kwargs):
+    """Combination calculations for grouped statistics.
+
+    The partial results for each group are combined element-wise,
+    since every chunk has partial results for all groups.
+
+    This function is passed to `dask.array.reduction` as its *chunk*,
+    *combine* and *aggregate* parameters.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        See `dask.array.reductions` for details of the parameters.
+
+    :Returns:
+
+        As for `cf_grouped_chunk`.
+
+    """
+    if not isinstance(pairs, list):
+        pairs = [pairs]
+
+    pairs = list(flatten(pairs))
+    d0 = pairs[0]
+    if computing_meta:
+        return d0
+
+    d = {}
+    for key, value in d0.items():
+        if key in ("weighted", "ddof") or value is None:
+            d[key] = value
+            continue
+
+        if key == "max":
+            func = np.maximum
+        elif key == "min":
+            func = np.minimum
+        else:
+            func = np.add
+
+        d[key] = reduce(func, [pair[key] for pair in pairs])
+
+    return d
+
+
+def cf_grouped_statistic(d, method, axis=0, mtol=1, sizes=None):
+    """Calculate one grouped statistic from combined partial sums.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `dict`
+            The combined partial sums for a chunk of the collapsed
+            array, as returned by `cf_grouped_combine`.
+
+        method: `str`
+            The collapse method used to create *d*.
+
+        axis: `int`
+            The collapse axis.
+
+        mtol: number, optional
+            The sample size threshold below which collapsed values are
+            set to missing data. See `mask_small_sample_size` for
+            details.
+
+        sizes: `numpy.ndarray`
+            The number of elements, including missing values, in each
+            group.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The collapsed chunk, with one element for each group along
+            the collapse axis.
+
+    """
+    # Groups with no values are missing data
+    N = d["N"]
+    mask = np.ma.getdata(N == 0)
+    if mask.any():
+        # Ignore floating point errors from groups with no values
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = cf_multi_statistic(d, method)
+    else:
+        x = cf_multi_statistic(d, method)
+
+    if mtol < 1:
+        shape = [1] * N.ndim
+        shape[axis] = sizes.size
+        mask |= N < (1 - mtol) * sizes.reshape(shape)
+
+    return np.ma.masked_where(mask, x, copy=False)
+
+
 # --------------------------------------------------------------------
 # mean
 # --------------------------------------------------------------------
@@ -633,6 +1023,206 @@ def cf_min_agg(
     return x
 
 
+# --------------------------------------------------------------------
+# multiple statistics
+# --------------------------------------------------------------------
+def cf_multi_chunk(
+    x,
+    weights=None,
+    methods=(),
+    ddof=None,
+    sum_dtype="f8",
+    dtype="f8",
+    computing_meta=False,
+    **kwargs,
+):
+    """Chunk calculations for multiple statistics.
+
+    The partial sums, extrema and sample sizes needed by all of the
+    given methods are calculated in a single pass over the chunk.
+
+    This function is passed to `dask.array.reduction` as its *chunk*
+    parameter.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        methods: sequence of `str`
+            The collapse methods, any of ``'max'``, ``'mean'``,
+            ``'mid_range'``, ``'min'``, ``'range'``,
+            ``'sample_size'``, ``'sum'``, and ``'var'``.
+
+        ddof: number
+            The delta degrees of freedom for the variance. See
+            `cf_var_chunk` for details.
+
+        sum_dtype: `str`
+            The data type of the sum.
+
+        See `dask.array.reductions` for details of the other
+        parameters.
+
+    :Returns:
+
+        `dict`
+            Dictionary with the keys:
+
+            * N: The sample size.
+            * weighted: True if weights have been set.
+            * ddof: The delta degrees of freedom.
+            * max: The maximum of ``x``, if required.
+            * min: The minimum of ``x``, if required.
+            * total: The weighted sum of ``x``, with data type
+                     *sum_dtype*, if required.
+            * V1, sum: As returned by `cf_mean_chunk`, if required.
+            * V2, part: As returned by `cf_var_chunk`, if required.
+
+    """
+    if computing_meta:
+        return x
+
+    x = cfdm_to_memory(x)
+    if weights is not None:
+        weights = cfdm_to_memory(weights)
+
+    if "var" in methods:
+        # N, V1, V2, sum, part
+        d = cf_var_chunk(x, weights=weights, dtype=dtype, ddof=ddof, **kwargs)
+    elif "mean" in methods:
+        # N, V1, sum
+        d = cf_mean_chunk(x, weights=weights, dtype=dtype, **kwargs)
+    else:
+        # N
+        d = cf_sample_size_chunk(x, **kwargs)
+
+    d["weighted"] = weights is not None
+    d["ddof"] = ddof
+
+    if "sum" in methods:
+        if "sum" in d and np.dtype(sum_dtype) == np.dtype(dtype):
+            # Re-use the weighted sum that has already been calculated
+            d["total"] = d["sum"]
+        else:
+            d["total"] = cf_sum_chunk(
+                x, weights=weights, dtype=sum_dtype, **kwargs
+            )["sum"]
+
+    if not set(methods).isdisjoint(("max", "mid_range", "range")):
+        d["max"] = chunk.max(x, **kwargs)
+
+    if not set(methods).isdisjoint(("min", "mid_range", "range")):
+        d["min"] = chunk.min(x, **kwargs)
+
+    return d
+
+
+def cf_multi_combine(pairs, axis=None, computing_meta=False, **kwargs):
+    """Combination calculations for multiple statistics.
+
+    This function is passed to `dask.array.reduction` as its *combine*
+    and *aggregate* parameters.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        See `dask.array.reductions` for details of the parameters.
+
+    :Returns:
+
+        As for `cf_multi_chunk`.
+
+    """
+    if not isinstance(pairs, list):
+        pairs = [pairs]
+
+    d0 = next(flatten(pairs))
+    d = {"weighted": d0["weighted"], "ddof": d0["ddof"]}
+
+    d["N"] = sum_sample_sizes(pairs, axis, computing_meta, **kwargs)
+    if computing_meta:
+        return d["N"]
+
+    for key in ("sum", "V1", "part", "total"):
+        if key in d0:
+            d[key] = sum_arrays(pairs, key, axis, None, **kwargs)
+
+    if "V2" in d0:
+        if d0["V2"] is None:
+            d["V2"] = None
+        else:
+            d["V2"] = sum_arrays(pairs, "V2", axis, None, **kwargs)
+
+    if "max" in d0:
+        d["max"] = max_arrays(pairs, "max", axis, None, **kwargs)
+
+    if "min" in d0:
+        d["min"] = min_arrays(pairs, "min", axis, None, **kwargs)
+
+    return d
+
+
+def cf_multi_statistic(d, method, axis=None, mtol=1, original_shape=None):
+    """Calculate one statistic from multiple statistics' partial sums.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `dict`
+            The combined partial sums for a chunk of the collapsed
+            array, as returned by `cf_multi_combine`.
+
+        method: `str`
+            The collapse method, which must be one of those used to
+            create *d*.
+
+        axis: `tuple` of `int`
+            The collapsed axes.
+
+        mtol: number, optional
+            The sample size threshold below which collapsed values are
+            set to missing data. See `mask_small_sample_size` for
+            details.
+
+        original_shape: `tuple`
+            The shape of the original, uncollapsed data.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The collapsed chunk, with the collapsed axes retained with
+            size one.
+
+    """
+    N = d["N"]
+    if method == "max":
+        x = d["max"]
+    elif method == "min":
+        x = d["min"]
+    elif method == "mid_range":
+        x = divide(d["max"] + d["min"], 2.0, dtype="f8")
+    elif method == "range":
+        x = d["max"] - d["min"]
+    elif method == "mean":
+        x = divide(d["sum"], d["V1"], dtype="f8")
+    elif method == "sum":
+        x = d["total"]
+    elif method == "var":
+        x = var_from_partials(d)
+    elif method == "sample_size":
+        x = N
+    elif method == "sum_of_weights":
+        x = d["V1"]
+    elif method == "sum_of_weights2":
+        x = d["V2"]
+    else:
+        raise ValueError(f"Unknown collapse method: {method!r}")
+
+    return mask_small_sample_size(x, N, axis, mtol, original_shape)
+
+
 # --------------------------------------------------------------------
 # range
 # --------------------------------------------------------------------
@@ -1174,6 +1764,445 @@ def cf_sum_of_weights2_chunk(
     return d
 
 
+# --------------------------------------------------------------------
+# t-digest
+# --------------------------------------------------------------------
+def _tdigest_rows(x, axis):
+    """Reshape an array so that its collapse axes are flattened.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_tdigest_unrows`
+
+    :Parameters:
+
+        x: `numpy.ndarray`
+            The array.
+
+        axis: sequence of `int`
+            The collapse axes.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The array with its collapse axes moved to the end and
+            flattened into a single trailing axis, and its other axes
+            flattened into a single leading axis.
+
+    """
+    ndim = x.ndim
+    naxes = len(axis)
+    x = np.moveaxis(x, axis, range(ndim - naxes, ndim))
+    return x.reshape(-1, reduce(mul, x.shape[ndim - naxes :], 1))
+
+
+def _tdigest_unrows(x, shape, axis):
+    """Reverse the reshaping of `_tdigest_rows`.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_tdigest_rows`
+
+    :Parameters:
+
+        x: `numpy.ndarray`
+            A two-dimensional array whose leading axis corresponds to
+            the flattened non-collapse axes of an array with shape
+            *shape*.
+
+        shape: `tuple`
+            The shape of the array with the original axes.
+
+        axis: sequence of `int`
+            The collapse axes.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The array with the original non-collapse axes and with
+            the trailing axis of *x* in place of the first collapse
+            axis. Each of the other collapse axes has size 1.
+
+    """
+    ndim = len(shape)
+    naxes = len(axis)
+    shape = [n for i, n in enumerate(shape) if i not in axis]
+    shape.append(x.shape[-1])
+    shape.extend((1,) * (naxes - 1))
+    x = x.reshape(shape)
+    return np.moveaxis(x, range(ndim - naxes, ndim), axis)
+
+
+def _tdigest_compress(mean, weight, compression, is_sorted=False):
+    """Compress t-digests to a given number of centroids.
+
+    The centroids of each t-digest are sorted by their means, and
+    then those that are adjacent are merged so that each merged
+    centroid spans at most about one unit of the scale function
+    ``k(q) = compression * (arcsin(2q-1)/pi + 1/2)``, where ``q`` is
+    the quantile of a centroid. This gives small centroids, and
+    therefore accurate percentiles, near the extremes of the
+    distribution. Centroids are only merged if a t-digest has more
+    non-zero weight centroids than *compression*.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        mean: `numpy.ndarray`
+            The centroid means, with one t-digest per row.
+
+        weight: `numpy.ndarray`
+            The centroid weights, with one t-digest per row. A weight
+            of zero indicates an unused centroid.
+
+        compression: `int`
+            The number of centroids of each compressed t-digest.
+
+        is_sorted: `bool`, optional
+            If True then the centroids of each row are already sorted
+            by their means, with unused centroids last.
+
+    :Returns:
+
+        2-`tuple` of `numpy.ndarray`
+            The means and weights of the compressed t-digests, each
+            with *compression* columns.
+
+    """
+    nrows, n = mean.shape
+    if not is_sorted:
+        # Sort the centroids of each row by their means, with unused
+        # centroids last
+        key = np.where(weight > 0, mean, np.inf)
+        index = np.argsort(key, axis=-1, kind="stable")
+        mean = np.take_along_axis(mean, index, axis=-1)
+        weight = np.take_along_axis(weight, index, axis=-1)
+
+    used = weight > 0
+
+    if used.sum(axis=-1).max(initial=0) <= compression:
+        # No merging needed
+        if n >= compression:
+            return mean[:, :compression], weight[:, :compression]
+
+        pad = ((0, 0), (0, compression - n))
+        return np.pad(mean, pad), np.pad(weight, pad)
+
+    # Find the group of each centroid from the quantile of its
+    # midpoint
+    q = np.cumsum(weight, axis=-1)
+    total = np.where(q[:, -1:] > 0, q[:, -1:], 1)
+    q -= 0.5 * weight
+    q /= total
+    q *= 2
+    q -= 1
+    np.clip(q, -1, 1, out=q)
+    np.arcsin(q, out=q)
+    q *= compression / np.pi
+    q += compression / 2
+    group = q.astype(int)
+    np.minimum(group, compression - 1, out=group)
+    group += np.arange(nrows)[:, np.newaxis] * compression
+    group = group.ravel()
+
+    # Merge the centroids of each group
+    size = nrows * compression
+    weight_sum = np.bincount(group, weights=weight.ravel(), minlength=size)
+    mean_sum = np.bincount(
+        group,
+        weights=np.where(used, mean * weight, 0).ravel(),
+        minlength=size,
+    )
+    used = weight_sum > 0
+    mean = np.divide(
+        mean_sum, weight_sum, out=np.zeros(size), where=used
+    ).reshape(nrows, compression)
+    weight = weight_sum.reshape(nrows, compression)
+    return mean, weight
+
+
+def tdigest_percentiles(d, q):
+    """Find approximate percentiles from t-digests.
+
+    The percentiles are found by linearly interpolating between the
+    means of the centroids, each of which is located at the middle of
+    the sorted positions that it represents, and the minimum and
+    maximum values. When no centroids have been merged, the
+    percentiles are identical to those calculated by
+    `numpy.percentile` with its default ``'linear'`` method.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `dict`
+            The t-digests, with one t-digest per row of each of its
+            ``'mean'``, ``'weight'``, ``'min'``, ``'max'`` and
+            ``'N'`` arrays.
+
+        q: `numpy.ndarray`
+            The percentile ranks, between 0 and 100 inclusive.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The percentiles, with one row per t-digest and one column
+            per percentile rank. Rows with no values are set to NaN.
+
+    """
+    mean = d["mean"]
+    weight = d["weight"]
+    N = d["N"]
+    nrows = mean.shape[0]
+
+    # The positions of the centroid means and the extreme values,
+    # where the sorted values are at positions 0, 1, ..., N-1
+    used = weight > 0
+    key = np.where(used, mean, np.inf)
+    index = np.argsort(key, axis=-1, kind="stable")
+    mean = np.take_along_axis(mean, index, axis=-1)
+    weight = np.take_along_axis(weight, index, axis=-1)
+    position = np.cumsum(weight, axis=-1) - 0.5 * weight - 0.5
+    position = np.where(weight > 0, position, np.inf)
+
+    position = np.concatenate(
+        (np.zeros((nrows, 1)), position, (N - 1)[:, np.newaxis]), axis=-1
+    )
+    values = np.concatenate(
+        (d["min"][:, np.newaxis], mean, d["max"][:, np.newaxis]), axis=-1
+    )
+    index = np.argsort(position, axis=-1, kind="stable")
+    position = np.take_along_axis(position, index, axis=-1)
+    values = np.take_along_axis(values, index, axis=-1)
+
+    # Interpolate between the positions that surround the position of
+    # each percentile rank
+    last = position.shape[-1] - 2
+    out = np.empty((nrows, q.size))
+    for j, rank in enumerate(q.flat):
+        target = (rank / 100) * (N - 1)
+        i = (position <= target[:, np.newaxis]).sum(axis=-1) - 1
+        i = np.clip(i, 0, last)[:, np.newaxis]
+        p0 = np.take_along_axis(position, i, axis=-1)[:, 0]
+        p1 = np.take_along_axis(position, i + 1, axis=-1)[:, 0]
+        v0 = np.take_along_axis(values, i, axis=-1)[:, 0]
+        v1 = np.take_along_axis(values, i + 1, axis=-1)[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.clip((target - p0) / (p1 - p0), 0, 1)
+            interpolate = np.isfinite(p1) & (p1 > p0) & (fraction > 0)
+            out[:, j] = np.where(interpolate, v0 + fraction * (v1 - v0), v0)
+
+    out[N <= 0] = np.nan
+    return out
+
+
+def cf_tdigest_chunk(
+    x, compression=100, axis=None, computing_meta=False, **kwargs
+):
+    """Chunk calculations for t-digests.
+
+    This function is passed to `dask.array.reduction` as its *chunk*
+    parameter.
+
+    A t-digest is a mergeable summary of the distribution of a
+    sample, comprising a bounded number of weighted centroids from
+    which approximate percentiles may be found (see
+    `tdigest_percentiles`). A t-digest is created for each element
+    of the collapsed array, from the values that contribute to it.
+    Missing and NaN values are ignored.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        compression: `int`, optional
+            The number of centroids in each t-digest.
+
+        See `dask.array.reductions` for details of the other
+        parameters.
+
+    :Returns:
+
+        `dict`
+            Dictionary with the keys:
+
+            * mean: The centroid means, with the centroids along the
+                    first collapse axis.
+            * weight: The centroid weights, with the centroids along
+                      the first collapse axis.
+            * min: The minimum of ``x``.
+            * max: The maximum of ``x``.
+            * N: The sample size.
+
+    """
+    if computing_meta:
+        return x
+
+    x = cfdm_to_memory(x)
+    shape = x.shape
+
+    mask = np.ma.getmaskarray(x)
+    x = np.ma.getdata(x)
+    if x.dtype.kind == "f":
+        mask = mask | np.isnan(x)
+
+    # Sort the values of each row, with missing values last. Each
+    # value is a centroid with a weight of 1.
+    mean = _tdigest_rows(x, axis).astype(float)
+    mask = _tdigest_rows(mask, axis)
+    mean[mask] = np.inf
+    mean.sort(axis=-1)
+    N = mask.shape[-1] - mask.sum(axis=-1)
+    weight = (np.arange(mean.shape[-1]) < N[:, np.newaxis]).astype(float)
+
+    d = {"N": N.astype(float)}
+    d["min"] = np.where(N > 0, mean[:, 0], np.inf)
+    d["max"] = np.where(
+        N > 0,
+        np.take_along_axis(mean, np.maximum(N - 1, 0)[:, np.newaxis], axis=-1)[
+            :, 0
+        ],
+        -np.inf,
+    )
+    mean[weight == 0] = 0
+    mean, weight = _tdigest_compress(mean, weight, compression, is_sorted=True)
+    d["mean"] = _tdigest_unrows(mean, shape, axis)
+    d["weight"] = _tdigest_unrows(weight, shape, axis)
+    for key in ("N", "min", "max"):
+        d[key] = _tdigest_unrows(d[key][:, np.newaxis], shape, axis)
+
+    return d
+
+
+def cf_tdigest_combine(
+    pairs, compression=100, axis=None, computing_meta=False, **kwargs
+):
+    """Combination calculations for t-digests.
+
+    This function is passed to `dask.array.reduction` as its
+    *combine* and *aggregate* parameters.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        compression: `int`, optional
+            The number of centroids in each t-digest.
+
+        See `dask.array.reductions` for details of the other
+        parameters.
+
+    :Returns:
+
+        As for `cf_tdigest_chunk`.
+
+    """
+    if not isinstance(pairs, list):
+        pairs = [pairs]
+
+    if computing_meta:
+        return pairs
+
+    d = {
+        "N": sum_arrays(pairs, "N", axis, "f8", **kwargs),
+        "min": min_arrays(pairs, "min", axis, None, **kwargs),
+        "max": max_arrays(pairs, "max", axis, None, **kwargs),
+    }
+
+    mean = _concatenate2(deepmap(lambda pair: pair["mean"], pairs), axis)
+    weight = _concatenate2(deepmap(lambda pair: pair["weight"], pairs), axis)
+    shape = mean.shape
+    mean, weight = _tdigest_compress(
+        _tdigest_rows(mean, axis), _tdigest_rows(weight, axis), compression
+    )
+    d["mean"] = _tdigest_unrows(mean, shape, axis)
+    d["weight"] = _tdigest_unrows(weight, shape, axis)
+    return d
+
+
+def cf_tdigest_percentile(
+    d, q, axis, keepdims=False, mtol=1, original_shape=None
+):
+    """Compute approximate percentiles from t-digests.
+
+    See `cf.Data.percentile` for further details.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.Data.percentile`, `cf_tdigest_chunk`
+
+    :Parameters:
+
+        d: `dict`
+            The t-digests, as returned by `cf_tdigest_combine`.
+
+        q: `numpy.ndarray`
+            Percentile or sequence of percentiles to compute, which
+            must be between 0 and 100 inclusive.
+
+        axis: `tuple` of `int`
+            Axes along which the percentiles are computed.
+
+        keepdims: `bool`, optional
+            If this is set to True, the axes which are reduced are
+            left in the result as dimensions with size one.
+
+        mtol: number, optional
+            The sample size threshold below which collapsed values are
+            set to missing data. See `mask_small_sample_size` for
+            details.
+
+        original_shape: `tuple`
+            The shape of the original, uncollapsed data.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The percentiles, with a leading percentile rank axis if
+            *q* is not scalar.
+
+    """
+    shape = d["N"].shape
+    N = _tdigest_rows(d["N"], axis)[:, 0]
+    p = tdigest_percentiles(
+        {
+            "mean": _tdigest_rows(d["mean"], axis),
+            "weight": _tdigest_rows(d["weight"], axis),
+            "min": _tdigest_rows(d["min"], axis)[:, 0],
+            "max": _tdigest_rows(d["max"], axis)[:, 0],
+            "N": N,
+        },
+        q,
+    )
+
+    mask = N <= 0
+    if mtol < 1:
+        Nmax = reduce(mul, [original_shape[i] for i in axis], 1)
+        mask |= N < (1 - mtol) * Nmax
+
+    if mask.any():
+        p = np.ma.masked_where(
+            np.broadcast_to(mask[:, np.newaxis], p.shape), p, copy=False
+        )
+
+    # Reshape to the output shape, with a leading percentile rank axis
+    p = _tdigest_unrows(p, shape, axis)
+    p = np.moveaxis(p, axis[0], 0)
+    if keepdims:
+        p = np.expand_dims(p, axis[0] + 1)
+    else:
+        p = p.reshape(
+            (p.shape[0],)
+            + tuple(n for i, n in enumerate(shape) if i not in axis)
+        )
+
+    if not q.ndim:
+        p = p[0]
+
+    return p
+
+
 # --------------------------------------------------------------------
 # unique
 # --------------------------------------------------------------------
@@ -1427,6 +2456,29 @@ def cf_var_agg(
     if computing_meta:
         return d
 
+    var = var_from_partials(d)
+    var = mask_small_sample_size(var, d["N"], axis, mtol, original_shape)
+    return var
+
+
+def var_from_partials(d):
+    """Calculate the variance from combined partial sums.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `dict`
+            The combined partial sums, as returned by
+            `cf_var_combine`.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The variance, with the delta degrees of freedom given by
+            ``d['ddof']``.
+
+    """
     ddof = d["ddof"]
     V1 = d["V1"]
     wsum = d["sum"]
@@ -1454,7 +2506,4 @@ def cf_var_agg(
         )
 
     # Now get the required global variance with the requested ddof
-    var = f * var
-
-    var = mask_small_sample_size(var, d["N"], axis, mtol, original_shape)
-    return var
+    return f * var
@@ -5,13 +5,13 @@ instance, as would be passed to `dask.array.map_blocks`.
 
 """
 
-from functools import partial
+from functools import lru_cache, partial
 
 import numpy as np
 from cfdm.data.dask_utils import cfdm_to_memory
 from scipy.ndimage import convolve1d
 
-from ..cfdatetime import dt, dt2rt, rt2dt
+from ..cfdatetime import dt, dt2rt, element_index, rt2dt, rt2elements
 from ..units import Units
 
 
@@ -237,8 +237,8 @@ def _getattr(x, attr):
 _array_getattr = np.vectorize(_getattr, excluded="attr")
 
 
-def cf_YMDhms(a, attr):
-    """Return a date-time component from an array of date-time objects.
+def cf_YMDhms(a, attr, units=None):
+    """Return a date-time component from an array of date-times.
 
     Only applicable for data with reference time units. The returned
     array will have the same mask hardness as the original array.
@@ -251,13 +251,24 @@ def cf_YMDhms(a, attr):
     :Parameters:
 
         a: `numpy.ndarray`
-            The array from which to extract date-time component.
+            The array from which to extract date-time component,
+            containing date-time objects or, if *units* are set,
+            numeric reference times.
 
         attr: `str`
             The name of the date-time component, one of ``'year'``,
             ``'month'``, ``'day'``, ``'hour'``, ``'minute'``,
             ``'second'``.
 
+        units: `Units`, optional
+            The units of numeric reference times. If set then the
+            date-time component is calculated directly from the
+            reference times with integer calendar arithmetic, falling
+            back to creating date-time objects for calendars and units
+            that are not supported.
+
+            .. versionadded:: NEXTVERSION
+
     :Returns:
 
         `numpy.ndarray`
@@ -272,9 +283,18 @@ def cf_YMDhms(a, attr):
     ... ])
     >>> cf_YMDmhs(a, 'day')
     array([1, 2])
+    >>> cf_YMDhms(np.array([0, 1]), 'day', cf.Units('days since 2000-01-01'))
+    array([1, 2])
 
     """
     a = cfdm_to_memory(a)
+    if units is not None:
+        elements = rt2elements(a, units)
+        if elements is not None:
+            return elements[element_index[attr]]
+
+        a = cf_rt2dt(a, units)
+
     return _array_getattr(a, attr=attr)
 
 
@@ -405,11 +425,194 @@ def cf_units(a, from_units, to_units):
 
     """
     a = cfdm_to_memory(a)
+
+    if isinstance(a, np.ndarray) and a.dtype.isnative:
+        dtype = a.dtype
+        if dtype.kind == "i" and dtype.char in "il":
+            # Integers are converted to floats, as done by
+            # `Units.conform`
+            dtype = np.dtype("f4" if dtype.char == "i" else "f8")
+
+        if dtype.kind == "f" and dtype.itemsize in (4, 8):
+            conversion = _affine_units_conversion(
+                from_units.units,
+                getattr(from_units, "calendar", None),
+                to_units.units,
+                getattr(to_units, "calendar", None),
+                dtype.str,
+            )
+            if conversion is not None:
+                return _affine_units(a, dtype, *conversion)
+
+    if np.ma.isMA(a) and not a.flags.c_contiguous:
+        # Make the array contiguous before `Units.conform` does,
+        # because it would do so without keeping the mask
+        a = a.copy(order="C")
+
     return Units.conform(
         a, from_units=from_units, to_units=to_units, inplace=False
     )
 
 
+# Values used to test that an affine units conversion reproduces
+# the conversion done by `Units.conform`. The first three values are
+# used to find the offset and scale.
+_affine_units_probe = np.concatenate(
+    (
+        [0, 2**30, 1, -1, 0.5, -3.75, 273.15, 1e-3, 12345.678, 3.3e7],
+        np.random.default_rng(0).standard_normal(100)
+        * np.logspace(-3, 6, 100),
+    )
+)
+
+
+@lru_cache(maxsize=1024)
+def _affine_units_conversion(
+    from_units, from_calendar, to_units, to_calendar, dtype
+):
+    """Find the scale and offset of an affine units conversion.
+
+    Most units conversions (such as ``'K'`` to ``'degC'``, or
+    ``'Pa'`` to ``'hPa'``) are of the form ``x*scale + offset``. The
+    scale and offset are found from the conversion of a few values
+    with `Units.conform`, and are only returned if applying them to
+    the values gives identical results.
+
+    The results are cached, so that each conversion is only tested
+    once per process.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf_units`
+
+    :Parameters:
+
+        from_units: `str`
+            The existing units.
+
+        from_calendar: `str` or `None`
+            The calendar of the existing units.
+
+        to_units: `str`
+            The units to convert to.
+
+        to_calendar: `str` or `None`
+            The calendar of the units to convert to.
+
+        dtype: `str`
+            The floating point data type of the converted values.
+
+    :Returns:
+
+        `tuple` or `None`
+            The scale and offset, or `None` if the conversion is not
+            affine, or if its results can not be reproduced exactly.
+
+    """
+    from_units = Units(from_units, calendar=from_calendar)
+    to_units = Units(to_units, calendar=to_calendar)
+    if (
+        from_units.isreftime
+        or to_units.isreftime
+        or from_units.equals(to_units)
+    ):
+        # Reference time conversions are done in more than one
+        # step, and values with equal units are not changed.
+        return
+
+    x = _affine_units_probe
+    try:
+        with np.errstate(all="ignore"):
+            y = Units.conform(x, from_units, to_units, inplace=False)
+            offset = float(y[0])
+
+            # Rounding means that a scale found from converted values
+            # can differ from the scale used by the conversion in its
+            # last place, so also try their neighbours.
+            scales = []
+            for scale in ((y[1] - y[0]) / x[1], y[2] - y[0]):
+                scales.extend(
+                    (
+                        scale,
+                        np.nextafter(scale, -np.inf),
+                        np.nextafter(scale, np.inf),
+                    )
+                )
+
+            dtype = np.dtype(dtype)
+            x = x.astype(dtype)
+            y = Units.conform(x, from_units, to_units, inplace=False)
+            for scale in scales:
+                scale = float(scale)
+                if np.array_equal(_affine_units(x, dtype, scale, offset), y):
+                    return scale, offset
+    except Exception:
+        pass
+
+
+def _affine_units(a, dtype, scale, offset):
+    """Convert array values with an affine units conversion.
+
+    The values are converted with ``a*scale + offset`` in double
+    precision, without changing the input array.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf_units`
+
+    :Parameters:
+
+        a: `numpy.ndarray`
+            The array.
+
+        dtype: `numpy.dtype`
+            The floating point data type of the returned array.
+
+        scale: `float`
+            The scale of the conversion.
+
+        offset: `float`
+            The offset of the conversion.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The converted values.
+
+    """
+    x = np.ma.getdata(a)
+    if x.dtype == dtype:
+        out = np.empty_like(x)
+    else:
+        # Convert integers to floats, and then convert the units in
+        # place
+        x = x.astype(dtype)
+        out = x
+
+    # Values are converted in double precision, as is done by
+    # UDUNITS, with single precision results only being rounded once
+    if not offset:
+        np.multiply(x, scale, out=out, dtype="f8", casting="same_kind")
+    elif scale == 1:
+        np.add(x, offset, out=out, dtype="f8", casting="same_kind")
+    elif dtype.itemsize == 8:
+        np.multiply(x, scale, out=out)
+        np.add(out, offset, out=out)
+    else:
+        y = np.multiply(x, scale, dtype="f8")
+        np.add(y, offset, out=out, casting="same_kind")
+
+    x = out
+    if np.ma.isMA(a):
+        mask = a.mask
+        if mask is not np.ma.nomask:
+            mask = mask.copy()
+
+        x = np.ma.masked_array(x, mask=mask)
+
+    return x
+
+
 def cf_is_masked(a):
     """Determine whether an array has masked values.
 
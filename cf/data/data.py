@@ -33,6 +33,7 @@ from ..functions import (
 from ..mixin2 import Container
 from ..units import Units
 from .collapse import Collapse
+from .collapse.dask_collapse import cf_tdigest_percentile
 from .dask_utils import (
     cf_contains,
     cf_dt2rt,
@@ -42,7 +43,13 @@ from .dask_utils import (
     cf_units,
 )
 from .mixin import DataClassDeprecationsMixin
-from .utils import YMDhms, collapse, conform_units, scalar_masked_array
+from .utils import (
+    YMDhms,
+    collapse,
+    conform_units,
+    parse_weights,
+    scalar_masked_array,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -1044,6 +1051,7 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
         squeeze=False,
         mtol=1,
         inplace=False,
+        compression=None,
         interpolation=None,
         interpolation2=None,
     ):
@@ -1122,6 +1130,10 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
 
             {{inplace: `bool`, optional}}
 
+            {{percentile compression: `int` or `None`, optional}}
+
+                .. versionadded:: NEXTVERSION
+
             interpolation: deprecated at version 3.14.0
                 Use the *method* parameter instead.
 
@@ -1215,7 +1227,23 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
         if q.ndim > 1:
             q = q.flatten()
 
-        if not np.issubdtype(d.dtype, np.number):
+        if method == "tdigest":
+            if compression is None:
+                compression = 100
+            elif compression < 1:
+                raise ValueError(
+                    "Can't calculate percentiles: compression must be a "
+                    f"positive integer. Got {compression!r}"
+                )
+            else:
+                compression = int(compression)
+
+            if not is_dask_collection(q) and ((q < 0) | (q > 100)).any():
+                raise ValueError(
+                    "Can't calculate percentiles: Percentile ranks must be "
+                    f"between 0 and 100 inclusive. Got {ranks!r}"
+                )
+        elif not np.issubdtype(d.dtype, np.number):
             method = "nearest"
 
         if axes is None:
@@ -1223,24 +1251,35 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
         else:
             axes = tuple(sorted(d._parse_axes(axes)))
 
-        # 'cf_percentile' has its own call to 'cfdm_to_memory', so we
-        # can set '_force_to_memory=False'.
+        # 'cf_percentile' and 'cf_tdigest_chunk' have their own calls
+        # to 'cfdm_to_memory', so we can set '_force_to_memory=False'.
         dx = d.to_dask_array(_force_to_memory=False)
         dtype = dx.dtype
         shape = dx.shape
 
-        # Rechunk the data so that the dimensions over which
-        # percentiles are being calculated all have one chunk.
-        #
-        # Make sure that no new chunks are larger (in bytes) than any
-        # original chunk.
-        new_chunks = normalize_chunks(
-            [-1 if i in axes else "auto" for i in range(dx.ndim)],
-            shape=shape,
-            dtype=dtype,
-            limit=dtype.itemsize * reduce(mul, map(max, dx.chunks), 1),
-        )
-        dx = dx.rechunk(new_chunks)
+        if method == "tdigest":
+            # Reduce the data to a t-digest for each output element,
+            # without rechunking
+            dx = Collapse().tdigest(dx, axis=axes, compression=compression)
+            func = cf_tdigest_percentile
+            args = (q, axes, not squeeze, mtol, shape)
+            token = compression
+        else:
+            # Rechunk the data so that the dimensions over which
+            # percentiles are being calculated all have one chunk.
+            #
+            # Make sure that no new chunks are larger (in bytes) than
+            # any original chunk.
+            new_chunks = normalize_chunks(
+                [-1 if i in axes else "auto" for i in range(dx.ndim)],
+                shape=shape,
+                dtype=dtype,
+                limit=dtype.itemsize * reduce(mul, map(max, dx.chunks), 1),
+            )
+            dx = dx.rechunk(new_chunks)
+            func = cf_percentile
+            args = (q, axes, method, not squeeze, mtol)
+            token = None
 
         # Initialise the indices of each chunk of the result
         #
@@ -1259,19 +1298,10 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
             keys = [(0,) + k for k in keys]
 
         # Create a new dask dictionary for the result
-        name = "cf-percentile-" + tokenize(dx, axes, q, method)
+        name = "cf-percentile-" + tokenize(dx, axes, q, method, token)
         name = (name,)
         dsk = {
-            name
-            + chunk_index: (
-                cf_percentile,
-                dask_key,
-                q,
-                axes,
-                method,
-                keepdims,
-                mtol,
-            )
+            name + chunk_index: (func, dask_key) + args
             for chunk_index, dask_key in zip(keys, flatten(dx.__dask_keys__()))
         }
 
@@ -6421,6 +6451,328 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
         d._set_dask(da.round(dx, decimals=decimals))
         return d
 
+    def grouped_collapse(
+        self,
+        method,
+        axis,
+        groups,
+        weights=None,
+        mtol=1,
+        ddof=0,
+        split_every=None,
+    ):
+        """Collapse groups of elements along an axis.
+
+        The axis is collapsed to one element for each group, where
+        each group comprises any elements along the axis, not
+        necessarily contiguous. All groups are collapsed together
+        from a single pass over the data, which results in far fewer
+        Dask tasks than collapsing a subspace for each group.
+
+        The collapsed value for each group is the same as that of the
+        corresponding collapse method (such as `max`, `var`, etc.)
+        applied to that group.
+
+        See
+        https://ncas-cms.github.io/cf-python/analysis.html#collapse-methods
+        for mathematical definitions.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `integral`, `max`, `maximum_absolute_value`,
+                     `mean`, `mean_absolute_value`, `mid_range`,
+                     `min`, `minimum_absolute_value`, `range`,
+                     `root_mean_square`, `sample_size`, `sd`, `sum`,
+                     `sum_of_squares`, `sum_of_weights`,
+                     `sum_of_weights2`, `var`
+
+        :Parameters:
+
+            method: `str`
+                The collapse method, any of ``'integral'``,
+                ``'max'``, ``'maximum_absolute_value'``, ``'mean'``,
+                ``'mean_absolute_value'``, ``'mid_range'``,
+                ``'min'``, ``'minimum_absolute_value'``,
+                ``'range'``, ``'root_mean_square'``,
+                ``'sample_size'``, ``'sd'``, ``'sum'``,
+                ``'sum_of_squares'``, ``'sum_of_weights'``,
+                ``'sum_of_weights2'``, and ``'var'``.
+
+            axis: `int`
+                The axis to be collapsed.
+
+            groups: 1-d array_like of `int`
+                The group of each element along the axis, numbered
+                from 0. Elements in negative groups are not in any
+                group. The size of the collapsed axis is one more than
+                the largest group number.
+
+            {{weights: data_like, `dict`, or `None`, optional}}
+
+                The weights are ignored by the ``'max'``,
+                ``'maximum_absolute_value'``, ``'mid_range'``,
+                ``'min'``, ``'minimum_absolute_value'``,
+                ``'range'``, and ``'sample_size'`` methods.
+
+            {{mtol: number, optional}}
+
+                The threshold applies to the number of elements in
+                each group.
+
+            {{ddof: number}}
+
+                By default *ddof* is 0.
+
+            {{split_every: `int` or `dict`, optional}}
+
+        :Returns:
+
+            `Data`
+                The collapsed data.
+
+        **Examples**
+
+        >>> d = cf.Data(np.arange(12).reshape(6, 2), 'K')
+        >>> d[1, 1] = cf.masked
+        >>> e = d.grouped_collapse('mean', 0, [0, 0, 1, 1, 1, -1])
+        >>> e
+        <CF Data(2, 2): [[1.0, ..., 7.0]] K>
+        >>> print(e.array)
+        [[1. 1.]
+         [6. 7.]]
+        >>> print(d.grouped_collapse('sample_size', 0, [1, 1, 0, 0, 0, 0]))
+        [[4 4]
+         [2 1]]
+
+        """
+        if method == "sum_of_squares":
+            return self.square().grouped_collapse(
+                "sum",
+                axis,
+                groups,
+                weights=weights,
+                mtol=mtol,
+                ddof=ddof,
+                split_every=split_every,
+            )
+
+        collapse_method = {
+            "integral": "sum",
+            "maximum_absolute_value": "max_abs",
+            "mean_absolute_value": "mean_abs",
+            "minimum_absolute_value": "min_abs",
+            "root_mean_square": "rms",
+            "sd": "var",
+        }.get(method, method)
+
+        if collapse_method not in (
+            "max",
+            "max_abs",
+            "mean",
+            "mean_abs",
+            "mid_range",
+            "min",
+            "min_abs",
+            "range",
+            "rms",
+            "sample_size",
+            "sum",
+            "sum_of_weights",
+            "sum_of_weights2",
+            "var",
+        ):
+            raise ValueError(
+                f"Can't do a grouped collapse with method {method!r}"
+            )
+
+        axis = self._parse_axes(axis)
+        if len(axis) != 1:
+            raise ValueError(
+                "Can't do a grouped collapse on multiple axes "
+                "simultaneously"
+            )
+
+        axis = axis[0]
+        weights = parse_weights(self, weights, axis)
+
+        d = self.copy(array=False)
+
+        # The chunk function has its own call to 'cfdm_to_memory', so
+        # we can set '_force_to_memory=False'.
+        dx = self.to_dask_array(_force_to_memory=False)
+        dx = Collapse().grouped(
+            dx,
+            collapse_method,
+            groups,
+            axis=axis,
+            weights=weights,
+            mtol=mtol,
+            ddof=ddof,
+            split_every=split_every,
+        )
+        d._set_dask(dx)
+
+        if d.size != self.size:
+            # Remove the out-dated HDF5 chunking strategy
+            d.nc_clear_hdf5_chunksizes()
+
+        units = self.Units
+        if method == "integral":
+            weights_units = getattr(weights, "Units", None)
+            if weights_units:
+                if units:
+                    units = units * weights_units
+                else:
+                    units = weights_units
+        elif method == "sample_size":
+            units = _units_None
+        elif method == "sum_of_weights":
+            units = getattr(weights, "Units", None)
+            if units is None:
+                units = _units_None
+        elif method == "sum_of_weights2":
+            units = getattr(weights, "Units", None)
+            if not units:
+                units = _units_None
+            else:
+                units = units**2
+        elif collapse_method == "var" and units:
+            units = units**2
+
+        d.override_units(units, inplace=True)
+
+        if method == "sd":
+            d.sqrt(inplace=True)
+
+        return d
+
+    def multi_collapse(
+        self,
+        methods,
+        axes=None,
+        weights=None,
+        squeeze=False,
+        mtol=1,
+        ddof=0,
+        split_every=None,
+    ):
+        """Calculate several statistics from a single pass over the data.
+
+        The partial sums, extrema and sample sizes needed by all of
+        the methods are calculated together, so that the returned
+        data share a single reading of the original data when they
+        are computed together (e.g. with `dask.compute`, or by
+        `stats`). Each result is the same as that of the
+        corresponding individual collapse method.
+
+        See
+        https://ncas-cms.github.io/cf-python/analysis.html#collapse-methods
+        for mathematical definitions.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `max`, `mean`, `mid_range`, `min`, `range`,
+                     `sample_size`, `sd`, `stats`, `sum`, `var`
+
+        :Parameters:
+
+            methods: sequence of `str`
+                The collapse methods, any of ``'max'``, ``'mean'``,
+                ``'mid_range'``, ``'min'``, ``'range'``,
+                ``'sample_size'``, ``'sd'``, ``'sum'``, and
+                ``'var'``.
+
+            {{collapse axes: (sequence of) `int`, optional}}
+
+            {{weights: data_like, `dict`, or `None`, optional}}
+
+                The weights are ignored by the ``'max'``,
+                ``'mid_range'``, ``'min'``, ``'range'``, and
+                ``'sample_size'`` methods.
+
+            {{collapse squeeze: `bool`, optional}}
+
+            {{mtol: number, optional}}
+
+            {{ddof: number}}
+
+                By default *ddof* is 0.
+
+            {{split_every: `int` or `dict`, optional}}
+
+        :Returns:
+
+            `dict`
+                The collapsed data for each method, keyed by method
+                name.
+
+        **Examples**
+
+        >>> a = np.ma.arange(12).reshape(4, 3)
+        >>> d = cf.Data(a, 'K')
+        >>> d[1, 1] = cf.masked
+        >>> out = d.multi_collapse(['max', 'mean', 'sd'])
+        >>> out['max']
+        <CF Data(1, 1): [[11]] K>
+        >>> out['mean']
+        <CF Data(1, 1): [[5.636363636363637]] K>
+        >>> out['sd']
+        <CF Data(1, 1): [[3.5744733184250004]] K>
+
+        """
+        methods = tuple(dict.fromkeys(methods))
+
+        # Standard deviations are calculated from variances
+        collapse_methods = ["var" if m == "sd" else m for m in methods]
+
+        if axes is None:
+            axes = tuple(range(self.ndim))
+        else:
+            axes = tuple(self._parse_axes(axes))
+
+        weights = parse_weights(self, weights, axes)
+
+        # The chunk function has its own call to 'cfdm_to_memory', so
+        # we can set '_force_to_memory=False'.
+        dx = self.to_dask_array(_force_to_memory=False)
+        dxs = Collapse().multi(
+            dx,
+            collapse_methods,
+            axis=axes,
+            weights=weights,
+            keepdims=not squeeze,
+            mtol=mtol,
+            ddof=ddof,
+            split_every=split_every,
+        )
+
+        out = {}
+        for method, collapse_method in zip(methods, collapse_methods):
+            d = self.copy(array=False)
+            d._set_dask(dxs[collapse_method])
+
+            if squeeze:
+                # Remove collapsed axis names
+                d._axes = [a for i, a in enumerate(d._axes) if i not in axes]
+
+            if d.size != self.size:
+                # Remove the out-dated HDF5 chunking strategy
+                d.nc_clear_hdf5_chunksizes()
+
+            if method == "sample_size":
+                d.override_units(_units_None, inplace=True)
+            elif collapse_method == "var":
+                units = d.Units
+                if units:
+                    d.override_units(units**2, inplace=True)
+
+                if method == "sd":
+                    d.sqrt(inplace=True)
+
+            out[method] = d
+
+        return out
+
     def stats(
         self,
         all=False,
@@ -6455,7 +6807,7 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
                      `root_mean_square`, `sample_size`,
                      `minimum_absolute_value`, `maximum_absolute_value`,
                      `mean_absolute_value`, `mean_of_upper_decile`, `sum`,
-                     `sum_of_squares`, `variance`
+                     `sum_of_squares`, `variance`, `multi_collapse`
 
         :Parameters:
 
@@ -6602,7 +6954,21 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
             "maximum_absolute_value",
         )
 
-        out = {}
+        # The statistics that are calculated together from a single
+        # pass over the data
+        multi_methods = {
+            "minimum": "min",
+            "mean": "mean",
+            "maximum": "max",
+            "range": "range",
+            "mid_range": "mid_range",
+            "standard_deviation": "sd",
+            "sum": "sum",
+            "variance": "var",
+            "sample_size": "sample_size",
+        }
+
+        stats = []
         for stat in (
             "minimum",
             "mean",
@@ -6619,8 +6985,24 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
             "sum",
             "sum_of_squares",
             "variance",
+            "sample_size",
         ):
             if all or locals()[stat]:
+                stats.append(stat)
+
+        multi = [
+            multi_methods[stat] for stat in stats if stat in multi_methods
+        ]
+        if multi:
+            multi = self.multi_collapse(multi, weights=weights)
+
+        out = {}
+        for stat in stats:
+            if stat == "sample_size":
+                out[stat] = multi["sample_size"]
+            elif stat in multi_methods:
+                out[stat] = multi[multi_methods[stat]].squeeze()
+            else:
                 func = getattr(self, stat)
                 if stat in no_weights:
                     value = delayed(func)(squeeze=True)
@@ -6629,14 +7011,20 @@ class Data(DataClassDeprecationsMixin, Container, cfdm.Data):
 
                 out[stat] = value
 
-        if all or sample_size:
-            out["sample_size"] = delayed(lambda: self.sample_size())()
-
         data_values = compute(out)[0]
         if values:
             # Convert cf.Data objects holding the scalars (or scalar array
-            # for the case of sample_size only) to scalar values
-            return {op: val.array.item() for op, val in data_values.items()}
+            # for the case of sample_size only) to scalar values,
+            # computing them together so that the data are only read
+            # once for all of the statistics calculated by
+            # 'multi_collapse'
+            values = compute(
+                *[val.to_dask_array() for val in data_values.values()]
+            )
+            return {
+                op: np.asanyarray(value).item()
+                for op, value in zip(data_values, values)
+            }
         else:
             return data_values
 
@@ -219,9 +219,19 @@ def YMDhms(d, attr):
     if not units.isreftime:
         raise ValueError(f"Can't get {attr}s from data with {units!r}")
 
-    d = d._asdatetime()
-    dx = d.to_dask_array()
-    dx = dx.map_blocks(partial(cf_YMDhms, attr=attr), dtype=int)
+    if d._isdatetime():
+        cf_func = partial(cf_YMDhms, attr=attr)
+    else:
+        # Calculate the date-time components directly from the
+        # numeric reference times
+        cf_func = partial(cf_YMDhms, attr=attr, units=units)
+
+    d = d.copy()
+
+    # 'cf_YMDhms' has its own call to 'cfdm_to_memory', so we can set
+    # '_force_to_memory=False'.
+    dx = d.to_dask_array(_force_to_memory=False)
+    dx = dx.map_blocks(cf_func, dtype=int)
     d._set_dask(dx)
     d.override_units(Units(None), inplace=True)
     return d
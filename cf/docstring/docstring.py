@@ -303,7 +303,36 @@ _docstring_substitution_definitions = {
                 ``'higher'``
                 ``'nearest'``
                 ``'midpoint'``
-                ===============================""",
+                ``'tdigest'``
+                ===============================
+
+                The ``'tdigest'`` method calculates approximate
+                percentiles from t-digests, which are mergeable
+                summaries of the distribution of the data, with the
+                ``'linear'`` method of interpolation. A t-digest is
+                created for each chunk of the data and the t-digests
+                are merged with a tree reduction, so that, unlike the
+                other methods, the data do not need to be rechunked to
+                have a single chunk along the axes over which the
+                percentiles are calculated. This can save a lot of
+                memory and time for data that are chunked along these
+                axes. The accuracy is controlled by the *compression*
+                parameter. The percentiles are exact when no more than
+                *compression* values contribute to each of them.""",
+    # percentile compression
+    "{{percentile compression: `int` or `None`, optional}}": """compression: `int` or `None`, optional
+                The maximum number of centroids in each t-digest when
+                *method* is ``'tdigest'``, otherwise ignored. If
+                `None`, the default, then a value of 100 is used. A
+                larger value gives more accurate percentiles, but
+                needs more memory, which is proportional to
+                *compression* times the size of the output data.
+
+                For normally distributed data, a compression of 100
+                typically gives percentiles that are within 0.3
+                percentile ranks of their requested ranks, with
+                smaller errors towards the extremes of the
+                distribution.""",
     # use_src_mask
     "{{use_src_mask: `bool`, optional}}": """use_src_mask: `bool`, optional
                 By default the mask of the source field is taken into
@@ -177,6 +177,50 @@ _collapse_weighted_methods = set(
 # --------------------------------------------------------------------
 _collapse_ddof_methods = set(("sd", "var"))
 
+# --------------------------------------------------------------------
+# These Data methods may be calculated together from a single pass
+# over the data
+# --------------------------------------------------------------------
+_collapse_multi_methods = set(
+    (
+        "max",
+        "mean",
+        "mid_range",
+        "min",
+        "range",
+        "sample_size",
+        "sd",
+        "sum",
+        "var",
+    )
+)
+
+# --------------------------------------------------------------------
+# These Data methods may be calculated for all groups of a grouped
+# collapse from a single pass over the data
+# --------------------------------------------------------------------
+_collapse_grouped_methods = set(
+    (
+        "integral",
+        "max",
+        "maximum_absolute_value",
+        "mean",
+        "mean_absolute_value",
+        "mid_range",
+        "min",
+        "minimum_absolute_value",
+        "range",
+        "root_mean_square",
+        "sample_size",
+        "sd",
+        "sum",
+        "sum_of_squares",
+        "sum_of_weights",
+        "sum_of_weights2",
+        "var",
+    )
+)
+
 _earth_radius = Data(6371229.0, "m")
 
 _relational_methods = (
@@ -4922,6 +4966,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
         remove_vertical_crs=True,
         _create_zero_size_cell_bounds=False,
         _update_cell_methods=True,
+        _multi=None,
         i=False,
         _debug=False,
         **kwargs,
@@ -5319,7 +5364,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
 
         :Parameters:
 
-            method: `str`
+            method: `str` or sequence of `str`
                 Define the collapse method. All of the axes specified by
                 the *axes* parameter are collapsed simultaneously by this
                 method. The method is given by one of the following
@@ -5438,6 +5483,34 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                 ...     'time: minimum within years', within_years=cf.M())
                 >>> g = g.collapse('mean over years', axes='T')
 
+                Several statistics of the same axes may be calculated
+                from a single pass over the data by providing a
+                sequence of collapse methods, in which case a
+                `FieldList` containing the collapsed field construct
+                for each method is returned. Each method must be one
+                of ``'maximum'``, ``'minimum'``, ``'mid_range'``,
+                ``'range'``, ``'sum'``, ``'sample_size'``, ``'mean'``,
+                ``'variance'``, or ``'standard_deviation'`` (or one of
+                their alternative names), and grouped collapses are
+                not allowed. The weights, if any, are only applied to
+                the methods that "May be" weighted. For example:
+
+                >>> fl = f.collapse(['mean', 'max', 'min', 'sd'], axes='T')
+
+                gives the same fields as:
+
+                >>> fl = cf.FieldList(
+                ...     [f.collapse(m, axes='T')
+                ...      for m in ('mean', 'max', 'min', 'sd')]
+                ... )
+
+                but the data of the collapsed fields are derived from
+                one shared reduction of the original data, which is
+                only read once when they are computed together
+                (e.g. with `dask.compute`).
+
+                .. versionadded:: NEXTVERSION
+
             axes: (sequence of) `str`, optional
                 The axes to be collapsed, defined by those which would be
                 selected by passing each given axis description to a call
@@ -6421,10 +6494,12 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
 
         :Returns:
 
-            `Field` or `numpy.ndarray`
+            `Field`, `FieldList`, or `numpy.ndarray`
                  The collapsed field construct. Alternatively, if the
                  *regroup* parameter is True then a `numpy` array is
-                 returned.
+                 returned, or if *method* is a sequence of collapse
+                 methods then a `FieldList` of the collapsed field
+                 constructs is returned.
 
         **Examples**
 
@@ -6449,6 +6524,68 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
 
         debug = is_log_level_debug(logger)
 
+        if not isinstance(method, str):
+            # --------------------------------------------------------
+            # Collapse with multiple methods from a single pass over
+            # the data
+            # --------------------------------------------------------
+            methods = tuple(method)
+            for method in methods:
+                if (
+                    _collapse_methods.get(method)
+                    not in _collapse_multi_methods
+                ):
+                    raise ValueError(
+                        f"Can't collapse: Method {method!r} can't be "
+                        "combined with other collapse methods"
+                    )
+
+            if inplace:
+                raise ValueError(
+                    "Can't collapse in-place with multiple collapse methods"
+                )
+
+            if group is not None or regroup:
+                raise ValueError(
+                    "Can't do a grouped collapse with multiple collapse "
+                    "methods"
+                )
+
+            # The state shared by the collapses for each method
+            multi = {
+                "methods": tuple(
+                    dict.fromkeys([_collapse_methods[m] for m in methods])
+                ),
+                "weighted": not _collapse_weighted_methods.isdisjoint(methods),
+            }
+
+            return FieldList(
+                [
+                    self.collapse(
+                        method,
+                        axes=axes,
+                        squeeze=squeeze,
+                        mtol=mtol,
+                        weights=weights,
+                        ddof=ddof,
+                        coordinate=coordinate,
+                        group_by=group_by,
+                        measure=measure,
+                        scale=scale,
+                        radius=radius,
+                        great_circle=great_circle,
+                        verbose=verbose,
+                        remove_vertical_crs=remove_vertical_crs,
+                        _create_zero_size_cell_bounds=(
+                            _create_zero_size_cell_bounds
+                        ),
+                        _update_cell_methods=_update_cell_methods,
+                        _multi=multi,
+                    )
+                    for method in methods
+                ]
+            )
+
         if inplace:
             f = self
         else:
@@ -6790,7 +6927,12 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                     f"    Input weights           = {weights!r}"
                 )  # pragma: no cover
 
-            if method not in _collapse_weighted_methods:
+            if method not in _collapse_weighted_methods and not (
+                _multi is not None and _multi["weighted"]
+            ):
+                # Note: For a collapse with multiple methods, the
+                #       weights are needed if any of the methods are
+                #       weighted
                 weights = None
 
             d_kwargs = {}
@@ -6832,7 +6974,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                     "collapses"
                 )
 
-            if method in _collapse_ddof_methods:
+            if method in _collapse_ddof_methods or _multi is not None:
                 d_kwargs["ddof"] = ddof
 
             # ========================================================
@@ -6846,13 +6988,35 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                     f"    f.dtype = {f.dtype}\n"
                 )  # pragma: no cover
 
-            getattr(f.data, method)(
-                axes=iaxes,
-                squeeze=squeeze,
-                mtol=mtol,
-                inplace=True,
-                **d_kwargs,
-            )
+            if _multi is None:
+                getattr(f.data, method)(
+                    axes=iaxes,
+                    squeeze=squeeze,
+                    mtol=mtol,
+                    inplace=True,
+                    **d_kwargs,
+                )
+            else:
+                # Use the data from a single collapse with all of the
+                # methods, which is created by the first method's
+                # collapse
+                key = tuple(iaxes)
+                collapsed = _multi.get(key)
+                if collapsed is None:
+                    collapsed = f.data.multi_collapse(
+                        _multi["methods"],
+                        axes=iaxes,
+                        squeeze=squeeze,
+                        mtol=mtol,
+                        **d_kwargs,
+                    )
+                    _multi[key] = collapsed
+
+                # Note: Don't use 'f.set_data', which would check the
+                #       data shape against the not-yet-collapsed
+                #       domain axes, and replace missing units with
+                #       those of the field.
+                f._set_component("data", collapsed[method].copy(), copy=False)
 
             if squeeze:
                 # ----------------------------------------------------
@@ -7635,6 +7799,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
         # raising an exception for 'can't match', I suppose.
 
         classification = None
+        grouped_data = False
 
         if group is not None:
             if within is not None or over is not None:
@@ -8272,11 +8437,42 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
             unique = unique[np.where(unique >= 0)[0]]
             unique.sort()
 
+            # --------------------------------------------------------
+            # Where possible, collapse the data of all groups together
+            # from a single pass over the data (see
+            # `Data.grouped_collapse`). In this case each group's
+            # collapse is only used to create its metadata, and so is
+            # applied to a copy of the field whose data are replaced
+            # with lazy, uninitialised values that are never computed.
+            # --------------------------------------------------------
+            grouped_data = method in _collapse_grouped_methods
+            if grouped_data and method in ("sd", "sum", "var"):
+                # Groups with one element are not collapsed, so
+                # these methods must collapse each group separately
+                # if there are any such groups
+                counts = np.bincount(classification[classification >= 0])
+                grouped_data = counts[unique].min() > 1
+
+            if grouped_data and not regroup:
+                data = self.data.copy(array=False)
+                data._set_dask(
+                    Data.empty(
+                        self.shape, dtype=self.dtype, chunks=-1
+                    ).to_dask_array(_force_to_memory=False)
+                )
+                field = self.copy()
+                field.set_data(data, copy=False)
+            else:
+                field = self
+
+            # The group of each partial collapse
+            groups = []
+
             ignore_n = -1
             for u in unique:
                 index = np.where(classification == u)[0].tolist()
 
-                pc = self.subspace(**{axis: index})
+                pc = field.subspace(**{axis: index})
 
                 # ----------------------------------------------------
                 # Ignore groups that don't meet the specified criteria
@@ -8370,6 +8566,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                         _update_cell_methods=False,
                     )
                 )
+                groups.append(u)
 
             if regroup:
                 # return the numpy array
@@ -8410,11 +8607,14 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                 coord is not None
                 and coord.construct_type == "dimension_coordinate"
             ):
-                fl.sort(
-                    key=lambda g: g.dimension_coordinate(
-                        filter_by_axis=(axis,)
-                    ).datum(0),
-                    reverse=coord.decreasing,
+                fl, groups = zip(
+                    *sorted(
+                        zip(fl, groups),
+                        key=lambda x: x[0]
+                        .dimension_coordinate(filter_by_axis=(axis,))
+                        .datum(0),
+                        reverse=coord.decreasing,
+                    )
                 )
 
             # --------------------------------------------------------
@@ -8428,6 +8628,32 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
             except ValueError as error:
                 raise ValueError(f"Can't collapse: {error}")
 
+        if grouped_data:
+            # --------------------------------------------------------
+            # Replace the dummy data with the collapsed data of all
+            # groups, numbering the groups in the order of the
+            # concatenated partial collapses
+            # --------------------------------------------------------
+            labels = np.full((axis_size,), -1)
+            for n, u in enumerate(groups):
+                labels[classification == u] = n
+
+            d = self.data.grouped_collapse(
+                method,
+                iaxis,
+                labels,
+                weights=weights,
+                mtol=mtol,
+                ddof=ddof,
+            )
+            dx = d.to_dask_array(_force_to_memory=False)
+            data = f.get_data(_fill_value=False)
+            if dx.dtype != data.dtype:
+                # Use the same data type as the collapse of each group
+                dx = dx.astype(data.dtype)
+
+            data._set_dask(dx)
+
         if squeeze and f.domain_axes(todict=True)[axis].get_size() == 1:
             # Remove a totally collapsed axis from the field's
             # data array
@@ -11628,6 +11854,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
         method="linear",
         squeeze=False,
         mtol=1,
+        compression=None,
         interpolation=None,
     ):
         """Compute percentiles of the data along the specified axes.
@@ -11718,6 +11945,10 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
                   datum if more than 25% of its input array elements are
                   missing data: ``mtol=0.25``.
 
+            {{percentile compression: `int` or `None`, optional}}
+
+                .. versionadded:: NEXTVERSION
+
             interpolation: deprecated at version 3.14.0
                 Use the *method* parameter instead.
 
@@ -11851,6 +12082,7 @@ class Field(mixin.FieldDomain, mixin.PropertiesData, cfdm.Field):
             method=method,
             squeeze=False,
             mtol=mtol,
+            compression=compression,
         )
 
         # ------------------------------------------------------------
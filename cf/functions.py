@@ -1,11 +1,14 @@
 import atexit
 import csv
 import ctypes.util
+import hashlib
 import importlib
 import logging
+import marshal
 import os
 import platform
 import re
+import stat
 import sys
 import warnings
 from collections.abc import Iterable
@@ -23,6 +26,7 @@ import cfdm
 import netCDF4
 import numpy as np
 from dask.base import is_dask_collection
+from dask.utils import parse_bytes
 from psutil import virtual_memory
 
 from . import __file__, __version__
@@ -30,8 +34,21 @@ from .constants import (
     CONSTANTS,
     OperandBoundsCombination,
     _stash2standard_name,
+    _stash2standard_name_versions,
 )
 from .docstring import _docstring_substitution_definitions
+from .umread_lib.filepool import file_pool
+
+logger = logging.getLogger(__name__)
+
+# The suffix of compiled STASH to standard name conversion table
+# cache files
+_stash2standard_name_cache_suffix = ".stash2sn"
+
+# The version of the compiled STASH to standard name conversion table
+# cache file format. Increment this whenever the structure of the
+# parsed table changes.
+_stash2standard_name_cache_version = 2
 
 
 # Instruction to close /proc/mem at exit.
@@ -171,6 +188,9 @@ def configuration(
     active_storage=None,
     active_storage_url=None,
     active_storage_max_requests=None,
+    max_open_files=None,
+    read_cache_size=None,
+    hash_cache_size=None,
     of_fraction=None,
     collapse_parallel_mode=None,
     free_memory_factor=None,
@@ -192,6 +212,9 @@ def configuration(
     * `active_storage`
     * `active_storage_url`
     * `active_storage_max_requests`
+    * `max_open_files`
+    * `read_cache_size`
+    * `hash_cache_size`
 
     These are all constants that apply throughout cf, except for in
     specific functions only if overridden by the corresponding keyword
@@ -212,7 +235,8 @@ def configuration(
                  `total_memory`, `log_level`, `regrid_logging`,
                  `relaxed_identities`, `bounds_combination_mode`,
                  `active_storage`, `active_storage_url`,
-                 `active_storage_max_requests`
+                 `active_storage_max_requests`, `max_open_files`,
+                 `read_cache_size`, `hash_cache_size`
 
     :Parameters:
 
@@ -282,6 +306,26 @@ def configuration(
 
             .. versionadded:: 3.16.3
 
+        max_open_files: `int` or `Constant`, optional
+            The new maximum number of idle PP and UM files kept
+            open. The default is to not change the value.
+
+            .. versionadded:: NEXTVERSION
+
+        read_cache_size: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the in-memory cache of
+            the constructs read from files. The default is to not
+            change the value.
+
+            .. versionadded:: NEXTVERSION
+
+        hash_cache_size: `int` or `str` or `Constant`, optional
+            The new maximum size in bytes of the in-memory cache of
+            the metadata arrays used for aggregation. The default is
+            to not change the value.
+
+            .. versionadded:: NEXTVERSION
+
         of_fraction: `float` or `Constant`, optional
             Deprecated at version 3.14.0 and is no longer
             available.
@@ -314,7 +358,10 @@ def configuration(
      'chunksize': 82873466.88000001,
      'active_storage': False,
      'active_storage_url': None,
-     'active_storage_max_requests': 100}
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
     >>> cf.chunksize(7.5e7)  # any change to one constant...
     82873466.88000001
     >>> cf.configuration()['chunksize']  # ...is reflected in the configuration
@@ -331,7 +378,10 @@ def configuration(
      'chunksize': 75000000.0,
      'active_storage': False,
      'active_storage_url': None,
-     'active_storage_max_requests': 100}
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
     >>> cf.configuration()  # the items set have been updated accordingly
     {'rtol': 2.220446049250313e-16,
      'atol': 2.220446049250313e-16,
@@ -343,7 +393,10 @@ def configuration(
      'chunksize': 75000000.0,
      'active_storage': False,
      'active_storage_url': None,
-     'active_storage_max_requests': 100}
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
 
     Use as a context manager:
 
@@ -357,7 +410,11 @@ def configuration(
      'bounds_combination_mode': 'AND',
      'chunksize': 75000000.0,
      'active_storage': False,
-     'active_storage_url': None}
+     'active_storage_url': None,
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
     >>> with cf.configuration(atol=9, rtol=10):
     ...     print(cf.configuration())
     ...
@@ -371,7 +428,10 @@ def configuration(
      'chunksize': 75000000.0,
      'active_storage': False,
      'active_storage_url': None,
-     'active_storage_max_requests': 100}
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
     >>> print(cf.configuration())
     {'rtol': 2.220446049250313e-16,
      'atol': 2.220446049250313e-16,
@@ -383,7 +443,10 @@ def configuration(
      'chunksize': 75000000.0,
      'active_storage': False,
      'active_storage_url': None,
-     'active_storage_max_requests': 100}
+     'active_storage_max_requests': 100,
+     'max_open_files': 64,
+     'read_cache_size': 0,
+     'hash_cache_size': 0}
 
     """
     if of_fraction is not None:
@@ -417,6 +480,9 @@ def configuration(
         active_storage=active_storage,
         active_storage_url=active_storage_url,
         active_storage_max_requests=active_storage_max_requests,
+        max_open_files=max_open_files,
+        read_cache_size=read_cache_size,
+        hash_cache_size=hash_cache_size,
     )
 
 
@@ -469,6 +535,9 @@ def _configuration(_Configuration, **kwargs):
         "active_storage": active_storage,
         "active_storage_url": active_storage_url,
         "active_storage_max_requests": active_storage_max_requests,
+        "max_open_files": max_open_files,
+        "read_cache_size": read_cache_size,
+        "hash_cache_size": hash_cache_size,
     }
 
     old_values = {}
@@ -1341,6 +1410,250 @@ class active_storage_max_requests(ConstantAccess):
         return int(arg)
 
 
+class max_open_files(ConstantAccess):
+    """The maximum number of idle PP and UM files kept open.
+
+    Files of PP and UM fields files that are opened to read the data
+    of a field are kept open in a process-wide pool after the read,
+    so that subsequent reads of the same file, such as for other Dask
+    chunks, do not need to open it again. This sets the maximum
+    number of files kept open by the pool when they are not being
+    read from, above which the least recently used files are
+    closed. A value of ``0`` disables the pool, so that every file is
+    closed after each read. The default is ``64``.
+
+    The open files may be inspected with `cf.open_files` and closed
+    with `cf.close_files`.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.close_files`, `cf.open_files`, `configuration`
+
+    :Parameters:
+
+        arg: `int` or `Constant`, optional
+            The new maximum number of idle open files. The default is
+            to not change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> cf.max_open_files()
+    64
+    >>> old = cf.max_open_files(10)
+    >>> cf.max_open_files()
+    10
+    >>> cf.max_open_files(old)
+    10
+    >>> cf.max_open_files()
+    64
+    >>> with cf.max_open_files(0):
+    ...     print(cf.max_open_files())
+    ...
+    0
+
+    """
+
+    _name = "MAX_OPEN_FILES"
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `CONSTANTS` dictionary.
+
+        """
+        arg = int(arg)
+        if arg < 0:
+            raise ValueError(
+                "Can't set max_open_files: Must be a non-negative "
+                f"integer. Got: {arg!r}"
+            )
+
+        file_pool.max_files = arg
+        return arg
+
+
+class _CacheSize(ConstantAccess):
+    """The maximum size of an in-memory cache, in bytes.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.hash_cache_size`, `cf.read_cache_size`
+
+    """
+
+    def _parse(cls, arg):
+        """Parse a new constant value.
+
+        .. versionaddedd:: NEXTVERSION
+
+        :Parameters:
+
+            cls:
+                This class.
+
+            arg:
+                The given new constant value.
+
+        :Returns:
+
+                A version of the new constant value suitable for
+                insertion into the `CONSTANTS` dictionary.
+
+        """
+        if isinstance(arg, str):
+            arg = parse_bytes(arg)
+
+        arg = int(arg)
+        if arg < 0:
+            raise ValueError(
+                f"Can't set {cls.__name__}: Must be a non-negative "
+                f"integer. Got: {arg!r}"
+            )
+
+        return arg
+
+
+class read_cache_size(_CacheSize):
+    """The maximum size of the in-memory cache of constructs read from
+    files.
+
+    When the cache is enabled, the field or domain constructs created
+    by `cf.read` from each local file, prior to aggregation, are kept
+    in memory. A subsequent `cf.read` of the same file, with the same
+    keyword parameters that affect the constructs created, returns
+    copies of the cached constructs without opening the file, as
+    long as the file has the same path, size and modification time
+    as when it was read. Copying the cached constructs does not copy
+    any data values, which are always read lazily from the original
+    files.
+
+    This sets the maximum total size of the cached constructs in
+    bytes, as estimated from the number of constructs and the size of
+    any of their data values that are in memory, above which the
+    least recently used files are removed from the cache. A value of ``0``, the default, disables
+    the cache, and any cached constructs are discarded by the next
+    `cf.read`.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.read`, `configuration`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum size of the cache in bytes, or a string
+            that gives the size with units (e.g. ``'100 MiB'``). The
+            default is to not change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> cf.read_cache_size()
+    0
+    >>> old = cf.read_cache_size('100 MiB')
+    >>> cf.read_cache_size()
+    104857600
+    >>> f = cf.read('file.nc')
+    >>> g = cf.read('file.nc')  # Fast
+    >>> cf.read_cache_size(old)
+    104857600
+    >>> cf.read_cache_size()
+    0
+    >>> with cf.read_cache_size(10e6):
+    ...     print(cf.read_cache_size())
+    ...
+    10000000
+
+    """
+
+    _name = "READ_CACHE_SIZE"
+
+
+class hash_cache_size(_CacheSize):
+    """The maximum size of the in-memory cache of metadata arrays used
+    for aggregation.
+
+    `cf.aggregate` needs the values of the coordinates and other
+    metadata arrays of the field constructs being aggregated. When
+    the cache is enabled, the values of such arrays that are stored
+    in local files are kept in memory, so that aggregating the same
+    field constructs again, for instance after reading the same
+    files with `cf.read`, does not read the arrays from the files
+    again. An entry is only used if its files have the same paths,
+    sizes and modification times as when the entry was created.
+    Arrays with identical values, such as the same grid stored in
+    many files, are only kept once.
+
+    This sets the maximum total size of the cached arrays in bytes,
+    above which the least recently used arrays are removed from the
+    cache. A value of ``0``, the default, disables the cache. See
+    the *hash_cache* parameter of `cf.aggregate` for a cache that
+    persists between sessions.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.aggregate`, `configuration`
+
+    :Parameters:
+
+        arg: `int` or `str` or `Constant`, optional
+            The new maximum size of the cache in bytes, or a string
+            that gives the size with units (e.g. ``'100 MiB'``). The
+            default is to not change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples**
+
+    >>> cf.hash_cache_size()
+    0
+    >>> old = cf.hash_cache_size('100 MiB')
+    >>> cf.hash_cache_size()
+    104857600
+    >>> f = cf.read('files*.nc')
+    >>> g = cf.read('files*.nc')  # Faster aggregation
+    >>> cf.hash_cache_size(old)
+    104857600
+    >>> cf.hash_cache_size()
+    0
+    >>> with cf.hash_cache_size(10e6):
+    ...     print(cf.hash_cache_size())
+    ...
+    10000000
+
+    """
+
+    _name = "HASH_CACHE_SIZE"
+
+
 def CF():
     """The version of the CF conventions.
 
@@ -1741,7 +2054,10 @@ def open_files_threshold_exceeded():
 def close_files(file_format=None):
     """Close open files containing sub-arrays of data arrays.
 
-    Deprecated at version 3.14.0 and is no longer available.
+    Files of PP and UM fields files that were opened to read the data
+    of a field are kept open in a process-wide pool, so that they may
+    be reused by subsequent reads. This function closes all of the
+    files in that pool that are not currently being read from.
 
     By default all such files are closed, but this may be restricted
     to files of a particular format.
@@ -1751,19 +2067,20 @@ def close_files(file_format=None):
 
     If there are no appropriate open files then no action is taken.
 
-    .. seealso:: `cf.close_one_file`, `cf.open_files`,
-                 `cf.open_files_threshold_exceeded`
+    .. seealso:: `cf.max_open_files`, `cf.open_files`
 
     :Parameters:
 
         file_format: `str`, optional
             Only close files of the given format. Recognised formats
-            are ``'netCDF'`` and ``'PP'``. By default files of any
-            format are closed.
+            are ``'netCDF'`` and ``'PP'``, where ``'PP'`` includes UM
+            fields files. By default files of any format are
+            closed. netCDF files are never kept open, so there are
+            never any of them to close.
 
     :Returns:
 
-        None
+        `None`
 
     **Examples**
 
@@ -1772,10 +2089,9 @@ def close_files(file_format=None):
     >>> cf.close_files('PP')
 
     """
-    # TODODASKAPI
-    _DEPRECATION_ERROR_FUNCTION(
-        "close_files", version="3.14.0", removed_at="5.0.0"
-    )  # pragma: no cover
+    _check_file_format(file_format)
+    if file_format in (None, "PP"):
+        file_pool.close()
 
 
 def close_one_file(file_format=None):
@@ -1829,30 +2145,32 @@ def close_one_file(file_format=None):
 
 
 def open_files(file_format=None):
-    """Return the open files containing sub-arrays of master data
-    arrays.
+    """Return the open files containing sub-arrays of data arrays.
 
-    Deprecated at version 3.14.0 and is no longer available.
+    Files of PP and UM fields files that were opened to read the data
+    of a field are kept open in a process-wide pool, so that they may
+    be reused by subsequent reads. This function returns the files in
+    that pool that are not currently being read from.
 
     By default all such files are returned, but the selection may be
     restricted to files of a particular format.
 
-    .. seealso:: `cf.close_files`, `cf.close_one_file`,
-                 `cf.open_files_threshold_exceeded`
+    .. seealso:: `cf.close_files`, `cf.max_open_files`
 
     :Parameters:
 
         file_format: `str`, optional
             Only return files of the given format. Recognised formats
-            are ``'netCDF'`` and ``'PP'``. By default all files are
-            returned.
+            are ``'netCDF'`` and ``'PP'``, where ``'PP'`` includes UM
+            fields files. By default all files are returned. netCDF
+            files are never kept open, so none are ever returned.
 
     :Returns:
 
         `dict`
             If *file_format* is set then return a dictionary of file
-            names of the specified format and their open file
-            objects. If *file_format* is not set then return a
+            names of the specified format and lists of their open
+            file objects. If *file_format* is not set then return a
             dictionary for which each key is a file format whose value
             is the dictionary that would have been returned if the
             *file_format* parameter was set.
@@ -1860,17 +2178,50 @@ def open_files(file_format=None):
     **Examples**
 
     >>> cf.open_files()
-    {'netCDF': {'file1.nc': <netCDF4.Dataset at 0x187b6d0>}}
-    >>> cf.open_files('netCDF')
-    {'file1.nc': <netCDF4.Dataset at 0x187b6d0>}
+    {'PP': {'file1.pp': [<cf.umread_lib.umfile.File object at 0x7f0>]}}
     >>> cf.open_files('PP')
+    {'file1.pp': [<cf.umread_lib.umfile.File object at 0x7f0>]}
+    >>> cf.open_files('netCDF')
+    {}
+    >>> cf.close_files()
+    >>> cf.open_files()
     {}
 
     """
-    # TODODASKAPI
-    _DEPRECATION_ERROR_FUNCTION(
-        "open_files", version="3.14.0", removed_at="5.0.0"
-    )  # pragma: no cover
+    _check_file_format(file_format)
+    if file_format == "netCDF":
+        return {}
+
+    files = file_pool.files()
+    if file_format is not None:
+        return files
+
+    if not files:
+        return {}
+
+    return {"PP": files}
+
+
+def _check_file_format(file_format):
+    """Check the file format given to `close_files` or `open_files`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        file_format: `str` or `None`
+            The file format.
+
+    :Returns:
+
+        `None`
+
+    """
+    if file_format not in (None, "netCDF", "PP"):
+        raise ValueError(
+            "Can't identify open files: file_format must be None, "
+            f"'netCDF' or 'PP'. Got: {file_format!r}"
+        )
 
 
 def ufunc(name, x, *args, **kwargs):
@@ -2450,6 +2801,11 @@ def load_stash2standard_name(table=None, delimiter="!", merge=True):
     If the "Valid from" and "Valid to" entries are omitted then the
     stash mapping is assumed to apply to all UM versions.
 
+    The parsed table is cached in a binary file in a directory of
+    `cf.tempdir` that is private to the current user, from which it is
+    loaded, instead of being parsed again, the next time that the same
+    unchanged table is loaded.
+
     .. seealso:: `stash2standard_name`
 
     :Parameters:
@@ -2489,6 +2845,50 @@ def load_stash2standard_name(table=None, delimiter="!", merge=True):
     >>> cf.load_stash2standard_name('my_table3.txt', merge=True)
     >>> cf.load_stash2standard_name('my_table4.txt', merge=False)
 
+    """
+    if table is None:
+        # Use default conversion table
+        merge = False
+        package_path = os.path.dirname(__file__)
+        table = os.path.join(package_path, "etc/STASH_to_CF.txt")
+    else:
+        # User supplied table
+        table = abspath(os.path.expanduser(os.path.expandvars(table)))
+
+    stash2sn = _load_stash2standard_name_cache(table, delimiter)
+    if stash2sn is None:
+        stash2sn = _parse_stash2standard_name(table, delimiter)
+        _save_stash2standard_name_cache(table, delimiter, stash2sn)
+
+    if not merge:
+        _stash2standard_name.clear()
+
+    _stash2standard_name.update(stash2sn)
+    _stash2standard_name_versions.clear()
+
+
+def _parse_stash2standard_name(table, delimiter):
+    """Parse a STASH to standard name conversion table text file.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `load_stash2standard_name`
+
+    :Parameters:
+
+        table: `str`
+            The absolute path of the conversion table.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `dict`
+            The conversion table, keyed by ``(submodel, STASH code)``
+            tuples, with a tuple of entries for each key, each of
+            which is a list.
+
     """
     # 0  Model
     # 1  STASH code
@@ -2503,15 +2903,6 @@ def load_stash2standard_name(table=None, delimiter="!", merge=True):
     # Number matching regular expression
     number_regex = r"([-+]?\d*\.?\d+(e[-+]?\d+)?)"
 
-    if table is None:
-        # Use default conversion table
-        merge = False
-        package_path = os.path.dirname(__file__)
-        table = os.path.join(package_path, "etc/STASH_to_CF.txt")
-    else:
-        # User supplied table
-        table = abspath(os.path.expanduser(os.path.expandvars(table)))
-
     with open(table, "r") as open_table:
         lines = csv.reader(
             open_table, delimiter=delimiter, skipinitialspace=True
@@ -2596,10 +2987,278 @@ def load_stash2standard_name(table=None, delimiter="!", merge=True):
         else:
             stash2sn[key] = line
 
-    if not merge:
-        _stash2standard_name.clear()
+    return stash2sn
 
-    _stash2standard_name.update(stash2sn)
+
+def _stash2standard_name_cache_directory(create=False):
+    """The directory of the compiled conversion table cache files.
+
+    The directory is in `cf.tempdir`, and is only used if it is owned
+    by the current user and can't be accessed by anyone else, so that
+    no other user can create or modify the cache files.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        create: `bool`, optional
+            If True then create the directory if it does not exist.
+
+    :Returns:
+
+        `str` or `None`
+            The directory, or `None` if it does not exist or can't
+            be trusted.
+
+    """
+    try:
+        uid = os.getuid()
+    except AttributeError:  # pragma: no cover
+        # The owner of the directory can't be checked on this
+        # platform, so don't cache the table
+        return
+
+    directory = os.path.join(str(tempdir()), f"cf-python-{uid}")
+    if create:
+        try:
+            os.makedirs(directory, mode=0o700)
+        except FileExistsError:
+            pass
+        except OSError:
+            return
+
+    try:
+        st = os.lstat(directory)
+    except OSError:
+        return
+
+    if (
+        not stat.S_ISDIR(st.st_mode)
+        or st.st_uid != uid
+        or st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    ):
+        logger.info(
+            "Not using the STASH to standard name cache directory "
+            f"{directory}: It is not a directory that is private to "
+            "the current user"
+        )  # pragma: no cover
+        return
+
+    return directory
+
+
+def _stash2standard_name_cache_file(table, create=False):
+    """The name of the compiled conversion table cache file.
+
+    The file name includes a hash of the full path of the conversion
+    table, so that tables with the same name in different
+    directories have different cache files.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_stash2standard_name_cache_directory`
+
+    :Parameters:
+
+        table: `str`
+            The absolute path of the conversion table.
+
+        create: `bool`, optional
+            If True then create the cache directory if it does not
+            exist.
+
+    :Returns:
+
+        `str` or `None`
+            The cache file name, or `None` if there is no trusted
+            cache directory.
+
+    """
+    directory = _stash2standard_name_cache_directory(create=create)
+    if directory is None:
+        return
+
+    digest = hashlib.sha1(table.encode("utf-8")).hexdigest()[:16]
+    name = os.path.basename(table)
+    return os.path.join(
+        directory, f"{name}.{digest}{_stash2standard_name_cache_suffix}"
+    )
+
+
+def _stash2standard_name_cache_signature(table, delimiter):
+    """The properties used to validate a compiled conversion table.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        table: `str`
+            The absolute path of the conversion table.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `tuple`
+            The path, size and modification time of the conversion
+            table, the delimiter, and the versions of the cache
+            format and of Python.
+
+    """
+    st = os.stat(table)
+    return (
+        table,
+        st.st_size,
+        st.st_mtime_ns,
+        delimiter,
+        _stash2standard_name_cache_version,
+        sys.version_info[:2],
+    )
+
+
+def _load_stash2standard_name_cache(table, delimiter):
+    """Load a compiled STASH to standard name conversion table.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_save_stash2standard_name_cache`
+
+    :Parameters:
+
+        table: `str`
+            The absolute path of the conversion table.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+    :Returns:
+
+        `dict` or `None`
+            The conversion table, or `None` if there is no valid
+            compiled version of it.
+
+    """
+    cache_file = _stash2standard_name_cache_file(table)
+    if cache_file is None:
+        return
+
+    try:
+        with open(cache_file, "rb") as f:
+            if os.fstat(f.fileno()).st_uid != os.getuid():
+                # Only trust a file created by the current user
+                return  # pragma: no cover
+
+            signature, stash2sn = marshal.loads(f.read())
+    except FileNotFoundError:
+        return
+    except Exception as error:
+        logger.info(
+            "Ignoring unreadable STASH to standard name cache file "
+            f"{cache_file}: {error}"
+        )  # pragma: no cover
+        return
+
+    if signature != _stash2standard_name_cache_signature(table, delimiter):
+        return
+
+    return stash2sn
+
+
+def _save_stash2standard_name_cache(table, delimiter, stash2sn):
+    """Save a compiled STASH to standard name conversion table.
+
+    The file is written atomically, so that concurrent readers never
+    see a partially written file. Any failure to write the file is
+    logged and otherwise ignored.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `_load_stash2standard_name_cache`
+
+    :Parameters:
+
+        table: `str`
+            The absolute path of the conversion table.
+
+        delimiter: `str`
+            The delimiter of the table columns.
+
+        stash2sn: `dict`
+            The conversion table.
+
+    :Returns:
+
+        `None`
+
+    """
+    cache_file = _stash2standard_name_cache_file(table, create=True)
+    if cache_file is None:
+        return
+
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            marshal.dump(
+                (
+                    _stash2standard_name_cache_signature(table, delimiter),
+                    stash2sn,
+                ),
+                f,
+            )
+
+        os.replace(tmp_file, cache_file)
+    except (OSError, ValueError) as error:
+        logger.info(
+            "Can't write STASH to standard name cache file "
+            f"{cache_file}: {error}"
+        )  # pragma: no cover
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
+def _stash2standard_name_records(submodel, stash, um_version):
+    """Return the conversion table entries valid for a UM version.
+
+    The entries for each combination of submodel, STASH code and UM
+    version are found once, and then remembered until the conversion
+    table is next changed by `load_stash2standard_name`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        submodel: `int`
+            The UM sub model identifier.
+
+        stash: `int`
+            The STASH code.
+
+        um_version: number
+            The UM version, e.g. ``405`` or ``1102``.
+
+    :Returns:
+
+        `tuple`
+            The conversion table entries for the submodel and STASH
+            code whose UM version ranges include *um_version*, in
+            their original order.
+
+    """
+    key = (submodel, stash, um_version)
+    records = _stash2standard_name_versions.get(key)
+    if records is None:
+        records = tuple(
+            record
+            for record in _stash2standard_name.get((submodel, stash), ())
+            if (record[2] is None or record[2] <= um_version)
+            and (record[3] is None or um_version <= record[3])
+        )
+        _stash2standard_name_versions[key] = records
+
+    return records
 
 
 def stash2standard_name():
@@ -0,0 +1,374 @@
+import logging
+import os
+import sqlite3
+import sys
+from io import BytesIO
+
+import numpy as np
+
+from .lrucache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# The version of the layout of hash cache files. Increment this
+# whenever the layout, or the serialisation of arrays, changes
+# incompatibly, so that old hash cache files are replaced.
+_hash_cache_version = 2
+
+
+def hash_cache_key(d):
+    """Return the key that identifies the values of file-backed data.
+
+    The key comprises the Dask name of the data, which identifies the
+    file addresses of the data and the lazy operations applied to
+    them, and the path, size and modification time of each file, so
+    that an entry is not used if any of its files has changed.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        d: `Data`
+            The data.
+
+    :Returns:
+
+        `tuple` or `None`
+            The Dask name and the file signatures, or `None` if the
+            data do not have a deterministic Dask name, do not
+            reference any files, or reference a non-local file.
+
+    """
+    try:
+        name = d.get_deterministic_name()
+    except ValueError:
+        return
+
+    filenames = d.get_filenames(normalise=True)
+    if not filenames:
+        return
+
+    signatures = []
+    for filename in sorted(filenames):
+        try:
+            stat = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return
+
+        signatures.append(f"{filename}:{stat.st_size}:{stat.st_mtime_ns}")
+
+    return name, "\n".join(signatures)
+
+
+class HashCache(LRUCache):
+    """A thread-safe, in-memory cache of the values of file-backed data.
+
+    `cf.aggregate` finds the hash values, and first and last values,
+    of coordinates and other metadata arrays from their values. When
+    the same files are aggregated repeatedly, this cache provides
+    those values without reading the files again.
+
+    Each entry is keyed by the Dask name of the data and is only used
+    if the files referenced by the data still have the same paths,
+    sizes and modification times as when the entry was created (see
+    `hash_cache_key`). Arrays with identical values, such as the same
+    grid coordinates stored in many files, are only stored once.
+
+    The memory used by the cached arrays is limited to the value of
+    `cf.hash_cache_size`, above which the least recently used entries
+    are removed.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.aggregate`, `cf.hash_cache_size`
+
+    """
+
+    _constant = "HASH_CACHE_SIZE"
+
+    def _clear(self):
+        """Remove all entries from the cache.
+
+        Must be called with the lock held.
+
+        :Returns:
+
+            `None`
+
+        """
+        super()._clear()
+
+        # The unique arrays and the number of entries that use each
+        # one: {token: [array, count]}
+        self._arrays = {}
+
+    def _remove(self, name):
+        """Remove an entry, and its array if no other entry uses it.
+
+        Must be called with the lock held.
+
+        :Parameters:
+
+            name: `str`
+                The Dask name of the entry.
+
+        :Returns:
+
+            `tuple`
+                The removed entry.
+
+        """
+        entry = super()._remove(name)
+        token = entry[1]
+        x = self._arrays[token]
+        x[1] -= 1
+        if not x[1]:
+            del self._arrays[token]
+            self._size -= x[0].nbytes
+
+        return entry
+
+    def get(self, key):
+        """Return the cached values of data.
+
+        :Parameters:
+
+            key: `tuple`
+                The key of the data, as returned by `hash_cache_key`.
+
+        :Returns:
+
+            `tuple` or `None`
+                The token and values of the data, or `None` if there
+                is no valid entry for the data. The values must not
+                be changed.
+
+        """
+        name, signatures = key
+        with self._lock:
+            entry = self._get(name)
+            if entry is None or entry[0] != signatures:
+                return
+
+            token = entry[1]
+            return token, self._arrays[token][0]
+
+    def put(self, key, token, array):
+        """Cache the values of data.
+
+        Any existing entry for the data is replaced. Nothing is cached
+        if the array is larger than `max_size`.
+
+        :Parameters:
+
+            key: `tuple`
+                The key of the data, as returned by `hash_cache_key`.
+
+            token: `str`
+                A token that identifies the values of the array.
+
+            array: `numpy.ndarray`
+                The values of the data, which must not be changed
+                afterwards.
+
+        :Returns:
+
+            `bool`
+                Whether or not the values were cached.
+
+        """
+        max_size = self.max_size
+        if max_size <= 0 or array.nbytes > max_size:
+            return False
+
+        name, signatures = key
+        with self._lock:
+            x = self._arrays.get(token)
+            if x is None:
+                x = [array, 0]
+                self._arrays[token] = x
+                self._size += array.nbytes
+
+            x[1] += 1
+
+            # Entries are {name: (signatures, token, size)}, where the
+            # size excludes that of the array
+            size = sys.getsizeof(name) + sys.getsizeof(signatures)
+            self._put(name, (signatures, token, size), max_size)
+
+        return True
+
+
+class HashCacheFile:
+    """An on-disk cache of the values of file-backed data.
+
+    The cache is an SQLite database file with the same entries as a
+    `HashCache`, which persists between sessions. There is one entry
+    for each Dask name, which is replaced when any of its files
+    changes, so the cache does not grow when the same files are
+    aggregated repeatedly.
+
+    The data and mask of each array are stored in the NumPy ``.npy``
+    format, and are loaded without allowing pickled objects, so arrays
+    of Python objects are not cached.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.aggregate`
+
+    """
+
+    def __init__(self, path):
+        """**Initialisation**
+
+        :Parameters:
+
+            path: `str`
+                The name of the cache file, which is created if it
+                does not already exist.
+
+        """
+        path = os.path.abspath(os.path.expanduser(os.path.expandvars(path)))
+        self.path = path
+        connection = sqlite3.connect(path)
+        self._connection = connection
+
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != _hash_cache_version:
+            # Replace a hash cache file with an old layout
+            connection.execute("DROP TABLE IF EXISTS entries")
+            connection.execute("DROP TABLE IF EXISTS arrays")
+            connection.execute(f"PRAGMA user_version = {_hash_cache_version}")
+
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "name TEXT PRIMARY KEY, "
+            "signatures TEXT NOT NULL, "
+            "token TEXT NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS arrays ("
+            "token TEXT PRIMARY KEY, "
+            "data BLOB NOT NULL, "
+            "mask BLOB)"
+        )
+
+    def __enter__(self):
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context, committing any new entries."""
+        self.close()
+
+    def close(self):
+        """Commit any new entries and close the cache file.
+
+        Arrays that are no longer used by any entry are removed.
+
+        :Returns:
+
+            `None`
+
+        """
+        connection = self._connection
+        if connection is not None:
+            connection.execute(
+                "DELETE FROM arrays WHERE token NOT IN "
+                "(SELECT token FROM entries)"
+            )
+            connection.commit()
+            connection.close()
+            self._connection = None
+
+    def get(self, key):
+        """Return the cached values of data.
+
+        :Parameters:
+
+            key: `tuple`
+                The key of the data, as returned by `hash_cache_key`.
+
+        :Returns:
+
+            `tuple` or `None`
+                The token and values of the data, or `None` if there
+                is no valid entry for the data.
+
+        """
+        name, signatures = key
+        row = self._connection.execute(
+            "SELECT entries.token, data, mask FROM entries JOIN arrays "
+            "ON entries.token = arrays.token WHERE name = ? AND "
+            "signatures = ?",
+            (name, signatures),
+        ).fetchone()
+        if row is None:
+            return
+
+        token, data, mask = row
+        try:
+            array = np.load(BytesIO(data), allow_pickle=False)
+            if mask is not None:
+                mask = np.load(BytesIO(mask), allow_pickle=False)
+                array = np.ma.array(array, mask=mask)
+        except Exception as error:
+            logger.warning(
+                f"Ignoring invalid hash cache entry in {self.path}: {error}"
+            )  # pragma: no cover
+            return  # pragma: no cover
+
+        return token, array
+
+    def put(self, key, token, array):
+        """Cache the values of data.
+
+        Any existing entry for the data is replaced. Nothing is
+        cached for an array of Python objects.
+
+        :Parameters:
+
+            key: `tuple`
+                The key of the data, as returned by `hash_cache_key`.
+
+            token: `str`
+                A token that identifies the values of the array.
+
+            array: `numpy.ndarray`
+                The values of the data.
+
+        :Returns:
+
+            `bool`
+                Whether or not the values were cached.
+
+        """
+        try:
+            data = BytesIO()
+            np.save(data, np.ma.getdata(array), allow_pickle=False)
+            if np.ma.isMA(array):
+                mask = BytesIO()
+                np.save(mask, np.ma.getmaskarray(array), allow_pickle=False)
+                mask = mask.getvalue()
+            else:
+                mask = None
+        except ValueError:
+            # An array of Python objects can't be stored without
+            # pickling it
+            return False
+
+        name, signatures = key
+        connection = self._connection
+        connection.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+            (name, signatures, token),
+        )
+        connection.execute(
+            "INSERT OR IGNORE INTO arrays VALUES (?, ?, ?)",
+            (token, data.getvalue(), mask),
+        )
+        return True
+
+
+# The process-wide cache of the values of file-backed data
+hash_cache = HashCache()
@@ -0,0 +1,165 @@
+import threading
+from collections import OrderedDict
+
+from .constants import CONSTANTS
+
+
+class LRUCache:
+    """A thread-safe, in-memory, least recently used cache.
+
+    Each entry is a tuple whose last element is the size of the
+    entry, in bytes. The total size of the entries is limited to
+    `max_size`, above which the least recently used entries are
+    removed.
+
+    Subclasses set the `_constant` attribute to the name of the
+    `CONSTANTS` item that gives `max_size`, and provide their own
+    ``get`` and ``put`` methods in terms of `_get` and `_put`.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+
+    # The name of the CONSTANTS item that gives the maximum total size
+    # of the entries
+    _constant = None
+
+    def __init__(self):
+        """**Initialisation**"""
+        self._lock = threading.Lock()
+        self._clear()
+
+    def __len__(self):
+        """The number of cached entries.
+
+        x.__len__() <==> len(x)
+
+        """
+        return len(self._entries)
+
+    @property
+    def max_size(self):
+        """The maximum total size of the cached entries, in bytes."""
+        return CONSTANTS[self._constant]
+
+    @property
+    def size(self):
+        """The total size of the cached entries, in bytes."""
+        return self._size
+
+    def _clear(self):
+        """Remove all entries from the cache.
+
+        Must be called with the lock held.
+
+        :Returns:
+
+            `None`
+
+        """
+        # The cached entries, least recently used first
+        self._entries = OrderedDict()
+
+        # The total size of the cached entries
+        self._size = 0
+
+    def _evict(self, max_size):
+        """Remove entries in excess of a maximum total size.
+
+        Must be called with the lock held.
+
+        :Parameters:
+
+            max_size: `int`
+                The maximum total size of the entries to keep.
+
+        :Returns:
+
+            `None`
+
+        """
+        entries = self._entries
+        while entries and self._size > max_size:
+            self._remove(next(iter(entries)))
+
+    def _get(self, key):
+        """Return an entry, marking it as the most recently used.
+
+        Must be called with the lock held.
+
+        :Parameters:
+
+            key:
+                The key of the entry.
+
+        :Returns:
+
+            `tuple` or `None`
+                The entry, or `None` if there isn't one.
+
+        """
+        self._evict(self.max_size)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+
+        return entry
+
+    def _put(self, key, entry, max_size):
+        """Add an entry, replacing any existing entry with the same key.
+
+        Must be called with the lock held.
+
+        :Parameters:
+
+            key:
+                The key of the entry.
+
+            entry: `tuple`
+                The entry, whose last element is its size in bytes.
+
+            max_size: `int`
+                The maximum total size of the entries to keep.
+
+        :Returns:
+
+            `None`
+
+        """
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = entry
+        self._size += entry[-1]
+        self._evict(max_size)
+
+    def _remove(self, key):
+        """Remove an entry.
+
+        Must be called with the lock held.
+
+        :Parameters:
+
+            key:
+                The key of the entry.
+
+        :Returns:
+
+            `tuple`
+                The removed entry.
+
+        """
+        entry = self._entries.pop(key)
+        self._size -= entry[-1]
+        return entry
+
+    def clear(self):
+        """Remove all entries from the cache.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            self._clear()
@@ -1,2 +1,4 @@
+from .catalogue import catalogue
+from .iread import iread
 from .read import read
 from .write import write
@@ -0,0 +1,1154 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from base64 import b64decode, b64encode
+
+import cfdm
+import dask.array as da
+import numpy as np
+from cfdm.data.abstract import Array, FileArray
+from dask.array.core import getter
+from dask.base import tokenize
+
+from ..auxiliarycoordinate import AuxiliaryCoordinate
+from ..bounds import Bounds
+from ..cellmeasure import CellMeasure
+from ..cellmethod import CellMethod
+from ..coordinateconversion import CoordinateConversion
+from ..coordinatereference import CoordinateReference
+from ..data import Data
+from ..data.array import H5netcdfArray, NetCDF4Array, UMArray
+from ..datum import Datum
+from ..dimensioncoordinate import DimensionCoordinate
+from ..domain import Domain
+from ..domainancillary import DomainAncillary
+from ..domainaxis import DomainAxis
+from ..field import Field
+from ..fieldancillary import FieldAncillary
+from ..fieldlist import FieldList
+
+logger = logging.getLogger(__name__)
+
+# The version of the layout of catalogue files, and of the
+# descriptions of constructs that they contain. Increment this
+# whenever either changes incompatibly, so that old catalogue files
+# are replaced.
+_catalogue_version = 3
+
+# The number of files read between the commits of new catalogue
+# entries by `catalogue`
+_catalogue_window = 100
+
+# The classes of the field and domain constructs that may be
+# catalogued
+_field_classes = {cls.__name__: cls for cls in (Field, Domain)}
+
+# The classes of the metadata constructs that may be catalogued, in
+# the order in which they are set on a field or domain construct
+_construct_classes = {
+    cls.__name__: cls
+    for cls in (
+        DomainAxis,
+        DimensionCoordinate,
+        AuxiliaryCoordinate,
+        CellMeasure,
+        DomainAncillary,
+        CoordinateReference,
+        FieldAncillary,
+        CellMethod,
+    )
+}
+
+# The classes of the file arrays that may be catalogued
+_file_array_classes = {
+    cls.__name__: cls for cls in (H5netcdfArray, NetCDF4Array, UMArray)
+}
+
+# The numpy data type kinds of array values that may be catalogued
+_dtype_kinds = "biufU"
+
+
+class _CatalogueError(Exception):
+    """A construct can not be described in a catalogue.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+
+
+def catalogue(
+    files,
+    path,
+    recursive=False,
+    followlinks=False,
+    **kwargs,
+):
+    """Store the constructs read from files in a catalogue.
+
+    A catalogue is an SQLite database file that stores, for each
+    input file, a description of the field or domain constructs read
+    from it: their properties, netCDF names and metadata constructs,
+    and for each data array either its values, if it was read into
+    memory, or the file addresses from which it is read lazily. A
+    later call to `cf.read` with the same catalogue creates the
+    constructs of each catalogued file from the catalogue, without
+    opening the file, so repeatedly reading a large archive of files
+    only pays for rediscovering the metadata of the files that have
+    changed. The data of the constructs are still read from the
+    original files, and only when they are needed.
+
+    A catalogue entry is only used if it was created from a file of
+    the same path, size and modification time, and with the same
+    `cf.read` keyword parameters that affect the constructs created
+    (such as *select*, *extra*, *um* and *dask_chunks*). Otherwise
+    the file is read again and its entry replaced, as it also is if
+    the entry can not be used to create the constructs.
+
+    A catalogue contains no executable content, so it may be shared
+    between users, and its entries do not depend on the versions of
+    the installed libraries. Files containing
+    constructs that can not be described in a catalogue are not
+    catalogued, and are read again each time. These include files
+    with compressed data (such as discrete sampling geometries),
+    geometry cells, UGRID meshes and aggregation variables.
+
+    Files are added to a catalogue by this function, or equivalently
+    whenever `cf.read` is used with the catalogue. Non-local files,
+    such as those on OPeNDAP servers or in S3 object stores, are
+    never catalogued.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.read`
+
+    :Parameters:
+
+        files: (arbitrarily nested sequence of) `str`
+            A string or arbitrarily nested sequence of strings giving
+            the file names or directory names of the files to
+            catalogue. See `cf.read` for details.
+
+        path: `str`
+            The name of the catalogue file, which is created if it
+            does not already exist.
+
+        recursive: `bool`, optional
+            If True then recursively catalogue sub-directories of any
+            directories specified with the *files* parameter. See
+            `cf.read` for details.
+
+        followlinks: `bool`, optional
+            If True, and *recursive* is True, then also search for
+            files in sub-directories which resolve to symbolic
+            links. See `cf.read` for details.
+
+        kwargs: optional
+            Any other keyword arguments accepted by `cf.read`, except
+            for *aggregate*, *cdl_string* and *nfields*. The same
+            keyword arguments must be given to `cf.read` for the
+            catalogue entries to be used.
+
+    :Returns:
+
+        `int`
+            The number of constructs in the catalogued files.
+
+    **Examples**
+
+    >>> cf.catalogue('archive/*.pp', 'archive.db')
+    9616
+    >>> f = cf.read('archive/*.pp', catalogue='archive.db')
+
+    """
+    from .iread import iread
+
+    if "aggregate" in kwargs:
+        raise ValueError("Can't set aggregate for cf.catalogue")
+
+    n = 0
+    for _ in iread(
+        files,
+        window=_catalogue_window,
+        aggregate=False,
+        recursive=recursive,
+        followlinks=followlinks,
+        catalogue=path,
+        **kwargs,
+    ):
+        n += 1
+
+    return n
+
+
+def _encode(value):
+    """Return a JSON serialisable description of a value.
+
+    Containers and numpy values are described by single-item
+    dictionaries whose keys identify their types, and which are
+    converted back by `_decode`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        value:
+            The value, which may be `None`, or a `bool`, `int`,
+            `float`, `str`, `list`, `tuple`, `set`, `dict`, `slice`,
+            numpy array or scalar, or `Data`, or any nesting of
+            these.
+
+    :Returns:
+
+            The description.
+
+    """
+    if value is np.ma.masked:
+        return {"masked": None}
+
+    if isinstance(value, (np.ndarray, np.generic)):
+        dtype = value.dtype
+        if dtype.kind not in _dtype_kinds:
+            raise _CatalogueError(f"Can't catalogue {dtype} values")
+
+        if isinstance(value, np.generic):
+            return {"scalar": [dtype.str, value.item()]}
+
+        # The mask is None for a numpy array, False for a masked array
+        # with no mask, or otherwise the Boolean mask values
+        mask = None
+        fill_value = None
+        if np.ma.isMA(value):
+            mask = value.mask
+            if mask is np.ma.nomask:
+                mask = False
+            else:
+                mask = _encode_bytes(mask)
+
+            fill_value = _encode(value.fill_value)
+
+        shape = list(value.shape)
+        value = np.ma.getdata(value)
+        if dtype.kind == "U":
+            value = value.tolist()
+        else:
+            value = _encode_bytes(value)
+
+        return {"array": [dtype.str, shape, value, mask, fill_value]}
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, list):
+        return [_encode(v) for v in value]
+
+    if isinstance(value, tuple):
+        return {"tuple": [_encode(v) for v in value]}
+
+    if isinstance(value, (set, frozenset)):
+        return {"set": [_encode(v) for v in value]}
+
+    if isinstance(value, dict):
+        return {"dict": [[_encode(k), _encode(v)] for k, v in value.items()]}
+
+    if isinstance(value, slice):
+        return {"slice": [value.start, value.stop, value.step]}
+
+    if isinstance(value, Data):
+        return {"data": _encode_data(value)}
+
+    raise _CatalogueError(f"Can't catalogue {value!r}")
+
+
+def _decode(description):
+    """Return the value described by `_encode`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        description:
+            The description of the value.
+
+    :Returns:
+
+            The value.
+
+    """
+    if isinstance(description, list):
+        return [_decode(v) for v in description]
+
+    if not isinstance(description, dict):
+        return description
+
+    ((kind, value),) = description.items()
+    if kind == "masked":
+        return np.ma.masked
+
+    if kind == "scalar":
+        dtype, value = value
+        return np.array(value, dtype=dtype)[()]
+
+    if kind == "array":
+        dtype, shape, value, mask, fill_value = value
+        dtype = np.dtype(dtype)
+        if dtype.kind == "U":
+            value = np.array(value, dtype=dtype).reshape(shape)
+        else:
+            value = _decode_bytes(value, dtype, shape)
+
+        if mask is False:
+            value = np.ma.array(value, fill_value=_decode(fill_value))
+        elif mask is not None:
+            value = np.ma.array(
+                value,
+                mask=_decode_bytes(mask, bool, shape),
+                fill_value=_decode(fill_value),
+            )
+
+        return value
+
+    if kind == "tuple":
+        return tuple(_decode(v) for v in value)
+
+    if kind == "set":
+        return set(_decode(v) for v in value)
+
+    if kind == "dict":
+        return {_decode(k): _decode(v) for k, v in value}
+
+    if kind == "slice":
+        return slice(*value)
+
+    if kind == "data":
+        return _decode_data(value)
+
+    raise ValueError(f"Unknown catalogued value type: {kind!r}")
+
+
+def _encode_bytes(array):
+    """Return the bytes of a numpy array as a base64 string.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array: `numpy.ndarray`
+            The array.
+
+    :Returns:
+
+        `str`
+            The base64 encoded bytes of the array, in C order.
+
+    """
+    return b64encode(np.ascontiguousarray(array).tobytes()).decode("ascii")
+
+
+def _decode_bytes(value, dtype, shape):
+    """Return the numpy array encoded by `_encode_bytes`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        value: `str`
+            The base64 encoded bytes of the array.
+
+        dtype: `numpy.dtype`
+            The data type of the array.
+
+        shape: sequence of `int`
+            The shape of the array.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The array.
+
+    """
+    return np.frombuffer(bytearray(b64decode(value)), dtype=dtype).reshape(
+        shape
+    )
+
+
+def _encode_file_array(array):
+    """Return a JSON serialisable description of a file array.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        array: `FileArray`
+            The file array.
+
+    :Returns:
+
+        `dict`
+            The description.
+
+    """
+    name = type(array).__name__
+    if _file_array_classes.get(name) is not type(array):
+        raise _CatalogueError(f"Can't catalogue {array!r}")
+
+    description = {
+        "class": name,
+        "filename": array.get_filename(),
+        "address": _encode(array.get_address()),
+        "dtype": array.dtype.str,
+        "shape": list(array.original_shape),
+        "mask": array.get_mask(),
+        "unpack": array.get_unpack(),
+        "attributes": _encode(array.get_attributes()),
+        "storage_options": _encode(
+            array.get_storage_options(create_endpoint_url=False)
+        ),
+    }
+    if isinstance(array, UMArray):
+        description.update(
+            {
+                "fmt": array.get_fmt(),
+                "word_size": array.get_word_size(),
+                "byte_ordering": array.get_byte_ordering(),
+                "mmap": array._get_component("mmap", False),
+            }
+        )
+
+    if array.is_subspace():
+        description["index"] = _encode(array.index())
+
+    return description
+
+
+def _decode_file_array(description):
+    """Return the file array described by `_encode_file_array`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        description: `dict`
+            The description of the file array.
+
+    :Returns:
+
+        `FileArray`
+            The file array.
+
+    """
+    description = description.copy()
+    cls = _file_array_classes[description.pop("class")]
+    index = description.pop("index", None)
+    for key in ("address", "attributes", "storage_options"):
+        description[key] = _decode(description[key])
+
+    description["dtype"] = np.dtype(description["dtype"])
+    description["shape"] = tuple(description["shape"])
+
+    array = cls(**description)
+    if index is not None:
+        array = array[_decode(index)]
+
+    return array
+
+
+def _encode_data(data):
+    """Return a JSON serialisable description of data.
+
+    Data that are not read from a file are described by their values,
+    and other data by the file arrays of their Dask chunks. Data
+    whose values have been modified since they were read from a file
+    can not be described.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        data: `Data`
+            The data.
+
+    :Returns:
+
+        `dict`
+            The description.
+
+    """
+    if data.get_compression_type():
+        raise _CatalogueError(f"Can't catalogue compressed data: {data!r}")
+
+    description = {
+        "dtype": data.dtype.str,
+        "units": data.get_units(None),
+        "calendar": data.get_calendar(None),
+        "fill_value": _encode(data.get_fill_value(None)),
+        "hardmask": data.hardmask,
+        "chunks": _encode(data.chunks),
+        "cyclic": sorted(data.cyclic()),
+        "cached_elements": _encode(data._get_cached_elements()),
+        "netcdf": _encode(data._get_component("netcdf", None)),
+        "original_filenames": sorted(
+            data._get_component("original_filenames", ())
+        ),
+    }
+
+    dx = data.to_dask_array(_force_mask_hardness=False, _force_to_memory=False)
+    graph = dict(dx.dask)
+    arrays = [a for a in graph.values() if isinstance(a, Array)]
+    if not arrays:
+        # The data are not read from a file. Get their values from
+        # the Dask array, rather than with `Data.array`, which would
+        # change the cached elements of the data.
+        description["values"] = _encode(np.asanyarray(dx.compute()))
+        return description
+
+    if len(arrays) == 1 and len(graph) == 1 + dx.npartitions:
+        # Each chunk is part of the same file array
+        description["array"] = _encode_file_array(arrays[0])
+        return description
+
+    # Find the file array of each chunk
+    fragments = []
+    for index, position in zip(data.chunk_indices(), data.chunk_positions()):
+        array = data[index].compute(_force_to_memory=False)
+        if not isinstance(array, FileArray):
+            raise _CatalogueError(f"Can't catalogue modified data: {data!r}")
+
+        fragments.append([list(position), _encode_file_array(array)])
+
+    description["fragments"] = fragments
+    description["deterministic"] = data.has_deterministic_name()
+    return description
+
+
+def _decode_data(description):
+    """Return the data described by `_encode_data`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        description: `dict`
+            The description of the data.
+
+    :Returns:
+
+        `Data`
+            The data.
+
+    """
+    kwargs = {
+        "units": description["units"],
+        "calendar": description["calendar"],
+        "fill_value": _decode(description["fill_value"]),
+        "hardmask": description["hardmask"],
+        "copy": False,
+    }
+    chunks = _decode(description["chunks"])
+
+    if "values" in description:
+        data = Data(_decode(description["values"]), chunks=chunks, **kwargs)
+    elif "array" in description:
+        array = _decode_file_array(description["array"])
+        data = Data(array, chunks=chunks, **kwargs)
+    else:
+        # Create the Dask graph that gets each chunk from its own
+        # file array
+        fragments = description["fragments"]
+        name = f"array-{tokenize(fragments)}"
+        dsk = {}
+        for position, array in fragments:
+            key = f"{name}-" + "-".join(map(str, position))
+            dsk[key] = _decode_file_array(array)
+            dsk[(name,) + tuple(position)] = (
+                getter,
+                key,
+                Ellipsis,
+                False,
+                False,
+            )
+
+        dx = da.Array(
+            dsk, name, chunks=chunks, dtype=np.dtype(description["dtype"])
+        )
+        data = Data(dx, **kwargs)
+        if description["deterministic"]:
+            # The graph name is derived from the file arrays, so it
+            # is as deterministic as that of the catalogued data
+            data._custom["has_deterministic_name"] = True
+
+    netcdf = _decode(description["netcdf"])
+    if netcdf is not None:
+        data._set_component("netcdf", netcdf, copy=False)
+
+    cached_elements = _decode(description["cached_elements"])
+    if cached_elements:
+        data._set_cached_elements(cached_elements)
+
+    cyclic = description["cyclic"]
+    if cyclic:
+        data.cyclic(cyclic)
+
+    original_filenames = description["original_filenames"]
+    if original_filenames:
+        data._original_filenames(define=original_filenames)
+
+    return data
+
+
+def _encode_variable(variable):
+    """Return a JSON serialisable description of a variable.
+
+    The description contains the properties, data, netCDF names and
+    original file names of the variable.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        variable:
+            The variable, such as a `Bounds` object or a metadata
+            construct that may contain data.
+
+    :Returns:
+
+        `dict`
+            The description.
+
+    """
+    description = {
+        "class": type(variable).__name__,
+        "properties": _encode(variable.properties()),
+        "netcdf": _encode(variable._get_component("netcdf", None)),
+        "original_filenames": sorted(
+            variable._get_component("original_filenames", ())
+        ),
+    }
+
+    data = variable.get_data(None, _units=False, _fill_value=False)
+    if data is not None:
+        description["data"] = _encode_data(data)
+
+    return description
+
+
+def _decode_variable(variable, description):
+    """Set the components described by `_encode_variable`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        variable:
+            The variable to be modified in-place.
+
+        description: `dict`
+            The description of the variable.
+
+    :Returns:
+
+            The variable.
+
+    """
+    variable.set_properties(_decode(description["properties"]), copy=False)
+
+    netcdf = _decode(description["netcdf"])
+    if netcdf is not None:
+        variable._set_component("netcdf", netcdf, copy=False)
+
+    original_filenames = description["original_filenames"]
+    if original_filenames:
+        variable._original_filenames(define=original_filenames)
+
+    data = description.get("data")
+    if data is not None:
+        variable.set_data(_decode_data(data), copy=False)
+
+    return variable
+
+
+def _encode_construct(construct):
+    """Return a JSON serialisable description of a metadata construct.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        construct:
+            The metadata construct.
+
+    :Returns:
+
+        `dict`
+            The description.
+
+    """
+    name = type(construct).__name__
+    if _construct_classes.get(name) is not type(construct):
+        raise _CatalogueError(f"Can't catalogue {construct!r}")
+
+    if isinstance(construct, DomainAxis):
+        return {
+            "class": name,
+            "size": construct.get_size(),
+            "netcdf": _encode(construct._get_component("netcdf", None)),
+        }
+
+    if isinstance(construct, CellMethod):
+        return {
+            "class": name,
+            "method": construct.get_method(None),
+            "axes": _encode(construct.get_axes(None)),
+            "qualifiers": _encode(construct.qualifiers()),
+        }
+
+    if isinstance(construct, CoordinateReference):
+        conversion = construct.coordinate_conversion
+        datum = construct.datum
+        return {
+            "class": name,
+            "coordinates": sorted(construct.coordinates()),
+            "coordinate_conversion": {
+                "parameters": _encode(conversion.parameters()),
+                "domain_ancillaries": _encode(conversion.domain_ancillaries()),
+            },
+            "datum": {"parameters": _encode(datum.parameters())},
+            "netcdf": _encode(construct._get_component("netcdf", None)),
+        }
+
+    if isinstance(construct, (AuxiliaryCoordinate, DimensionCoordinate)) and (
+        construct.get_geometry(None) is not None
+        or construct.has_interior_ring()
+        or construct.has_node_count()
+        or construct.has_part_node_count()
+    ):
+        raise _CatalogueError(f"Can't catalogue geometry cells: {construct!r}")
+
+    description = _encode_variable(construct)
+
+    if isinstance(construct, CellMeasure):
+        description["measure"] = construct.get_measure(None)
+
+    if isinstance(construct, (AuxiliaryCoordinate, DimensionCoordinate)):
+        description["climatology"] = construct.is_climatology()
+        description["period"] = _encode(construct.period())
+
+    if isinstance(
+        construct, (AuxiliaryCoordinate, DimensionCoordinate, DomainAncillary)
+    ):
+        bounds = construct.get_bounds(None)
+        if bounds is not None:
+            description["bounds"] = _encode_variable(bounds)
+
+    return description
+
+
+def _decode_construct(description):
+    """Return the metadata construct described by `_encode_construct`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        description: `dict`
+            The description of the metadata construct.
+
+    :Returns:
+
+            The metadata construct.
+
+    """
+    cls = _construct_classes[description["class"]]
+
+    if cls is DomainAxis:
+        construct = cls(size=description["size"])
+    elif cls is CellMethod:
+        return cls(
+            axes=_decode(description["axes"]),
+            method=description["method"],
+            qualifiers=_decode(description["qualifiers"]),
+            copy=False,
+        )
+    elif cls is CoordinateReference:
+        conversion = description["coordinate_conversion"]
+        construct = cls(
+            coordinates=description["coordinates"],
+            datum=Datum(
+                parameters=_decode(description["datum"]["parameters"])
+            ),
+            coordinate_conversion=CoordinateConversion(
+                parameters=_decode(conversion["parameters"]),
+                domain_ancillaries=_decode(conversion["domain_ancillaries"]),
+            ),
+            copy=False,
+        )
+    else:
+        construct = _decode_variable(cls(), description)
+
+        measure = description.get("measure")
+        if measure is not None:
+            construct.set_measure(measure)
+
+        if description.get("climatology"):
+            construct.set_climatology(True)
+
+        bounds = description.get("bounds")
+        if bounds is not None:
+            construct.set_bounds(
+                _decode_variable(Bounds(), bounds), copy=False
+            )
+
+        period = _decode(description.get("period"))
+        if period is not None:
+            construct.period(period)
+
+        return construct
+
+    netcdf = _decode(description["netcdf"])
+    if netcdf is not None:
+        construct._set_component("netcdf", netcdf, copy=False)
+
+    return construct
+
+
+def _encode_field(field):
+    """Return a JSON serialisable description of a field or domain.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        field: `Field` or `Domain`
+            The field or domain construct.
+
+    :Returns:
+
+        `dict`
+            The description.
+
+    """
+    name = type(field).__name__
+    if _field_classes.get(name) is not type(field):
+        raise _CatalogueError(f"Can't catalogue {field!r}")
+
+    constructs = field.constructs
+    data_axes = constructs.data_axes()
+    description = {
+        "class": name,
+        "properties": _encode(field.properties()),
+        "netcdf": _encode(field._get_component("netcdf", None)),
+        "original_filenames": sorted(
+            field._get_component("original_filenames", ())
+        ),
+        "dataset_compliance": _encode(field.dataset_compliance()),
+        "constructs": [
+            [key, _encode(data_axes.get(key)), _encode_construct(construct)]
+            for key, construct in constructs.items()
+        ],
+        "cyclic": sorted(field._cyclic),
+    }
+
+    if isinstance(field, Field):
+        description["id"] = getattr(field, "id", None)
+
+        # The standard name of a UM field, which `cf.read` sets as a
+        # property after aggregation
+        description["standard_name"] = field._custom.get("standard_name")
+
+        data = field.get_data(None, _units=False, _fill_value=False)
+        if data is not None:
+            description["data"] = _encode_data(data)
+            description["data_axes"] = list(field.get_data_axes())
+
+    return description
+
+
+def _decode_field(description):
+    """Return the field or domain described by `_encode_field`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        description: `dict`
+            The description of the field or domain construct.
+
+    :Returns:
+
+        `Field` or `Domain`
+            The field or domain construct.
+
+    """
+    field = _field_classes[description["class"]]()
+    field.set_properties(_decode(description["properties"]), copy=False)
+
+    netcdf = _decode(description["netcdf"])
+    if netcdf is not None:
+        field._set_component("netcdf", netcdf, copy=False)
+
+    field._set_dataset_compliance(
+        _decode(description["dataset_compliance"]), copy=False
+    )
+
+    # Set the constructs in an order that ensures that the domain
+    # axes, coordinates and domain ancillaries referenced by other
+    # constructs already exist
+    order = tuple(_construct_classes)
+    for key, axes, construct in sorted(
+        description["constructs"], key=lambda x: order.index(x[2]["class"])
+    ):
+        field.set_construct(
+            _decode_construct(construct),
+            key=key,
+            axes=_decode(axes),
+            copy=False,
+            autocyclic={"no-op": True},
+            conform=False,
+        )
+
+    data = description.get("data")
+    if data is not None:
+        field.set_data(
+            _decode_data(data), axes=description["data_axes"], copy=False
+        )
+
+    for axis in description["cyclic"]:
+        field.cyclic(axis, iscyclic=True, config={"axis": axis})
+
+    field_id = description.get("id")
+    if field_id is not None:
+        field.id = field_id
+
+    standard_name = description.get("standard_name")
+    if standard_name is not None:
+        field._custom["standard_name"] = standard_name
+
+    original_filenames = description["original_filenames"]
+    if original_filenames:
+        field._original_filenames(define=original_filenames)
+
+    return field
+
+
+class Catalogue:
+    """A catalogue of the constructs read from files.
+
+    Each entry contains a JSON description of the constructs read
+    from a file, from which the constructs are created without
+    opening the file (see `cf.catalogue`).
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.catalogue`
+
+    """
+
+    def __init__(self, path):
+        """**Initialisation**
+
+        :Parameters:
+
+            path: `str`
+                The name of the catalogue file, which is created if
+                it does not already exist.
+
+        """
+        path = os.path.abspath(os.path.expanduser(os.path.expandvars(path)))
+        self.path = path
+
+        connection = sqlite3.connect(path)
+        self._connection = connection
+
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != _catalogue_version:
+            # Replace a catalogue with an old layout
+            connection.execute("DROP TABLE IF EXISTS files")
+            connection.execute(f"PRAGMA user_version = {_catalogue_version}")
+
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT NOT NULL, "
+            "options TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "mtime_ns INTEGER NOT NULL, "
+            "ftype TEXT, "
+            "identities TEXT NOT NULL, "
+            "constructs TEXT NOT NULL, "
+            "PRIMARY KEY (path, options))"
+        )
+
+    def __enter__(self):
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the runtime context, committing any new entries."""
+        self.close()
+
+    def close(self):
+        """Commit any new entries and close the catalogue file.
+
+        :Returns:
+
+            `None`
+
+        """
+        connection = self._connection
+        if connection is not None:
+            connection.commit()
+            connection.close()
+            self._connection = None
+
+    @staticmethod
+    def options_key(options):
+        """Return a key that identifies the read options.
+
+        :Parameters:
+
+            options: `dict`
+                The keyword parameters used to read each file.
+
+        :Returns:
+
+            `str`
+                The key, which is the same for equal options.
+
+        """
+
+        def normalise(x):
+            if isinstance(x, dict):
+                return sorted((k, normalise(v)) for k, v in x.items())
+
+            if isinstance(x, (set, frozenset)):
+                return sorted(map(normalise, x))
+
+            if isinstance(x, (list, tuple)):
+                return [normalise(v) for v in x]
+
+            return repr(x)
+
+        options = {
+            k: v
+            for k, v in options.items()
+            if k not in ("verbose", "warnings")
+        }
+        options = repr(normalise(options)).encode("utf-8")
+        return hashlib.sha1(options).hexdigest()
+
+    @staticmethod
+    def _signature(filename):
+        """Return the properties of a file that validate its entry.
+
+        :Parameters:
+
+            filename: `str`
+                The file name.
+
+        :Returns:
+
+            `tuple` or `None`
+                The absolute path, size and modification time of the
+                file, or `None` if it is not a local file.
+
+        """
+        try:
+            stat = os.stat(filename)
+        except (OSError, TypeError, ValueError):
+            return
+
+        return (os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+
+    def get(self, filename, key):
+        """Return the catalogued constructs of a file.
+
+        :Parameters:
+
+            filename: `str`
+                The file name.
+
+            key: `str`
+                The read options key, as returned by `options_key`.
+
+        :Returns:
+
+            `tuple` or `None`
+                The constructs in a `FieldList` and the file type, as
+                returned by `cf.read._read_a_file`, or `None` if
+                there is no valid entry for the file.
+
+        """
+        signature = self._signature(filename)
+        if signature is None:
+            return
+
+        path, size, mtime_ns = signature
+        row = self._connection.execute(
+            "SELECT ftype, constructs FROM files WHERE "
+            "path = ? AND options = ? AND size = ? AND mtime_ns = ?",
+            (path, key, size, mtime_ns),
+        ).fetchone()
+        if row is None:
+            return
+
+        ftype, constructs = row
+        try:
+            constructs = FieldList(map(_decode_field, json.loads(constructs)))
+        except Exception as error:
+            # The entry can't be used, so the file will be read again
+            # and its entry replaced
+            logger.warning(
+                f"Ignoring invalid catalogue entry for {path} in "
+                f"{self.path}: {error!r}"
+            )
+            return
+
+        return constructs, ftype
+
+    def put(self, filename, key, result):
+        """Catalogue the constructs of a file.
+
+        Any existing entry for the file and options key is replaced.
+        Nothing is catalogued for non-local files, or for constructs
+        that can not be described in a catalogue.
+
+        :Parameters:
+
+            filename: `str`
+                The file name.
+
+            key: `str`
+                The read options key, as returned by `options_key`.
+
+            result: `tuple`
+                The constructs in a `FieldList` and the file type, as
+                returned by `cf.read._read_a_file`.
+
+        :Returns:
+
+            `bool`
+                Whether or not the constructs were catalogued.
+
+        """
+        signature = self._signature(filename)
+        if signature is None:
+            return False
+
+        constructs, ftype = result
+        try:
+            description = json.dumps([_encode_field(c) for c in constructs])
+        except _CatalogueError as error:
+            if cfdm.is_log_level_info(logger):
+                logger.info(
+                    f"Not cataloguing {filename}: {error}"
+                )  # pragma: no cover
+
+            return False
+
+        path, size, mtime_ns = signature
+        identities = json.dumps([c.identity() for c in constructs])
+        self._connection.execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, key, size, mtime_ns, ftype, identities, description),
+        )
+        return True
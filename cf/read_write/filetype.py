@@ -0,0 +1,274 @@
+import os
+import re
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+# The number of bytes at the start of a file that are needed to
+# detect its type
+_header_size = 112
+
+# The maximum length of the lines read when detecting a CDL file,
+# which stops a large binary file from being read in its entirety
+_max_line_length = 65536
+
+# The magic numbers at the start of netCDF-3 (classic, 64-bit offset
+# and 64-bit data) and HDF5 files
+_netCDF3_magic = (b"CDF\x01", b"CDF\x02", b"CDF\x05")
+_HDF5_magic = b"\x89HDF"
+
+# The names of the byte orders of this machine and of the reverse of
+# this machine, and the corresponding numpy byte order characters
+if sys.byteorder == "little":
+    _byte_orders = (("little_endian", "<"), ("big_endian", ">"))
+else:
+    _byte_orders = (("big_endian", ">"), ("little_endian", "<"))
+
+
+def dataset_type(filename):
+    """Return the type of a dataset, as determined by its contents.
+
+    Only the first few bytes of the file are inspected, and any file
+    suffix is not considered. The result is cached for each file, and
+    is reused until the file's size or modification time change.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `um_dataset_type`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `str` or `None`
+            The dataset type:
+
+            * ``'netCDF3'`` for a netCDF-3 file,
+            * ``'netCDF4'`` for a netCDF-4 (or any other HDF5) file,
+            * ``'CDL'`` for a CDL text file,
+            * ``'PP'`` for a PP file,
+            * ``'FF'`` for a UM fields file,
+            * `None` if the file can't be read, or is of any other
+              type. This is always the case for non-local URIs, such
+              as those starting ``https:`` or ``s3:``.
+
+    **Examples**
+
+    >>> dataset_type('file.nc')
+    'netCDF4'
+    >>> dataset_type('file.pp')
+    'PP'
+    >>> print(dataset_type('file.txt'))
+    None
+
+    """
+    return _sniff_file(filename)[0]
+
+
+def um_dataset_type(filename):
+    """Return the type of a PP or UM fields file.
+
+    The type is detected in the same way as by the UM file reading
+    library, and the result is cached in the same way as by
+    `dataset_type`.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `dataset_type`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `dict` or `None`
+            The file format (``'PP'`` or ``'FF'``), byte order
+            (``'little_endian'`` or ``'big_endian'``) and word size
+            (``4`` or ``8``) of the file, or `None` if it is not a PP
+            or UM fields file.
+
+    **Examples**
+
+    >>> um_dataset_type('file.pp')
+    {'fmt': 'PP', 'byte_ordering': 'big_endian', 'word_size': 4}
+    >>> print(um_dataset_type('file.nc'))
+    None
+
+    """
+    um_type = _sniff_file(filename)[1]
+    if um_type is None:
+        return
+
+    return dict(zip(("fmt", "byte_ordering", "word_size"), um_type))
+
+
+def _sniff_file(filename):
+    """Find the type of a file, using a cached result if possible.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `tuple`
+            The dataset type, and the PP or UM fields file type as a
+            tuple, either of which may be `None`.
+
+    """
+    try:
+        stat = os.stat(filename)
+    except (OSError, TypeError, ValueError):
+        # Not a local file
+        return (None, None)
+
+    return _sniff(os.path.abspath(filename), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _sniff(path, size, mtime_ns):
+    """Find the type of a file from its contents.
+
+    The file's size and modification time are only used as part of
+    the cache key.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        path: `str`
+            The absolute path of the file.
+
+        size: `int`
+            The size of the file in bytes.
+
+        mtime_ns: `int`
+            The modification time of the file in nanoseconds.
+
+    :Returns:
+
+        `tuple`
+            The dataset type, and the PP or UM fields file type as a
+            tuple, either of which may be `None`.
+
+    """
+    try:
+        with open(path, "rb") as fh:
+            header = fh.read(_header_size)
+            if header[:4] in _netCDF3_magic:
+                return ("netCDF3", None)
+
+            if header[:4] == _HDF5_magic:
+                return ("netCDF4", None)
+
+            um_type = _um_file_type(header)
+            if um_type is not None:
+                return (um_type[0], um_type)
+
+            fh.seek(0)
+            if _is_cdl(fh):
+                return ("CDL", None)
+    except OSError:
+        pass
+
+    return (None, None)
+
+
+def _um_file_type(header):
+    """Detect the type of a PP or UM fields file from its header.
+
+    This is equivalent to the ``detect_file_type`` function of the UM
+    file reading library.
+
+    A fields file is recognised by its second word being a valid
+    submodel indicator (1, 2 or 4), and a PP file by its first word
+    being the length of a lookup header record in bytes. A 64-bit PP
+    file must also have zeros for every other 32-bit value of the
+    first 14 words. Each test is tried for both word sizes and both
+    byte orders, native byte order first.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        header: `bytes`
+            At least the first 112 bytes of the file.
+
+    :Returns:
+
+        `tuple` or `None`
+            The file format (``'PP'`` or ``'FF'``), byte order and
+            word size, or `None` if the header is not from a PP or UM
+            fields file.
+
+    """
+    if len(header) < _header_size:
+        return
+
+    words = {
+        (word_size, endian): np.frombuffer(
+            header, dtype=f"{endian}i{word_size}", count=2
+        ).tolist()
+        for word_size in (4, 8)
+        for _, endian in _byte_orders
+    }
+
+    # Fields file
+    for byte_ordering, endian in _byte_orders:
+        for word_size in (4, 8):
+            if words[(word_size, endian)][1] in (1, 2, 4):
+                return ("FF", byte_ordering, word_size)
+
+    # PP file
+    data4 = np.frombuffer(header, dtype="i4")
+    alternating_zeros = not data4[::2].any() or not data4[1::2].any()
+    for word_size in (8, 4):
+        if word_size == 8 and not alternating_zeros:
+            continue
+
+        for byte_ordering, endian in _byte_orders:
+            if words[(word_size, endian)][0] in (
+                64 * word_size,
+                128 * word_size,
+            ):
+                return ("PP", byte_ordering, word_size)
+
+
+def _is_cdl(fh):
+    """Whether or not an open file is a CDL text file.
+
+    A CDL file has a first line, ignoring blank lines and comments,
+    that starts with ``netcdf``.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        fh: file object
+            The file, opened in binary mode and positioned at the
+            start.
+
+    :Returns:
+
+        `bool`
+
+    """
+    try:
+        line = fh.readline(_max_line_length).decode("utf-8")
+        while re.match(r"^\s*//|^\s*$", line):
+            line = fh.readline(_max_line_length).decode("utf-8")
+            if not line:
+                break
+    except UnicodeDecodeError:
+        return False
+
+    return line.startswith("netcdf ")
@@ -0,0 +1,112 @@
+from glob import escape
+from urllib.parse import urlparse
+
+from ..functions import flat
+from .read import read
+
+
+def iread(
+    files,
+    window=1,
+    aggregate=True,
+    recursive=False,
+    followlinks=False,
+    **kwargs,
+):
+    """Iterate over the field or domain constructs read from files.
+
+    This is a generator version of `cf.read` that reads its input
+    files in consecutive groups, or windows, of a given number of
+    files, and yields the field or domain constructs from each window
+    before the next window is read. Only the constructs from one
+    window are held by the iterator at any time, so a very large
+    number of files, such as a year of hourly UM fields files, may be
+    processed with bounded memory.
+
+    The constructs of each window are exactly those that would be
+    returned by `cf.read` for the files in that window. In particular,
+    if aggregation is in use, as it is by default, then constructs are
+    aggregated across all of the files in a window, but never across
+    windows. The default window size of one file aggregates the
+    constructs of each file independently.
+
+    Note that file names are expanded before any files are read, but
+    no file is opened until its window is read.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.read`, `cf.aggregate`
+
+    :Parameters:
+
+        files: (arbitrarily nested sequence of) `str`
+            A string or arbitrarily nested sequence of strings giving
+            the file names, directory names, or OPenDAP URLs from
+            which to read constructs. See `cf.read` for details.
+
+        window: `int`, optional
+            The number of consecutive files to read, and possibly
+            aggregate, together. By default each file is read on its
+            own.
+
+        aggregate: `bool` or `dict`, optional
+            Whether or not to aggregate the constructs read from the
+            files in each window, and how. See `cf.read` for details.
+
+        recursive: `bool`, optional
+            If True then recursively read sub-directories of any
+            directories specified with the *files* parameter. See
+            `cf.read` for details.
+
+        followlinks: `bool`, optional
+            If True, and *recursive* is True, then also search for
+            files in sub-directories which resolve to symbolic
+            links. See `cf.read` for details.
+
+        kwargs: optional
+            Any other keyword arguments accepted by `cf.read`, which
+            are applied to each window, except for *cdl_string* and
+            *nfields*.
+
+    :Returns:
+
+        generator
+            An iterator over the field or domain constructs.
+
+    **Examples**
+
+    >>> for f in cf.iread('data/*.pp', select='air_temperature'):
+    ...     print(f.collapse('T: mean').array)
+
+    Aggregate the constructs from each day of hourly files:
+
+    >>> for f in cf.iread(sorted(glob('hourly/*.pp')), window=24):
+    ...     f.collapse('T: max')
+
+    >>> fl = cf.FieldList(cf.iread('file*.nc', window=2))
+
+    """
+    for kwarg in ("cdl_string", "nfields"):
+        if kwargs.get(kwarg):
+            raise ValueError(f"Can't set {kwarg} for cf.iread")
+
+    window = int(window)
+    if window < 1:
+        raise ValueError(
+            f"Can't iterate over files: window must be positive. Got {window}"
+        )
+
+    filenames = []
+    for file_glob in flat(files):
+        for filename in read._expand_files(file_glob, recursive, followlinks):
+            if urlparse(filename).scheme not in ("https", "http", "s3"):
+                # Stop cf.read from expanding a file name that
+                # contains file name metacharacters
+                filename = escape(filename)
+
+            filenames.append(filename)
+
+    for i in range(0, len(filenames), window):
+        yield from read(
+            filenames[i : i + window], aggregate=aggregate, **kwargs
+        )
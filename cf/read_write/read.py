@@ -1,26 +1,62 @@
 import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from glob import glob
+from multiprocessing import get_context
 from os.path import isdir
 from re import Pattern
 from urllib.parse import urlparse
 
 import cfdm
+import numpy as np
 from cfdm.read_write.exceptions import DatasetTypeError
 from cfdm.read_write.netcdf import NetCDFRead
 
 from ..aggregate import aggregate as cf_aggregate
 from ..cfimplementation import implementation
+from ..constants import _stash2standard_name
 from ..decorators import _manage_log_level_via_verbosity
 from ..domainlist import DomainList
 from ..fieldlist import FieldList
-from ..functions import _DEPRECATION_ERROR_FUNCTION_KWARGS, flat
+from ..functions import (
+    _DEPRECATION_ERROR_FUNCTION_KWARGS,
+    configuration,
+    flat,
+    stash2standard_name,
+)
 from ..query import Query
+from .catalogue import Catalogue
+from .filetype import dataset_type, um_dataset_type
+from .readcache import read_cache
 from .um import UMRead
 
 logger = logging.getLogger(__name__)
 
 
+def _initialise_worker(config, stash2sn):
+    """Initialise a worker process that reads files for `cf.read`.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        config: `dict`
+            The `cf.configuration` of the parent process.
+
+        stash2sn: `dict`
+            The STASH code to standard name conversion table of the
+            parent process, as returned by `cf.stash2standard_name`.
+
+    :Returns:
+
+        `None`
+
+    """
+    configuration(**config)
+    _stash2standard_name.update(stash2sn)
+
+
 class read(cfdm.read):
     """Read field or domain constructs from files.
 
@@ -139,8 +175,15 @@ class read(cfdm.read):
     metadata constructs (coordinates, cell measures, etc.)  must be
     compared non-lazily to ascertain if aggregation is possible.
 
+    When the same files are read many times in a session, the
+    constructs created from each file prior to aggregation may be
+    kept in memory by setting `cf.read_cache_size`, so that
+    subsequent reads of an unchanged file with the same keyword
+    parameters return copies of them without opening the file.
+
     .. seealso:: `cf.aggregate`, `cf.write`, `cf.Field`, `cf.Domain`,
-                 `cf.load_stash2standard_name`, `cf.unique_constructs`
+                 `cf.load_stash2standard_name`, `cf.read_cache_size`,
+                 `cf.unique_constructs`
 
     :Parameters:
 
@@ -285,6 +328,40 @@ class read(cfdm.read):
                         then be re-read with this height as a *um*
                         parameter.
 
+            * ``'index'``: `bool` or `str`
+
+              Whether or not to use a persistent lookup header index
+              for each file. Parsing the lookup headers of a large
+              fields file can dominate the time taken to read it, so
+              the parsed headers may be stored in an index file that
+              is used in place of the lookup headers when the same,
+              unchanged file is read again. If True then the index is
+              stored in a sidecar file next to each dataset, with the
+              suffix ``.umindex.npz``. If a string then it is the name
+              of a directory in which to store the index files, which
+              is useful when the datasets are in read-only
+              directories. An index is ignored, and rewritten, if the
+              dataset's size or modification time have changed since
+              it was created. By default no index is used.
+
+              .. versionadded:: NEXTVERSION
+
+            * ``'mmap'``: `bool`
+
+              Whether or not to access the data of unpacked records
+              via a memory map of each file, so that only the parts
+              of a record that are needed are read from disk. By
+              default each record that is needed is read in its
+              entirety.
+
+              .. warning:: If a file is truncated or rewritten whilst
+                           its data are being accessed via a memory
+                           map then the Python process may be
+                           terminated with a bus error (SIGBUS),
+                           rather than an exception being raised.
+
+              .. versionadded:: NEXTVERSION
+
             If format is specified as ``'PP'`` then the word size and
             byte order default to ``4`` and ``'big'`` respectively.
 
@@ -334,6 +411,16 @@ class read(cfdm.read):
             select='air_temperature')`` is equivalent to ``fl =
             cf.read(file).select_by_identity('air_temperature')``.
 
+            For PP and UM fields, the selection is applied to the
+            lookup header of each variable before any of its field
+            constructs are created, so unselected variables cost very
+            little to read. The identities available at this stage
+            are the ``stash_code``, ``lbproc``, ``lbtim``, ``runid``,
+            ``submodel``, ``um_stash_source`` and ``source``
+            properties, and the standard name, long name and units
+            from the STASH code to standard name conversion table
+            (see `cf.load_stash2standard_name`).
+
         recursive: `bool`, optional
             If True then recursively read sub-directories of any
             directories specified with the *files* parameter.
@@ -382,6 +469,16 @@ class read(cfdm.read):
 
         {{read dask_chunks: `str`, `int`, `None`, or `dict`, optional}}
 
+              For PP and UM fields files, each record is a storage
+              chunk, and a Dask chunk always spans whole records. The
+              ``'storage-aligned'`` and ``'storage-exact'`` options
+              both give one record per Dask chunk, and any other
+              option allows a Dask chunk to span many records, all of
+              which are read with a single opening of the file. For
+              `dict` values, the time and vertical axes of PP and UM
+              fields are identified by the keys ``'T'`` (or
+              ``'time'``) and ``'Z'`` respectively.
+
               .. versionadded:: 3.17.0
 
         {{read store_dataset_chunks: `bool`, optional}}
@@ -400,6 +497,70 @@ class read(cfdm.read):
 
             .. versionadded:: 3.17.0
 
+        max_workers: `int` or `None`, optional
+            The maximum number of files to read at the same time,
+            each one in a separate process. By default, or if
+            *max_workers* is ``1``, the files are read one after
+            another.
+
+            The constructs from all of the files are combined in the
+            order of the files, before any aggregation, so the
+            returned constructs do not depend on the number of
+            workers. Reading in parallel is most beneficial for many
+            files, each with a lot of metadata, since the constructs
+            read by each process have to be copied back to this one.
+
+            *Parameter example:*
+              To read up to 8 files at once: ``max_workers=8``
+
+            .. versionadded:: NEXTVERSION
+
+        subspace: `dict` or `None`, optional
+            Subspace the field or domain constructs read from each
+            file, before aggregation, by passing the dictionary's
+            items as keyword arguments to their ``subspace`` method
+            (see `cf.Field.subspace` for details). Each value must be
+            a coordinate value or a `cf.Query` object, since
+            positional indices, such as slices and sequences of
+            integers or booleans, would be applied to the constructs
+            of each file separately, and so are not allowed. By
+            default the constructs are not subspaced.
+
+            Subspacing the constructs from each file is faster than,
+            and uses less memory than, subspacing the aggregated
+            constructs, because data from outside of the subspace
+            are never included in any construct. It gives the same
+            result, except that constructs that can't be subspaced,
+            because they don't have the given coordinates or none of
+            their cells are selected, are not returned rather than
+            causing an error.
+
+            *Parameter example:*
+              To select latitudes between 40 and 60 degrees north in
+              the year 2020: ``subspace={'latitude': cf.wi(40, 60),
+              'T': cf.year(2020)}``
+
+            .. versionadded:: NEXTVERSION
+
+        catalogue: `str` or `None`, optional
+            The name of a catalogue file, as created by
+            `cf.catalogue`. The constructs of each input file that
+            has a valid entry in the catalogue are created from the
+            catalogue without opening the file, and the constructs of
+            any other local input file are read from the file and
+            added to the catalogue, which is created if it does not
+            already exist. An entry is only valid for a file of the
+            same path, size and modification time, read with the same
+            keyword parameters that affect the constructs created,
+            and an entry that can not be used is replaced. See
+            `cf.catalogue` for details. By default no catalogue is
+            used.
+
+            *Parameter example:*
+              ``catalogue='archive.db'``
+
+            .. versionadded:: NEXTVERSION
+
         umversion: deprecated at version 3.0.0
             Use the *um* parameter instead.
 
@@ -510,6 +671,9 @@ class read(cfdm.read):
         netcdf_backend=None,
         storage_options=None,
         cache=True,
+        max_workers=None,
+        catalogue=None,
+        subspace=None,
         chunks="auto",
         ignore_read_error=False,
         fmt=None,
@@ -585,7 +749,6 @@ class read(cfdm.read):
         info = cfdm.is_log_level_info(logger)
 
         cls.netcdf = NetCDFRead(cls.implementation)
-        cls.um = UMRead(cls.implementation)
 
         # ------------------------------------------------------------
         # Parse the 'select' keyword parameter
@@ -603,12 +766,11 @@ class read(cfdm.read):
             aggregate_options = {}
 
         aggregate_options["copy"] = False
+        aggregate_options["profile"] = False
 
         # ------------------------------------------------------------
         # Parse the 'file_type' keyword parameter
         # ------------------------------------------------------------
-        netCDF_file_types = set(("netCDF", "CDL"))
-        UM_file_types = set(("UM",))
         if file_type is not None:
             if isinstance(file_type, str):
                 file_type = (file_type,)
@@ -621,6 +783,35 @@ class read(cfdm.read):
         if not um:
             um = {}
 
+        # ------------------------------------------------------------
+        # Parse the 'subspace' keyword parameter
+        # ------------------------------------------------------------
+        if subspace is not None and not isinstance(subspace, dict):
+            raise ValueError(
+                "Can't read files: subspace must be a dictionary or None. "
+                f"Got {subspace!r}"
+            )
+
+        if subspace:
+            for key, value in subspace.items():
+                if isinstance(value, (list, slice, tuple, range, np.ndarray)):
+                    # Positional indices would be applied to the
+                    # constructs of each file separately
+                    raise ValueError(
+                        "Can't read files: subspace values must be "
+                        "coordinate values or queries, not positional "
+                        f"indices. Got {key}={value!r}"
+                    )
+
+        # ------------------------------------------------------------
+        # Parse the 'max_workers' keyword parameter
+        # ------------------------------------------------------------
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(
+                "Can't read files: max_workers must be positive or None. "
+                f"Got {max_workers!r}"
+            )
+
         # ------------------------------------------------------------
         # Parse the 'cdl_string' keyword parameter
         # ------------------------------------------------------------
@@ -643,11 +834,6 @@ class read(cfdm.read):
         else:
             out = FieldList()
 
-        # Count the number of fields (in all files) and the number of
-        # files
-        field_counter = -1
-        file_counter = 0
-
         if cdl_string:
             if isinstance(files, str):
                 files = (files,)
@@ -657,145 +843,53 @@ class read(cfdm.read):
             ]
             file_type = set(("CDL",))
 
+        # Expand the file names
+        filenames = []
         for file_glob in flat(files):
-            # Expand variables
-            file_glob = os.path.expanduser(os.path.expandvars(file_glob))
-
-            scheme = urlparse(file_glob).scheme
-            if scheme in ("https", "http", "s3"):
-                # Do not glob a remote URL
-                files2 = (file_glob,)
-            else:
-                # Glob files on disk
-                files2 = glob(file_glob)
-
-                if not files2:
-                    # Trigger a FileNotFoundError error
-                    open(file_glob)
-
-                files3 = []
-                for x in files2:
-                    if isdir(x):
-                        # Walk through directories, possibly recursively
-                        for path, subdirs, filenames in os.walk(
-                            x, followlinks=followlinks
-                        ):
-                            files3.extend(
-                                os.path.join(path, f) for f in filenames
-                            )
-                            if not recursive:
-                                break
-                    else:
-                        files3.append(x)
-
-                files2 = files3
-
-            # The types of all of the input files
-            ftypes = set()
-
-            for filename in files2:
-                if info:
-                    logger.info(f"File: {filename}")  # pragma: no cover
-
-                # ----------------------------------------------------
-                # Read the file
-                # ----------------------------------------------------
-                file_contents = []
-
-                # The type of this file
-                ftype = None
-
-                # Record file type errors
-                file_format_errors = []
+            filenames.extend(
+                cls._expand_files(file_glob, recursive, followlinks)
+            )
 
-                if ftype is None and (
-                    file_type is None
-                    or file_type.intersection(netCDF_file_types)
-                ):
-                    # Try to read as netCDF
-                    try:
-                        file_contents = super().__new__(
-                            cls,
-                            filename=filename,
-                            external=external,
-                            extra=extra,
-                            verbose=verbose,
-                            warnings=warnings,
-                            mask=mask,
-                            unpack=unpack,
-                            warn_valid=warn_valid,
-                            domain=domain,
-                            storage_options=storage_options,
-                            netcdf_backend=netcdf_backend,
-                            dask_chunks=dask_chunks,
-                            store_dataset_chunks=store_dataset_chunks,
-                            cache=cache,
-                            cfa=cfa,
-                            cfa_write=cfa_write,
-                            to_memory=to_memory,
-                            squeeze=squeeze,
-                            unsqueeze=unsqueeze,
-                            file_type=file_type,
-                        )
-                    except DatasetTypeError as error:
-                        if file_type is None:
-                            file_format_errors.append(error)
-                    else:
-                        file_format_errors = []
-                        ftype = "netCDF"
-
-                if ftype is None and (
-                    file_type is None or file_type.intersection(UM_file_types)
-                ):
-                    # Try to read as UM
-                    try:
-                        file_contents = cls.um.read(
-                            filename,
-                            um_version=um.get("version"),
-                            verbose=verbose,
-                            set_standard_name=False,
-                            height_at_top_of_model=height_at_top_of_model,
-                            fmt=um.get("fmt"),
-                            word_size=um.get("word_size"),
-                            endian=um.get("endian"),
-                            select=select,
-                            squeeze=squeeze,
-                            unsqueeze=unsqueeze,
-                            domain=domain,
-                            file_type=file_type,
-                            unpack=unpack,
-                        )
-                    except DatasetTypeError as error:
-                        if file_type is None:
-                            file_format_errors.append(error)
-                    else:
-                        file_format_errors = []
-                        ftype = "UM"
-
-                if file_format_errors:
-                    error = "\n".join(map(str, file_format_errors))
-                    raise DatasetTypeError(f"\n{error}")
-
-                if domain:
-                    file_contents = DomainList(file_contents)
-
-                file_contents = FieldList(file_contents)
-
-                if ftype:
-                    ftypes.add(ftype)
-
-                # Select matching fields (only for netCDF files at
-                # this stage - we'll other it for other file types
-                # later)
-                if select and ftype == "netCDF":
-                    file_contents = file_contents.select_by_identity(*select)
-
-                # Add this file's contents to that already read from
-                # other files
-                out.extend(file_contents)
-
-                field_counter = len(out)
-                file_counter += 1
+        # The types of all of the input files
+        ftypes = set()
+
+        for file_contents, ftype in cls._read_files(
+            filenames,
+            max_workers,
+            catalogue,
+            file_type=file_type,
+            um=um,
+            select=select,
+            subspace=subspace,
+            domain=domain,
+            external=external,
+            extra=extra,
+            verbose=verbose,
+            warnings=warnings,
+            mask=mask,
+            unpack=unpack,
+            warn_valid=warn_valid,
+            storage_options=storage_options,
+            netcdf_backend=netcdf_backend,
+            dask_chunks=dask_chunks,
+            store_dataset_chunks=store_dataset_chunks,
+            cache=cache,
+            cfa=cfa,
+            cfa_write=cfa_write,
+            to_memory=to_memory,
+            squeeze=squeeze,
+            unsqueeze=unsqueeze,
+            height_at_top_of_model=height_at_top_of_model,
+        ):
+            if ftype:
+                ftypes.add(ftype)
+
+            # Add this file's contents to that already read from
+            # other files
+            out.extend(file_contents)
+
+        field_counter = len(out)
+        file_counter = len(filenames)
 
         # ----------------------------------------------------------------
         # Aggregate the output fields/domains
@@ -854,6 +948,376 @@ class read(cfdm.read):
 
         return out
 
+    @classmethod
+    def _read_files(
+        cls,
+        filenames,
+        max_workers=None,
+        catalogue=None,
+        use_read_cache=True,
+        **kwargs,
+    ):
+        """Read files, possibly in parallel.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_read_a_file`
+
+        :Parameters:
+
+            filenames: sequence of `str`
+                The files to read.
+
+            max_workers: `int` or `None`, optional
+                The maximum number of files to read at the same time,
+                each one in a separate process. If `None` or ``1``
+                then the files are read one after another.
+
+            catalogue: `str` or `None`, optional
+                The name of a catalogue file from which to get the
+                constructs of catalogued files, and to which to add
+                the constructs of other files. If `None` then no
+                catalogue is used.
+
+            use_read_cache: `bool`, optional
+                If True, the default, then get the constructs of
+                previously read files from the in-memory read cache,
+                and add the constructs of other files to it, when the
+                cache is enabled with `cf.read_cache_size`.
+
+            kwargs: optional
+                Keyword arguments to `_read_a_file`.
+
+        :Returns:
+
+            generator
+                The output of `_read_a_file` for each file, in the
+                same order as *filenames*.
+
+        """
+        if use_read_cache and read_cache.max_size > 0:
+            key = Catalogue.options_key(kwargs)
+            cached = [read_cache.get(filename, key) for filename in filenames]
+
+            # Read the files which are not in the read cache
+            results = cls._read_files(
+                [
+                    filename
+                    for filename, result in zip(filenames, cached)
+                    if result is None
+                ],
+                max_workers,
+                catalogue,
+                use_read_cache=False,
+                **kwargs,
+            )
+            for filename, result in zip(filenames, cached):
+                if result is None:
+                    result = next(results)
+                    read_cache.put(filename, key, result)
+
+                yield result
+
+            return
+
+        if use_read_cache and len(read_cache):
+            # The read cache has been disabled, so free its memory
+            read_cache.clear()
+
+        if catalogue is not None:
+            with Catalogue(catalogue) as cat:
+                key = cat.options_key(kwargs)
+                catalogued = [cat.get(filename, key) for filename in filenames]
+
+                # Read the files which are not in the catalogue
+                results = cls._read_files(
+                    [
+                        filename
+                        for filename, result in zip(filenames, catalogued)
+                        if result is None
+                    ],
+                    max_workers,
+                    use_read_cache=False,
+                    **kwargs,
+                )
+                for filename, result in zip(filenames, catalogued):
+                    if result is None:
+                        result = next(results)
+                        cat.put(filename, key, result)
+
+                    yield result
+
+            return
+
+        if max_workers is None or max_workers <= 1 or len(filenames) <= 1:
+            for filename in filenames:
+                yield cls._read_a_file(filename, **kwargs)
+
+            return
+
+        # Start new worker processes, rather than forking this one,
+        # which might be holding locks in other threads, and give them
+        # this process's configuration and STASH code to standard
+        # name conversion table
+        executor = ProcessPoolExecutor(
+            max_workers=min(max_workers, len(filenames)),
+            mp_context=get_context("spawn"),
+            initializer=_initialise_worker,
+            initargs=(configuration(), stash2standard_name()),
+        )
+        try:
+            # Note: 'map' returns the results in the order of the
+            #       files, and raises any exception from reading a
+            #       file when that file's result is reached.
+            yield from executor.map(
+                partial(cls._read_a_file, **kwargs), filenames
+            )
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    @classmethod
+    def _read_a_file(
+        cls,
+        filename,
+        file_type=None,
+        um=None,
+        select=None,
+        subspace=None,
+        domain=False,
+        height_at_top_of_model=None,
+        **kwargs,
+    ):
+        """Read the field or domain constructs from a single file.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `_read_files`
+
+        :Parameters:
+
+            filename: `str`
+                The file to read.
+
+            file_type: `None` or `set`
+                The file types to read, as parsed by `cf.read`.
+
+            um: `dict`
+                The *um* parameter of `cf.read`.
+
+            select: `None` or sequence
+                The *select* parameter of `cf.read`, as parsed by
+                `cf.read`.
+
+            subspace: `None` or `dict`
+                The *subspace* parameter of `cf.read`.
+
+            domain: `bool`
+                The *domain* parameter of `cf.read`.
+
+            height_at_top_of_model: `None` or `float`
+                The deprecated *height_at_top_of_model* parameter of
+                `cf.read`.
+
+            kwargs: optional
+                Other parameters of `cf.read` that apply to the
+                reading of netCDF files.
+
+        :Returns:
+
+            2-`tuple`
+                The `FieldList` of constructs read from the file, and
+                the type of the file (``'netCDF'``, ``'UM'`` or
+                `None`). Only the netCDF constructs have been
+                selected by *select*, but all constructs have been
+                subspaced by *subspace*.
+
+        """
+        if cfdm.is_log_level_info(logger):
+            logger.info(f"File: {filename}")  # pragma: no cover
+
+        netCDF_file_types = set(("netCDF", "CDL"))
+        UM_file_types = set(("UM",))
+
+        # Find the type of the file from its contents, so that it only
+        # needs to be read by the right reader. If the type can't be
+        # found, which is always the case for remote files, then each
+        # reader is tried in turn.
+        ds_type = dataset_type(filename)
+        try_netCDF = ds_type is None or ds_type in (
+            "netCDF3",
+            "netCDF4",
+            "CDL",
+        )
+        try_UM = ds_type is None or ds_type in ("PP", "FF")
+
+        fmt = um.get("fmt")
+        word_size = um.get("word_size")
+        endian = um.get("endian")
+        if try_UM and fmt is None and word_size is None and endian is None:
+            # Use the detected PP or UM fields file type, so that it
+            # does not need to be detected again
+            um_type = um_dataset_type(filename)
+            if um_type is not None:
+                fmt = um_type["fmt"]
+                word_size = um_type["word_size"]
+                endian = um_type["byte_ordering"].split("_")[0]
+
+        file_contents = []
+
+        # The type of this file
+        ftype = None
+
+        # Record file type errors
+        file_format_errors = []
+
+        if (
+            ftype is None
+            and try_netCDF
+            and (
+                file_type is None or file_type.intersection(netCDF_file_types)
+            )
+        ):
+            # Try to read as netCDF
+            try:
+                file_contents = super().__new__(
+                    cls,
+                    filename=filename,
+                    domain=domain,
+                    file_type=file_type,
+                    **kwargs,
+                )
+            except DatasetTypeError as error:
+                if file_type is None:
+                    file_format_errors.append(error)
+            else:
+                file_format_errors = []
+                ftype = "netCDF"
+
+        if (
+            ftype is None
+            and try_UM
+            and (file_type is None or file_type.intersection(UM_file_types))
+        ):
+            # Try to read as UM
+            try:
+                file_contents = UMRead(cls.implementation).read(
+                    filename,
+                    um_version=um.get("version"),
+                    verbose=kwargs.get("verbose"),
+                    set_standard_name=False,
+                    height_at_top_of_model=height_at_top_of_model,
+                    fmt=fmt,
+                    word_size=word_size,
+                    endian=endian,
+                    index=um.get("index"),
+                    mmap=um.get("mmap", False),
+                    dask_chunks=kwargs.get("dask_chunks"),
+                    select=select,
+                    squeeze=kwargs.get("squeeze"),
+                    unsqueeze=kwargs.get("unsqueeze"),
+                    domain=domain,
+                    file_type=file_type,
+                    unpack=kwargs.get("unpack"),
+                )
+            except DatasetTypeError as error:
+                if file_type is None:
+                    file_format_errors.append(error)
+            else:
+                file_format_errors = []
+                ftype = "UM"
+
+        if file_format_errors:
+            error = "\n".join(map(str, file_format_errors))
+            raise DatasetTypeError(f"\n{error}")
+
+        if domain:
+            file_contents = DomainList(file_contents)
+
+        file_contents = FieldList(file_contents)
+
+        # Select matching fields (only for netCDF files at this stage
+        # - we'll other it for other file types later)
+        if select and ftype == "netCDF":
+            file_contents = file_contents.select_by_identity(*select)
+
+        if subspace:
+            # Subspace each construct, discarding those that can't be
+            # subspaced
+            subspaced = []
+            for construct in file_contents:
+                try:
+                    subspaced.append(construct.subspace(**subspace))
+                except (ValueError, IndexError) as error:
+                    if cfdm.is_log_level_info(logger):
+                        logger.info(
+                            f"Discarding {construct!r} from {filename}: "
+                            f"{error}"
+                        )  # pragma: no cover
+
+            file_contents = FieldList(subspaced)
+
+        return file_contents, ftype
+
+    @staticmethod
+    def _expand_files(file_glob, recursive=False, followlinks=False):
+        """Expand a file name into the names of the files to read.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `cf.iread`
+
+        :Parameters:
+
+            file_glob: `str`
+                The file name, directory name, or OPenDAP URL, which
+                may contain variables and file name
+                metacharacters. See `cf.read` for details.
+
+            recursive: `bool`, optional
+                If True then recursively expand sub-directories of
+                any directories. See `cf.read` for details.
+
+            followlinks: `bool`, optional
+                If True, and *recursive* is True, then also expand
+                sub-directories which resolve to symbolic links. See
+                `cf.read` for details.
+
+        :Returns:
+
+            sequence of `str`
+                The file names.
+
+        """
+        # Expand variables
+        file_glob = os.path.expanduser(os.path.expandvars(file_glob))
+
+        scheme = urlparse(file_glob).scheme
+        if scheme in ("https", "http", "s3"):
+            # Do not glob a remote URL
+            return (file_glob,)
+
+        # Glob files on disk
+        files = glob(file_glob)
+
+        if not files:
+            # Trigger a FileNotFoundError error
+            open(file_glob)
+
+        out = []
+        for x in files:
+            if isdir(x):
+                # Walk through directories, possibly recursively
+                for path, subdirs, filenames in os.walk(
+                    x, followlinks=followlinks
+                ):
+                    out.extend(os.path.join(path, f) for f in filenames)
+                    if not recursive:
+                        break
+            else:
+                out.append(x)
+
+        return out
+
     @staticmethod
     def _plural(n):  # pragma: no cover
         """Return a suffix which reflects a word's plural."""
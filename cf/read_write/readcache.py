@@ -0,0 +1,170 @@
+import logging
+
+from ..lrucache import LRUCache
+from .catalogue import Catalogue
+
+logger = logging.getLogger(__name__)
+
+# The approximate memory used by each construct, and each of its
+# bounds and interior ring variables, excluding its data values
+_variable_size = 1024
+
+
+def _constructs_size(constructs):
+    """Return an estimate of the memory used by constructs.
+
+    Each construct, and each of its metadata constructs and their
+    bounds and interior ring variables, is assumed to use a fixed
+    amount of memory, plus the size of its data values if they are in
+    memory. Lazy data values are not included, since they are always
+    read from the original files.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        constructs: `FieldList`
+            The field or domain constructs.
+
+    :Returns:
+
+        `int`
+            The estimated size, in bytes.
+
+    """
+    size = 0
+    for f in constructs:
+        variables = [f, *f.constructs.values()]
+        while variables:
+            x = variables.pop()
+            size += _variable_size
+            for method in ("get_bounds", "get_interior_ring"):
+                get = getattr(x, method, None)
+                if get is not None:
+                    y = get(None)
+                    if y is not None:
+                        variables.append(y)
+
+            get_data = getattr(x, "get_data", None)
+            if get_data is None:
+                continue
+
+            d = get_data(None, _units=False, _fill_value=False)
+            if d is not None and d.__in_memory__:
+                size += d.size * d.dtype.itemsize
+
+    return size
+
+
+class ReadCache(LRUCache):
+    """A thread-safe, in-memory cache of the constructs read from files.
+
+    The cache stores, for each file read with given `cf.read` keyword
+    parameters, the constructs created from the file prior to
+    aggregation. An entry is only used if the file still has the
+    same path, size and modification time as when it was read.
+
+    The memory used by the cached constructs is limited to the value
+    of `cf.read_cache_size`, above which the least recently used
+    entries are removed. The memory used is estimated from the number
+    of constructs and the size of any of their data values that are
+    in memory. The cached constructs otherwise only contain lazy
+    data, whose values are always read from the original files.
+
+    A copy of the cached constructs is returned by `get`, so that
+    changes to the returned constructs never affect the cache, and a
+    copy is stored by `put`, so that later changes to the stored
+    constructs never affect the cache either. Copying constructs
+    with lazy data does not copy any data values.
+
+    .. versionadded:: NEXTVERSION
+
+    .. seealso:: `cf.read_cache_size`
+
+    """
+
+    _constant = "READ_CACHE_SIZE"
+
+    def get(self, filename, key):
+        """Return the cached constructs of a file.
+
+        :Parameters:
+
+            filename: `str`
+                The file name.
+
+            key: `str`
+                The read options key, as returned by
+                `Catalogue.options_key`.
+
+        :Returns:
+
+            `tuple` or `None`
+                A copy of the constructs in a `FieldList` and the file
+                type, as returned by `cf.read._read_a_file`, or `None`
+                if there is no valid entry for the file.
+
+        """
+        signature = Catalogue._signature(filename)
+        if signature is None:
+            return
+
+        with self._lock:
+            entry = self._get((signature, key))
+
+        if entry is None:
+            return
+
+        constructs, ftype, _ = entry
+        return constructs.copy(), ftype
+
+    def put(self, filename, key, result):
+        """Cache the constructs of a file.
+
+        Any existing entry for the file and options key is replaced.
+        Nothing is cached for non-local files, or for constructs that
+        are larger than `max_size`.
+
+        :Parameters:
+
+            filename: `str`
+                The file name.
+
+            key: `str`
+                The read options key, as returned by
+                `Catalogue.options_key`.
+
+            result: `tuple`
+                The constructs in a `FieldList` and the file type, as
+                returned by `cf.read._read_a_file`.
+
+        :Returns:
+
+            `bool`
+                Whether or not the constructs were cached.
+
+        """
+        max_size = self.max_size
+        if max_size <= 0:
+            return False
+
+        signature = Catalogue._signature(filename)
+        if signature is None:
+            return False
+
+        constructs, ftype = result
+        size = _constructs_size(constructs)
+        if size > max_size:
+            return False
+
+        # Entries are {(signature, key): (constructs, ftype, size)}
+        with self._lock:
+            self._put(
+                (signature, key), (constructs.copy(), ftype, size), max_size
+            )
+
+        return True
+
+
+# The process-wide cache of the constructs read from files
+read_cache = ReadCache()
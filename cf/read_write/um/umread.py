@@ -12,6 +12,7 @@ from cfdm import Constructs, is_log_level_info
 from cfdm.read_write.exceptions import DatasetTypeError
 from dask.array.core import getter, normalize_chunks
 from dask.base import tokenize
+from dask.utils import parse_bytes
 from netCDF4 import date2num as netCDF4_date2num
 
 from ... import __Conventions__, __version__
@@ -22,12 +23,13 @@ from ...decorators import (
     _manage_log_level_via_verbose_attr,
     _manage_log_level_via_verbosity,
 )
-from ...functions import abspath
+from ...functions import _stash2standard_name_records, abspath
 from ...functions import atol as cf_atol
 from ...functions import load_stash2standard_name
 from ...functions import rtol as cf_rtol
 from ...umread_lib.umfile import File
 from ...units import Units
+from ..filetype import um_dataset_type
 
 logger = logging.getLogger(__name__)
 
@@ -492,6 +494,8 @@ class UMField:
         squeeze=False,
         unsqueeze=False,
         unpack=True,
+        dask_chunks="storage-aligned",
+        mmap=False,
         **kwargs,
     ):
         """**Initialisation**
@@ -571,6 +575,18 @@ class UMField:
 
                 .. versionadded:: 3.17.0
 
+            dask_chunks: `str`, `int`, `None`, or `dict`, optional
+                Specify the Dask chunking of the data. See
+                `UMRead.read` for details.
+
+                .. versionadded:: NEXTVERSION
+
+            mmap: `bool`, optional
+                Whether or not to access the data of unpacked records
+                via a memory map. See `UMRead.read` for details.
+
+                .. versionadded:: NEXTVERSION
+
             kwargs: *optional*
                 Keyword arguments providing extra CF properties for each
                 return field construct.
@@ -592,19 +608,33 @@ class UMField:
         self.byte_ordering = byte_ordering
         self.word_size = word_size
         self.unpack = unpack
+        self.dask_chunks = dask_chunks
+        self.mmap = mmap
 
         self.atol = cf_atol()
 
+        self.fields = []
+
+        # Only process the requested fields. This is tested on the
+        # lookup header of the first record, before any of the
+        # variable's records are grouped or interpreted.
+        if select and not self.match_header(var.recs[0], select, um_version):
+            # This PP/UM field does not match the requested selection
+            self.field = (None,)
+            return
+
         self.field = self.implementation.initialise_Field()
 
         cf_properties = {}
         attributes = {}
 
-        self.fields = []
-
         filename = abspath(var.file.path)
         self.filename = filename
 
+        # Get the lookup headers of all records as one array, so that
+        # header items can be interpreted as whole-array operations
+        headers = var.get_headers()
+
         groups = var.group_records_by_extra_data()
 
         n_groups = len(groups)
@@ -613,14 +643,19 @@ class UMField:
             # There is one group of records
             groups_nz = [var.nz]
             groups_nt = [var.nt]
+            groups_headers = [headers]
         elif n_groups > 1:
             # There are multiple groups of records, distinguished by
             # different extra data.
+            rownumber = {id(rec): i for i, rec in enumerate(var.recs)}
+
             groups_nz = []
             groups_nt = []
+            groups_headers = []
             groups2 = []
             for group in groups:
                 group_size = len(group)
+                group_headers = headers[[rownumber[id(rec)] for rec in group]]
                 if group_size == 1:
                     # There is only one record in this group
                     split_group = False
@@ -628,27 +663,21 @@ class UMField:
                 elif group_size > 1:
                     # There are multiple records in this group
                     # Find the lengths of runs of identical times
-                    times = [
-                        (self.header_vtime(rec), self.header_dtime(rec))
-                        for rec in group
-                    ]
-                    lengths = [
-                        len(tuple(g)) for k, g in itertools.groupby(times)
-                    ]
-                    if len(set(lengths)) == 1:
+                    times = self.header_times(group_headers)
+                    starts = np.flatnonzero(
+                        (times[1:] != times[:-1]).any(axis=1)
+                    )
+                    lengths = np.diff(
+                        np.concatenate(([0], starts + 1, [group_size]))
+                    )
+                    if (lengths == lengths[0]).all():
                         # Each run of identical times has the same
                         # length, so it is possible that this group
                         # forms a variable of nz x nt records.
-                        split_group = False
-                        nz = lengths.pop()
-                        z0 = [self.z for rec in group[:nz]]
-                        for i in range(nz, group_size, nz):
-                            z1 = [
-                                self.header_z(rec) for rec in group[i : i + nz]
-                            ]
-                            if z1 != z0:
-                                split_group = True
-                                break
+                        nz = int(lengths[0])
+                        z = self.header_levels(group_headers)
+                        z = z.reshape((group_size // nz, nz) + z.shape[1:])
+                        split_group = not (z == z[0]).all()
                     else:
                         # Different runs of identical times have
                         # different lengths, so it is not possible for
@@ -663,13 +692,15 @@ class UMField:
                     groups2.extend([[rec] for rec in group])
                     groups_nz.extend([1] * group_size)
                     groups_nt.extend([1] * group_size)
+                    groups_headers.extend(group_headers[:, np.newaxis])
                 else:
                     # This group forms a complete nz x nt matrix, so
                     # it may be considered as a variable in its own
                     # right and doesn't need to be split up.
                     groups2.append(group)
                     groups_nz.append(nz)
-                    groups_nt.append(group_size / nz)
+                    groups_nt.append(group_size // nz)
+                    groups_headers.append(group_headers)
 
             groups = groups2
 
@@ -731,39 +762,6 @@ class UMField:
         if source is not None and model_um_version is not None:
             source += f" vn{model_um_version}"
 
-        # Only process the requested fields
-        ok = True
-        if select:
-            values1 = (
-                f"stash_code={stash}",
-                f"lbproc={LBPROC}",
-                f"lbtim={LBTIM}",
-                f"runid={self.decode_lbexp()}",
-                f"submodel={submodel}",
-            )
-            if um_stash_source is not None:
-                values1 += (f"um_stash_source={um_stash_source}",)
-            if source:
-                values1 += (f"source={source}",)
-
-            ok = False
-            for value0 in select:
-                for value1 in values1:
-                    ok = Constructs._matching_values(
-                        value0, None, value1, basic=True
-                    )
-                    if ok:
-                        break
-
-                if ok:
-                    break
-
-        if not ok:
-            # This PP/UM field does not match the requested selection
-            self.field = (None,)
-            return
-
-        # Still here?
         self.lbnpt = LBNPT
         self.lbrow = LBROW
         self.lbtim = LBTIM
@@ -841,8 +839,11 @@ class UMField:
         self.stash = stash
 
         # The STASH code has been set in the PP header, so try to find
-        # its standard_name from the conversion table
-        stash_records = _stash2standard_name.get((submodel, stash), None)
+        # its standard_name from the entries of the conversion table
+        # that are valid for this UM version
+        stash_records = _stash2standard_name_records(
+            submodel, stash, self.um_version
+        )
 
         um_Units = None
         um_condition = None
@@ -851,7 +852,6 @@ class UMField:
         standard_name = None
 
         if stash_records:
-            um_version = self.um_version
             for (
                 long_name,
                 units,
@@ -862,9 +862,6 @@ class UMField:
                 um_condition,
             ) in stash_records:
                 # Check that conditions are met
-                if not self.test_um_version(valid_from, valid_to, um_version):
-                    continue
-
                 if um_condition:
                     if not self.test_um_condition(
                         um_condition, LBCODE, BPLAT, BPLON
@@ -907,14 +904,19 @@ class UMField:
         if long_name is None:
             cf_properties["long_name"] = identity
 
-        for recs, nz, nt in zip(groups, groups_nz, groups_nt):
+        for recs, nz, nt, headers in zip(
+            groups, groups_nz, groups_nt, groups_headers
+        ):
             self.recs = recs
             self.nz = nz
             self.nt = nt
             self.z_recs = recs[:nz]
             self.t_recs = recs[::nz]
+            self.headers = headers
+            self.z_headers = headers[:nz]
+            self.t_headers = headers[::nz]
 
-            LBUSER5 = recs[0].int_hdr.item(lbuser5)
+            LBUSER5 = headers["int_hdr"].item(0, lbuser5)
 
             #            self.cell_method_axis_name = {'area': 'area'}
 
@@ -1196,6 +1198,76 @@ class UMField:
 
         return "\n".join(out)
 
+    def _dask_chunks(self, data_shape, dtype, pmaxes):
+        """Find the dask chunks for the data.
+
+        The last two dimensions, which span each record, are never
+        chunked. Each chunk of the leading time and vertical
+        dimensions spans one or more whole records.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `create_data`
+
+        :Parameters:
+
+            data_shape: `tuple`
+                The shape of the data.
+
+            dtype: `numpy.dtype`
+                The data type of the data.
+
+            pmaxes: sequence of `str`
+                The domain axis identifiers of the leading dimensions
+                of the data.
+
+        :Returns:
+
+            `tuple`
+                The normalised dask chunks.
+
+        """
+        dask_chunks = self.dask_chunks
+        n_leading = len(pmaxes)
+
+        if dask_chunks in ("storage-aligned", "storage-exact"):
+            # One record per chunk
+            chunks = (1,) * n_leading
+        elif isinstance(dask_chunks, dict):
+            chunks = []
+            for axis in pmaxes:
+                if axis == _axis.get("t"):
+                    keys = ("T", "time")
+                else:
+                    keys = ("Z",)
+
+                c = "auto"
+                for key in keys:
+                    if key in dask_chunks:
+                        c = dask_chunks[key]
+                        break
+
+                chunks.append(c)
+
+            chunks = tuple(chunks)
+        else:
+            # 'auto', a byte-size string, an integer, or None
+            chunks = (dask_chunks,) * n_leading
+
+        chunks = tuple(-1 if c is None else c for c in chunks)
+
+        limit = None
+        for c in chunks:
+            if isinstance(c, str) and c != "auto":
+                limit = parse_bytes(c)
+                break
+
+        chunks = tuple("auto" if isinstance(c, str) else c for c in chunks)
+
+        return normalize_chunks(
+            chunks + (-1, -1), shape=data_shape, dtype=dtype, limit=limit
+        )
+
     def _reorder_z_axis(self, indices, z_axis, pmaxes):
         """Reorder the Z axis `Rec` instances.
 
@@ -1296,18 +1368,10 @@ class UMField:
         field = self.field
 
         # "a" domain ancillary
-        array = np.array(
-            [rec.real_hdr[blev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,  # Zsea
-        )
-        bounds0 = np.array(
-            [rec.real_hdr[brlev] for rec in self.z_recs],  # Zsea lower
-            dtype=self.real_hdr_dtype,
-        )
-        bounds1 = np.array(
-            [rec.real_hdr[brsvd1] for rec in self.z_recs],  # Zsea upper
-            dtype=self.real_hdr_dtype,
-        )
+        real_hdr = self.z_headers["real_hdr"]
+        array = real_hdr[:, blev].copy()  # Zsea
+        bounds0 = real_hdr[:, brlev].copy()  # Zsea lower
+        bounds1 = real_hdr[:, brsvd1].copy()  # Zsea upper
         bounds = self.create_bounds_array(bounds0, bounds1)
 
         # Insert new Z axis
@@ -1330,14 +1394,7 @@ class UMField:
         # Height at top of atmosphere
         toa_height = self.height_at_top_of_model
         if toa_height is None:
-            pseudolevels = any(
-                [
-                    rec.int_hdr.item(
-                        lbuser5,
-                    )
-                    for rec in self.z_recs
-                ]
-            )
+            pseudolevels = self.z_headers["int_hdr"][:, lbuser5].any()
             if pseudolevels:
                 # Pseudolevels and atmosphere hybrid height
                 # coordinates are both present => can't reliably infer
@@ -1380,18 +1437,9 @@ class UMField:
             )
 
         # "b" domain ancillary
-        array = np.array(
-            [rec.real_hdr[bhlev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds0 = np.array(
-            [rec.real_hdr[bhrlev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds1 = np.array(
-            [rec.real_hdr[brsvd2] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
+        array = real_hdr[:, bhlev].copy()
+        bounds0 = real_hdr[:, bhrlev].copy()
+        bounds1 = real_hdr[:, brsvd2].copy()
         bounds = self.create_bounds_array(bounds0, bounds1)
 
         ac = self.implementation.initialise_DomainAncillary()
@@ -1440,18 +1488,10 @@ class UMField:
 
         field = self.field
 
-        array = np.array(
-            [rec.real_hdr[blev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds0 = np.array(
-            [rec.real_hdr[brlev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds1 = np.array(
-            [rec.real_hdr[brsvd1] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
+        real_hdr = self.z_headers["real_hdr"]
+        array = real_hdr[:, blev].copy()
+        bounds0 = real_hdr[:, brlev].copy()
+        bounds1 = real_hdr[:, brsvd1].copy()
         bounds = self.create_bounds_array(bounds0, bounds1)
 
         # Create Z domain axis construct
@@ -1473,18 +1513,9 @@ class UMField:
             autocyclic=_autocyclic_false,
         )
 
-        array = np.array(
-            [rec.real_hdr[bhlev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds0 = np.array(
-            [rec.real_hdr[bhrlev] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
-        bounds1 = np.array(
-            [rec.real_hdr[brsvd2] for rec in self.z_recs],
-            dtype=self.real_hdr_dtype,
-        )
+        array = real_hdr[:, bhlev].copy()
+        bounds0 = real_hdr[:, bhrlev].copy()
+        bounds1 = real_hdr[:, brsvd2].copy()
         bounds = self.create_bounds_array(bounds0, bounds1)
 
         # ac = AuxiliaryCoordinate()
@@ -1532,31 +1563,21 @@ class UMField:
             `DimensionCoordinate`
 
         """
-        array = []
-        bounds = []
-        ak_array = []
-        ak_bounds = []
-        bk_array = []
-        bk_bounds = []
-
-        for rec in self.z_recs:
-            BLEV, BRLEV, BHLEV, BHRLEV, BULEV, BHULEV = self.header_bz(rec)
-
-            array.append(BLEV + BHLEV / _pstar)
-            bounds.append([BRLEV + BHRLEV / _pstar, BULEV + BHULEV / _pstar])
-
-            ak_array.append(BHLEV)
-            ak_bounds.append((BHRLEV, BHULEV))
+        # BLEV, BRLEV, BHLEV, BHRLEV, BULEV, BHULEV
+        BLEV, BRLEV, BHLEV, BHRLEV, BULEV, BHULEV = self.header_levels(
+            self.z_headers
+        )[:, 2:].T
+
+        array = BLEV + BHLEV / _pstar
+        bounds = np.stack(
+            (BRLEV + BHRLEV / _pstar, BULEV + BHULEV / _pstar), axis=1
+        )
 
-            bk_array.append(BLEV)
-            bk_bounds.append((BRLEV, BULEV))
+        ak_array = BHLEV
+        ak_bounds = np.stack((BHRLEV, BHULEV), axis=1)
 
-        array = np.array(array, dtype=float)
-        bounds = np.array(bounds, dtype=float)
-        ak_array = np.array(ak_array, dtype=float)
-        ak_bounds = np.array(ak_bounds, dtype=float)
-        bk_array = np.array(bk_array, dtype=float)
-        bk_bounds = np.array(bk_bounds, dtype=float)
+        bk_array = BLEV
+        bk_bounds = np.stack((BRLEV, BULEV), axis=1)
 
         field = self.field
 
@@ -1869,9 +1890,31 @@ class UMField:
     def ctime(self, rec):
         """Return elapsed time since the clock time of the given
         record."""
+        return self._ctime(
+            tuple(self.header_vtime(rec)), tuple(self.header_dtime(rec))
+        )
+
+    def _ctime(self, LBVTIME, LBDTIME):
+        """Return elapsed time since a clock time.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `ctime`, `ctimes`
+
+        :Parameters:
+
+            LBVTIME: `tuple`
+                The validity time (LBYR, LBMON, LBDAT, LBHR, LBMIN).
+
+            LBDTIME: `tuple`
+                The data time (LBYRD, LBMOND, LBDATD, LBHRD, LBMIND).
+
+        :Returns:
+
+            `float`
+
+        """
         reftime = self.refUnits
-        LBVTIME = tuple(self.header_vtime(rec))
-        LBDTIME = tuple(self.header_dtime(rec))
 
         key = (LBVTIME, LBDTIME, self.refunits, self.calendar)
         ctime = _cached_ctime.get(key, None)
@@ -1890,6 +1933,173 @@ class UMField:
 
         return ctime
 
+    def ctimes(self, headers):
+        """Return elapsed times since the clock times of many records.
+
+        Each distinct pair of validity and data times is only
+        converted once.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `ctime`, `elapsed_times`
+
+        :Parameters:
+
+            headers: `numpy.ndarray`
+                The lookup headers of the records, as returned by
+                `umfile.Var.get_headers`.
+
+        :Returns:
+
+            `numpy.ndarray`
+
+        """
+        times = self.header_times(headers)
+        unique, inverse = np.unique(times, axis=0, return_inverse=True)
+        ctimes = np.array(
+            [self._ctime(tuple(t[:5]), tuple(t[5:])) for t in unique.tolist()]
+        )
+        return ctimes[inverse.reshape(-1)]
+
+    def elapsed_times(self, dates):
+        """Return elapsed times since the reference time for many dates.
+
+        Each distinct date is only converted once, and all of the
+        conversions that aren't already cached are done with a single
+        call to `cftime.date2num`. The results are the same as those
+        returned by `vtime` and `dtime`.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `dtime`, `vtime`
+
+        :Parameters:
+
+            dates: `numpy.ndarray`
+                The dates, as an integer array of shape ``(n, 5)``
+                containing the year, month, day, hour and minute of
+                each date.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The elapsed times, in units of `refunits`, with
+                `numpy.nan` for any invalid dates.
+
+        **Examples**
+
+        >>> u.elapsed_times(np.array([[1991, 1, 1, 0, 0],
+        ...                           [1991, 2, 1, 0, 0]]))
+        array([ 0., 31.])
+
+        """
+        units = self.refunits
+        calendar = self.calendar
+
+        unique, inverse = np.unique(dates, axis=0, return_inverse=True)
+        keys = [(tuple(date), units, calendar) for date in unique.tolist()]
+
+        times = np.array(
+            [_cached_date2num.get(key, np.nan) for key in keys], dtype=float
+        )
+
+        missing = [
+            i for i, key in enumerate(keys) if key not in _cached_date2num
+        ]
+        if missing:
+            try:
+                new = cftime.date2num(
+                    [
+                        cftime.datetime(*keys[i][0], calendar=calendar)
+                        for i in missing
+                    ],
+                    units,
+                    calendar,
+                )
+            except ValueError:
+                # At least one date is invalid, so convert them one
+                # at a time
+                new = []
+                for i in missing:
+                    try:
+                        new.append(
+                            cftime.date2num(
+                                cftime.datetime(
+                                    *keys[i][0], calendar=calendar
+                                ),
+                                units,
+                                calendar,
+                            )
+                        )
+                    except ValueError:
+                        new.append(np.nan)  # ppp
+
+            for i, time in zip(missing, np.ravel(new).tolist()):
+                times[i] = time
+                if not np.isnan(time):
+                    _cached_date2num[keys[i]] = time
+
+        return times[inverse.reshape(-1)]
+
+    def header_times(self, headers):
+        """Return the validity and data times of many records.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `header_dtime`, `header_vtime`
+
+        :Parameters:
+
+            headers: `numpy.ndarray`
+                The lookup headers of the records, as returned by
+                `umfile.Var.get_headers`.
+
+        :Returns:
+
+            `numpy.ndarray`
+                An integer array of shape ``(n, 10)`` containing
+                [LBYR, LBMON, LBDAT, LBHR, LBMIN, LBYRD, LBMOND,
+                LBDATD, LBHRD, LBMIND] for each record.
+
+        """
+        int_hdr = headers["int_hdr"]
+        return np.concatenate(
+            (int_hdr[:, lbyr : lbmin + 1], int_hdr[:, lbyrd : lbmind + 1]),
+            axis=1,
+        )
+
+    def header_levels(self, headers):
+        """Return the level header items of many records.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `header_z`
+
+        :Parameters:
+
+            headers: `numpy.ndarray`
+                The lookup headers of the records, as returned by
+                `umfile.Var.get_headers`.
+
+        :Returns:
+
+            `numpy.ndarray`
+                A float array of shape ``(n, 8)`` containing [LBLEV,
+                LBUSER5, BLEV, BRLEV, BHLEV, BHRLEV, BULEV, BHULEV]
+                for each record.
+
+        """
+        int_hdr = headers["int_hdr"]
+        real_hdr = headers["real_hdr"]
+        return np.concatenate(
+            (
+                int_hdr[:, [lblev, lbuser5]].astype(float),
+                real_hdr[:, blev : bhrlev + 1].astype(float),
+                real_hdr[:, brsvd1 : brsvd2 + 1].astype(float),
+            ),
+            axis=1,
+        )
+
     def header_vtime(self, rec):
         """Return the list [LBYR, LBMON, LBDAT, LBHR, LBMIN] for the
         given record.
@@ -1994,7 +2204,7 @@ class UMField:
         >>> u.header_z(rec)
 
         """
-        return self.header_lz + self.header_bz
+        return self.header_lz(rec) + self.header_bz(rec)
 
     @_manage_log_level_via_verbose_attr
     def create_data(self):
@@ -2023,169 +2233,117 @@ class UMField:
             "calendar": getattr(um_Units, "calendar", None),
         }
 
-        data_type_in_file = self.data_type_in_file
-
         filename = self.filename
 
         data_axes = [_axis["y"], _axis["x"]]
 
+        # Find the aggregation axes, and the position in the
+        # aggregation grid of each record (identified by its position
+        # in self.recs)
+        if len(recs) == 1:
+            # 0-d partition matrix
+            pmaxes = []
+            indices = [(0,)]
+        elif nt > 1 and nz > 1:
+            # 2-d partition matrix
+            z_axis = _axis[self.z_axis]
+            pmaxes = [_axis["t"], z_axis]
+            indices = [divmod(i, nz) + (i,) for i in range(len(recs))]
+            if z_axis in self.down_axes:
+                indices = self._reorder_z_axis(indices, z_axis, pmaxes)
+        else:
+            # 1-d partition matrix
+            z_axis = _axis.get(self.z_axis)
+            if nz > 1:
+                pmaxes = [z_axis]
+            else:
+                pmaxes = [_axis["t"]]
+
+            indices = [(i, i) for i in range(len(recs))]
+            if nz > 1 and z_axis in self.down_axes:
+                indices = self._reorder_z_axis(indices, z_axis, pmaxes)
+
+        pmshape = tuple(n for n in (nt, nz) if n > 1)
+        if not pmaxes:
+            pmshape = ()
+
+        data_shape = pmshape + yx_shape
+
+        grid = np.empty(pmshape, dtype=int)
+        for index in indices:
+            grid[index[:-1]] = index[-1]
+
+        # The data type and header offset of every record, in the
+        # aggregation grid
+        file_data_types = self.data_types_in_file(self.headers)[grid, ...]
+        hdr_offsets = self.headers["hdr_offset"][grid, ...]
+
+        dtype = np.result_type(*set(file_data_types.flat))
+
+        # Find the dask chunks, each of which may span many records
+        chunks = self._dask_chunks(data_shape, dtype, pmaxes)
+        single_records = all(max(c) == 1 for c in chunks[: len(pmshape)])
+
         # Initialise a dask graph for the uncompressed array, and some
         # dask.array.core.getter arguments
-        token = tokenize((nt, nz) + yx_shape, uuid4())
+        token = tokenize(data_shape, uuid4())
         name = (UMArray().__class__.__name__ + "-" + token,)
         dsk = {}
         full_slice = Ellipsis
         klass_name = UMArray().__class__.__name__
 
         fmt = self.fmt
+        word_size = self.word_size
+        byte_ordering = self.byte_ordering
         unpack = self.unpack
+        mmap = self.mmap
 
-        if len(recs) == 1:
-            # --------------------------------------------------------
-            # 0-d partition matrix
-            # --------------------------------------------------------
-            pmaxes = []
-            file_data_types = set()
-
-            rec = recs[0]
-
-            fill_value = rec.real_hdr.item(bmdi)
-            if fill_value == _BMDI_no_missing_data_value:
-                fill_value = None
-
-            data_shape = yx_shape
+        locations = [
+            np.cumsum((0,) + c[:-1]).tolist() for c in chunks[: len(pmshape)]
+        ]
+        for chunk_index in itertools.product(
+            *[range(len(c)) for c in locations]
+        ):
+            block = tuple(
+                slice(locations[i][j], locations[i][j] + chunks[i][j])
+                for i, j in enumerate(chunk_index)
+            ) + (Ellipsis,)
+            block_offsets = hdr_offsets[block]
+            shape = block_offsets.shape + yx_shape
+
+            if block_offsets.size == 1:
+                address = block_offsets.item()
+                file_data_type = file_data_types[block].item()
+            else:
+                address = tuple(block_offsets.flat)
+                file_data_type = np.result_type(
+                    *set(file_data_types[block].flat)
+                )
 
             subarray = UMArray(
                 filename=filename,
-                address=rec.hdr_offset,
-                shape=yx_shape,
-                dtype=data_type_in_file(rec),
+                address=address,
+                shape=shape,
+                dtype=file_data_type,
                 fmt=fmt,
-                word_size=self.word_size,
-                byte_ordering=self.byte_ordering,
+                word_size=word_size,
+                byte_ordering=byte_ordering,
                 attributes=attributes,
                 unpack=unpack,
+                mmap=mmap,
             )
 
-            key = f"{klass_name}-{tokenize(subarray)}"
+            # The graph name is already unique, so there is no need to
+            # tokenize each subarray
+            key = f"{klass_name}-{token}-" + "-".join(map(str, chunk_index))
             dsk[key] = subarray
-            dsk[name + (0, 0)] = (getter, key, full_slice, False, False)
-
-            dtype = data_type_in_file(rec)
-            chunks = normalize_chunks((-1, -1), shape=data_shape, dtype=dtype)
-        else:
-            # --------------------------------------------------------
-            # 1-d or 2-d partition matrix
-            # --------------------------------------------------------
-            file_data_types = set()
-
-            # Find the partition matrix shape
-            pmshape = [n for n in (nt, nz) if n > 1]
-
-            if len(pmshape) == 1:
-                # ----------------------------------------------------
-                # 1-d partition matrix
-                # ----------------------------------------------------
-                z_axis = _axis.get(self.z_axis)
-                if nz > 1:
-                    pmaxes = [z_axis]
-                    data_shape = (nz, LBROW, LBNPT)
-                else:
-                    pmaxes = [_axis["t"]]
-                    data_shape = (nt, LBROW, LBNPT)
-
-                word_size = self.word_size
-                byte_ordering = self.byte_ordering
-
-                indices = [(i, rec) for i, rec in enumerate(recs)]
-
-                if nz > 1 and z_axis in self.down_axes:
-                    indices = self._reorder_z_axis(indices, z_axis, pmaxes)
-
-                for i, rec in indices:
-                    # Find the data type of the array in the file
-                    file_data_type = data_type_in_file(rec)
-                    file_data_types.add(file_data_type)
-
-                    shape = (1,) + yx_shape
-
-                    subarray = UMArray(
-                        filename=filename,
-                        address=rec.hdr_offset,
-                        shape=shape,
-                        dtype=file_data_type,
-                        fmt=fmt,
-                        word_size=word_size,
-                        byte_ordering=byte_ordering,
-                        attributes=attributes,
-                        unpack=unpack,
-                    )
-
-                    key = f"{klass_name}-{tokenize(subarray)}"
-                    dsk[key] = subarray
-                    dsk[name + (i, 0, 0)] = (
-                        getter,
-                        key,
-                        full_slice,
-                        False,
-                        False,
-                    )
-
-                dtype = np.result_type(*file_data_types)
-                chunks = normalize_chunks(
-                    (1, -1, -1), shape=data_shape, dtype=dtype
-                )
-            else:
-                # ----------------------------------------------------
-                # 2-d partition matrix
-                # ----------------------------------------------------
-                z_axis = _axis[self.z_axis]
-                pmaxes = [_axis["t"], z_axis]
-
-                data_shape = (nt, nz, LBROW, LBNPT)
-
-                word_size = self.word_size
-                byte_ordering = self.byte_ordering
-
-                indices = [
-                    divmod(i, nz) + (rec,) for i, rec in enumerate(recs)
-                ]
-                if z_axis in self.down_axes:
-                    indices = self._reorder_z_axis(indices, z_axis, pmaxes)
-
-                for t, z, rec in indices:
-                    # Find the data type of the array in the file
-                    file_data_type = data_type_in_file(rec)
-                    file_data_types.add(file_data_type)
-
-                    shape = (1, 1) + yx_shape
-
-                    subarray = UMArray(
-                        filename=filename,
-                        address=rec.hdr_offset,
-                        shape=shape,
-                        dtype=file_data_type,
-                        fmt=fmt,
-                        word_size=word_size,
-                        byte_ordering=byte_ordering,
-                        attributes=attributes,
-                        unpack=unpack,
-                    )
-
-                    key = f"{klass_name}-{tokenize(subarray)}"
-                    dsk[key] = subarray
-                    dsk[name + (t, z, 0, 0)] = (
-                        getter,
-                        key,
-                        full_slice,
-                        False,
-                        False,
-                    )
-
-                dtype = np.result_type(*file_data_types)
-                chunks = normalize_chunks(
-                    (1, 1, -1, -1), shape=data_shape, dtype=dtype
-                )
+            dsk[name + chunk_index + (0, 0)] = (
+                getter,
+                key,
+                full_slice,
+                False,
+                False,
+            )
 
         data_axes = pmaxes + data_axes
 
@@ -2199,14 +2357,17 @@ class UMField:
 
         # Create the Data object
         data = Data(dx, units=um_Units, fill_value=fill_value)
-        data._nc_set_aggregation_write_status(True)
+        if single_records:
+            # Each dask chunk is exactly one record, so the data may
+            # be written as a CF-netCDF aggregation variable
+            data._nc_set_aggregation_write_status(True)
 
         self.data = data
         self.data_axes = data_axes
 
         return data
 
-    def decode_lbexp(self):
+    def decode_lbexp(self, LBEXP=None):
         """Decode the integer value of LBEXP in the PP header into a
         runid.
 
@@ -2214,6 +2375,14 @@ class UMField:
         from the cache, otherwise the value will be decoded and then added
         to the cache.
 
+        :Parameters:
+
+            LBEXP: `int`, optional
+                The value of LBEXP to decode. By default the LBEXP
+                value of the field's lookup header is used.
+
+                .. versionadded:: NEXTVERSION
+
         :Returns:
 
             `str`
@@ -2228,7 +2397,8 @@ class UMField:
         '-34'
 
         """
-        LBEXP = self.int_hdr[lbexp]
+        if LBEXP is None:
+            LBEXP = self.int_hdr[lbexp]
 
         runid = _cached_runid.get(LBEXP, None)
         if runid is not None:
@@ -2455,7 +2625,7 @@ class UMField:
             out : `AuxiliaryCoordinate` or `DimensionCoordinate` or `None`
 
         """
-        array = tuple([rec.int_hdr.item(lblev) for rec in self.z_recs])
+        array = tuple(self.z_headers["int_hdr"][:, lblev].tolist())
 
         key = array
         c = _cached_model_level_number_coordinate.get(key, None)
@@ -2537,6 +2707,135 @@ class UMField:
         # Int or float
         return rec.get_type_and_num_words()[0]
 
+    def data_types_in_file(self, headers):
+        """Return the data types of the data arrays of many records.
+
+        This is equivalent to calling `data_type_in_file` for each
+        record, but the lookup headers are interpreted as whole-array
+        operations.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            headers: `numpy.ndarray`
+                The lookup headers of the records, as returned by
+                `umfile.Var.get_headers`.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The data type of each record.
+
+        """
+        c = self.recs[0].file._c_interface
+        int_hdr = headers["int_hdr"]
+
+        types = np.full(
+            int_hdr.shape[:-1], np.dtype(c.file_data_real_type), dtype=object
+        )
+        types[np.isin(int_hdr[..., lbuser1], (2, -2, 3, -3))] = np.dtype(
+            c.file_data_int_type
+        )
+        types[int_hdr[..., lbuser2] == 3] = np.dtype(bool)
+        return types
+
+    def match_header(self, rec, select, um_version):
+        """Whether or not a lookup header matches a selection.
+
+        The header is tested against the identities that the field
+        created from it would have, as far as they can be determined
+        from the lookup header alone: the STASH code, LBPROC, LBTIM,
+        run ID, submodel, STASH source and model source, and the
+        standard name, long name and units from the STASH code to
+        standard name conversion table.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `stash_record`
+
+        :Parameters:
+
+            rec: `umfile.Rec`
+                A record of the variable.
+
+            select: sequence of `str` or `Query` or `re.Pattern`
+                The selection criteria. The header matches if any of
+                its identities matches any of the criteria. See
+                `cf.Field.match_by_identity` for details.
+
+            um_version: number
+                The default UM version, which is superseded by that
+                in the lookup header, if set.
+
+        :Returns:
+
+            `bool`
+                Whether or not the lookup header matches.
+
+        """
+        int_hdr = rec.int_hdr.tolist()
+        real_hdr = rec.real_hdr.tolist()
+
+        stash = int_hdr[lbuser4]
+        submodel = int_hdr[lbuser7]
+
+        values1 = [
+            f"stash_code={stash}",
+            f"lbproc={int_hdr[lbproc]}",
+            f"lbtim={int_hdr[lbtim]}",
+            f"runid={self.decode_lbexp(int_hdr[lbexp])}",
+            f"submodel={submodel}",
+        ]
+
+        if stash:
+            section, item = divmod(stash, 1000)
+            values1.append(
+                "um_stash_source=m%02ds%02di%03d" % (submodel, section, item)
+            )
+
+        header_um_version, source = divmod(int_hdr[lbsrce], 10000)
+        if header_um_version > 0 and int(um_version) == um_version:
+            model_um_version = header_um_version
+            um_version = header_um_version
+        else:
+            model_um_version = None
+
+        source = _lbsrce_model_codes.get(source)
+        if source:
+            if model_um_version is not None:
+                source += f" vn{model_um_version}"
+
+            values1.append(f"source={source}")
+
+        stash_record = self.stash_record(
+            submodel,
+            stash,
+            um_version,
+            int_hdr[lbcode],
+            real_hdr[bplat],
+            real_hdr[bplon],
+        )
+        if stash_record is not None:
+            long_name, units, _, _, standard_name = stash_record[:5]
+            values1.append(f"long_name={long_name.rstrip()}")
+            if units:
+                values1.append(f"units={units}")
+
+            if standard_name:
+                values1.extend(
+                    (standard_name, f"standard_name={standard_name}")
+                )
+
+        for value0 in select:
+            for value1 in values1:
+                if Constructs._matching_values(
+                    value0, None, value1, basic=True
+                ):
+                    return True
+
+        return False
+
     def printfdr(self, display=False):
         """Print out the contents of PP field headers.
 
@@ -2560,10 +2859,7 @@ class UMField:
             array = np.array((LBUSER5,), dtype=self.int_hdr_dtype)
         else:
             # 'Z' aggregation has been done along the pseudolevel axis
-            array = np.array(
-                [rec.int_hdr.item(lbuser5) for rec in self.z_recs],
-                dtype=self.int_hdr_dtype,
-            )
+            array = self.z_headers["int_hdr"][:, lbuser5].copy()
             self.z_axis = "p"
 
         axiscode = 40
@@ -2677,6 +2973,55 @@ class UMField:
         )
         return dc
 
+    def stash_record(self, submodel, stash, um_version, LBCODE, BPLAT, BPLON):
+        """Return the STASH conversion table entry that applies to a
+        field.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `test_um_condition`, `test_um_version`
+
+        :Parameters:
+
+            submodel: `int`
+
+            stash: `int`
+
+            um_version: number
+
+            LBCODE: `int`
+
+            BPLAT: `float`
+
+            BPLON: `float`
+
+        :Returns:
+
+            `tuple` or `None`
+                The first entry for the submodel and STASH code whose
+                UM version range and condition are satisfied, or
+                `None` if there is no such entry.
+
+        **Examples**
+
+        >>> u.stash_record(1, 30201, 1100, 1, 90.0, 0.0)
+        ('U COMPNT OF WIND ON P LEV/UV GRID', 'm s-1', None, None,
+         'eastward_wind', {}, '')
+
+        """
+        for stash_record in _stash2standard_name_records(
+            submodel, stash, um_version
+        ):
+            um_condition = stash_record[6]
+            if um_condition and not self.test_um_condition(
+                um_condition, LBCODE, BPLAT, BPLON
+            ):
+                continue
+
+            return stash_record
+
+        return None
+
     def test_um_condition(self, um_condition, LBCODE, BPLAT, BPLON):
         """Return `True` if a field satisfies the condition specified
         for a STASH code to standard name conversion.
@@ -2790,10 +3135,9 @@ class UMField:
             `DimensionCoordinate`
 
         """
-        recs = self.t_recs
-
-        vtimes = np.array([self.vtime(rec) for rec in recs], dtype=float)
-        dtimes = np.array([self.dtime(rec) for rec in recs], dtype=float)
+        times = self.header_times(self.t_headers)
+        vtimes = self.elapsed_times(times[:, :5])
+        dtimes = self.elapsed_times(times[:, 5:])
 
         if np.isnan(vtimes.sum()) or np.isnan(dtimes.sum()):
             return  # ppp
@@ -2807,7 +3151,7 @@ class UMField:
         elif IB == 3:
             # The field is a time mean from T1 to T2 for each year
             # from LBYR to LBYRD
-            ctimes = np.array([self.ctime(rec) for rec in recs])
+            ctimes = self.ctimes(self.t_headers)
             array = 0.5 * (vtimes + ctimes)
             bounds = self.create_bounds_array(vtimes, dtimes)
 
@@ -3342,18 +3686,13 @@ class UMField:
                 "BRSVD1:"
             )  # pragma: no cover
 
-        z_recs = self.z_recs
-        array = tuple([rec.real_hdr.item(blev) for rec in z_recs])
-        bounds0 = tuple(
-            [rec.real_hdr[brlev] for rec in z_recs]
-        )  # lower level boundary
-        bounds1 = tuple([rec.real_hdr[brsvd1] for rec in z_recs])  # bulev
+        real_hdr = self.z_headers["real_hdr"]
+        array = real_hdr[:, blev].copy()
+        bounds0 = real_hdr[:, brlev].copy()  # lower level boundary
+        bounds1 = real_hdr[:, brsvd1].copy()  # bulev
         if _coord_positive.get(axiscode, None) == "down":
             bounds0, bounds1 = bounds1, bounds0
 
-        array = np.array(array, dtype=self.real_hdr_dtype)
-        bounds0 = np.array(bounds0, dtype=self.real_hdr_dtype)
-        bounds1 = np.array(bounds1, dtype=self.real_hdr_dtype)
         bounds = self.create_bounds_array(bounds0, bounds1)
 
         if (bounds0 == bounds1).all() or np.allclose(bounds.min(), _pp_rmdi):
@@ -3410,6 +3749,9 @@ class UMRead(cfdm.read_write.IORead):
         file_type=None,
         ignore_unknown_type=False,
         unpack=True,
+        index=None,
+        mmap=False,
+        dask_chunks="storage-aligned",
     ):
         """Read fields from a PP file or UM fields file.
 
@@ -3473,6 +3815,10 @@ class UMRead(cfdm.read_write.IORead):
                 equivalent to ``fl =
                 cf.read(file).select_by_identity('stash_code=3236')``.
 
+                The selection is applied to the lookup header of each
+                variable before any of its field constructs are
+                created. See `UMField.match_header` for details.
+
             squeeze: `bool`, optional
                 If True then remove all size 1 dimensions from field
                 construct data arrays, regardless of how the data are
@@ -3503,6 +3849,43 @@ class UMRead(cfdm.read_write.IORead):
 
                 .. versionadded:: 3.17.0
 
+            index: `bool` or `str` or `None`, optional
+                Whether or not to use a persistent lookup header
+                index to avoid parsing all of the lookup headers of
+                a file that has not changed since it was last
+                read. If True then the index is stored in a sidecar
+                file next to the dataset, and if a string then the
+                index is stored in that directory. By default no
+                index is used. See `umread_lib.umfile.File` for
+                details.
+
+                .. versionadded:: NEXTVERSION
+
+            mmap: `bool`, optional
+                If True then the data of records that are not packed
+                are accessed via a memory map of the file, so that
+                only the parts of a record that are needed are read
+                from disk. By default each record that is needed is
+                read in its entirety. See `UMArray` for details.
+
+                .. versionadded:: NEXTVERSION
+
+            dask_chunks: `str`, `int`, `None`, or `dict`, optional
+                Specify the Dask chunking of the field data. See
+                `cf.read` for details.
+
+                Each Dask chunk spans one or more whole records, and
+                all of the records in a Dask chunk are read from the
+                file with a single opening of it. With
+                ``'storage-aligned'`` (the default) or
+                ``'storage-exact'`` there is one record per Dask
+                chunk. With any other value, a Dask chunk may span
+                many records along the time and vertical axes, which
+                may be identified in a `dict` by the keys ``'T'`` (or
+                ``'time'``) and ``'Z'`` respectively.
+
+                .. versionadded:: NEXTVERSION
+
         :Returns:
 
             `list`
@@ -3545,6 +3928,7 @@ class UMRead(cfdm.read_write.IORead):
             "byte_ordering": byte_ordering,
             "word_size": word_size,
             "fmt": fmt,
+            "index": index,
         }
 
         history = f"Converted from UM/PP by cf-python v{__version__}"
@@ -3570,8 +3954,13 @@ class UMRead(cfdm.read_write.IORead):
 
         info = is_log_level_info(logger)
 
-        um = [
-            UMField(
+        # Note: Only keep the fields of each UMField, so that the
+        #       UMField objects, and the record information that
+        #       they hold, can be freed as soon as they are no longer
+        #       needed.
+        fields = []
+        for var in f.vars:
+            um = UMField(
                 var,
                 f.fmt,
                 f.byte_ordering,
@@ -3585,13 +3974,14 @@ class UMRead(cfdm.read_write.IORead):
                 select=select,
                 info=info,
                 unpack=unpack,
+                dask_chunks=dask_chunks,
+                mmap=mmap,
             )
-            for var in f.vars
-        ]
+            fields.extend(field for field in um.fields if field)
 
         self.file_close()
 
-        return [field for x in um for field in x.fields if field]
+        return fields
 
     def _open_um_file(
         self,
@@ -3601,6 +3991,7 @@ class UMRead(cfdm.read_write.IORead):
         word_size=None,
         byte_ordering=None,
         parse=True,
+        index=None,
     ):
         """Open a UM fields file or PP file.
 
@@ -3617,6 +4008,13 @@ class UMRead(cfdm.read_write.IORead):
 
                 .. versionadded:: 3.16.2
 
+            index: `bool` or `str` or `None`, optional
+                Whether or not to use a persistent lookup header
+                index when parsing the contents. See `read` for
+                details.
+
+                .. versionadded:: NEXTVERSION
+
         :Returns:
 
             `umread_lib.umfile.File`
@@ -3631,6 +4029,7 @@ class UMRead(cfdm.read_write.IORead):
                 word_size=word_size,
                 fmt=fmt,
                 parse=parse,
+                index=index,
             )
         except Exception:
             try:
@@ -3649,7 +4048,8 @@ class UMRead(cfdm.read_write.IORead):
         """Whether or not a file is a PP file or UM fields file.
 
         Note that the file type is determined by inspecting the file's
-        content and any file suffix is not considered.
+        content and any file suffix is not considered. The result is
+        cached until the file's size or modification time change.
 
         :Parameters:
 
@@ -3666,16 +4066,7 @@ class UMRead(cfdm.read_write.IORead):
         True
 
         """
-        try:
-            # Note: No need to completely parse the file to ascertain
-            #       if it's PP or FF.
-            self.file_open(filename, parse=False)
-        except Exception:
-            self.file_close()
-            return False
-        else:
-            self.file_close()
-            return True
+        return um_dataset_type(filename) is not None
 
     def file_close(self):
         """Close the file that has been read.
@@ -3721,6 +4112,7 @@ class UMRead(cfdm.read_write.IORead):
             word_size=g.get("word_size"),
             fmt=g.get("fmt"),
             parse=parse,
+            index=g.get("index"),
         )
 
 
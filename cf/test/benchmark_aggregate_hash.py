@@ -0,0 +1,71 @@
+"""Scaling benchmark for the hashing stage of `cf.aggregate`.
+
+A netCDF file is created for each of many time steps of
+``cf.example_field(0)``, each with a different time coordinate. The
+fields are read without aggregation, so that their coordinates are
+stored in the files, and increasing numbers of them are then
+aggregated. Each coordinate array is only computed once and is only
+compared with the unique arrays that may equal it, so the time taken
+should increase about linearly with the number of fields.
+
+The hashing time, as reported by the *profile* parameter of
+`cf.aggregate`, is shown with the total time.
+
+Usage::
+
+   python benchmark_aggregate_hash.py [maximum number of fields]
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import cf
+
+
+def create_files(tmpdir, nfields):
+    """Create a netCDF file for each of *nfields* time steps."""
+    f = cf.example_field(0)
+    filenames = []
+    for i in range(nfields):
+        g = f.copy()
+        t = g.dimension_coordinate("T")
+        t.set_data(t.data + i)
+        filename = os.path.join(tmpdir, f"field_{i:06d}.nc")
+        cf.write(g, filename)
+        filenames.append(filename)
+
+    return filenames
+
+
+def timed(func, *args, **kwargs):
+    """Return the result of ``func(*args, **kwargs)`` and the elapsed
+    time."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(nfields=1600):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filenames = create_files(tmpdir, nfields)
+        fields = cf.read(filenames, aggregate=False)
+        print(f"{len(fields)} fields of shape {fields[0].shape}")
+
+        n = 100
+        while n <= nfields:
+            (g, profile), elapsed = timed(
+                cf.aggregate, fields[:n], profile=True
+            )
+            assert len(g) == 1
+            print(
+                f"{n:6d} fields {elapsed:8.2f} s "
+                f"(hashing {profile['time']['hashing']:8.2f} s)"
+            )
+            n *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,104 @@
+"""Benchmark for date-time components and conversions of reference times.
+
+For each of several calendars, the shortest time of three taken to
+process an array of numeric reference times is reported for:
+
+* ``year``: the years of the reference times, with
+  `cf.data.dask_utils.cf_YMDhms`, which is used by `cf.Data.year`;
+
+* ``rt2dt``: the conversion of the reference times to date-time
+  objects, with `cf.cfdatetime.rt2dt`;
+
+* ``dt2rt``: the conversion of the date-time objects back to
+  reference times, with `cf.cfdatetime.dt2rt`.
+
+Each is compared with the equivalent calculation using `cftime`,
+which is how all of them were done before integer calendar arithmetic
+was used, and the results are checked to be identical.
+
+Usage::
+
+   python benchmark_datetime_components.py [number of values]
+
+"""
+
+import sys
+import time
+
+import cftime
+import numpy as np
+
+import cf
+from cf.cfdatetime import dt2rt, rt2dt
+from cf.data.dask_utils import _array_getattr, cf_YMDhms
+
+calendars = (
+    "standard",
+    "proleptic_gregorian",
+    "julian",
+    "noleap",
+    "360_day",
+)
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return the result of ``func(*args, **kwargs)`` and the shortest
+    elapsed time of *repeat* calls."""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed.append(time.perf_counter() - start)
+
+    return result, min(elapsed)
+
+
+def cftime_year(a, units):
+    """Return the years of reference times using `cftime`."""
+    dt = cftime.num2date(
+        a, units.units, units.calendar, only_use_cftime_datetimes=True
+    )
+    return _array_getattr(dt, attr="year")
+
+
+def main(n=1000000):
+    rng = np.random.default_rng(0)
+    array = np.round(rng.uniform(-1e5, 1e5, n), 4)
+    print(f"{n} values")
+
+    for calendar in calendars:
+        units = cf.Units("days since 1850-01-01", calendar)
+
+        year0, t0 = timed(cftime_year, array, units)
+        year1, t1 = timed(cf_YMDhms, array, "year", units=units)
+        assert np.array_equal(year0, year1)
+
+        dt0, t2 = timed(
+            cftime.num2date,
+            array,
+            units.units,
+            calendar,
+            only_use_cftime_datetimes=True,
+        )
+        dt1, t3 = timed(rt2dt, array, units)
+        assert (dt0 == dt1).all()
+
+        rt0, t4 = timed(cftime.date2num, dt0, units.units, calendar)
+        rt1, t5 = timed(dt2rt, dt0, None, units)
+        assert rt0.dtype == rt1.dtype
+        assert np.array_equal(rt0, rt1)
+
+        print(f"{calendar}:")
+        for name, x, y in (
+            ("year", t0, t1),
+            ("rt2dt", t2, t3),
+            ("dt2rt", t4, t5),
+        ):
+            print(
+                f"    {name:<6} cftime={x:6.3f} s cf={y:6.3f} s "
+                f"speed-up={x / y:6.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,87 @@
+"""Benchmark for grouped collapses with `cf.Field.collapse`.
+
+A field with daily data for the given number of 360-day years is
+collapsed to monthly means with ``group=cf.M()``, and to a monthly
+climatology with ``within_years=cf.M()`` followed by ``over_years``.
+
+The time to create each collapsed field, the number of tasks in its
+Dask graph, and the time to compute its data are reported.
+
+Usage::
+
+   python benchmark_grouped_collapse.py [number of years]
+
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cf
+
+
+def create_field(nyears):
+    """Create a field with daily data for *nyears* 360-day years."""
+    f = cf.example_field(0)
+    ndays = nyears * 360
+
+    t = cf.DimensionCoordinate(
+        properties={"standard_name": "time"},
+        data=cf.Data(
+            np.arange(ndays) + 0.5, "days since 2000-01-01", calendar="360_day"
+        ),
+    )
+    t.set_bounds(t.create_bounds())
+
+    g = cf.Field(properties=f.properties())
+    axis_T = g.set_construct(cf.DomainAxis(ndays))
+    g.set_construct(t, axes=axis_T)
+    axes = [axis_T]
+    for key in f.get_data_axes():
+        axis = g.set_construct(f.domain_axis(key).copy())
+        dim = f.dimension_coordinate(filter_by_axis=(key,))
+        g.set_construct(dim.copy(), axes=axis)
+        axes.append(axis)
+
+    rng = np.random.default_rng(0)
+    data = cf.Data(
+        rng.random((ndays,) + f.shape), f.Units, chunks=(360,) + f.shape
+    )
+    g.set_data(data, axes=axes)
+    return g
+
+
+def timed(func, *args, **kwargs):
+    """Return the result of ``func(*args, **kwargs)`` and the elapsed
+    time."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main(nyears=40):
+    f = create_field(nyears)
+    print(f"Field of shape {f.shape}")
+
+    for name, func in (
+        ("monthly means", lambda: f.collapse("T: mean", group=cf.M())),
+        (
+            "climatology",
+            lambda: f.collapse(
+                "T: mean within years T: mean over years",
+                within_years=cf.M(),
+            ),
+        ),
+    ):
+        g, create = timed(func)
+        ntasks = len(g.to_dask_array().dask)
+        _, compute = timed(lambda: g.array)
+        print(
+            f"{name:<14} shape={g.shape} tasks={ntasks:<6} "
+            f"create={create:7.2f} s compute={compute:7.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,90 @@
+"""Benchmark for converting the units of lazy data.
+
+For each of several units conversions, the shortest time of three
+taken to convert the units of each of many chunks, as is done when the
+`Units` of lazy `cf.Data` are set, is reported for:
+
+* ``udunits``: each chunk converted with `cf.Units.conform`, as was
+  done before affine conversions were applied with numpy;
+
+* ``cf_units``: each chunk converted with
+  `cf.data.dask_utils.cf_units`, which applies affine conversions
+  with numpy and uses `cf.Units.conform` otherwise.
+
+The converted values are checked to be identical in both cases.
+
+Usage::
+
+   python benchmark_units_conversion.py [number of chunks] [chunk size]
+
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import cf
+from cf.data.dask_utils import cf_units
+
+conversions = (
+    ("K", "degC", "f8"),
+    ("K", "degC", "f4"),
+    ("Pa", "hPa", "f8"),
+    ("kg m-2 s-1", "kg m-2 day-1", "f4"),
+    ("degF", "degC", "f8"),
+    ("m s-1", "knot", "i4"),
+    ("days since 2000-01-01", "hours since 1999-12-01", "f8"),
+)
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return the result of ``func(*args, **kwargs)`` and the shortest
+    elapsed time of *repeat* calls."""
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed.append(time.perf_counter() - start)
+
+    return result, min(elapsed)
+
+
+def convert(chunks, func, from_units, to_units):
+    """Convert the units of each chunk."""
+    return [func(a, from_units, to_units) for a in chunks]
+
+
+def conform(a, from_units, to_units):
+    """Convert the units of a chunk with `cf.Units.conform`."""
+    return cf.Units.conform(a, from_units, to_units, inplace=False)
+
+
+def main(nchunks=1000, chunksize=10000):
+    rng = np.random.default_rng(0)
+    array = rng.standard_normal((nchunks, chunksize)) * 100 + 300
+    print(f"{nchunks} chunks of {chunksize} values")
+
+    for from_units, to_units, dtype in conversions:
+        chunks = list(array.astype(dtype))
+        from_units = cf.Units(from_units)
+        to_units = cf.Units(to_units)
+
+        # Convert one chunk first, so that the conversion is cached
+        cf_units(chunks[0], from_units, to_units)
+
+        udunits, t0 = timed(convert, chunks, conform, from_units, to_units)
+        affine, t1 = timed(convert, chunks, cf_units, from_units, to_units)
+        for x, y in zip(udunits, affine):
+            assert x.dtype == y.dtype
+            assert np.array_equal(x, y)
+
+        name = f"{from_units} -> {to_units} ({dtype})"
+        print(
+            f"{name:<48} udunits={t0:6.3f} s cf_units={t1:6.3f} s "
+            f"speed-up={t0 / t1:5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,123 @@
+"""Throughput benchmark for unpacking WGDOS-packed PP records.
+
+A PP file containing many WGDOS-packed records is created by repeating
+the record in ``wgdos_packed.pp`` with different validity times. The
+records are then unpacked:
+
+* one at a time, with `cf.umread_lib.umfile.Rec.get_data`;
+
+* in a single batch, with
+  `cf.umread_lib.umfile.File.read_records_data`;
+
+* in batches from several threads at once, which only scales if the
+  GIL is released whilst the records are being unpacked.
+
+Usage::
+
+   python benchmark_wgdos_unpack.py [number of records] [number of threads]
+
+"""
+
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import cf
+from cf.umread_lib.umfile import File
+
+wgdos_packed = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "wgdos_packed.pp"
+)
+
+
+def create_file(filename, nrec):
+    """Create a PP file of *nrec* WGDOS-packed records."""
+    with open(wgdos_packed, "rb") as f:
+        raw = f.read()
+
+    # The file contains one little-endian, 32-bit record
+    n = int(np.frombuffer(raw[:4], dtype="<i4")[0])
+    int_hdr = np.frombuffer(raw[4 : 4 + n], dtype="<i4").copy()
+    data = raw[4 + n + 4 :]
+
+    with open(filename, "wb") as f:
+        for i in range(nrec):
+            # Increment LBYR and LBYRD so that each record has a
+            # different validity time
+            hdr = int_hdr.copy()
+            hdr[0] += i
+            hdr[6] += i
+            f.write(raw[:4] + hdr.tobytes() + raw[4 + n : 8 + n] + data)
+
+
+def timed(func, *args):
+    """Return the result of ``func(*args)`` and the elapsed time."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def report(label, nrec, nbytes, elapsed):
+    """Print the throughput of an unpacking method."""
+    print(
+        f"{label:<28} {elapsed:8.4f} s  "
+        f"{nrec / elapsed:10.1f} records/s  "
+        f"{nbytes / elapsed / 2**20:8.1f} MiB/s"
+    )
+
+
+def main(nrec=2000, nthreads=4):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "wgdos_packed.pp")
+        create_file(filename, nrec)
+
+        f = File(filename)
+        recs = [rec for var in f.vars for rec in var.recs]
+        print(f"{len(recs)} WGDOS-packed records of shape (145, 192)")
+
+        # One record at a time
+        serial, elapsed = timed(
+            lambda: np.array([rec.get_data() for rec in recs])
+        )
+        nbytes = serial.nbytes
+        report("Rec.get_data", nrec, nbytes, elapsed)
+
+        # One batch
+        batch, elapsed = timed(f.read_records_data, recs)
+        report("File.read_records_data", nrec, nbytes, elapsed)
+        assert (batch == serial).all()
+
+        # Concurrent batches from different threads, each with its
+        # own open file
+        def unpack(recs):
+            g = File(filename, parse=False)
+            data = g.read_records_data(recs)
+            g.close_fd()
+            return data
+
+        chunks = np.array_split(np.arange(len(recs)), nthreads)
+        chunks = [[recs[i] for i in chunk] for chunk in chunks]
+        with ThreadPoolExecutor(nthreads) as executor:
+            threaded, elapsed = timed(
+                lambda: np.concatenate(list(executor.map(unpack, chunks)))
+            )
+
+        report(f"{nthreads} threads", nrec, nbytes, elapsed)
+        assert (threaded == serial).all()
+
+        # The full cf.read path, with one dask chunk per record and
+        # with all records in one dask chunk
+        for dask_chunks in ("storage-aligned", -1):
+            field = cf.read(filename, dask_chunks=dask_chunks)[0]
+            _, elapsed = timed(lambda: field.array)
+            report(f"cf.read {dask_chunks!r}", nrec, nbytes, elapsed)
+
+        f.close_fd()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
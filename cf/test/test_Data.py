@@ -11,6 +11,7 @@ import warnings
 from functools import reduce
 from operator import mul
 
+import cftime
 import dask.array as da
 import numpy as np
 from scipy.ndimage import convolve1d
@@ -736,6 +737,112 @@ class DataTest(unittest.TestCase):
         self.assertEqual(e.shape, (0,))
         self.assertTrue((e.array == a.compressed()).all())
 
+    def test_Data_grouped_collapse(self):
+        """Test the `grouped_collapse` Data method."""
+        d = cf.Data(self.ma, "K", chunks=(2, 3, 2, 5))
+        weights = cf.Data(np.arange(1, 6), "m").reshape(1, 1, 5, 1)
+        groups = [1, 0, 1, -1, 0]
+        for method in (
+            "integral",
+            "max",
+            "maximum_absolute_value",
+            "mean",
+            "mean_absolute_value",
+            "mid_range",
+            "min",
+            "minimum_absolute_value",
+            "range",
+            "root_mean_square",
+            "sample_size",
+            "sd",
+            "sum",
+            "sum_of_squares",
+            "sum_of_weights",
+            "sum_of_weights2",
+            "var",
+        ):
+            for w in (None, weights):
+                if method == "integral" and w is None:
+                    continue
+
+                kwargs = {"mtol": 0.6, "weights": w}
+                if method in ("sd", "var"):
+                    kwargs["ddof"] = 1
+
+                e = d.grouped_collapse(method, 2, groups, **kwargs)
+                self.assertEqual(e.shape, (3, 4, 2, 5))
+
+                # Compare with a separate collapse of each group
+                for i, index in enumerate(([1, 4], [0, 2])):
+                    kw = kwargs.copy()
+                    if method in (
+                        "max",
+                        "maximum_absolute_value",
+                        "mid_range",
+                        "min",
+                        "minimum_absolute_value",
+                        "range",
+                        "sample_size",
+                    ):
+                        del kw["weights"]
+                    elif w is not None:
+                        kw["weights"] = w[:, :, index]
+
+                    f = getattr(d[:, :, index], method)(axes=2, **kw)
+                    g = e[:, :, i]
+                    self.assertEqual(g.dtype, f.dtype)
+                    self.assertEqual(g.Units, f.Units)
+                    self.assertTrue(g.equals(f, rtol=1e-12, verbose=3))
+
+        # Unsupported method
+        with self.assertRaises(ValueError):
+            d.grouped_collapse("median", 2, groups)
+
+    def test_Data_multi_collapse(self):
+        """Test the `multi_collapse` Data method."""
+        d = cf.Data(self.ma, "K", chunks=(2, 3, 2, 5))
+        weights = {0: np.arange(1, 4), 2: np.arange(1, 6)}
+        methods = (
+            "max",
+            "mean",
+            "mid_range",
+            "min",
+            "range",
+            "sample_size",
+            "sd",
+            "sum",
+            "var",
+        )
+        for axes in (None, 0, (0, 2), (1, 3)):
+            for squeeze in (False, True):
+                for w in (None, weights):
+                    out = d.multi_collapse(
+                        methods,
+                        axes=axes,
+                        weights=w,
+                        squeeze=squeeze,
+                        mtol=0.9,
+                        ddof=1,
+                    )
+                    self.assertEqual(tuple(out), methods)
+                    for method, e in out.items():
+                        kwargs = {}
+                        if method in ("mean", "sd", "sum", "var"):
+                            kwargs["weights"] = w
+
+                        if method in ("sd", "var"):
+                            kwargs["ddof"] = 1
+
+                        f = getattr(d, method)(
+                            axes=axes, squeeze=squeeze, mtol=0.9, **kwargs
+                        )
+                        self.assertEqual(e.dtype, f.dtype)
+                        self.assertTrue(e.equals(f, verbose=3))
+
+        # Unsupported method
+        with self.assertRaises(ValueError):
+            d.multi_collapse(["mean", "median"])
+
     def test_Data_stats(self):
         """Test the `stats` Data method."""
         d = cf.Data([1, 1])
@@ -2156,6 +2263,43 @@ class DataTest(unittest.TestCase):
         self.assertTrue(d.minute.equals(cf.Data([[37, 25]])))
         self.assertTrue(d.second.equals(cf.Data([[26, 26]])))
 
+        # Compare with the date-time objects created by cftime
+        a = np.ma.array(
+            [-1e6 - 0.25, -200.5, -0.001, 0, 59.75, 1e5 + 1 / 3, 5e6],
+            mask=[0, 0, 0, 1, 0, 0, 0],
+        )
+        for calendar in (
+            "standard",
+            "proleptic_gregorian",
+            "julian",
+            "noleap",
+            "all_leap",
+            "360_day",
+        ):
+            for units in (
+                "days since 1582-10-15",
+                "hours since -1000-03-01 12:00",
+                "seconds since 2000-01-01",
+            ):
+                d = cf.Data(a, units, calendar=calendar, chunks=4)
+                dt = cftime.num2date(a, units, calendar)
+                for attr in (
+                    "year",
+                    "month",
+                    "day",
+                    "hour",
+                    "minute",
+                    "second",
+                ):
+                    x = np.ma.array(
+                        [getattr(t, attr, -1) for t in dt.filled(None)],
+                        mask=a.mask,
+                    )
+                    self.assertTrue(
+                        getattr(d, attr).equals(cf.Data(x)),
+                        f"{attr} of {units} in {calendar} calendar",
+                    )
+
         # Can't get year from data with non-reference time units
         with self.assertRaises(ValueError):
             cf.Data([[1, 2]], units="m").year
@@ -2667,6 +2811,88 @@ class DataTest(unittest.TestCase):
             with self.assertRaises(ValueError):
                 d.percentile(q).array
 
+    def test_Data_percentile_tdigest(self):
+        """Test the `percentile` Data method with method='tdigest'."""
+        ranks = ([30, 60, 90], [0, 100], 50)
+
+        # Exact when no values are merged
+        d = cf.Data(self.a, chunks=(2, 2, 3, 5))
+        for axis in [None] + self.axes_combinations:
+            for keepdims in (True, False):
+                for q in ranks:
+                    a1 = np.percentile(self.a, q, axis=axis, keepdims=keepdims)
+                    b1 = d.percentile(
+                        q,
+                        axes=axis,
+                        squeeze=not keepdims,
+                        method="tdigest",
+                        compression=300,
+                    )
+                    self.assertEqual(b1.shape, a1.shape)
+                    self.assertTrue(np.allclose(b1.array, a1))
+
+        # Masked data
+        filled = np.ma.filled(self.ma, np.nan)
+        d = cf.Data(self.ma, chunks=(2, 2, 3, 5))
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore",
+                category=RuntimeWarning,
+                message=".*All-NaN slice encountered.*",
+            )
+            for axis in [None] + self.axes_combinations:
+                for q in ranks:
+                    a1 = np.nanpercentile(filled, q, axis=axis, keepdims=True)
+                    a1 = np.ma.masked_invalid(a1)
+                    b1 = d.percentile(
+                        q, axes=axis, method="tdigest", compression=300
+                    ).array
+                    self.assertEqual(b1.shape, a1.shape)
+                    self.assertTrue(
+                        (
+                            np.ma.getmaskarray(b1) == np.ma.getmaskarray(a1)
+                        ).all()
+                    )
+                    self.assertTrue(np.ma.allclose(b1, a1))
+
+        # Approximate percentiles of many values
+        rng = np.random.default_rng(0)
+        a = rng.normal(size=(3000, 4))
+        d = cf.Data(a, chunks=(100, 2))
+        q = np.array([1, 10, 50, 90, 99])
+        for compression in (None, 1000):
+            b1 = d.percentile(
+                q,
+                axes=0,
+                squeeze=True,
+                method="tdigest",
+                compression=compression,
+            ).array
+            self.assertEqual(b1.shape, (5, 4))
+
+            # The ranks of the approximate percentiles are within 1
+            # of the requested ranks
+            a1 = np.sort(a, axis=0)
+            for j in range(4):
+                r = np.searchsorted(a1[:, j], b1[:, j]) / 30
+                self.assertTrue((abs(r - q) < 1).all())
+
+        # Test mtol
+        d = cf.Data(np.ma.arange(12).reshape(3, 4), chunks=2)
+        d[1, -1] = cf.masked
+        e = d.percentile(50, axes=0, mtol=1, method="tdigest")
+        self.assertEqual(np.ma.count(e.array), 4)
+        e = d.percentile(50, axes=0, mtol=0.1, method="tdigest")
+        self.assertEqual(np.ma.count(e.array), 3)
+
+        # Invalid arguments
+        for q in (-9, [999]):
+            with self.assertRaises(ValueError):
+                d.percentile(q, method="tdigest")
+
+        with self.assertRaises(ValueError):
+            d.percentile(50, method="tdigest", compression=0)
+
     def test_Data_section(self):
         """Test the `section` Data method."""
         d = cf.Data(np.arange(24).reshape(2, 3, 4))
@@ -4380,6 +4606,30 @@ class DataTest(unittest.TestCase):
         d.Units = cf.Units("km")
         self.assertEqual(d._get_cached_elements(), {0: 1.0, 1: 2.0, -1: 3.0})
 
+        # Affine and reference time conversions give the same values
+        # as UDUNITS
+        a = np.ma.arange(-9.5, 300, 2.25).reshape(6, 23)
+        a[1, 3] = np.ma.masked
+        for units0, units1 in (
+            ("K", "degC"),
+            ("degF", "degC"),
+            ("Pa", "hPa"),
+            ("m s-1", "knot"),
+            ("days since 2000-01-01", "hours since 1999-12-01"),
+        ):
+            units0 = cf.Units(units0)
+            units1 = cf.Units(units1)
+            for dtype in ("f8", "f4", "i4", "i8"):
+                x = a.astype(dtype)
+                d = cf.Data(x, units0, chunks=(3, 12))
+                d.Units = units1
+                e = cf.Units.conform(x, units0, units1)
+                self.assertEqual(d.dtype, e.dtype)
+                self.assertTrue((d.mask.array == e.mask).all())
+                self.assertTrue(
+                    np.array_equal(d.array.data, e.data, equal_nan=True)
+                )
+
     def test_Data_get_data(self):
         """Test the `get_data` Data method."""
         d = cf.Data(9)
@@ -1,6 +1,9 @@
 import datetime
 import faulthandler
+import io
 import os
+import sqlite3
+import tempfile
 import unittest
 import warnings
 
@@ -737,6 +740,264 @@ class aggregateTest(unittest.TestCase):
             "[ 5 10] :AGGREGATED: [-5 20]",
         )
 
+    def test_aggregate_many_fields(self):
+        """Test the aggregation of more than two fields at once"""
+        f = cf.example_field(0)
+        g = f.flip("Y")
+
+        for x in (f, g):
+            pieces = [x[:1], x[1:3], x[3:4], x[4:]]
+            for order in (pieces, pieces[::-1], pieces[2:] + pieces[:2]):
+                a = cf.aggregate(order)
+                self.assertEqual(len(a), 1)
+                self.assertTrue(a[0].equals(x))
+
+        # The inputs are not changed
+        pieces = [g[:1], g[1:3], g[3:]]
+        copies = [p.copy() for p in pieces]
+        cf.aggregate(pieces)
+        for p, c in zip(pieces, copies):
+            self.assertTrue(p.equals(c))
+
+    def test_aggregate_equal_coordinates(self):
+        """Test cf.aggregate with coordinates equal within tolerance"""
+        f = cf.example_field(0)
+        fields = []
+        for i in range(4):
+            g = f.copy()
+            t = g.dimension_coordinate("T")
+            t.set_data(t.data + i * 31)
+            fields.append(g)
+
+        a = cf.aggregate(fields)
+        self.assertEqual(len(a), 1)
+
+        # Coordinates that are equal within the tolerance
+        lat = fields[1].dimension_coordinate("Y")
+        lat.set_data(lat.data + 1e-9)
+        b = cf.aggregate(fields, atol=1e-6)
+        self.assertEqual(len(b), 1)
+
+        b = cf.aggregate(fields, atol=1e-12)
+        self.assertEqual(len(b), 2)
+
+    def test_aggregate_hash_cache(self):
+        """Test the cache of the values used for aggregation"""
+        f = cf.example_field(0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filenames = []
+            for i in range(3):
+                g = f.copy()
+                t = g.dimension_coordinate("T")
+                t.set_data(t.data + i * 31)
+                filename = os.path.join(tmpdir, f"file{i}.nc")
+                cf.write(g, filename)
+                filenames.append(filename)
+
+            fields = cf.read(filenames, aggregate=False)
+            a = cf.aggregate(fields)
+            self.assertEqual(len(a), 1)
+
+            # In-memory cache
+            cache = cf.hashcache.hash_cache
+            cache.clear()
+            with cf.hash_cache_size("10 MiB"):
+                b = cf.aggregate(fields)
+                self.assertGreater(len(cache), 0)
+                self.assertGreater(cache.size, 0)
+                self.assertTrue(b.equals(a))
+
+                # Uses the cached values
+                b = cf.aggregate(cf.read(filenames, aggregate=False))
+                self.assertTrue(b.equals(a))
+
+            cache.clear()
+            self.assertEqual(len(cache), 0)
+
+            # Identical arrays are only stored once, and are removed
+            # with the last entry that uses them
+            array = np.arange(1000.0)
+            with cf.hash_cache_size(3 * array.nbytes):
+                self.assertTrue(cache.put(("a", "s"), "token", array))
+                size = cache.size
+                self.assertTrue(cache.put(("b", "s"), "token", array))
+                self.assertLess(cache.size, size + array.nbytes)
+                self.assertEqual(cache.get(("a", "s"))[0], "token")
+                self.assertIsNone(cache.get(("a", "other signatures")))
+
+                for name in "cde":
+                    self.assertTrue(cache.put((name, "s"), name, array))
+
+                self.assertLessEqual(cache.size, 3 * array.nbytes)
+                self.assertIsNone(cache.get(("a", "s")))
+                self.assertNotIn("token", cache._arrays)
+
+            cache.clear()
+
+            # Cache file
+            path = os.path.join(tmpdir, "hash_cache.db")
+            b = cf.aggregate(fields, hash_cache=path)
+            self.assertTrue(os.path.isfile(path))
+            self.assertTrue(b.equals(a))
+            self.assertEqual(len(cache), 0)
+
+            b = cf.aggregate(fields, hash_cache=path)
+            self.assertTrue(b.equals(a))
+
+            # The arrays are stored without pickling them
+            with sqlite3.connect(path) as connection:
+                rows = connection.execute(
+                    "SELECT data, mask FROM arrays"
+                ).fetchall()
+
+            connection.close()
+            self.assertGreater(len(rows), 0)
+            for data, mask in rows:
+                np.load(io.BytesIO(data), allow_pickle=False)
+                self.assertIsNone(mask)
+
+            with cf.hashcache.HashCacheFile(path) as hash_cache_file:
+                key = ("name", "signatures")
+                array = np.ma.array([1.0, 2, 3], mask=[0, 1, 0])
+                self.assertTrue(hash_cache_file.put(key, "token", array))
+                token, array1 = hash_cache_file.get(key)
+                self.assertEqual(token, "token")
+                self.assertTrue((array1.mask == array.mask).all())
+                self.assertTrue((array1 == array).all())
+
+                array = np.array([cf.dt(2000, 1, 1)], dtype=object)
+                self.assertFalse(hash_cache_file.put(key, "token2", array))
+
+            # A changed file is read again
+            g = f.copy()
+            lat = g.dimension_coordinate("Y")
+            lat.set_data(lat.data + 1)
+            cf.write(g, filenames[0])
+            fields = cf.read(filenames, aggregate=False)
+            for kwargs in ({}, {"hash_cache": path}):
+                with cf.hash_cache_size("10 MiB"):
+                    b = cf.aggregate(fields, **kwargs)
+
+                self.assertEqual(len(b), 2)
+
+            cache.clear()
+
+    def test_aggregate_profile(self):
+        """Test the 'profile' keyword of cf.aggregate"""
+        f = cf.example_field(0)
+        fields = []
+        for i in range(3):
+            g = f.copy()
+            t = g.dimension_coordinate("T")
+            t.set_data(t.data + i * 31)
+            fields.extend([g[:, :2], g[:, 2:]])
+
+        a = cf.aggregate(fields)
+        b, stats = cf.aggregate(fields, profile=True)
+        self.assertTrue(b.equals(a))
+
+        self.assertEqual(stats["fields"], 6)
+        self.assertEqual(stats["signatures"], 1)
+        self.assertEqual(stats["output"], 1)
+        self.assertEqual(stats["aggregations"], 4)
+        self.assertGreaterEqual(stats["passes"], 2)
+        self.assertGreater(stats["arrays"], 0)
+        self.assertGreater(stats["bytes"], 0)
+        self.assertEqual(stats["cached_arrays"], 0)
+        self.assertGreater(stats["graph_size"], 0)
+
+        times = stats["time"]
+        self.assertEqual(
+            set(times),
+            set(
+                (
+                    "signatures",
+                    "hashing",
+                    "grouping",
+                    "sorting",
+                    "checking",
+                    "concatenation",
+                    "total",
+                )
+            ),
+        )
+        self.assertTrue(all(t >= 0 for t in times.values()))
+        self.assertGreaterEqual(
+            times["total"],
+            sum(t for phase, t in times.items() if phase != "total"),
+        )
+
+        # Unaggregatable fields
+        g = f.copy()
+        g.standard_name = "air_temperature"
+        _, stats = cf.aggregate([f, g], profile=True)
+        self.assertEqual(stats["fields"], 2)
+        self.assertEqual(stats["signatures"], 2)
+        self.assertEqual(stats["output"], 2)
+        self.assertEqual(stats["aggregations"], 0)
+
+    def test_aggregate_into(self):
+        """Test the 'into' keyword of cf.aggregate"""
+        f = cf.example_field(0)
+
+        # Fields for four time steps, each split along latitude
+        steps = []
+        for i in range(4):
+            g = f.copy()
+            t = g.dimension_coordinate("T")
+            t.set_data(t.data + i * 31)
+            steps.append([g[:2], g[2], g[3:]])
+
+        h = cf.aggregate([x for step in steps for x in step])
+        self.assertEqual(len(h), 1)
+
+        # Aggregate each time step into the previous ones, in
+        # increasing and decreasing time order
+        for order in (steps, steps[::-1]):
+            g = cf.aggregate(order[0], incremental=True)
+            for step in order[1:]:
+                g = cf.aggregate(step, into=g)
+
+            self.assertEqual(len(g), 1)
+            self.assertTrue(g[0].equals(h[0]))
+
+        # 'into' is unchanged
+        g = cf.aggregate(steps[0], incremental=True)
+        g0 = g.copy()
+        cf.aggregate(steps[1], into=g)
+        x = cf.aggregate(steps[2], into=g)
+        self.assertTrue(g.equals(g0))
+        self.assertEqual(x[0].shape, (2, 5, 8))
+
+        # Unrelated fields are output separately
+        q = cf.example_field(1)
+        x = cf.aggregate([q], into=g)
+        self.assertEqual(len(x), 2)
+        self.assertTrue(x.select("specific_humidity").equals(g))
+        self.assertTrue(x.select("air_temperature")[0].equals(q))
+
+        # Aggregation with different options, or into a list that was
+        # not returned by an incremental cf.aggregate, is the same as
+        # aggregating everything together
+        for kwargs, into in (
+            ({"relaxed_units": True}, g),
+            ({}, cf.FieldList(g0)),
+            ({}, g0),
+            ({}, cf.aggregate(steps[0])),
+        ):
+            x = cf.aggregate(steps[1], into=into, **kwargs)
+            y = cf.aggregate(into + steps[1], **kwargs)
+            self.assertTrue(x.equals(y, unordered=True))
+
+        # The state, and its arrays, is only kept on request
+        from cf.aggregate import _aggregation_states
+
+        n = len(_aggregation_states)
+        x = cf.aggregate(steps[0])
+        self.assertEqual(len(_aggregation_states), n)
+        x = cf.aggregate(steps[0], incremental=True)
+        self.assertEqual(len(_aggregation_states), n + 1)
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -791,6 +791,124 @@ class Field_collapseTest(unittest.TestCase):
                     # compute time
                     g.array
 
+    def test_Field_collapse_multiple_methods(self):
+        f = cf.example_field(1)
+        f[0, 0, 0] = cf.masked
+
+        methods = (
+            "mean",
+            "maximum",
+            "min",
+            "sd",
+            "variance",
+            "range",
+            "mid_range",
+            "sum",
+            "sample_size",
+        )
+        for axes, weights, squeeze in (
+            ("X", None, False),
+            ("area", "area", False),
+            ("T", None, True),
+            (None, None, False),
+        ):
+            fl = f.collapse(
+                methods, axes=axes, weights=weights, squeeze=squeeze, mtol=0.5
+            )
+            self.assertIsInstance(fl, cf.FieldList)
+            self.assertEqual(len(fl), len(methods))
+            for method, g in zip(methods, fl):
+                h = f.collapse(
+                    method,
+                    axes=axes,
+                    weights=weights,
+                    squeeze=squeeze,
+                    mtol=0.5,
+                )
+                self.assertTrue(g.equals(h, verbose=3))
+
+        # The collapsed fields share a single reduction of the data
+        fl = f.collapse(["mean", "max", "sd"], axes="X")
+        layers = [set(g.to_dask_array().dask.layers) for g in fl]
+        shared = set.intersection(*layers)
+        self.assertTrue(
+            any(name.startswith("cf_multi_chunk") for name in shared)
+        )
+
+        # Methods that can't be combined
+        with self.assertRaises(ValueError):
+            f.collapse(["mean", "median"], axes="X")
+
+        # Grouped collapses are not allowed
+        with self.assertRaises(ValueError):
+            f.collapse(["mean", "max"], axes="T", group=1)
+
+        # Can't collapse in-place
+        with self.assertRaises(ValueError):
+            f.collapse(["mean", "max"], axes="X", inplace=True)
+
+    def test_Field_collapse_grouped_single_pass(self):
+        f = cf.example_field(2)
+        f[2, 0, 0] = cf.masked
+        f[12:15, 1, 1] = cf.masked
+
+        for method, weights, mtol in (
+            ("mean", None, 1),
+            ("mean", "T", 0.5),
+            ("max", None, 1),
+            ("range", None, 0.5),
+            ("sd", "T", 1),
+            ("var", None, 1),
+            ("sum", "T", 1),
+            ("sample_size", None, 1),
+            ("root_mean_square", None, 1),
+        ):
+            g = f.collapse(
+                f"T: {method}", group=12, weights=weights, mtol=mtol
+            )
+            self.assertEqual(g.shape, (3, 5, 8))
+
+            # The data of all groups come from a single reduction
+            self.assertTrue(
+                any(
+                    name.startswith("cf_grouped_chunk")
+                    for name in g.to_dask_array().dask.layers
+                )
+            )
+
+            # Compare with a separate collapse of each group
+            for i in range(3):
+                h = f[i * 12 : (i + 1) * 12].collapse(
+                    f"T: {method}", weights=weights, mtol=mtol
+                )
+                a = g[i].array
+                b = h.array
+                self.assertEqual(a.dtype, b.dtype)
+                self.assertTrue(
+                    (
+                        numpy.ma.getmaskarray(a) == numpy.ma.getmaskarray(b)
+                    ).all()
+                )
+                self.assertTrue(numpy.ma.allclose(a, b))
+
+        # Non-contiguous groups
+        g = f.collapse(
+            "T: mean within years T: mean over years", within_years=cf.M()
+        )
+        self.assertEqual(g.shape, (12, 5, 8))
+        for i, t in enumerate(g.dimension_coordinate("T").datetime_array):
+            h = f.subspace(T=cf.month(t.month)).collapse("T: mean")
+            self.assertTrue(g[i].data.equals(h.data, rtol=1e-12, verbose=3))
+
+        # Methods that collapse each group separately
+        g = f.collapse("T: median", group=12)
+        self.assertFalse(
+            any(
+                name.startswith("cf_grouped_chunk")
+                for name in g.to_dask_array().dask.layers
+            )
+        )
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
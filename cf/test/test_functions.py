@@ -56,7 +56,7 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org, dict)
 
         # Check all keys that should be there are, with correct value type:
-        self.assertEqual(len(org), 11)  # update expected len if add new key(s)
+        self.assertEqual(len(org), 14)  # update expected len if add new key(s)
 
         # Types expected:
         self.assertIsInstance(org["atol"], float)
@@ -68,6 +68,9 @@ class functionTest(unittest.TestCase):
         self.assertIsInstance(org["tempdir"], str)
         self.assertIsInstance(org["active_storage"], bool)
         self.assertIsInstance(org["active_storage_max_requests"], int)
+        self.assertIsInstance(org["max_open_files"], int)
+        self.assertIsInstance(org["read_cache_size"], int)
+        self.assertIsInstance(org["hash_cache_size"], int)
         # Log level may be input as an int but always given as
         # equiv. string
         self.assertIsInstance(org["log_level"], str)
@@ -90,6 +93,9 @@ class functionTest(unittest.TestCase):
             "active_storage": True,
             "active_storage_url": None,
             "active_storage_max_requests": 100,
+            "max_open_files": 10,
+            "read_cache_size": 1000,
+            "hash_cache_size": 2000,
         }
 
         # Test the setting of each lone item.
@@ -2,6 +2,7 @@ import atexit
 import datetime
 import faulthandler
 import os
+import shutil
 import tempfile
 import unittest
 
@@ -11,12 +12,11 @@ faulthandler.enable()  # to debug seg faults and timeouts
 
 import cf
 
-n_tmpfiles = 1
 tmpfiles = [
-    tempfile.mkstemp("_test_pp.nc", dir=os.getcwd())[1]
-    for i in range(n_tmpfiles)
+    tempfile.mkstemp(f"_test_pp{ext}", dir=os.getcwd())[1]
+    for ext in (".nc", ".pp")
 ]
-[tmpfile] = tmpfiles
+[tmpfile, tmpfile_pp] = tmpfiles
 
 
 def _remove_tmpfiles():
@@ -92,6 +92,64 @@ class ppTest(unittest.TestCase):
 
         cf.load_stash2standard_name()
 
+    def test_load_stash2standard_name_cache(self):
+        from cf.functions import (
+            _load_stash2standard_name_cache,
+            _parse_stash2standard_name,
+            _stash2standard_name_cache_file,
+        )
+
+        cf.load_stash2standard_name(self.new_table)
+        table = os.path.abspath(self.new_table)
+        self.assertTrue(os.path.isfile(_stash2standard_name_cache_file(table)))
+
+        parsed = _parse_stash2standard_name(table, "!")
+        self.assertEqual(_load_stash2standard_name_cache(table, "!"), parsed)
+        self.assertIsNone(_load_stash2standard_name_cache(table, ","))
+
+        # Modifying the table invalidates the cache
+        mtime = os.stat(table).st_mtime_ns + 10**9
+        os.utime(table, ns=(mtime, mtime))
+
+        self.assertIsNone(_load_stash2standard_name_cache(table, "!"))
+
+        # A cache directory that other users can access is not used
+        cf.load_stash2standard_name(self.new_table)
+        directory = os.path.dirname(_stash2standard_name_cache_file(table))
+        os.chmod(directory, 0o777)
+        try:
+            self.assertIsNone(_stash2standard_name_cache_file(table))
+            self.assertIsNone(_load_stash2standard_name_cache(table, "!"))
+        finally:
+            os.chmod(directory, 0o700)
+
+        self.assertEqual(_load_stash2standard_name_cache(table, "!"), parsed)
+
+        cf.load_stash2standard_name()
+        self.assertEqual(
+            cf.stash2standard_name(),
+            _parse_stash2standard_name(
+                os.path.join(
+                    os.path.dirname(cf.__file__), "etc/STASH_to_CF.txt"
+                ),
+                "!",
+            ),
+        )
+
+    def test_stash2standard_name_records(self):
+        from cf.functions import _stash2standard_name_records
+
+        cf.load_stash2standard_name()
+        records = cf.stash2standard_name()[(1, 1)]
+        self.assertEqual(records[0][2:4], [None, 407.0])
+        self.assertEqual(_stash2standard_name_records(1, 1, 405), records)
+        self.assertEqual(_stash2standard_name_records(1, 1, 1100), ())
+        self.assertEqual(_stash2standard_name_records(1, -1, 405), ())
+
+        cf.load_stash2standard_name(self.new_table, merge=False)
+        self.assertEqual(_stash2standard_name_records(1, 1, 405), ())
+        cf.load_stash2standard_name()
+
     def test_stash2standard_name(self):
         d = cf.stash2standard_name()
         self.assertIsInstance(d, dict)
@@ -103,6 +161,26 @@ class ppTest(unittest.TestCase):
         f = cf.read(self.ppfile, select="lbproc=0")
         self.assertEqual(len(f), 1)
 
+    def test_PP_read_select_header(self):
+        f = cf.read(self.ppfile)
+        for select in (
+            "eastward_wind",
+            "standard_name=eastward_wind",
+            "long_name=U COMPNT OF WIND ON P LEV/UV GRID",
+            "units=m s-1",
+            "stash_code=30201",
+            "um_stash_source=m01s30i201",
+            "lbtim=12",
+            ["air_temperature", "lbproc=0"],
+            cf.eq("eastward_wind"),
+        ):
+            g = cf.read(self.ppfile, select=select)
+            self.assertEqual(len(g), 1)
+            self.assertTrue(g[0].equals(f[0]))
+
+        for select in ("air_temperature", "stash_code=1", "lbproc=128"):
+            self.assertEqual(len(cf.read(self.ppfile, select=select)), 0)
+
     def test_PP_WGDOS_UNPACKING(self):
         f = cf.read(self.ppfile)[0]
 
@@ -138,6 +216,87 @@ class ppTest(unittest.TestCase):
         self.assertTrue(f.dimension_coordinate("time", default=False))
         self.assertTrue(f.auxiliary_coordinate("longitude", default=False))
 
+    def test_PP_group_records_by_extra_data(self):
+        umfile = cf.umread_lib.umfile
+
+        # Make a file containing four copies of a record with extra
+        # data, the second of which has a different first 'x' value
+        # and the third of which has a first 'x' value that differs
+        # by less than the tolerance
+        u = umfile.File(self.ppextradata)
+        [rec] = u.vars[0].recs
+        u.close_fd()
+
+        with open(self.ppextradata, "rb") as fh:
+            record = fh.read()
+
+        # The first 'x' value follows the first extra data code word
+        offset = int(
+            rec.data_offset
+            + 4 * (rec.int_hdr[umfile.LBLREC] - rec.int_hdr[umfile.LBEXT])
+            + 4
+        )
+        x = np.frombuffer(record, ">f4", count=1, offset=offset)[0]
+        records = [bytearray(record) for i in range(4)]
+        for i, value in ((1, x + 10), (2, x * (1 + 1e-7))):
+            records[i][offset : offset + 4] = np.array(value, ">f4").tobytes()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "extra_data4.pp")
+            with open(filename, "wb") as fh:
+                fh.write(b"".join(records))
+
+            u = umfile.File(filename)
+            recs = [rec for var in u.vars for rec in var.recs]
+            self.assertEqual(len(recs), 4)
+
+            # Decoding all records at once gives the same as decoding
+            # each one
+            var = umfile.Var(recs, 1, 4)
+            var.file = u
+            length = 4 * int(rec.int_hdr[umfile.LBEXT])
+            raw = var._read_raw_extra_data(np.arange(4), length)
+            [(rows, extra)] = cf.umread_lib.extraData.decode_extra_data(
+                raw, 4, u.byte_ordering
+            )
+            self.assertEqual(rows.tolist(), [0, 1, 2, 3])
+            for i, r in enumerate(recs):
+                extra_data = r.read_extra_data()
+                self.assertEqual([k for k, v in extra], sorted(extra_data))
+                for key, values in extra:
+                    self.assertEqual(values[i].dtype, extra_data[key].dtype)
+                    self.assertTrue((values[i] == extra_data[key]).all())
+
+            groups = var.group_records_by_extra_data()
+            self.assertEqual(
+                [[recs.index(r) for r in group] for group in groups],
+                [[0, 2, 3], [1]],
+            )
+            self.assertEqual(groups[1][0].get_extra_data()["x"][0], x + 10)
+
+            var = umfile.Var(recs[::2], 1, 2)
+            var.file = u
+            self.assertEqual(var.group_records_by_extra_data(), [recs[::2]])
+
+            u.close_fd()
+
+        # Rows that match within the tolerance are grouped together,
+        # even when a row with a different value of a later column
+        # sorts between them
+        group = umfile.Var._group_rows_by_values
+        x = np.array([[1], [1], [1 + 5e-6]], dtype="f4")
+        title = np.array([["a"], ["b"], ["a"]])
+        self.assertEqual(
+            [g.tolist() for g in group([("x", x), ("title", title)])],
+            [[0, 2], [1]],
+        )
+
+        # Every row of a group matches the first row of the group
+        x = np.array([[1 + 12e-6], [1], [1 + 6e-6]], dtype="f4")
+        self.assertEqual(
+            [g.tolist() for g in group([("x", x)])], [[1, 2], [0]]
+        )
+
     def test_PP_um_version(self):
         f = cf.read(self.ppfile)[0]
         self.assertEqual(f.get_property("um_version"), "11.0")
@@ -145,6 +304,218 @@ class ppTest(unittest.TestCase):
         f = cf.read(self.ppfile, um={"version": "6.6.3"})[0]
         self.assertEqual(f.get_property("um_version"), "6.6.3")
 
+    def test_PP_index(self):
+        f = cf.read(self.ppfile)[0]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Create the index
+            g = cf.read(self.ppfile, um={"index": tmpdir})[0]
+            self.assertTrue(g.equals(f))
+
+            index_files = os.listdir(tmpdir)
+            self.assertEqual(len(index_files), 1)
+            self.assertTrue(index_files[0].endswith(".umindex.npz"))
+
+            # Use the index
+            g = cf.read(self.ppfile, um={"index": tmpdir})[0]
+            self.assertTrue(g.equals(f))
+            self.assertEqual(os.listdir(tmpdir), index_files)
+
+            h = cf.umread_lib.umfile.File(self.ppfile)
+            i = cf.umread_lib.umfile.File(self.ppfile, index=tmpdir)
+            self.assertEqual(len(i.vars), len(h.vars))
+            for var0, var1 in zip(h.vars, i.vars):
+                self.assertEqual((var1.nz, var1.nt), (var0.nz, var0.nt))
+                for rec0, rec1 in zip(var0.recs, var1.recs):
+                    self.assertTrue((rec1.int_hdr == rec0.int_hdr).all())
+                    self.assertTrue((rec1.real_hdr == rec0.real_hdr).all())
+                    self.assertEqual(rec1.data_offset, rec0.data_offset)
+                    self.assertEqual(rec1.disk_length, rec0.disk_length)
+
+            h.close_fd()
+            i.close_fd()
+
+    def test_PP_dask_chunks(self):
+        f = cf.read("file1.pp")[0]
+        self.assertEqual(f.data.numblocks, (2, 2, 1, 1))
+
+        for dask_chunks, numblocks in (
+            ("auto", (1, 1, 1, 1)),
+            (-1, (1, 1, 1, 1)),
+            (1, (2, 2, 1, 1)),
+            ({"T": None, "Z": 1}, (1, 2, 1, 1)),
+        ):
+            g = cf.read("file1.pp", dask_chunks=dask_chunks)[0]
+            self.assertEqual(g.data.numblocks, numblocks)
+            self.assertTrue(g.equals(f))
+            for index in (
+                (0,),
+                (slice(None), 1),
+                (1, 0, slice(3, 5), [1, 4, 6]),
+                (slice(None, None, -1),),
+            ):
+                self.assertTrue((g[index].array == f[index].array).all())
+
+    def test_PP_dask_chunks_unpack(self):
+        # Give each record a different BDATUM and BMKS, so that each
+        # has its own add_offset and scale_factor
+        shutil.copy("file1.pp", tmpfile_pp)
+        f = cf.umread_lib.umfile.File(tmpfile_pp)
+        offsets = [rec.hdr_offset for var in f.vars for rec in var.recs]
+        f.close_fd()
+
+        real_hdr = np.memmap(tmpfile_pp, dtype="<f4", mode="r+")
+        for offset, (bdatum, bmks) in zip(
+            offsets, ((7, 4), (100, 2), (0, 1), (-5, 3))
+        ):
+            i = offset // 4 + 45
+            real_hdr[i + 4] = bdatum
+            real_hdr[i + 18] = bmks
+
+        real_hdr.flush()
+        del real_hdr
+
+        f = cf.read(tmpfile_pp)[0]
+        self.assertEqual(f.data.numblocks, (2, 2, 1, 1))
+        array = f.array
+
+        g = cf.read(tmpfile_pp, dask_chunks=-1)[0]
+        self.assertEqual(g.data.numblocks, (1, 1, 1, 1))
+
+        # Compute the multi-record chunk twice, so that the second
+        # read uses any attributes stored by the first
+        for _ in range(2):
+            self.assertTrue((g.array == array).all())
+
+        dx = g.data.to_dask_array(_force_to_memory=False)
+        [um_array] = [v for v in dx.dask.values() if isinstance(v, cf.UMArray)]
+        for _ in range(2):
+            self.assertTrue((np.asanyarray(um_array) == array).all())
+
+    def test_PP_read_records_data(self):
+        for filename in ("file1.pp", "umfile.pp", "wgdos_packed.pp"):
+            u = cf.umread_lib.umfile.File(filename)
+            for var in u.vars:
+                recs = var.recs
+                a = np.array([rec.get_data() for rec in recs])
+                self.assertTrue((u.read_records_data(recs) == a).all())
+                self.assertTrue(
+                    (u.read_records_data(recs[::-1]) == a[::-1]).all()
+                )
+
+            u.close_fd()
+
+    def test_PP_mmap(self):
+        for filename in ("file1.pp", "extra_data.pp", "wgdos_packed.pp"):
+            u = cf.umread_lib.umfile.File(filename)
+            for var in u.vars:
+                for rec in var.recs:
+                    a = rec.get_data()
+                    b = rec.get_data(mmap=True)
+                    self.assertEqual(b.dtype.newbyteorder("="), a.dtype)
+                    self.assertTrue((b == a).all())
+
+            u.close_fd()
+
+            # Memory maps are only used on request
+            f = cf.read(filename, dask_chunks=-1)[0]
+            array = f.data.todict()
+            for a in array.values():
+                if isinstance(a, cf.UMArray):
+                    self.assertFalse(a._get_component("mmap"))
+
+            f = cf.read(filename, dask_chunks=-1, um={"mmap": True})[0]
+            array = f.data.todict()
+            umarrays = [a for a in array.values() if isinstance(a, cf.UMArray)]
+            self.assertTrue(umarrays)
+            for a in umarrays:
+                self.assertTrue(a._get_component("mmap"))
+                b = a.copy()
+                b._set_component("mmap", False, copy=False)
+                for index in (Ellipsis, (Ellipsis, [0, 2]), (Ellipsis, 1, 2)):
+                    x = a[index].array
+                    y = b[index].array
+                    self.assertTrue(x.dtype.isnative)
+                    self.assertTrue(x.flags.writeable)
+                    self.assertTrue((x == y).all())
+
+    def test_PP_headers(self):
+        for filename in ("file1.pp", "umfile.pp", "extra_data.pp"):
+            u = cf.umread_lib.umfile.File(filename)
+            for var in u.vars:
+                headers = var.get_headers()
+                self.assertIs(var.get_headers(), headers)
+                self.assertEqual(headers.shape, (len(var.recs),))
+                for h, rec in zip(headers, var.recs):
+                    self.assertTrue((h["int_hdr"] == rec.int_hdr).all())
+                    self.assertTrue((h["real_hdr"] == rec.real_hdr).all())
+                    self.assertEqual(h["hdr_offset"], rec.hdr_offset)
+                    self.assertEqual(h["data_offset"], rec.data_offset)
+                    self.assertEqual(h["disk_length"], rec.disk_length)
+
+            u.close_fd()
+
+        f = cf.read("file1.pp")[0]
+        t = f.dimension_coordinate("T")
+        self.assertTrue((t.array == [120.5, 121.5]).all())
+        self.assertTrue((t.bounds.array == [[120, 121], [121, 122]]).all())
+        self.assertEqual(f.dimension_coordinate("Z").size, 2)
+
+    def test_PP_open_files(self):
+        cf.close_files()
+        self.assertEqual(cf.open_files(), {})
+
+        f = cf.read(self.ppfile)[0]
+        array = f.array
+        files = cf.open_files("PP")
+        self.assertEqual(list(files), [f.get_filenames().pop()])
+        self.assertEqual(len(cf.open_files()), 1)
+        self.assertEqual(cf.open_files("netCDF"), {})
+
+        # Reusing a pooled file gives the same answer
+        self.assertTrue((f.array == array).all())
+        self.assertEqual(cf.open_files("PP"), files)
+
+        cf.close_files("netCDF")
+        self.assertEqual(cf.open_files("PP"), files)
+        cf.close_files()
+        self.assertEqual(cf.open_files(), {})
+
+        with cf.max_open_files(0):
+            self.assertTrue((f.array == array).all())
+            self.assertEqual(cf.open_files(), {})
+
+        with self.assertRaises(ValueError):
+            cf.open_files("bad")
+
+        with self.assertRaises(ValueError):
+            cf.max_open_files(-1)
+
+    def test_PP_file_pool(self):
+        pool = cf.umread_lib.filepool.FilePool(max_files=1)
+        f = pool.open(self.ppfile)
+        pool.release(f)
+        g = pool.open(self.ppfile)
+        self.assertIs(g, f)
+
+        h = pool.open(self.ppfile)
+        self.assertIsNot(h, g)
+        pool.release(g)
+        pool.release(h)
+        self.assertIsNone(g.fd)
+        self.assertEqual(pool.files(), {self.ppfile: [h]})
+
+        pool.close()
+        self.assertIsNone(h.fd)
+        self.assertEqual(pool.files(), {})
+
+        # Files in use when the pool is closed are not reused
+        f = pool.open(self.ppfile)
+        pool.close()
+        pool.release(f)
+        self.assertIsNone(f.fd)
+        self.assertEqual(pool.files(), {})
+
 
 if __name__ == "__main__":
     print("Run date:", datetime.datetime.now())
@@ -2,6 +2,7 @@ import atexit
 import datetime
 import faulthandler
 import inspect
+import json
 import os
 import shutil
 import subprocess
@@ -190,6 +191,314 @@ class read_writeTest(unittest.TestCase):
         cf.read(self.filename, aggregate=False)
         cf.read(self.filename, aggregate={})
 
+    def test_iread(self):
+        files = [self.filename, "file1.pp", "wgdos_packed.pp"]
+
+        f = cf.iread(files)
+        self.assertTrue(next(f).equals(cf.read(self.filename)[0]))
+
+        f = list(cf.iread(files))
+        g = [x for filename in files for x in cf.read(filename)]
+        self.assertEqual(len(f), len(g))
+        for x, y in zip(f, g):
+            self.assertTrue(x.equals(y))
+
+        for window in (2, 3, 10):
+            f = list(cf.iread(files, window=window))
+            g = [
+                x
+                for i in range(0, len(files), window)
+                for x in cf.read(files[i : i + window])
+            ]
+            self.assertEqual(len(f), len(g))
+            for x, y in zip(f, g):
+                self.assertTrue(x.equals(y))
+
+        f = list(cf.iread(files, window=3, select="eastward_wind"))
+        g = cf.read(files, select="eastward_wind")
+        self.assertEqual(len(f), len(g))
+        self.assertTrue(all(x.identity() == "eastward_wind" for x in f))
+
+        # Files are expanded before any are read
+        self.assertEqual(len(list(cf.iread("file1.p[p]"))), 1)
+        with self.assertRaises(FileNotFoundError):
+            cf.iread([self.filename, "bad_file.nc"]).__next__()
+
+        with self.assertRaises(ValueError):
+            list(cf.iread(files, window=0))
+
+        with self.assertRaises(ValueError):
+            list(cf.iread(files, cdl_string=True))
+
+    def test_read_max_workers(self):
+        files = [self.filename, "file1.pp", "wgdos_packed.pp", self.filename]
+
+        for aggregate in (True, False):
+            f = cf.read(files, aggregate=aggregate)
+            for max_workers in (1, 2):
+                g = cf.read(
+                    files, aggregate=aggregate, max_workers=max_workers
+                )
+                self.assertEqual(len(g), len(f))
+                for x, y in zip(f, g):
+                    self.assertTrue(x.equals(y))
+
+        f = cf.read(files, select="eastward_wind", max_workers=2)
+        self.assertTrue(f.equals(cf.read(files, select="eastward_wind")))
+
+        f = cf.read(files, file_type="UM", max_workers=2)
+        self.assertTrue(f.equals(cf.read(files, file_type="UM")))
+
+        # Errors from any file are raised
+        with self.assertRaises(DatasetTypeError):
+            cf.read([self.filename, "test_read_write.py"], max_workers=2)
+
+        with self.assertRaises(ValueError):
+            cf.read(files, max_workers=0)
+
+    def test_read_subspace(self):
+        files = ["file1.pp", self.filename]
+
+        subspace = {
+            "grid_latitude": cf.wi(0, 20),
+            "T": cf.ge(cf.dt("1979-05-02")),
+        }
+        f = cf.read(files, subspace=subspace)
+        self.assertEqual(len(f), 1)
+        self.assertTrue(f[0].equals(cf.read(files)[0].subspace(**subspace)))
+
+        # Constructs that can't be subspaced are discarded
+        for subspace in (
+            {"grid_latitude": cf.wi(100, 120)},
+            {"air_pressure": 500},
+            {"no_such_identity": 1},
+        ):
+            f = cf.read("file1.pp", subspace=subspace)
+            self.assertEqual(len(f), 0)
+
+        f = cf.read(files, subspace={"air_pressure": cf.wi(800, 900)})
+        self.assertEqual(len(f), 1)
+        self.assertEqual(f[0].dimension_coordinate("Z").size, 1)
+
+        with self.assertRaises(ValueError):
+            cf.read(files, subspace=[1])
+
+        # Positional indices are not allowed, since they would be
+        # applied to each file separately
+        f = cf.example_field(0)
+        files = [tmpfile, tmpfile2]
+        cf.write(f[:, :4], files[0])
+        cf.write(f[:, 4:], files[1])
+        g = cf.read(files)
+        self.assertEqual(len(g), 1)
+        self.assertTrue(g[0].equals(f))
+        for value in (slice(0, 5), [0, 5], np.array([0, 5]), (0, 5)):
+            with self.assertRaises(ValueError):
+                cf.read(files, subspace={"X": value})
+
+        # Coordinate value conditions give the same result as
+        # subspacing after aggregation
+        for value in (cf.wi(0, 200), cf.lt(100), 67.5):
+            h = cf.read(files, subspace={"X": value})
+            self.assertEqual(len(h), 1)
+            self.assertTrue(h[0].equals(g[0].subspace(X=value)))
+
+    def test_read_catalogue(self):
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [
+                shutil.copy(filename, tmpdir)
+                for filename in (self.filename, "file1.pp", "wgdos_packed.pp")
+            ]
+
+            path = os.path.join(tmpdir, "catalogue.db")
+            self.assertEqual(cf.catalogue(files, path), 3)
+
+            def entries():
+                with sqlite3.connect(path) as connection:
+                    return connection.execute(
+                        "SELECT path, mtime_ns, identities FROM files "
+                        "ORDER BY path"
+                    ).fetchall()
+
+            catalogued = entries()
+            self.assertEqual(
+                [row[0] for row in catalogued],
+                sorted(os.path.abspath(f) for f in files),
+            )
+
+            for aggregate in (True, False):
+                f = cf.read(files, aggregate=aggregate)
+                g = cf.read(files, aggregate=aggregate, catalogue=path)
+                self.assertEqual(len(g), len(f))
+                for x, y in zip(f, g):
+                    self.assertTrue(x.equals(y))
+
+            self.assertEqual(entries(), catalogued)
+
+            # Different read options have their own entries
+            g = cf.read(files[1], select="eastward_wind", catalogue=path)
+            self.assertTrue(
+                g.equals(cf.read(files[1], select="eastward_wind"))
+            )
+            self.assertEqual(len(entries()), 4)
+
+            # A modified file is read again
+            mtime = os.stat(files[1]).st_mtime_ns + 10**9
+            os.utime(files[1], ns=(mtime, mtime))
+            g = cf.read(files, catalogue=path)
+            self.assertTrue(g.equals(cf.read(files)))
+            self.assertEqual(len(entries()), 4)
+            self.assertIn(mtime, [row[1] for row in entries()])
+
+            # Read with parallel workers, with some files catalogued
+            files.append(shutil.copy("umfile.pp", tmpdir))
+            g = cf.read(files, catalogue=path, max_workers=2)
+            self.assertTrue(g.equals(cf.read(files)))
+            self.assertEqual(len(entries()), 5)
+
+    def test_read_catalogue_entries(self):
+        import sqlite3
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [
+                shutil.copy(filename, tmpdir)
+                for filename in ("umfile.pp", "gathered.nc")
+            ]
+            path = os.path.join(tmpdir, "catalogue.db")
+            f = cf.read(files[0])
+
+            # Files with compressed data are not catalogued
+            cf.catalogue(files, path)
+
+            def execute(sql):
+                connection = sqlite3.connect(path)
+                with connection:
+                    rows = connection.execute(sql).fetchall()
+
+                connection.close()
+                return rows
+
+            [(filename, constructs)] = execute(
+                "SELECT path, constructs FROM files"
+            )
+            self.assertEqual(filename, os.path.abspath(files[0]))
+            self.assertIsInstance(json.loads(constructs), list)
+
+            # Catalogued constructs are created without opening the
+            # file, whose contents are replaced here without changing
+            # its size or modification time
+            stat = os.stat(files[0])
+            with open(files[0], "r+b") as fh:
+                fh.write(bytes(stat.st_size))
+
+            os.utime(files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            g = cf.read(files[0], catalogue=path)
+            self.assertEqual(len(g), 1)
+            self.assertTrue(g[0].domain.equals(f[0].domain))
+            self.assertEqual(g[0].get_filenames(), f[0].get_filenames())
+
+            # An entry that can't be used is replaced
+            shutil.copy("umfile.pp", files[0])
+            cf.catalogue(files[0], path)
+            execute("UPDATE files SET constructs = '[{}]'")
+            g = cf.read(files[0], catalogue=path)
+            self.assertTrue(g.equals(f))
+            [(constructs1,)] = execute("SELECT constructs FROM files")
+            self.assertEqual(constructs1, constructs)
+
+    def test_read_cache_size(self):
+        from cf.read_write.readcache import read_cache
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            files = [
+                shutil.copy(filename, tmpdir)
+                for filename in (self.filename, "file1.pp")
+            ]
+
+            f = cf.read(files)
+            self.assertEqual(len(read_cache), 0)
+
+            with cf.read_cache_size("100 MiB"):
+                self.assertEqual(cf.read_cache_size(), 104857600)
+
+                g = cf.read(files)
+                self.assertTrue(g.equals(f))
+                self.assertEqual(len(read_cache), 2)
+                size = read_cache.size
+                self.assertGreater(size, 0)
+
+                # Reads of cached files return copies
+                g = cf.read(files)
+                self.assertTrue(g.equals(f))
+                g[0].del_property("standard_name", None)
+                self.assertTrue(cf.read(files).equals(f))
+
+                # Different read options have their own entries
+                g = cf.read(files, select="eastward_wind")
+                self.assertTrue(g.equals(f.select("eastward_wind")))
+                self.assertEqual(len(read_cache), 4)
+
+                # A modified file is read again
+                mtime = os.stat(files[1]).st_mtime_ns + 10**9
+                os.utime(files[1], ns=(mtime, mtime))
+                self.assertTrue(cf.read(files).equals(f))
+                self.assertEqual(len(read_cache), 5)
+
+                # Least recently used files are removed when the cache
+                # is full
+                cf.read_cache_size(size)
+                self.assertTrue(cf.read(files).equals(f))
+                self.assertLessEqual(read_cache.size, size)
+                self.assertEqual(len(read_cache), 2)
+
+            # Disabling the cache discards its contents
+            self.assertEqual(cf.read_cache_size(), 0)
+            self.assertTrue(cf.read(files).equals(f))
+            self.assertEqual(len(read_cache), 0)
+
+        with self.assertRaises(ValueError):
+            cf.read_cache_size(-1)
+
+    def test_read_dataset_type(self):
+        from cf.read_write.filetype import dataset_type, um_dataset_type
+
+        for filename, ds_type in (
+            ("test_file2.nc", "netCDF3"),
+            (self.filename, "netCDF4"),
+            (self.broken_bounds, "CDL"),
+            ("file1.pp", "PP"),
+            ("extra_data.pp", "PP"),
+            ("test_read_write.py", None),
+            ("no_such_file.nc", None),
+            ("https://no_such_host/file.nc", None),
+        ):
+            self.assertEqual(dataset_type(filename), ds_type)
+
+        for filename in ("file1.pp", "extra_data.pp", "wgdos_packed.pp"):
+            u = cf.umread_lib.umfile.File(filename, parse=False)
+            self.assertEqual(
+                um_dataset_type(filename),
+                {
+                    "fmt": u.fmt,
+                    "byte_ordering": u.byte_ordering,
+                    "word_size": u.word_size,
+                },
+            )
+            u.close_fd()
+
+        self.assertIsNone(um_dataset_type(self.filename))
+
+        # The cached type is forgotten when the file is modified
+        shutil.copy("file1.pp", tmpfile)
+        self.assertEqual(dataset_type(tmpfile), "PP")
+        shutil.copy("test_file2.nc", tmpfile)
+        mtime = os.stat(tmpfile).st_mtime_ns + 10**9
+        os.utime(tmpfile, ns=(mtime, mtime))
+        self.assertEqual(dataset_type(tmpfile), "netCDF3")
+        self.assertTrue(cf.read(tmpfile).equals(cf.read("test_file2.nc")))
+
     def test_read_extra(self):
         # Test 'extra' keyword of cf.read
         filename = self.filename
@@ -25,6 +25,16 @@ int WITH_LEN(read_record_data_core)(int fd,
 				    size_t nwords, 
 				    void *data_return);
 
+int WITH_LEN(unpack_records_core)(size_t nrec,
+				  void *packed_data,
+				  const size_t *packed_offsets,
+				  const size_t *disk_lengths,
+				  Byte_ordering byte_ordering, 
+				  const void *int_hdrs,
+				  const void *real_hdrs,
+				  size_t nwords,
+				  void *data_return);
+
 File *WITH_LEN(file_parse_core)(int fd,
 				File_type file_type);
 
@@ -42,6 +42,13 @@ int get_valid_records_ff(int fd,
 			 size_t hdr_start, size_t hdr_size, int nrec,
 			 int valid[], int *n_valid_rec_return);
 int unpack_run_length_encoded(REAL *datain, INTEGER nin, REAL *dataout, INTEGER nout, REAL mdi);
+int unpack_record_data(void *packed_data,
+		       size_t packed_bytes,
+		       Byte_ordering byte_ordering, 
+		       const INTEGER *int_hdr,
+		       const REAL *real_hdr,
+		       size_t nwords,
+		       void *data_return);
 
 /* process_vars.c */
 int process_vars(File *file, List *heaplist);
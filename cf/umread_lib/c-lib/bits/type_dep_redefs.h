@@ -59,6 +59,8 @@
 #define test_skip_var test_skip_var_sgl
 #define time_diff time_diff_sgl
 #define time_set time_set_sgl
+#define unpack_record_data unpack_record_data_sgl
+#define unpack_records_core unpack_records_core_sgl
 #define unpack_run_length_encoded unpack_run_length_encoded_sgl
 #define unwgdos unwgdos_sgl
 #define var_has_regular_z_t var_has_regular_z_t_sgl
@@ -126,6 +128,8 @@
 #define test_skip_var test_skip_var_dbl
 #define time_diff time_diff_dbl
 #define time_set time_set_dbl
+#define unpack_record_data unpack_record_data_dbl
+#define unpack_records_core unpack_records_core_dbl
 #define unpack_run_length_encoded unpack_run_length_encoded_dbl
 #define unwgdos unwgdos_dbl
 #define var_has_regular_z_t var_has_regular_z_t_dbl
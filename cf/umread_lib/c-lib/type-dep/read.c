@@ -1,5 +1,6 @@
 #include <unistd.h>
 #include <stdlib.h>
+#include <string.h>
 
 #include "umfileint.h"
 
@@ -339,9 +340,8 @@ int read_record_data_core(int fd,
 			  void *data_return)
 {
   int pack;
-  size_t packed_bytes, ipt, packed_words;
+  size_t packed_bytes;
   void *packed_data;
-  REAL mdi;
 
   packed_data = NULL;
 
@@ -357,15 +357,6 @@ int read_record_data_core(int fd,
     {
       /* PACKING IN USE */
 
-      /* Complain if not REAL data. In cdunifpp, this test was applied only to Cray 32-bit packing,
-       * but in fact also unwgdos assumes real, so apply to both packing types.
-       */
-      if (get_type(int_hdr) != real_type)
-	{
-	  error_mesg("Unpacking supported only for REAL type data");
-	  ERR;
-	}
-      
       /* first allocate array and read in packed data */
 
       /* disk_length includes extra data, so subtract off */
@@ -395,53 +386,9 @@ int read_record_data_core(int fd,
       CKP(   packed_data = malloc(packed_bytes)  );
       ERRIF(   read(fd, packed_data, packed_bytes)  != packed_bytes   );
 
-      /* NOW UNPACK ACCORDING TO PACKING TYPE (including byte swapping where necessary). */
-      
-      switch(pack)
-	{
-	case 1:
-	  /* WGDOS */
-	  
-	  /* unwgdos routine wants to know number of native integers in input.
-	   * input type might not be native int, so calculate:
-	   */
-	  mdi = get_var_real_fill_value(real_hdr);
-	  
-	  /* Note - even though we read in raw (unswapped) data from the file, we do not 
-	   * byte swap prior to calling unwgdos, as the packed data contains a mixture
-	   * of types of different lengths, so leave it to unwgdos() that knows about
-	   * this and has appropriate byte swapping code.
-	   */
-	  CKI(   unwgdos(packed_data, packed_bytes, data_return, nwords, mdi)   );
-	 
-	  break;
-	  
-	case 2:
-	  if (byte_ordering == REVERSE_ORDERING)
-	    swap_bytes_sgl(packed_data, packed_bytes / 4);
-	  
-	  for (ipt = 0; ipt < nwords ; ipt++)
-	    ((REAL*) data_return)[ipt] = ((float32_t *) packed_data)[ipt];
-	  
-	  break;
-	  
-	case 3:
-	  error_mesg("GRIB unpacking not supported");
-	  ERR;
-	  
-	  /* break; */
-
-	case 4:
-	  packed_words = packed_bytes / WORD_SIZE;
-	  if (byte_ordering == REVERSE_ORDERING)
-	    swap_bytes(packed_data, packed_words);
-	  mdi = get_var_real_fill_value(real_hdr);
-	  CKI(   unpack_run_length_encoded(packed_data, packed_words, data_return, nwords, mdi)   );
-	  break;
-
-	default:
-	  SWITCH_BUG;
-	}
+      CKI(   unpack_record_data(packed_data, packed_bytes, byte_ordering,
+				int_hdr, real_hdr, nwords, data_return)   );
+
       free(packed_data);
     }
   return 0;
@@ -453,6 +400,143 @@ int read_record_data_core(int fd,
 }
 
 
+/*
+ * unpacks the data of one record from a buffer containing the raw
+ * (unswapped) data as read from the file, storing nwords words at
+ * data_return
+ *
+ * note that the buffer may be byte swapped in place
+ */
+int unpack_record_data(void *packed_data,
+		       size_t packed_bytes,
+		       Byte_ordering byte_ordering, 
+		       const INTEGER *int_hdr,
+		       const REAL *real_hdr,
+		       size_t nwords,
+		       void *data_return)
+{
+  int pack;
+  size_t ipt, packed_words;
+  REAL mdi;
+
+  pack = get_var_packing(int_hdr);
+
+  if (pack == 0)
+    {
+      /* unpacked data -- copy, and byte swap if necessary */
+      ERRIF(   packed_bytes < nwords * WORD_SIZE   );
+      memcpy(data_return, packed_data, nwords * WORD_SIZE);
+      if (byte_ordering == REVERSE_ORDERING)
+	swap_bytes(data_return, nwords);
+      return 0;
+    }
+
+  /* Complain if not REAL data. In cdunifpp, this test was applied only to Cray 32-bit packing,
+   * but in fact also unwgdos assumes real, so apply to both packing types.
+   */
+  if (get_type(int_hdr) != real_type)
+    {
+      error_mesg("Unpacking supported only for REAL type data");
+      ERR;
+    }
+
+  /* NOW UNPACK ACCORDING TO PACKING TYPE (including byte swapping where necessary). */
+
+  switch(pack)
+    {
+    case 1:
+      /* WGDOS */
+
+      /* unwgdos routine wants to know number of native integers in input.
+       * input type might not be native int, so calculate:
+       */
+      mdi = get_var_real_fill_value(real_hdr);
+
+      /* Note - even though we read in raw (unswapped) data from the file, we do not 
+       * byte swap prior to calling unwgdos, as the packed data contains a mixture
+       * of types of different lengths, so leave it to unwgdos() that knows about
+       * this and has appropriate byte swapping code.
+       */
+      CKI(   unwgdos(packed_data, packed_bytes, data_return, nwords, mdi)   );
+
+      break;
+
+    case 2:
+      if (byte_ordering == REVERSE_ORDERING)
+	swap_bytes_sgl(packed_data, packed_bytes / 4);
+
+      for (ipt = 0; ipt < nwords ; ipt++)
+	((REAL*) data_return)[ipt] = ((float32_t *) packed_data)[ipt];
+
+      break;
+
+    case 3:
+      error_mesg("GRIB unpacking not supported");
+      ERR;
+
+      /* break; */
+
+    case 4:
+      packed_words = packed_bytes / WORD_SIZE;
+      if (byte_ordering == REVERSE_ORDERING)
+	swap_bytes(packed_data, packed_words);
+      mdi = get_var_real_fill_value(real_hdr);
+      CKI(   unpack_run_length_encoded(packed_data, packed_words, data_return, nwords, mdi)   );
+      break;
+
+    default:
+      SWITCH_BUG;
+    }
+  return 0;
+  ERRBLKI;
+}
+
+
+/*
+ * unpacks the data of nrec records, all of which have nwords data
+ * words, from a buffer containing their raw (unswapped) data as read
+ * from the file.
+ *
+ * The data of record irec start at byte packed_offsets[irec] of
+ * packed_data, with disk length disk_lengths[irec] (which includes
+ * any extra data); its headers are at int_hdrs[irec * N_INT_HDR] and
+ * real_hdrs[irec * N_REAL_HDR]; and its nwords unpacked words are
+ * stored at data_return[irec * nwords].
+ *
+ * note that the buffer may be byte swapped in place
+ */
+int unpack_records_core(size_t nrec,
+			void *packed_data,
+			const size_t *packed_offsets,
+			const size_t *disk_lengths,
+			Byte_ordering byte_ordering, 
+			const void *int_hdrs,
+			const void *real_hdrs,
+			size_t nwords,
+			void *data_return)
+{
+  size_t irec, packed_bytes;
+  const INTEGER *int_hdr;
+  const REAL *real_hdr;
+
+  for (irec = 0; irec < nrec; irec++)
+    {
+      int_hdr = (const INTEGER *) int_hdrs + irec * N_INT_HDR;
+      real_hdr = (const REAL *) real_hdrs + irec * N_REAL_HDR;
+
+      /* disk_length includes extra data, so subtract off */
+      packed_bytes = disk_lengths[irec] - get_extra_data_length(int_hdr);
+
+      CKI(   unpack_record_data((char *) packed_data + packed_offsets[irec],
+				packed_bytes, byte_ordering,
+				int_hdr, real_hdr, nwords,
+				(char *) data_return + irec * nwords * WORD_SIZE)   );
+    }
+  return 0;
+  ERRBLKI;
+}
+
+
 int unpack_run_length_encoded(REAL *datain, INTEGER nin, REAL *dataout, INTEGER nout, REAL mdi)
 {
   REAL *src, *dest, *end_src, *end_dest, data;
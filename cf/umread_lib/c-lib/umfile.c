@@ -163,3 +163,33 @@ int read_record_data(int fd,
   /* invalid word size falls through to error return */
   ERRBLKI;
 }
+
+int unpack_records(size_t nrec,
+		   void *packed_data,
+		   const size_t *packed_offsets,
+		   const size_t *disk_lengths,
+		   Byte_ordering byte_ordering, 
+		   int word_size, 
+		   const void *int_hdrs,
+		   const void *real_hdrs,
+		   size_t nwords, 
+		   void *data_return)
+{
+  errorhandle_init();
+  
+  switch(word_size) 
+    {
+    case 4:
+      CKI(  unpack_records_core_sgl(nrec, packed_data, packed_offsets, disk_lengths,
+				    byte_ordering, int_hdrs, real_hdrs, nwords,
+				    data_return)  );
+      return 0;
+    case 8:
+      CKI(  unpack_records_core_dbl(nrec, packed_data, packed_offsets, disk_lengths,
+				    byte_ordering, int_hdrs, real_hdrs, nwords,
+				    data_return)  );
+      return 0;
+    }
+  /* invalid word size falls through to error return */
+  ERRBLKI;
+}
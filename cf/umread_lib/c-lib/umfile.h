@@ -165,6 +165,37 @@ int read_record_data(int fd,
 */
 /* ------------------------------------------------------------------- */
 
+int unpack_records(size_t nrec,
+		   void *packed_data,
+		   const size_t *packed_offsets,
+		   const size_t *disk_lengths,
+		   Byte_ordering byte_ordering, 
+		   int word_size, 
+		   const void *int_hdrs,
+		   const void *real_hdrs,
+		   size_t nwords, 
+		   void *data_return);
+/* 
+   Unpacks the data of nrec records from a buffer that the caller has
+   already filled with their raw data as read from the file, doing
+   byte-swapping and unpacking as necessary.  Does no file access, so
+   many calls may run concurrently.
+
+   The data of record i start at byte packed_offsets[i] of packed_data
+   and have disk length disk_lengths[i], as for read_record_data.  The
+   PP headers of all records are passed as contiguous arrays of nrec *
+   45 ints and nrec * 19 floats/doubles, as appropriate to passed
+   word_size.  The buffer may be byte-swapped in place.
+
+   Every record must have nwords data words, obtained by calling
+   get_nwords(), and the caller must provide storage of size nrec *
+   nwords words in data_return, in which the data of record i start at
+   word i * nwords.
+
+   Return value is 0 for success, 1 for failure.
+*/
+/* ------------------------------------------------------------------- */
+
 
 int get_extra_data_offset_and_length(int word_size, 
 				     const void *int_hdr,
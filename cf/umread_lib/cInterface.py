@@ -592,6 +592,96 @@ class CInterface:
 
         return data
 
+    def unpack_records(
+        self,
+        packed_data,
+        packed_offsets,
+        disk_lengths,
+        byte_ordering,
+        word_size,
+        int_hdrs,
+        real_hdrs,
+        data_type,
+        nwords,
+    ):
+        """Unpacks the data of many records from an in-memory buffer.
+
+        No file access is done, and the GIL is released for the
+        duration of the C call, so many calls may run concurrently
+        in different threads.
+
+        inputs:
+           packed_data - raw record data as read from the file (1-d
+              numpy uint8 array, which may be byte swapped in place)
+           packed_offsets - start of each record's data in
+              packed_data, in bytes
+           disk_lengths - disk length of each record, in bytes
+           byte_ordering - 'little_endian' or 'big_endian'
+           word_size - 4 or 8
+           int_hdrs - integer PP headers (numpy array of shape
+              (nrec, 45))
+           real_hdrs - real PP headers (numpy array of shape
+              (nrec, 19))
+           data_type - 'integer' or 'real'
+           nwords - number of data words in every record
+              type and nwords should have been returned by
+              get_type_and_num_words()
+
+        returns:
+           numpy array of shape (nrec, nwords)
+
+        """
+        nrec = len(packed_offsets)
+
+        if data_type == "integer":
+            data = self._get_empty_int_array(nrec * nwords)
+            ctypes_data = self._get_ctypes_int_array()
+        elif data_type == "real":
+            data = self._get_empty_real_array(nrec * nwords)
+            ctypes_data = self._get_ctypes_real_array()
+        else:
+            raise ValueError("data_type must be 'integer' or 'real'")
+
+        packed_offsets = numpy.array(packed_offsets, dtype=numpy.uintp)
+        disk_lengths = numpy.array(disk_lengths, dtype=numpy.uintp)
+        int_hdrs = numpy.ascontiguousarray(
+            int_hdrs, dtype=self.file_data_int_type
+        ).reshape(-1)
+        real_hdrs = numpy.ascontiguousarray(
+            real_hdrs, dtype=self.file_data_real_type
+        ).reshape(-1)
+
+        self.lib.unpack_records.argtypes = [
+            CT.c_size_t,
+            _get_ctypes_array(numpy.uint8),
+            _get_ctypes_array(numpy.uintp),
+            _get_ctypes_array(numpy.uintp),
+            CT.c_int,
+            CT.c_int,
+            self._get_ctypes_int_array(),
+            self._get_ctypes_real_array(),
+            CT.c_size_t,
+            ctypes_data,
+        ]
+
+        rv = self.lib.unpack_records(
+            nrec,
+            packed_data,
+            packed_offsets,
+            disk_lengths,
+            enum_byte_ordering.as_index(byte_ordering),
+            word_size,
+            int_hdrs,
+            real_hdrs,
+            nwords,
+            data,
+        )
+
+        if rv != 0:
+            raise umfile.UMFileException("Error unpacking record data")
+
+        return data.reshape(nrec, nwords)
+
 
 if __name__ == "__main__":
     import sys
@@ -169,3 +169,132 @@ class ExtraDataUnpacker:
                 d[key] = np.append(d[key], vals)
 
         return ExtraData(d)
+
+
+def extra_data_layout(words):
+    """Find the layout of the extra data of a record.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        words: 1-d `numpy.ndarray`
+            The integer words of the extra data.
+
+    :Returns:
+
+        `tuple`
+            The position and value of each extra data code word.
+
+    """
+    layout = []
+    pos = 0
+    n = words.size
+    while pos < n:
+        i = int(words[pos])
+        if i == 0:
+            break
+
+        layout.append((pos, i))
+        pos += 1 + i // 1000
+
+    return tuple(layout)
+
+
+def decode_extra_data(raw, word_size, byte_ordering):
+    """Decode the extra data of many records at once.
+
+    All of the records must have the same amount of extra data, and
+    the extra data of each record is decoded in the same way as by
+    `ExtraDataUnpacker.get_data`. Rather than walking the extra data
+    of each record in turn, the records are partitioned by the layout
+    of their extra data, which is usually the same for all of them,
+    and each extra data item is then extracted for all of the records
+    in a partition as one array.
+
+    .. versionadded:: NEXTVERSION
+
+    :Parameters:
+
+        raw: 2-d `numpy.ndarray`
+            The extra data of each record, as unsigned bytes in the
+            file's byte order, with one row per record.
+
+        word_size: `int`
+            The word size in bytes (``4`` or ``8``).
+
+        byte_ordering: `str`
+            ``'little_endian'`` or ``'big_endian'``.
+
+    :Returns:
+
+        `list` of `tuple`
+            For each partition of records with the same layout, in
+            order of their first record, a tuple of the rows of *raw*
+            in that partition and the ``(key, values)`` pairs of
+            their extra data, sorted by key. The values are a 2-d
+            array with one row per record of the partition, each of
+            which is the array that `ExtraDataUnpacker.get_data` would
+            give for that key.
+
+    **Examples**
+
+    >>> decode_extra_data(raw, 4, 'big_endian')
+    [(array([0, 1, 2]),
+      [('x', array([[1.5, 2.5],
+                    [1.5, 2.5],
+                    [3.5, 4.5]], dtype=float32))])]
+
+    """
+    if byte_ordering == "little_endian":
+        endian = "<"
+    else:
+        endian = ">"
+
+    itype = np.dtype(f"{endian}i{word_size}")
+    ftype = np.dtype(f"{endian}f{word_size}")
+    native_ftype = ExtraDataUnpacker._float_types[word_size]
+
+    raw = np.ascontiguousarray(raw, dtype=np.uint8)
+    words = raw.view(itype)
+
+    layout = extra_data_layout(words[0])
+    if all((words[:, pos] == i).all() for pos, i in layout):
+        # All records have the same layout
+        partitions = {layout: np.arange(raw.shape[0])}
+    else:
+        partitions = {}
+        for row, w in enumerate(words):
+            partitions.setdefault(extra_data_layout(w), []).append(row)
+
+    out = []
+    for layout, rows in partitions.items():
+        rows = np.asanyarray(rows)
+        r = raw[rows]
+        w = words[rows]
+        d = {}
+        for pos, i in layout:
+            ia, ib = divmod(i, 1000)
+            key, etype = _codes[ib]
+            start = pos + 1
+            stop = start + ia
+            if etype == float:
+                vals = w[:, start:stop].view(ftype).astype(native_ftype)
+            elif etype == str:
+                vals = np.array(
+                    [
+                        [x.tobytes().decode("utf-8").rstrip("\x00")]
+                        for x in r[:, start * word_size : stop * word_size]
+                    ]
+                )
+
+            d.setdefault(key, []).append(vals)
+
+        out.append(
+            (
+                rows,
+                [(key, np.concatenate(d[key], axis=1)) for key in sorted(d)],
+            )
+        )
+
+    return out
@@ -0,0 +1,273 @@
+import os
+import threading
+from collections import OrderedDict
+
+from .umfile import File
+
+# The default maximum number of idle UM files kept open by the pool
+_default_max_files = 64
+
+
+class FilePool:
+    """A thread-safe pool of open UM and PP files.
+
+    Opening a `File` requires opening the file, and possibly also
+    detecting its file type, and closing it again afterwards costs
+    another system call. When the data of many records are read, as
+    is typical for a dask computation, the pool avoids this by keeping
+    recently used files open so that they may be reused.
+
+    A file obtained with `open` is for the exclusive use of the caller
+    until it is returned with `release`, because reading data changes
+    the file position of the underlying file descriptor. Idle files
+    are closed on a least recently used basis when there are more than
+    `max_files` of them.
+
+    An idle file is only reused if the file on disk has not been
+    replaced or modified since it was opened. All files are forgotten
+    by a child process after a fork, so that parent and child
+    processes never share file positions.
+
+    .. versionadded:: NEXTVERSION
+
+    """
+
+    def __init__(self, max_files=_default_max_files):
+        """**Initialisation**
+
+        :Parameters:
+
+            max_files: `int`, optional
+                The maximum number of idle files to keep open.
+
+        """
+        self._lock = threading.Lock()
+        self._max_files = int(max_files)
+        self._reset()
+
+    def _reset(self):
+        """Forget all open files, without closing them.
+
+        :Returns:
+
+            `None`
+
+        """
+        # Idle files, keyed by file type: {key: [(File, stat), ...]}
+        self._idle = {}
+
+        # The keys of the idle files, least recently used first:
+        # {id(File): key}
+        self._lru = OrderedDict()
+
+        # Files currently in use: {id(File): (key, stat, generation)}
+        self._in_use = {}
+
+        # Incremented by `close`, so that files which were in use at
+        # the time are closed when they are released
+        self._generation = 0
+
+    def _after_fork(self):
+        """Reset the pool in a child process after a fork.
+
+        File descriptors inherited from the parent process share
+        their file positions with it, so they are closed without
+        being used.
+
+        :Returns:
+
+            `None`
+
+        """
+        self._lock = threading.Lock()
+        idle = [f for files in self._idle.values() for f, _ in files]
+        self._reset()
+        for f in idle:
+            f.close_fd()
+
+    @staticmethod
+    def _stat(st):
+        """The properties of a file used to check for its replacement.
+
+        :Parameters:
+
+            st: `os.stat_result`
+
+        :Returns:
+
+            `tuple`
+
+        """
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+
+    @property
+    def max_files(self):
+        """The maximum number of idle files to keep open."""
+        return self._max_files
+
+    @max_files.setter
+    def max_files(self, value):
+        with self._lock:
+            self._max_files = int(value)
+            evict = self._evict()
+
+        for f in evict:
+            f.close_fd()
+
+    def _evict(self):
+        """Remove idle files in excess of `max_files` from the pool.
+
+        Must be called with the lock held.
+
+        :Returns:
+
+            `list` of `File`
+                The removed files, which need to be closed.
+
+        """
+        evict = []
+        lru = self._lru
+        idle = self._idle
+        while len(lru) > max(self._max_files, 0):
+            _, key = lru.popitem(last=False)
+            files = idle[key]
+            evict.append(files.pop(0)[0])
+            if not files:
+                del idle[key]
+
+        return evict
+
+    def open(self, path, byte_ordering=None, word_size=None, fmt=None):
+        """Return an open, unparsed file.
+
+        :Parameters:
+
+            path: `str`
+                The name of the UM or PP file.
+
+            byte_ordering: `str`, optional
+                ``'little_endian'`` or ``'big_endian'``
+
+            word_size: `int`, optional
+                ``4`` or ``8``
+
+            fmt: `str`, optional
+                ``'FF'`` or ``'PP'``
+
+        :Returns:
+
+            `File`
+                The open file, which should be returned to the pool
+                with `release` when it is no longer needed.
+
+        """
+        key = (path, fmt, word_size, byte_ordering)
+
+        f = None
+        with self._lock:
+            files = self._idle.get(key)
+            if files:
+                # Reuse the most recently used idle file
+                f, stat = files.pop()
+                if not files:
+                    del self._idle[key]
+
+                del self._lru[id(f)]
+
+        if f is not None:
+            try:
+                current = self._stat(os.stat(path))
+            except OSError:
+                current = None
+
+            if current != stat:
+                # The file on disk has changed since it was opened
+                f.close_fd()
+                f = None
+
+        if f is None:
+            f = File(
+                path,
+                byte_ordering=byte_ordering,
+                word_size=word_size,
+                fmt=fmt,
+                parse=False,
+            )
+            stat = self._stat(os.fstat(f.fd))
+
+        with self._lock:
+            self._in_use[id(f)] = (key, stat, self._generation)
+
+        return f
+
+    def release(self, f):
+        """Return a file obtained with `open` to the pool.
+
+        The file is closed if the pool is full, or if it was not
+        obtained from the pool.
+
+        :Parameters:
+
+            f: `File`
+                The file to release.
+
+        :Returns:
+
+            `None`
+
+        """
+        evict = [f]
+        with self._lock:
+            info = self._in_use.pop(id(f), None)
+            if info is not None and f.fd is not None:
+                key, stat, generation = info
+                if generation == self._generation and self._max_files > 0:
+                    self._idle.setdefault(key, []).append((f, stat))
+                    self._lru[id(f)] = key
+                    evict = self._evict()
+
+        for f in evict:
+            f.close_fd()
+
+    def close(self):
+        """Close all idle files.
+
+        Files that are currently in use are closed when they are
+        released.
+
+        :Returns:
+
+            `None`
+
+        """
+        with self._lock:
+            idle = [f for files in self._idle.values() for f, _ in files]
+            self._idle = {}
+            self._lru = OrderedDict()
+            self._generation += 1
+
+        for f in idle:
+            f.close_fd()
+
+    def files(self):
+        """Return the idle open files.
+
+        :Returns:
+
+            `dict`
+                The idle open files, keyed by file name.
+
+        """
+        out = {}
+        with self._lock:
+            for (path, *_), files in self._idle.items():
+                out.setdefault(path, []).extend(f for f, _ in files)
+
+        return out
+
+
+# The process-wide pool of open UM and PP files
+file_pool = FilePool()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=file_pool._after_fork)
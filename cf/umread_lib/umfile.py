@@ -1,11 +1,15 @@
+import hashlib
+import logging
+import mmap
 import os
-from functools import cmp_to_key
 
 import numpy
 from cfdm.read_write.exceptions import DatasetTypeError
 
 from . import cInterface
-from .extraData import ExtraDataUnpacker
+from .extraData import ExtraData, ExtraDataUnpacker, decode_extra_data
+
+logger = logging.getLogger(__name__)
 
 
 class UMFileException(Exception):
@@ -14,16 +18,35 @@ class UMFileException(Exception):
 
 # Lookup header pointers
 LBLREC = 14  # Length of data record (including any extra data)
+LBEXT = 19  # Length of extra data
 LBPACK = 20  # Packing method indicator
 LBEGIN = 28  # Disk address/Start Record
 
+# The version of the layout of lookup header index files. Increment
+# this whenever the layout changes, so that old index files are
+# ignored.
+_index_version = 1
+
+# The suffix of lookup header index files
+_index_suffix = ".umindex.npz"
+
+# The largest gap, in bytes, between the data of two records that are
+# nevertheless read from disk with a single read
+_max_read_gap = 65536
+
 
 class File:
     """A class for a UM file that gives a view of the file including
     sets of PP records combined into variables."""
 
     def __init__(
-        self, path, byte_ordering=None, word_size=None, fmt=None, parse=True
+        self,
+        path,
+        byte_ordering=None,
+        word_size=None,
+        fmt=None,
+        parse=True,
+        index=None,
     ):
         """Open and parse a UM file.
 
@@ -58,12 +81,36 @@ class File:
                 sufficient info about the file type to ensure that the
                 `get_data` method of those `Rec` objects will work.
 
+            index: `bool` or `str` or `None`, optional
+                Whether or not to use a persistent lookup header
+                index, which stores the result of parsing the file so
+                that subsequent parses of an unchanged file do not
+                need to read and interpret every lookup header
+                again. Ignored if *parse* is False.
+
+                If True then the index is stored in a "sidecar" file
+                in the same directory as the UM file, with the same
+                name plus the suffix ``.umindex.npz``. If a string
+                then it is taken as the name of a directory in which
+                to store the index file, which is useful when the
+                directory containing the UM file is not writable. If
+                `None` or False, the default, then no index is used.
+
+                An index is only used if it was created from a file
+                of the same path, size and modification time, and
+                with the same file type. An invalid or unreadable
+                index is silently replaced by a new one, and failure
+                to write an index file does not cause an error.
+
+                .. versionadded:: NEXTVERSION
+
         """
         c = cInterface.CInterface()
         self._c_interface = c
 
         self.path = path
         self.fd = None
+        self._mmap = None
         self.open_fd()
 
         if byte_ordering and word_size and fmt:
@@ -89,8 +136,19 @@ class File:
             # Note that the word size used to interpret file pointers
             # needs to have been previously set.
             # --------------------------------------------------------
-            info = c.parse_file(self.fd, file_type_obj)
-            self.vars = info["vars"]
+            index_file = None
+            vars = None
+            if index:
+                index_file = self._index_file(index)
+                vars = self._load_index(index_file)
+
+            if vars is None:
+                info = c.parse_file(self.fd, file_type_obj)
+                vars = info["vars"]
+                if index_file is not None:
+                    self._save_index(index_file, vars)
+
+            self.vars = vars
             self._add_back_refs()
 
     def open_fd(self):
@@ -120,6 +178,120 @@ class File:
 
         self.fd = None
 
+        # Don't close the memory map explicitly, as there may still
+        # be arrays which are views of it. It will be closed when
+        # the last of these has been deleted.
+        self._mmap = None
+
+    def get_mmap(self):
+        """Return a read-only memory map of the whole file.
+
+        The memory map is created from the open low-level file
+        descriptor on the first call, and then reused until the file
+        descriptor is closed.
+
+        .. versionadded:: NEXTVERSION
+
+        :Returns:
+
+            `mmap.mmap`
+                The memory map.
+
+        """
+        if self._mmap is None:
+            self._mmap = mmap.mmap(self.open_fd(), 0, access=mmap.ACCESS_READ)
+
+        return self._mmap
+
+    def read_records_data(self, recs):
+        """Read and unpack the data of many records at once.
+
+        The raw data of all of the records are first read from disk
+        into one buffer, with records whose data are close together
+        in the file being read with a single read. The buffer is then
+        unpacked by a single call to the C library, during which the
+        GIL is released, into one preallocated array.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `Rec.get_data`
+
+        :Parameters:
+
+            recs: sequence of `Rec`
+                The records, all of which must have the same data
+                type and number of data words.
+
+        :Returns:
+
+            `numpy.ndarray`
+                The unpacked data, with one row per record.
+
+        """
+        c = self._c_interface
+
+        types_and_nwords = set(
+            c.get_type_and_num_words(rec.int_hdr) for rec in recs
+        )
+        if len(types_and_nwords) != 1:
+            raise ValueError(
+                "Can't read the data of records with different data types "
+                "or numbers of data words"
+            )
+
+        data_type, nwords = types_and_nwords.pop()
+
+        # Find the runs of records whose data are close enough
+        # together to be read with a single read
+        data_offsets = [rec.data_offset for rec in recs]
+        disk_lengths = [rec.disk_length for rec in recs]
+        order = numpy.argsort(data_offsets, kind="stable")
+
+        runs = []
+        for i in order.tolist():
+            start = data_offsets[i]
+            end = start + disk_lengths[i]
+            if runs and start - runs[-1][1] <= _max_read_gap:
+                runs[-1][1] = max(runs[-1][1], end)
+            else:
+                runs.append([start, end])
+
+        # Read the raw data into one buffer
+        size = sum(end - start for start, end in runs)
+        packed_data = numpy.empty(size, dtype="uint8")
+        fd = self.open_fd()
+        run_offsets = []
+        position = 0
+        for start, end in runs:
+            buffer = memoryview(packed_data[position : position + end - start])
+            n = os.preadv(fd, [buffer], start)
+            if n != end - start:
+                raise UMFileException("Error reading record data")
+
+            run_offsets.append((start, end, position))
+            position += end - start
+
+        # Find the start of each record's data in the buffer
+        run_starts = numpy.array([start for start, _, _ in run_offsets])
+        packed_offsets = []
+        for data_offset in data_offsets:
+            start, _, position = run_offsets[
+                numpy.searchsorted(run_starts, data_offset, side="right") - 1
+            ]
+            packed_offsets.append(position + data_offset - start)
+
+        return c.unpack_records(
+            packed_data,
+            packed_offsets,
+            disk_lengths,
+            self.byte_ordering,
+            self.word_size,
+            numpy.array([rec.int_hdr for rec in recs]),
+            numpy.array([rec.real_hdr for rec in recs]),
+            data_type,
+            nwords,
+        )
+
     def _detect_file_type(self):
         """Store string values describing the auto-detected file type.
 
@@ -142,6 +314,206 @@ class File:
         self.byte_ordering = d["byte_ordering"]
         self.word_size = d["word_size"]
 
+    def _file_signature(self):
+        """The properties of the file used to validate an index.
+
+        .. versionadded:: NEXTVERSION
+
+        :Returns:
+
+            `dict`
+                The absolute path, size and modification time of the
+                file, and the file type.
+
+        """
+        stat = os.fstat(self.fd)
+        return {
+            "path": os.path.abspath(self.path),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "fmt": self.fmt,
+            "byte_ordering": self.byte_ordering,
+            "word_size": self.word_size,
+            "version": _index_version,
+        }
+
+    def _index_file(self, index):
+        """The name of the lookup header index file.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            index: `bool` or `str`
+                If True then return the name of the sidecar file next
+                to the UM file. If a string then return the name of
+                a file in that directory.
+
+        :Returns:
+
+            `str`
+                The index file name.
+
+        """
+        path = os.path.abspath(self.path)
+        if index is True:
+            return path + _index_suffix
+
+        # Include a hash of the full path in the file name, so that
+        # UM files with the same name in different directories can
+        # share an index directory.
+        directory = os.path.expanduser(os.path.expandvars(index))
+        digest = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(
+            directory, f"{os.path.basename(path)}.{digest}{_index_suffix}"
+        )
+
+    def _load_index(self, index_file):
+        """Create variables from a lookup header index file.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            index_file: `str`
+                The index file name.
+
+        :Returns:
+
+            `list` of `Var`, or `None`
+                The variables, or `None` if the index file does not
+                exist, can not be read, or does not describe the
+                current contents of the UM file.
+
+        """
+        if not os.path.isfile(index_file):
+            return
+
+        try:
+            with numpy.load(index_file, allow_pickle=False) as index:
+                for key, value in self._file_signature().items():
+                    if index[key].item() != value:
+                        logger.info(
+                            f"Ignoring out of date UM index file {index_file}"
+                        )  # pragma: no cover
+                        return
+
+                int_hdrs = index["int_hdrs"]
+                real_hdrs = index["real_hdrs"]
+                hdr_offsets = index["hdr_offsets"].tolist()
+                data_offsets = index["data_offsets"].tolist()
+                disk_lengths = index["disk_lengths"].tolist()
+                var_nz = index["var_nz"].tolist()
+                var_nt = index["var_nt"].tolist()
+                var_supervar_index = index["var_supervar_index"].tolist()
+        except Exception as error:
+            logger.info(
+                f"Ignoring unreadable UM index file {index_file}: {error}"
+            )  # pragma: no cover
+            return
+
+        vars = []
+        start = 0
+        for nz, nt, svi in zip(var_nz, var_nt, var_supervar_index):
+            stop = start + nz * nt
+            recs = [
+                Rec(
+                    int_hdrs[i],
+                    real_hdrs[i],
+                    hdr_offsets[i],
+                    data_offsets[i],
+                    disk_lengths[i],
+                )
+                for i in range(start, stop)
+            ]
+            if svi < 0:
+                svi = None
+
+            vars.append(Var(recs, nz, nt, svi))
+            start = stop
+
+        return vars
+
+    def _save_index(self, index_file, vars):
+        """Write a lookup header index file.
+
+        The file is written atomically, so that concurrent readers
+        never see a partially written index. Any failure to write
+        the file is logged and otherwise ignored.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
+
+            index_file: `str`
+                The index file name.
+
+            vars: `list` of `Var`
+                The variables parsed from the UM file.
+
+        :Returns:
+
+            `None`
+
+        """
+        c = self._c_interface
+        recs = [rec for var in vars for rec in var.recs]
+        if recs:
+            int_hdrs = numpy.stack([rec.int_hdr for rec in recs])
+            real_hdrs = numpy.stack([rec.real_hdr for rec in recs])
+        else:
+            int_hdrs = numpy.empty((0, 45), dtype=c.file_data_int_type)
+            real_hdrs = numpy.empty((0, 19), dtype=c.file_data_real_type)
+
+        arrays = {
+            key: numpy.array(value)
+            for key, value in self._file_signature().items()
+        }
+        arrays.update(
+            {
+                "int_hdrs": int_hdrs,
+                "real_hdrs": real_hdrs,
+                "hdr_offsets": numpy.array(
+                    [rec.hdr_offset for rec in recs], dtype="int64"
+                ),
+                "data_offsets": numpy.array(
+                    [rec.data_offset for rec in recs], dtype="int64"
+                ),
+                "disk_lengths": numpy.array(
+                    [rec.disk_length for rec in recs], dtype="int64"
+                ),
+                "var_nz": numpy.array([var.nz for var in vars], dtype="int64"),
+                "var_nt": numpy.array([var.nt for var in vars], dtype="int64"),
+                "var_supervar_index": numpy.array(
+                    [
+                        (
+                            -1
+                            if var.supervar_index is None
+                            else var.supervar_index
+                        )
+                        for var in vars
+                    ],
+                    dtype="int64",
+                ),
+            }
+        )
+
+        tmp_file = f"{index_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+            with open(tmp_file, "wb") as f:
+                numpy.savez(f, **arrays)
+
+            os.replace(tmp_file, index_file)
+        except OSError as error:
+            logger.info(
+                f"Can't write UM index file {index_file}: {error}"
+            )  # pragma: no cover
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
     def _add_back_refs(self):
         """Add file attribute to `Var` objects, and both `!file` and
         `!var` attributes to `Rec` objects.
@@ -170,45 +542,193 @@ class Var:
         self.nz = nz
         self.nt = nt
         self.supervar_index = supervar_index
+        self._headers = None
 
-    @staticmethod
-    def _compare(x, y):
-        """Method equivalent to the Python 2 'cmp'.
+    def get_headers(self):
+        """Return the lookup headers of all records as one array.
 
-        Note that (x > y) - (x < y) is equivalent but not as performant
-        since it would not short-circuit.
+        The array is created on the first call and then reused.
+
+        .. versionadded:: NEXTVERSION
 
         :Returns:
 
-            `int`
+            `numpy.ndarray`
+                A structured array with one element per record, in the
+                same order as the `!recs` attribute, and fields
+                ``'int_hdr'`` (the 45 integer header items),
+                ``'real_hdr'`` (the 19 real header items),
+                ``'hdr_offset'``, ``'data_offset'`` and
+                ``'disk_length'``.
+
+        **Examples**
+
+        >>> h = v.get_headers()
+        >>> h.shape
+        (4,)
+        >>> h["int_hdr"][:, 0]
+        array([1979, 1979, 1979, 1979], dtype=int32)
 
         """
-        if x == y:
-            return 0
-        elif x > y:
-            return 1
-        else:
-            return -1
+        headers = self._headers
+        if headers is None:
+            recs = self.recs
+            rec0 = recs[0]
+            headers = numpy.empty(
+                len(recs),
+                dtype=[
+                    ("int_hdr", rec0.int_hdr.dtype, rec0.int_hdr.shape),
+                    ("real_hdr", rec0.real_hdr.dtype, rec0.real_hdr.shape),
+                    ("hdr_offset", "int64"),
+                    ("data_offset", "int64"),
+                    ("disk_length", "int64"),
+                ],
+            )
+            headers["int_hdr"] = [rec.int_hdr for rec in recs]
+            headers["real_hdr"] = [rec.real_hdr for rec in recs]
+            headers["hdr_offset"] = [rec.hdr_offset for rec in recs]
+            headers["data_offset"] = [rec.data_offset for rec in recs]
+            headers["disk_length"] = [rec.disk_length for rec in recs]
+            self._headers = headers
+
+        return headers
+
+    def _read_raw_extra_data(self, indices, length):
+        """Read the raw extra data of some of the records.
+
+        .. versionadded:: NEXTVERSION
+
+        :Parameters:
 
-    def _compare_recs_by_extra_data(self, a, b):
-        """Compare records with respect to their extra data.
+            indices: `numpy.ndarray`
+                The positions in `recs` of the records, all of which
+                must have the same amount of extra data.
+
+            length: `int`
+                The length in bytes of the extra data of each record.
 
         :Returns:
 
-            `int`
+            `numpy.ndarray`
+                The extra data of each record as unsigned bytes in
+                the file's byte order, with one row per record.
 
         """
-        return self._compare(a.get_extra_data(), b.get_extra_data())
+        file = self.file
+        headers = self.get_headers()[indices]
+        int_hdr = headers["int_hdr"].astype("int64")
+
+        # If the data are packed then the extra data are at the very
+        # end of the record, otherwise they directly follow the data
+        offsets = numpy.where(
+            int_hdr[:, LBPACK] != 0,
+            headers["data_offset"] + headers["disk_length"] - length,
+            headers["data_offset"]
+            + (int_hdr[:, LBLREC] - int_hdr[:, LBEXT]) * file.word_size,
+        )
+
+        try:
+            buffer = numpy.frombuffer(file.get_mmap(), dtype=numpy.uint8)
+            return buffer[offsets[:, numpy.newaxis] + numpy.arange(length)]
+        except (OSError, ValueError, IndexError):
+            # Can't memory map the file, or some extra data lie beyond
+            # the end of it, so read the extra data of each record
+            fd = file.open_fd()
+            raw = numpy.empty((len(offsets), length), dtype=numpy.uint8)
+            for row, offset in zip(raw, offsets.tolist()):
+                row[...] = numpy.frombuffer(
+                    os.pread(fd, length, offset), dtype=numpy.uint8
+                )
+
+            return raw
+
+    @staticmethod
+    def _group_rows_by_values(extra):
+        """Group the rows of decoded extra data with matching values.
+
+        .. versionadded:: NEXTVERSION
+
+        .. seealso:: `group_records_by_extra_data`
+
+        :Parameters:
 
-    def _compare_recs_by_orig_order(self, a, b):
-        """Compare records with respect to their original order.
+            extra: `list` of `tuple`
+                The ``(key, values)`` pairs of one partition of
+                decoded extra data, as returned by
+                `decode_extra_data`.
 
         :Returns:
 
-            `int`
+            `list` of `numpy.ndarray`
+                The row indices of each group, in ascending order. The
+                groups are sorted by their extra data values.
 
         """
-        return self._compare(self.recs.index(a), self.recs.index(b))
+        # The columns to sort by, in order of decreasing priority, and
+        # the relative tolerance with which each one is compared
+        columns = []
+        tolerances = []
+        for key, values in extra:
+            if values.dtype.kind == "f":
+                tolerance = ExtraData._tolerances[values.dtype]
+            else:
+                # Compare strings by their sorted position
+                _, codes = numpy.unique(values, return_inverse=True)
+                values = codes.reshape(values.shape)
+                tolerance = None
+
+            columns.extend(values.T)
+            tolerances.extend([tolerance] * values.shape[1])
+
+        # Refine the groups by each column in turn, so that rows that
+        # match within the tolerances are never separated by a column
+        # of lower priority
+        n = columns[0].size
+        labels = numpy.zeros(n, dtype=int)
+        for values, tolerance in zip(columns, tolerances):
+            if (values == values[0]).all():
+                # All rows have the same value
+                continue
+
+            order = numpy.lexsort((values, labels))
+            values = values[order]
+            new = labels[order]
+            new = new[1:] != new[:-1]
+            if tolerance is None:
+                new |= values[1:] != values[:-1]
+            else:
+                b = values[1:]
+                new |= numpy.abs(values[:-1] - b) > numpy.abs(b * tolerance)
+
+                # Split any runs of adjacent matching values that
+                # contain a value that does not match the first value
+                # of its run
+                starts = numpy.flatnonzero(new) + 1
+                first = values[numpy.insert(starts, 0, 0)]
+                first = first[numpy.cumsum(numpy.insert(new, 0, False))]
+                mismatch = numpy.abs(first - values) > numpy.abs(
+                    values * tolerance
+                )
+                if mismatch.any():
+                    new = new.tolist()
+                    a = values[0]
+                    for i, b in enumerate(values[1:].tolist()):
+                        if new[i] or abs(a - b) > abs(b * tolerance):
+                            new[i] = True
+                            a = b
+
+                    new = numpy.array(new, dtype=bool)
+
+            labels[order] = numpy.cumsum(numpy.insert(new, 0, False))
+            if labels.max() == n - 1:
+                # Every row is in a group of its own
+                break
+
+        order = numpy.argsort(labels, kind="stable")
+        labels = labels[order]
+        return numpy.split(
+            order, numpy.flatnonzero(labels[1:] != labels[:-1]) + 1
+        )
 
     def group_records_by_extra_data(self):
         """Group records by matching extra data.
@@ -221,36 +741,59 @@ class Var:
         Within each group, the ordering of returned records is the
         same as in the `!recs` attribute.
 
+        The extra data of all records are decoded together as arrays
+        (see `decode_extra_data`), and the records are grouped by
+        sorting each extra data value in turn. Floating point values
+        match if they are equal to within a relative tolerance of
+        ``1e-5`` for 32-bit words, or ``1e-13`` for 64-bit words, of
+        the value of the first record of the group. The decoded extra data of the
+        first record of each group is stored on that record, so that
+        `Rec.get_extra_data` does not need to read it again.
+
         :Returns:
 
             `list`
 
         """
-        compare = self._compare_recs_by_extra_data
-        recs = self.recs[:]
+        recs = self.recs
         n = len(recs)
-        if n == 0:
+        if n <= 1:
             # shouldn't have a var without records, but...
-            return []
-
-        #        recs.sort(compare) #python2
-        recs.sort(key=cmp_to_key(compare))
-
-        # optimise simple case - if two ends of a sorted list match,
-        # the whole list matches
-        if not compare(recs[0], recs[-1]):
-            return [self.recs[:]]
+            return [recs[:]] if n else []
 
+        file = self.file
+        word_size = file.word_size
+        lengths = self.get_headers()["int_hdr"][:, LBEXT].astype("int64")
+        lengths = numpy.maximum(lengths, 0) * word_size
+        if not lengths.any():
+            # No record has any extra data
+            return [recs[:]]
+
+        # Records with different amounts of extra data never match, so
+        # partition the records by their amount of extra data
         groups = []
-        this_grp = []
-        for i, rec in enumerate(recs):
-            this_grp.append(rec)
-            if i == n - 1 or compare(rec, recs[i + 1]):
-                this_grp.sort(key=self._compare_recs_by_orig_order)
-                groups.append(this_grp)
-                this_grp = []
-
-        return groups
+        _, first = numpy.unique(lengths, return_index=True)
+        for length in lengths[numpy.sort(first)].tolist():
+            indices = numpy.flatnonzero(lengths == length)
+            if not length:
+                groups.append(indices)
+                continue
+
+            raw = self._read_raw_extra_data(indices, length)
+            for rows, extra in decode_extra_data(
+                raw, word_size, file.byte_ordering
+            ):
+                for group in self._group_rows_by_values(extra):
+                    row = group[0]
+                    recs[indices[rows[row]]]._extra_data = ExtraData(
+                        {key: values[row] for key, values in extra}
+                    )
+                    groups.append(indices[rows[group]])
+
+        if len(groups) == 1:
+            return [recs[:]]
+
+        return [[recs[i] for i in group.tolist()] for group in groups]
 
 
 class Rec:
@@ -422,9 +965,23 @@ class Rec:
 
         return dtype, num_words
 
-    def get_data(self):
+    def get_data(self, mmap=False):
         """Get the data array associated with the record.
 
+        :Parameters:
+
+            mmap: `bool`, optional
+                If True and the record's data are not packed (i.e. the
+                lookup header LBPACK value is 0 modulo 10), then
+                return a read-only view of a memory map of the file,
+                with the file's data type and byte order. No data are
+                read from disk until the view is accessed, and then
+                only from the pages that are accessed. Otherwise the
+                data are read into memory and converted to native
+                byte order.
+
+                .. versionadded:: NEXTVERSION
+
         :Returns:
 
             `numpy.ndarray`
@@ -435,6 +992,30 @@ class Rec:
         int_hdr = self.int_hdr
         data_type, nwords = c.get_type_and_num_words(int_hdr)
 
+        if mmap and not int_hdr[LBPACK] % 10:
+            if file.byte_ordering == "little_endian":
+                dtype = "<"
+            else:
+                dtype = ">"
+
+            if data_type == "integer":
+                dtype += "i"
+            else:
+                dtype += "f"
+
+            dtype = numpy.dtype(dtype + str(file.word_size))
+            try:
+                return numpy.frombuffer(
+                    file.get_mmap(),
+                    dtype=dtype,
+                    count=nwords,
+                    offset=self.data_offset,
+                )
+            except (OSError, ValueError):
+                # Can't memory map the file, or the record lies beyond
+                # the end of it, so fall back to reading the data
+                pass
+
         return c.read_record_data(
             file.fd,
             self.data_offset,